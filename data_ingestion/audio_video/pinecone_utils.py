@@ -33,7 +33,21 @@ Rate Limits:
 """
 
 
-def create_embeddings(chunks, client):
+def _request_embeddings(client, texts, model_name):
+    """Embed texts in one API call, checking that every text got a vector."""
+    response = client.embeddings.create(input=texts, model=model_name)
+    embeddings = [embedding.embedding for embedding in response.data]
+
+    # Verify we got the expected number of embeddings
+    if len(embeddings) != len(texts):
+        logger.error(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        raise ValueError(
+            f"Embedding count mismatch: expected {len(texts)}, got {len(embeddings)}"
+        )
+    return embeddings
+
+
+def create_embeddings(chunks, client, cache=None):
     """
     Generates embeddings for text chunks using OpenAI's API.
 
@@ -41,6 +55,7 @@ def create_embeddings(chunks, client):
     - Processes all chunks in single API call
     - Maintains chunk order for vector mapping
     - Returns flat list of embeddings
+    - With an EmbeddingCache, only chunks not embedded before are sent
 
     Rate Limits: Determined by OpenAI API quotas
     """
@@ -90,16 +105,14 @@ def create_embeddings(chunks, client):
     if not model_name:
         raise ValueError("OPENAI_INGEST_EMBEDDINGS_MODEL environment variable not set")
 
-    try:
-        response = client.embeddings.create(input=texts, model=model_name)
-        embeddings = [embedding.embedding for embedding in response.data]
+    def embed(batch):
+        return _request_embeddings(client, batch, model_name)
 
-        # Verify we got the expected number of embeddings
-        if len(embeddings) != len(texts):
-            logger.error(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
-            raise ValueError(
-                f"Embedding count mismatch: expected {len(texts)}, got {len(embeddings)}"
-            )
+    try:
+        if cache is not None:
+            embeddings = cache.embed(texts, embed, model_name)
+        else:
+            embeddings = embed(texts)
 
         logger.debug(f"Successfully created {len(embeddings)} embeddings")
         return embeddings
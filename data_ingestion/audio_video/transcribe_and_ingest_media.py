@@ -28,6 +28,7 @@ Processing Control:
   -f, --force                  Force re-transcription and re-indexing
   -c, --clear-vectors          Clear existing vectors before processing
   -o, --override-conflicts     Continue processing even if filename conflicts are found
+  --no-embedding-cache         Embed every chunk instead of reusing media/embedding-cache.db
 
 Queue Management:
   -q, --queue NAME             Specify an alternative queue name for parallel processing
@@ -86,6 +87,7 @@ from data_ingestion.audio_video.youtube_utils import (
     download_youtube_audio,
     extract_youtube_id,
 )
+from data_ingestion.utils.embedding_cache import EmbeddingCache
 from data_ingestion.utils.pinecone_utils import clear_library_vectors
 from data_ingestion.utils.s3_utils import S3UploadError, upload_to_s3
 from pyutil.env_utils import load_env
@@ -413,6 +415,7 @@ def _process_and_store_transcription(
     library_name,
     s3_key,
     site_config,
+    embedding_cache=None,
 ):
     """
     Processes transcription into chunks and stores in Pinecone.
@@ -450,7 +453,7 @@ def _process_and_store_transcription(
 
         if not dryrun:
             try:
-                embeddings = create_embeddings(chunks, client)
+                embeddings = create_embeddings(chunks, client, embedding_cache)
                 logger.debug(f"{len(embeddings)} embeddings created for {file_name}")
 
                 # Use youtube_data for metadata if it's a YouTube video
@@ -559,6 +562,7 @@ def process_file(
     youtube_data=None,
     s3_key=None,
     site=None,
+    embedding_cache=None,
 ):
     """
     Core processing pipeline for a single media file or YouTube video.
@@ -622,6 +626,7 @@ def process_file(
         library_name,
         s3_key,
         site_config,
+        embedding_cache,
     )
 
     if processing_report["errors"] > 0:
@@ -652,6 +657,8 @@ def worker(task_queue, result_queue, args, stop_event):
     configure_logging(args.debug)
     logger = logging.getLogger(__name__)
     client = OpenAI()
+    # Workers share one cache file; each opens its own connection
+    embedding_cache = None if args.no_embedding_cache else EmbeddingCache()
 
     try:
         index = load_pinecone()
@@ -701,7 +708,9 @@ def worker(task_queue, result_queue, args, stop_event):
 
             logger.debug(f"Worker processing item: {item}")
             # Process item and report results back to main thread
-            item_id, report = process_item(item, args, client, index, site_config)
+            item_id, report = process_item(
+                item, args, client, index, site_config, embedding_cache
+            )
             logger.debug(f"Worker processed item: {item_id}, report: {report}")
             result_queue.put((item_id, report))
         except Empty:
@@ -716,8 +725,11 @@ def worker(task_queue, result_queue, args, stop_event):
             else:
                 result_queue.put((None, {"errors": 1, "error_details": [str(e)]}))
 
+    if embedding_cache is not None:
+        logger.info(embedding_cache.summary())
+
 
-def process_item(item, args, client, index, site_config):
+def process_item(item, args, client, index, site_config, embedding_cache=None):
     """
     Processes a single media item with timing metrics and cleanup.
 
@@ -779,6 +791,7 @@ def process_item(item, args, client, index, site_config):
         youtube_data=youtube_data,
         s3_key=s3_key,
         site=args.site,
+        embedding_cache=embedding_cache,
     )
     end_time = time.time()
     processing_time = end_time - start_time
@@ -1018,6 +1031,11 @@ def _parse_arguments():
         action="store_true",
         help="Continue processing even if filename conflicts are found",
     )
+    processing.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Embed every chunk instead of reusing vectors from previous runs",
+    )
 
     # Queue management options
     queue = parser.add_argument_group("Queue Management")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel document chunking on a WordPress database.
+
+Fetches posts the same way ingest_db_text.py does (site config, exclusion
+rules, HTML stripped for chunking) and splits them with SpacyTextSplitter
+once per worker count. Reports docs/sec and the speedup over one process,
+and checks that every run produces the same chunks as the serial one.
+Nothing is embedded, uploaded or written to Pinecone.
+
+Load a WordPress dump into MySQL first (see
+sql_to_vector_db/process_anandalib_dump.py). The site's .env file must
+provide the same variables ingest_db_text.py needs.
+
+Command Line Options:
+  --site SITE           Site name for config and env loading (required)
+  --database NAME       MySQL database holding the WordPress tables (required)
+  --library-name NAME   Library name used when fetching posts (required)
+  --max-records N       Only fetch this many posts
+  --workers N [N ...]   Worker counts to time (default: 1 2 4 ... up to the CPU count)
+
+Usage Examples:
+  python bin/benchmark_chunking_pool.py --site ananda --database anandalib_2025_06_01 \\
+      --library-name "Ananda Library"
+  python bin/benchmark_chunking_pool.py --site ananda --database anandalib_2025_06_01 \\
+      --library-name "Ananda Library" --max-records 2000 --workers 1 8
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from data_ingestion.sql_to_vector_db.ingest_db_text import (
+    _build_chunking_document,
+    close_db_connection,
+    fetch_all_data,
+    get_config,
+    get_db_config,
+    get_db_connection,
+    load_environment,
+)
+from data_ingestion.utils.text_splitter_utils import SpacyTextSplitter
+
+
+def default_worker_counts() -> list[int]:
+    """1, 2, 4, ... up to and including the CPU count."""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if cpus > 1:
+        counts.append(cpus)
+    return counts
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare serial and process-pool chunking of WordPress posts"
+    )
+    parser.add_argument("--site", required=True, help="Site name")
+    parser.add_argument("--database", required=True, help="MySQL database name")
+    parser.add_argument("--library-name", required=True, help="Library name")
+    parser.add_argument("--max-records", type=int, help="Only fetch this many posts")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=default_worker_counts(),
+        help="Worker counts to time",
+    )
+    return parser.parse_args()
+
+
+def load_posts(args: argparse.Namespace) -> list:
+    """Fetch posts like ingest_db_text.py and return their chunking documents."""
+    load_environment(args.site)
+    connection = get_db_connection(get_db_config(args))
+    try:
+        rows = fetch_all_data(
+            connection,
+            get_config(args.site),
+            args.library_name,
+            args.site,
+            args.max_records,
+        )
+    finally:
+        close_db_connection(connection)
+    return [_build_chunking_document(row) for row in rows]
+
+
+def time_workers(workers: int, documents: list) -> tuple[float, list[str]]:
+    """Chunk all documents with a splitter using `workers` processes.
+
+    Pool startup is not timed. Returns (seconds, chunk texts).
+    """
+    splitter = SpacyTextSplitter(
+        chunk_size=250, chunk_overlap=50, log_summary_on_split=False, workers=workers
+    )
+    try:
+        # Start the workers and load spaCy outside the timed run
+        splitter.split_documents(documents[: workers * 2])
+        start = time.perf_counter()
+        chunks = splitter.split_documents(documents)
+        return time.perf_counter() - start, [chunk.page_content for chunk in chunks]
+    finally:
+        splitter.close()
+
+
+def main() -> None:
+    args = parse_arguments()
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s - %(message)s")
+
+    documents = load_posts(args)
+    if not documents:
+        print("No posts fetched")
+        return
+    characters = sum(len(doc.page_content) for doc in documents)
+    print(f"{len(documents):,} posts, {characters:,} characters, {os.cpu_count()} CPUs")
+
+    baseline_seconds, baseline_chunks = None, None
+    for workers in args.workers:
+        seconds, chunks = time_workers(workers, documents)
+        if baseline_seconds is None:
+            baseline_seconds, baseline_chunks = seconds, chunks
+        same = "identical" if chunks == baseline_chunks else "DIFFERENT chunks"
+        print(
+            f"{workers:3d} workers: {seconds:7.2f}s = {len(documents) / seconds:8.1f} docs/sec, "
+            f"{baseline_seconds / seconds:4.1f}x, {len(chunks):,} chunks, {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
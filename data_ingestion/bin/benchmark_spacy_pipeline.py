@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the spaCy pipeline SpacyTextSplitter loads, full versus sentence-only.
+
+SpacyTextSplitter only reads tokens and sentence boundaries from spaCy. This
+compares three setups on the paragraphs of a PDF, each in a fresh process so
+memory figures don't mix:
+
+- full: the complete pipeline (tagger, parser, NER, ...) with one nlp() call
+  per paragraph, as the splitter used to work
+- sentences: load_spacy_pipeline's sentence-only pipeline, one nlp() call
+  per paragraph
+- sentences+pipe: the sentence-only pipeline with nlp.pipe batches, as the
+  splitter works now
+
+For each it reports load time, resident memory added by loading, time per MB
+of text, peak resident memory while processing, and the sentence count (the
+parser and senter can disagree on a few boundaries). Nothing is chunked,
+embedded or written to Pinecone.
+
+Command Line Options:
+  --pdf PATH         PDF file whose text is processed (required)
+  --pipeline NAME    spaCy model (default: en_core_web_sm)
+  --batch-size N     nlp.pipe batch size (default: SPACY_PIPE_BATCH_SIZE)
+
+Usage Examples:
+  python bin/benchmark_spacy_pipeline.py --pdf ~/books/autobiography.pdf
+  python bin/benchmark_spacy_pipeline.py --pdf big.pdf --batch-size 256
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+import psutil
+
+from data_ingestion.pdf_to_vector_db import PyPDFLoader, _assemble_full_document
+from data_ingestion.utils.text_splitter_utils import (
+    SPACY_PIPE_BATCH_SIZE,
+    SpacyTextSplitter,
+    load_spacy_pipeline,
+)
+
+SETUPS = {
+    "full": (False, False),
+    "sentences": (True, False),
+    "sentences+pipe": (True, True),
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare the full and sentence-only spaCy pipelines"
+    )
+    parser.add_argument("--pdf", required=True, help="PDF file to process")
+    parser.add_argument("--pipeline", default="en_core_web_sm", help="spaCy model")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SPACY_PIPE_BATCH_SIZE,
+        help="nlp.pipe batch size",
+    )
+    return parser.parse_args()
+
+
+def load_paragraphs(pdf_path: str) -> list[str]:
+    """Extract a PDF's text like pdf_to_vector_db.py and split it into paragraphs."""
+    document = _assemble_full_document(PyPDFLoader(pdf_path).load())
+    if document is None:
+        print(f"No text content found in {pdf_path}")
+        sys.exit(1)
+    splitter = SpacyTextSplitter()
+    return splitter._extract_paragraphs(splitter._clean_text(document.page_content))
+
+
+def run_setup(
+    pipeline: str,
+    sentences_only: bool,
+    use_pipe: bool,
+    batch_size: int,
+    paragraphs: list[str],
+) -> dict:
+    """Load a pipeline and find sentences in every paragraph. Runs in a fresh process."""
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+
+    start = time.perf_counter()
+    nlp = load_spacy_pipeline(pipeline, sentences_only=sentences_only)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = process.memory_info().rss
+
+    start = time.perf_counter()
+    if use_pipe:
+        docs = nlp.pipe(paragraphs, batch_size=batch_size)
+    else:
+        docs = (nlp(paragraph) for paragraph in paragraphs)
+    sentences = sum(len(list(doc.sents)) for doc in docs)
+    seconds = time.perf_counter() - start
+
+    return {
+        "components": nlp.pipe_names,
+        "load_seconds": load_seconds,
+        "model_mb": (rss_loaded - rss_before) / 2**20,
+        "seconds": seconds,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+        "sentences": sentences,
+    }
+
+
+def main() -> None:
+    args = parse_arguments()
+    paragraphs = load_paragraphs(args.pdf)
+    megabytes = sum(len(p.encode()) for p in paragraphs) / 2**20
+    print(f"{len(paragraphs):,} paragraphs, {megabytes:.2f} MB of text\n")
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name, (sentences_only, use_pipe) in SETUPS.items():
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(
+                run_setup,
+                (args.pipeline, sentences_only, use_pipe, args.batch_size, paragraphs),
+            )
+
+    full = results["full"]
+    print(
+        f"{'setup':<16}{'load s':>8}{'model MB':>10}{'s/MB':>9}{'speedup':>9}"
+        f"{'peak MB':>9}{'sentences':>11}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<16}{result['load_seconds']:8.2f}{result['model_mb']:10.0f}"
+            f"{result['seconds'] / megabytes:9.2f}"
+            f"{full['seconds'] / result['seconds']:8.1f}x"
+            f"{result['peak_mb']:9.0f}{result['sentences']:11,}"
+        )
+    print()
+    for name, result in results.items():
+        print(f"{name}: {', '.join(result['components'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark SpacyTextSplitter chunking throughput on a large PDF.
+
+Chunks the same document three times and reports chunks/sec for each run:
+
+- legacy: token counting as it used to work, with tiktoken.encoding_for_model
+  looked up on every call and every token ID decoded back to a string just
+  to take len() of the result
+- strings: the cached encoder and count-only token API, still encoding each
+  paragraph, chunk and overlapped chunk separately
+- offsets: the single-tokenization engine (utils/token_chunking.py), which
+  encodes the document once and slices its token IDs
+
+The PDF text is extracted and assembled exactly as pdf_to_vector_db.py does
+before chunking. All runs must produce identical chunks; differences from
+the legacy run are reported. Nothing is embedded or written to Pinecone.
+
+Command Line Options:
+  --pdf PATH      PDF file to chunk (required)
+  --model MODEL   Embedding model whose tokenizer is used
+                  (default: OPENAI_INGEST_EMBEDDINGS_MODEL or text-embedding-3-large)
+  --rounds N      Timed runs per mode, best is reported (default: 3)
+
+Usage Examples:
+  python bin/benchmark_text_splitter.py --pdf ~/books/autobiography.pdf
+  python bin/benchmark_text_splitter.py --pdf big.pdf --model text-embedding-ada-002
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import tiktoken
+
+from data_ingestion.pdf_to_vector_db import PyPDFLoader, _assemble_full_document
+from data_ingestion.utils.text_splitter_utils import SpacyTextSplitter
+
+
+class LegacyTokenCountingSplitter(SpacyTextSplitter):
+    """SpacyTextSplitter with the uncached, decode-every-token counting."""
+
+    def _encode(self, text: str) -> list[int]:
+        if not text.strip():
+            return []
+        return tiktoken.encoding_for_model(self._get_embedding_model()).encode(text)
+
+    def count_tokens(self, text: str) -> int:
+        if not text.strip():
+            return 0
+        encoding = tiktoken.encoding_for_model(self._get_embedding_model())
+        return len([encoding.decode([token_id]) for token_id in encoding.encode(text)])
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare token counting and chunking engines in SpacyTextSplitter"
+    )
+    parser.add_argument("--pdf", required=True, help="PDF file to chunk")
+    parser.add_argument(
+        "--model",
+        default=os.getenv("OPENAI_INGEST_EMBEDDINGS_MODEL", "text-embedding-3-large"),
+        help="Embedding model whose tokenizer is used",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Timed runs per mode")
+    return parser.parse_args()
+
+
+def load_pdf_text(pdf_path: str) -> str:
+    """Extract and assemble a PDF's text like pdf_to_vector_db.py."""
+    document = _assemble_full_document(PyPDFLoader(pdf_path).load())
+    if document is None:
+        print(f"No text content found in {pdf_path}")
+        sys.exit(1)
+    return document.page_content
+
+
+def time_splitter(
+    splitter: SpacyTextSplitter, text: str, rounds: int
+) -> tuple[float, list[str]]:
+    """Split the text `rounds` times. Returns (best seconds, chunks)."""
+    best = float("inf")
+    chunks: list[str] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        chunks = splitter.split_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+def main() -> None:
+    args = parse_arguments()
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s - %(message)s")
+    os.environ["OPENAI_INGEST_EMBEDDINGS_MODEL"] = args.model
+
+    text = load_pdf_text(args.pdf)
+    print(f"{args.pdf}: {len(text):,} characters, best of {args.rounds} runs")
+
+    # Load spaCy and the tokenizer before timing anything
+    warmup = SpacyTextSplitter(log_summary_on_split=False)
+    warmup._ensure_nlp()
+    warmup.count_tokens("warm up")
+
+    results, timings = {}, {}
+    for name, splitter_class, engine in (
+        ("legacy", LegacyTokenCountingSplitter, "strings"),
+        ("strings", SpacyTextSplitter, "strings"),
+        ("offsets", SpacyTextSplitter, "offsets"),
+    ):
+        splitter = splitter_class(log_summary_on_split=False, chunking_engine=engine)
+        seconds, chunks = time_splitter(splitter, text, args.rounds)
+        results[name], timings[name] = chunks, seconds
+        print(
+            f"{name:<8} {len(chunks):6d} chunks in {seconds:7.2f}s = "
+            f"{len(chunks) / seconds:8.1f} chunks/sec"
+        )
+
+    for name in ("strings", "offsets"):
+        print(f"{name} speedup over legacy: {timings['legacy'] / timings[name]:.1f}x")
+        if results["legacy"] == results[name]:
+            print(f"{name} chunks identical")
+            continue
+        differing = sum(
+            old != new
+            for old, new in zip(results["legacy"], results[name], strict=False)
+        )
+        print(
+            f"{name} chunks differ: {len(results['legacy'])} vs {len(results[name])} "
+            f"chunks, {differing} differing positions"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark main-text extraction engines on a saved corpus of crawled pages.
+
+Runs clean_content with the single-pass lxml extractor and with the original
+BeautifulSoup html.parser path over the same HTML files, reports pages/sec for
+each, and lists pages where the two extract different text.
+
+The corpus is a directory of .html files. --save fills it with pages sampled
+from the site's crawl queue (fetched over plain HTTP, so pages that need
+JavaScript are saved as served), which keeps later runs repeatable and
+offline. Nothing is written to the crawl queue or Pinecone.
+
+Usage:
+    python benchmark_content_extraction.py --site ananda-public --save 200
+    python benchmark_content_extraction.py --site ananda-public --rounds 5
+    python benchmark_content_extraction.py --site ananda-public --corpus ~/pages
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.benchmark_fetch_paths import sample_visited_urls  # noqa: E402
+from crawler.website_crawler import (  # noqa: E402
+    WebsiteCrawler,
+    ensure_scheme,
+    load_config,
+)
+
+ENGINES = ("beautifulsoup", "lxml")
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare the lxml and BeautifulSoup content extractors"
+    )
+    parser.add_argument("--site", required=True, help="Site ID (e.g., ananda-public)")
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        help="Directory of .html files (default: db/extraction_corpus_<site>)",
+    )
+    parser.add_argument(
+        "--save",
+        type=int,
+        metavar="N",
+        help="First save N random visited pages from the crawl queue to the corpus",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Timed passes")
+    return parser.parse_args()
+
+
+def save_corpus(crawler: WebsiteCrawler, corpus: Path, count: int) -> None:
+    """Fetch sampled visited pages and store their HTML in the corpus."""
+    corpus.mkdir(parents=True, exist_ok=True)
+    saved = 0
+    for url in sample_visited_urls(crawler.site_id, count):
+        try:
+            response = crawler.http_session.get(ensure_scheme(url), timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            logging.warning(f"Could not fetch {url}: {e}")
+            continue
+        saved += 1
+        (corpus / f"page_{saved:05d}.html").write_text(response.text)
+    print(f"Saved {saved} pages to {corpus}")
+
+
+def time_engine(
+    crawler: WebsiteCrawler, engine: str, pages: list[str], rounds: int
+) -> tuple[float, list[str]]:
+    """Extract every page `rounds` times. Returns (best seconds, texts)."""
+    crawler.content_extractor = engine
+    best = float("inf")
+    texts: list[str] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        texts = [crawler.clean_content(html) for html in pages]
+        best = min(best, time.perf_counter() - start)
+    return best, texts
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s - %(message)s")
+    args = parse_arguments()
+    config = load_config(args.site)
+    if config is None:
+        sys.exit(1)
+
+    crawler = WebsiteCrawler(
+        args.site, config, skip_db_init=True, skip_robots_init=True
+    )
+    corpus = args.corpus or (
+        Path(__file__).resolve().parent / "db" / f"extraction_corpus_{args.site}"
+    )
+    if args.save:
+        save_corpus(crawler, corpus, args.save)
+
+    files = sorted(corpus.glob("*.html"))
+    if not files:
+        print(f"No .html files in {corpus}; run with --save N first")
+        sys.exit(1)
+    pages = [path.read_text(errors="replace") for path in files]
+    total_kb = sum(len(page) for page in pages) / 1024
+    print(f"Extracting {len(pages)} pages ({total_kb:.0f} KB), best of {args.rounds}")
+
+    results, timings = {}, {}
+    for engine in ENGINES:
+        seconds, texts = time_engine(crawler, engine, pages, args.rounds)
+        results[engine], timings[engine] = texts, seconds
+        print(
+            f"{engine:<14} {seconds:7.2f}s = {len(pages) / seconds:7.1f} pages/sec "
+            f"({seconds / len(pages) * 1000:.1f} ms/page)"
+        )
+
+    print(f"lxml speedup: {timings['beautifulsoup'] / timings['lxml']:.1f}x")
+
+    differing = [
+        path.name
+        for path, old, new in zip(
+            files, results["beautifulsoup"], results["lxml"], strict=True
+        )
+        if old != new
+    ]
+    print(f"Identical text: {len(pages) - len(differing)}/{len(pages)} pages")
+    for name in differing[:10]:
+        print(f"  differs: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark the static-HTML fetch path against the Playwright browser path.
+
+Fetches the same URLs once through each path and reports pages/sec. For the
+static path it also reports how many pages would have fallen back to the
+browser, and why. The browser path performs the same navigation and
+extraction steps as crawl_page. Nothing is written to the crawl queue or
+Pinecone.
+
+Usage:
+    python benchmark_fetch_paths.py --site ananda-public --sample 50
+    python benchmark_fetch_paths.py --site ananda-public --urls https://www.ananda.org/about/
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.queue_db import connect_read_only  # noqa: E402
+from crawler.static_fetch import (  # noqa: E402
+    DEFAULT_STATIC_FETCH_MIN_CHARS,
+    StaticFetcher,
+)
+from crawler.website_crawler import (  # noqa: E402
+    WebsiteCrawler,
+    _setup_browser,
+    ensure_scheme,
+    load_config,
+)
+from playwright.sync_api import sync_playwright  # noqa: E402
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare pages/sec of the static fetch path and the browser path"
+    )
+    parser.add_argument("--site", required=True, help="Site ID (e.g., ananda-public)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--urls", nargs="+", help="URLs to fetch")
+    source.add_argument(
+        "--sample",
+        type=int,
+        help="Fetch this many random visited URLs from the site's crawl queue",
+    )
+    parser.add_argument(
+        "--skip-browser", action="store_true", help="Only run the static path"
+    )
+    return parser.parse_args()
+
+
+def sample_visited_urls(site_id: str, count: int) -> list[str]:
+    """Pick random visited URLs from the crawl queue (read-only)."""
+    db_path = Path(__file__).resolve().parent / "db" / f"crawler_queue_{site_id}.db"
+    conn = connect_read_only(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT url FROM crawl_queue WHERE status = 'visited' "
+            "AND length(content_hash) = 64"
+        ).fetchall()
+    finally:
+        conn.close()
+    urls = [row[0] for row in rows]
+    return random.sample(urls, min(count, len(urls)))
+
+
+def run_static_path(crawler: WebsiteCrawler, urls: list[str]) -> tuple[float, int]:
+    """Fetch all URLs over HTTP. Returns (seconds, pages served without browser)."""
+    start = time.time()
+    served = 0
+    for url in urls:
+        if crawler._try_static_fetch(ensure_scheme(url)) is not None:
+            served += 1
+    return time.time() - start, served
+
+
+def run_browser_path(crawler: WebsiteCrawler, urls: list[str]) -> tuple[float, int]:
+    """Fetch all URLs with Playwright. Returns (seconds, pages extracted)."""
+    extracted = 0
+    with sync_playwright() as p:
+        browser, page = _setup_browser(p, cleanup_orphans=False)
+        try:
+            start = time.time()
+            for url in urls:
+                url = ensure_scheme(url)
+                try:
+                    page.goto(url, wait_until="commit")
+                    content, _links = crawler._extract_page_content(page, url)
+                    extracted += content is not None
+                except Exception as e:
+                    logging.warning(f"Browser fetch failed for {url}: {e}")
+            elapsed = time.time() - start
+        finally:
+            browser.close()
+    return elapsed, extracted
+
+
+def print_result(label: str, pages: int, seconds: float, detail: str) -> float:
+    rate = pages / seconds if seconds > 0 else 0.0
+    print(
+        f"{label:<8} {pages:>5} pages in {seconds:7.1f}s = {rate:6.2f} pages/sec  {detail}"
+    )
+    return rate
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+    args = parse_arguments()
+    config = load_config(args.site)
+    if config is None:
+        sys.exit(1)
+
+    urls = args.urls or sample_visited_urls(args.site, args.sample)
+    if not urls:
+        print("No URLs to benchmark")
+        sys.exit(1)
+
+    crawler = WebsiteCrawler(
+        args.site, config, skip_db_init=True, skip_robots_init=True
+    )
+    crawler.revalidator = None
+    crawler.static_fetcher = StaticFetcher(
+        crawler.http_session,
+        browser_required_patterns=config.get("browser_required_patterns", []),
+        min_chars=config.get("static_fetch_min_chars", DEFAULT_STATIC_FETCH_MIN_CHARS),
+    )
+
+    print(f"Benchmarking {len(urls)} URLs for {args.site}")
+    static_seconds, served = run_static_path(crawler, urls)
+    static_rate = print_result(
+        "static",
+        len(urls),
+        static_seconds,
+        f"({served} served, fallbacks: {crawler.static_fetcher.stats.fallbacks or 'none'})",
+    )
+
+    if args.skip_browser:
+        return
+    browser_seconds, extracted = run_browser_path(crawler, urls)
+    browser_rate = print_result(
+        "browser", len(urls), browser_seconds, f"({extracted} extracted)"
+    )
+    if browser_rate > 0:
+        print(f"Static path speedup: {static_rate / browser_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
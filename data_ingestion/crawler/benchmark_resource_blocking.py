@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark subresource blocking on crawl navigation.
+
+Loads each URL twice in Playwright, once with every request allowed and once
+with the site's resource blocking policy, and reports per page:
+
+- bytes transferred (response headers and bodies of finished requests)
+- navigation time, from goto until the load event
+- requests blocked by the policy
+
+Navigation waits for the load event rather than the crawler's "commit" so the
+time includes the subresources that blocking skips. The two runs alternate per
+URL so server caching affects both equally. Nothing is written to the crawl
+queue or Pinecone.
+
+Usage:
+    python benchmark_resource_blocking.py --site ananda-public --sample 20
+    python benchmark_resource_blocking.py --site ananda-public --urls https://www.ananda.org/about/
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.benchmark_fetch_paths import sample_visited_urls  # noqa: E402
+from crawler.browser_recycling import open_page  # noqa: E402
+from crawler.resource_blocking import (  # noqa: E402
+    ResourceBlocker,
+    ResourceBlockingPolicy,
+)
+from crawler.website_crawler import (  # noqa: E402
+    USER_AGENT,
+    _setup_browser,
+    ensure_scheme,
+    load_config,
+)
+from playwright.sync_api import sync_playwright  # noqa: E402
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare bytes and navigation time with and without "
+        "subresource blocking"
+    )
+    parser.add_argument("--site", required=True, help="Site ID (e.g., ananda-public)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--urls", nargs="+", help="URLs to load")
+    source.add_argument(
+        "--sample",
+        type=int,
+        help="Load this many random visited URLs from the site's crawl queue",
+    )
+    return parser.parse_args()
+
+
+def load_page(browser, url: str, blocker: ResourceBlocker | None) -> tuple[float, int]:
+    """Load url in a fresh context. Returns (navigation seconds, bytes transferred)."""
+    page = open_page(browser, USER_AGENT)
+    finished = []
+    page.on("requestfinished", finished.append)
+    if blocker is not None:
+        blocker.install(page)
+    try:
+        start = time.perf_counter()
+        page.goto(url, wait_until="load", timeout=60000)
+        seconds = time.perf_counter() - start
+        transferred = 0
+        for request in finished:
+            sizes = request.sizes()
+            transferred += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        return seconds, transferred
+    finally:
+        page.close()
+
+
+def print_page(url: str, full: tuple, blocked: tuple, requests_blocked: int) -> None:
+    saved_kb = (full[1] - blocked[1]) / 1024
+    print(
+        f"{full[1] / 1024:9.0f} KB -> {blocked[1] / 1024:7.0f} KB "
+        f"(-{saved_kb:7.0f} KB)  {full[0]:6.2f}s -> {blocked[0]:6.2f}s "
+        f"({blocked[0] - full[0]:+6.2f}s)  {requests_blocked:>4} blocked  {url}"
+    )
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+    args = parse_arguments()
+    config = load_config(args.site)
+    if config is None:
+        sys.exit(1)
+
+    urls = args.urls or sample_visited_urls(args.site, args.sample)
+    if not urls:
+        print("No URLs to benchmark")
+        sys.exit(1)
+
+    # Measure the configured policy even if blocking is disabled for the site
+    policy = ResourceBlockingPolicy.from_config(
+        {**config, "resource_blocking_enabled": True}
+    )
+    print(f"Benchmarking {len(urls)} URLs for {args.site}")
+    print(f"Blocking types: {sorted(policy.blocked_resource_types)} and trackers")
+    results = []
+    with sync_playwright() as p:
+        browser, page = _setup_browser(p, cleanup_orphans=False)
+        page.close()
+        try:
+            for url in urls:
+                url = ensure_scheme(url)
+                blocker = ResourceBlocker(policy)
+                try:
+                    full = load_page(browser, url, None)
+                    blocked = load_page(browser, url, blocker)
+                except Exception as e:
+                    logging.warning(f"Load failed for {url}: {e}")
+                    continue
+                requests_blocked = sum(blocker.blocked.values())
+                print_page(url, full, blocked, requests_blocked)
+                results.append((full, blocked))
+        finally:
+            browser.close()
+
+    if not results:
+        return
+    saved = [(full[1] - blocked[1]) / 1024 for full, blocked in results]
+    faster = [full[0] - blocked[0] for full, blocked in results]
+    print(
+        f"Per page: {statistics.mean(saved):.0f} KB saved on average "
+        f"(median {statistics.median(saved):.0f} KB), navigation "
+        f"{statistics.mean(faster):.2f}s faster on average "
+        f"(median {statistics.median(faster):.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark crawl_queue scheduling queries at increasing queue sizes.
+
+Builds throwaway in-memory queues with a mix of pending, due and not-yet-due
+visited URLs at several priorities, then times:
+
+- legacy: the single OR + ORDER BY query get_next_url_to_crawl used to run,
+  which sorts every candidate row on each call
+- next:   get_next_url_to_crawl() with the indexed scheduler
+- claim:  claim_next_urls(k), which hands out k URLs per transaction
+
+Nothing touches a real crawl queue.
+
+Usage:
+    python benchmark_scheduler.py
+    python benchmark_scheduler.py --sizes 1000 100000 --claim-size 8
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from functools import partial
+from os.path import abspath, dirname
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from crawler.website_crawler import WebsiteCrawler  # noqa: E402
+
+LEGACY_NEXT_URL_QUERY = """
+    SELECT url, status FROM crawl_queue
+    WHERE (
+        (status = 'pending' AND (retry_after IS NULL OR retry_after <= datetime('now')))
+        OR (status = 'visited' AND next_crawl <= datetime('now'))
+    )
+    ORDER BY
+        priority DESC,
+        CASE WHEN status = 'pending' THEN 0 ELSE 1 END,
+        last_crawl IS NULL DESC,
+        retry_count ASC,
+        next_crawl ASC,
+        url ASC
+    LIMIT 1
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time crawl_queue scheduling queries")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Queue sizes to test",
+    )
+    parser.add_argument(
+        "--calls", type=int, default=200, help="Scheduling calls timed per method"
+    )
+    parser.add_argument(
+        "--claim-size", type=int, default=4, help="URLs per claim_next_urls call"
+    )
+    return parser.parse_args()
+
+
+def build_crawler(size: int, seed: int = 42) -> WebsiteCrawler:
+    """Crawler bound to an in-memory queue holding `size` URLs."""
+    crawler = WebsiteCrawler(
+        "benchmark",
+        {"domain": "example.com"},
+        skip_db_init=True,
+        skip_robots_init=True,
+    )
+    crawler.conn = sqlite3.connect(":memory:")
+    crawler.conn.row_factory = sqlite3.Row
+    crawler.cursor = crawler.conn.cursor()
+    crawler._create_schema()
+
+    rng = random.Random(seed)
+    rows = []
+    for i in range(size):
+        roll = rng.random()
+        if roll < 0.2:
+            status, next_crawl, last_crawl = "pending", None, None
+        elif roll < 0.25:
+            status, next_crawl, last_crawl = "visited", "-1 days", "-15 days"
+        else:
+            status, next_crawl, last_crawl = "visited", "+10 days", "-4 days"
+        priority = rng.choice([0, 0, 0, 0, 1, 2])
+        rows.append(
+            (f"https://example.com/page/{i}", status, priority, next_crawl, last_crawl)
+        )
+    crawler.cursor.executemany(
+        """
+        INSERT INTO crawl_queue (url, status, priority, next_crawl, last_crawl)
+        VALUES (?, ?, ?, datetime('now', ?), datetime('now', ?))
+        """,
+        rows,
+    )
+    crawler.conn.commit()
+    return crawler
+
+
+def time_calls(calls: int, fn) -> float:
+    """Average milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main() -> None:
+    args = parse_arguments()
+    print(f"{'rows':>8} {'legacy ms':>10} {'next ms':>10} {'claim ms':>10} per URL")
+    for size in args.sizes:
+        crawler = build_crawler(size)
+        legacy_ms = time_calls(
+            args.calls, partial(crawler.cursor.execute, LEGACY_NEXT_URL_QUERY)
+        )
+
+        # get_next_url_to_crawl resets due re-crawls to pending, so the queue
+        # is rebuilt before each stateful method
+        crawler = build_crawler(size)
+        next_ms = time_calls(args.calls, crawler.get_next_url_to_crawl)
+
+        crawler = build_crawler(size)
+        claim_ms = time_calls(
+            args.calls, partial(crawler.claim_next_urls, args.claim_size)
+        )
+        print(
+            f"{size:>8} {legacy_ms:>10.3f} {next_ms:>10.3f} "
+            f"{claim_ms / args.claim_size:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
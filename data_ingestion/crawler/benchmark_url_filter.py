@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the crawler's per-link URL checks.
+
+Runs should_skip_url + is_valid_url over a link corpus shaped like a crawl of
+a WordPress site: every page repeats the same header/footer nav, then adds its
+own article links, media files, feeds and external links. It compares the
+precompiled UrlFilter path with the previous implementation, which is kept
+below. robots.txt is parsed from a local WordPress-style file, so no network
+is needed.
+
+With --site, the site's skip_patterns and up to --pages real queue URLs are
+used (read-only) instead of synthetic article links.
+
+Usage:
+    python benchmark_url_filter.py
+    python benchmark_url_filter.py --site ananda-public --pages 2000
+"""
+
+import argparse
+import logging
+import random
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from os.path import abspath, dirname
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from crawler.queue_db import connect_read_only  # noqa: E402
+from crawler.website_crawler import (  # noqa: E402
+    USER_AGENT,
+    WebsiteCrawler,
+    load_config,
+)
+
+DOMAIN = "example.com"
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /wp-admin/
+Allow: /wp-admin/admin-ajax.php
+Disallow: /search/
+Disallow: /cart/
+Disallow: /checkout/
+Disallow: /my-account/
+Disallow: /*?s=
+Sitemap: https://example.com/sitemap_index.xml
+"""
+
+DEFAULT_SKIP_PATTERNS = [
+    "^/search/",
+    "^/login/",
+    "^/cart/",
+    "^/account/",
+    "^/checkout/",
+    "^/wp-admin/",
+    "/autobiography$",
+    r"\?replytocom=",
+]
+
+LEGACY_SKIP_EXTENSIONS = [
+    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".pdf", ".doc", ".docx", ".xls",
+    ".xlsx", ".zip", ".rar", ".mp3", ".mp4", ".m4a", ".wav", ".aac", ".avi",
+    ".mov", ".wmv", ".flv", ".webp", ".rss", ".xml", ".ico", ".css", ".js",
+    ".woff", ".woff2", ".ttf", ".eot",
+]  # fmt: skip
+
+
+def legacy_should_skip_url(crawler: WebsiteCrawler, url: str) -> bool:
+    """should_skip_url before UrlFilter."""
+    if any(re.search(pattern, url) for pattern in crawler.skip_patterns):
+        return True
+    query_params = urlparse(url).query.lower()
+    calendar_params = ["ical", "ical=1", "export", "format=ical", "format=ics"]
+    return any(param in query_params for param in calendar_params)
+
+
+def legacy_is_valid_url(crawler: WebsiteCrawler, url: str) -> bool:
+    """is_valid_url before UrlFilter."""
+    parsed = urlparse(url)
+    domain = parsed.netloc.replace("www.", "")
+    path = parsed.path.lower()
+    if domain != crawler.domain:
+        logging.debug(f"Skipping external domain: {domain}")
+        return False
+    crawler._ensure_robots_cache_fresh()
+    if not crawler.robots_parser.can_fetch(USER_AGENT, url):
+        logging.debug(f"Robots.txt disallows crawling: {url}")
+        return False
+    if parsed.scheme not in ["http", "https"]:
+        return False
+    skip_extensions = list(LEGACY_SKIP_EXTENSIONS)  # rebuilt per call, as before
+    if (
+        any(path.endswith(ext) for ext in skip_extensions)
+        or "/feed/" in path
+        or "/wp-content/uploads/" in path
+        or "/wp-includes/" in path
+        or "/wp-admin/" in path
+    ):
+        logging.debug(f"Skipping non-HTML content: {url}")
+        return False
+    if not parsed.path or parsed.path == "/":
+        logging.debug(f"Skipping root or anchor-only URL: {url}")
+        return False
+    return True
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time per-link URL filtering")
+    parser.add_argument("--site", help="Use this site's skip patterns and queue URLs")
+    parser.add_argument("--pages", type=int, default=1000, help="Pages in the corpus")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed passes")
+    return parser.parse_args()
+
+
+def queue_urls(site_id: str, limit: int) -> list[str]:
+    """Real URLs from the site's crawl queue (read-only), if it exists."""
+    db_path = Path(__file__).resolve().parent / "db" / f"crawler_queue_{site_id}.db"
+    try:
+        conn = connect_read_only(db_path)
+    except sqlite3.OperationalError:
+        print(f"No crawl queue at {db_path}, using synthetic article links")
+        return []
+    try:
+        rows = conn.execute("SELECT url FROM crawl_queue LIMIT ?", (limit,)).fetchall()
+    finally:
+        conn.close()
+    return [f"https://{row[0]}" for row in rows]
+
+
+def build_corpus(domain: str, pages: int, articles: list[str]) -> list[str]:
+    """Links as extracted from `pages` pages, nav repeated on every page."""
+    rng = random.Random(42)
+    base = f"https://www.{domain}"
+    nav = [f"{base}/{section}/" for section in ("about", "events", "blog", "donate")]
+    nav += [f"{base}/topics/{i}/" for i in range(80)]
+    nav += [f"{base}/search/", f"{base}/cart/", f"{base}/feed/", f"{base}/"]
+    nav += ["https://www.facebook.com/share", "mailto:info@example.com"]
+    links = []
+    for page in range(pages):
+        links.extend(nav)
+        links.extend(rng.sample(articles, min(20, len(articles))))
+        links.append(f"{base}/wp-content/uploads/2024/05/photo-{page}.jpg")
+        links.append(f"{base}/events/{page}/?ical=1")
+        links.append(f"{base}/talks/{page}.mp3")
+    return links
+
+
+def time_pass(links: list[str], skip, valid) -> tuple[float, int]:
+    start = time.perf_counter()
+    kept = sum(1 for link in links if valid(link) and not skip(link))
+    return time.perf_counter() - start, kept
+
+
+def main() -> None:
+    args = parse_arguments()
+    config = {"domain": DOMAIN, "skip_patterns": DEFAULT_SKIP_PATTERNS}
+    articles = []
+    if args.site:
+        config = load_config(args.site)
+        if config is None:
+            sys.exit(1)
+        articles = queue_urls(args.site, args.pages * 5)
+    domain = config["domain"]
+    articles = articles or [
+        f"https://{domain}/blog/post-{i}/" for i in range(args.pages * 5)
+    ]
+
+    crawler = WebsiteCrawler(
+        args.site or "benchmark", config, skip_db_init=True, skip_robots_init=True
+    )
+    crawler.robots_parser = RobotFileParser()
+    crawler.robots_parser.parse(ROBOTS_TXT.replace(DOMAIN, crawler.domain).split("\n"))
+    crawler.robots_cache_timestamp = datetime.now()
+
+    links = build_corpus(crawler.domain, args.pages, articles)
+    print(f"{len(links)} links from {args.pages} pages")
+
+    legacy = [
+        time_pass(
+            links,
+            lambda u: legacy_should_skip_url(crawler, u),
+            lambda u: legacy_is_valid_url(crawler, u),
+        )
+        for _ in range(args.rounds)
+    ]
+    current = [
+        time_pass(links, crawler.should_skip_url, crawler.is_valid_url)
+        for _ in range(args.rounds)
+    ]
+    if {kept for _, kept in legacy} != {kept for _, kept in current}:
+        print("WARNING: legacy and current filters kept different link counts")
+
+    for label, runs in (("legacy", legacy), ("current", current)):
+        best = min(seconds for seconds, _ in runs)
+        print(
+            f"{label:<8} {best * 1e6 / len(links):6.2f} us/link "
+            f"({runs[0][1]} kept, best of {args.rounds})"
+        )
+    robots = crawler.url_filter.robots
+    print(f"robots.txt decisions reused: {robots.hits}/{robots.hits + robots.misses}")
+
+
+if __name__ == "__main__":
+    main()
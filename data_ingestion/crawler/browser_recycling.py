@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+"""
+Browser context recycling for the website crawler.
+
+The crawler used to relaunch Firefox every 50 pages and after every page
+error. A relaunch kills orphaned processes, waits for resources to recover
+and starts a new browser, which costs tens of seconds each time. Most of the
+memory a long crawl accumulates belongs to page state (DOM, JS heap, caches)
+in the browser context, not to the browser process itself:
+
+- Each page lives in its own browser context. browser.new_page() creates one,
+  and closing the page closes it.
+- recycle_page swaps in a fresh context on the same browser. It takes well
+  under a second.
+- BrowserMemoryBudget triggers a recycle early when a browser's Firefox
+  processes grow past a memory limit. The limit is per browser: concurrent
+  workers each start their own Playwright driver (start_playwright) and
+  measure only the Firefox processes under it.
+- Full browser restarts are left for real crashes: a disconnected browser or
+  a recycle that fails.
+
+BrowserRecycleStats counts recycles and restarts and the time each cost.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_CONTEXT_MAX_PAGES = 50
+DEFAULT_BROWSER_MAX_MEMORY_MB = 2048
+MEMORY_CHECK_INTERVAL_SECONDS = 10.0
+
+
+def open_page(browser, user_agent: str):
+    """Open a page in a new browser context and check that it responds."""
+    page = browser.new_page()
+    try:
+        page.set_extra_http_headers({"User-Agent": user_agent})
+        if page.evaluate("() => 'browser_ready'") != "browser_ready":
+            raise RuntimeError("Browser page not responsive to JavaScript")
+    except Exception:
+        with suppress(Exception):
+            page.close()
+        raise
+    return page
+
+
+def recycle_page(browser, page, user_agent: str):
+    """Close a page with its browser context and open a fresh one.
+
+    Raises if the browser can no longer open pages; the caller should then
+    restart the browser.
+    """
+    if page is not None:
+        with suppress(Exception):
+            page.close()
+    return open_page(browser, user_agent)
+
+
+# Serializes driver starts so each one's process can be told apart
+_DRIVER_START_LOCK = threading.Lock()
+
+
+def _child_pids() -> set[int]:
+    if psutil is None:
+        return set()
+    try:
+        return {child.pid for child in psutil.Process().children()}
+    except psutil.Error:
+        return set()
+
+
+def start_playwright(playwright_factory: Callable) -> tuple:
+    """Start a Playwright driver. Returns (playwright, driver process ID).
+
+    playwright_factory is sync_playwright. The driver is a child process of
+    this one, and the browsers it launches run under it, so the ID scopes
+    browser_memory_mb to this driver's browsers. It is None when psutil is
+    unavailable or the new process can't be told apart.
+    """
+    with _DRIVER_START_LOCK:
+        before = _child_pids()
+        playwright = playwright_factory().start()
+        started = _child_pids() - before
+    return playwright, started.pop() if len(started) == 1 else None
+
+
+def browser_memory_mb(pid: int | None = None) -> float | None:
+    """Resident memory of the Firefox processes under pid (default: this process).
+
+    Returns None when psutil is unavailable.
+    """
+    if psutil is None:
+        return None
+    try:
+        children = psutil.Process(pid or os.getpid()).children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for child in children:
+        try:
+            if "firefox" in child.name().lower():
+                total += child.memory_info().rss
+        except psutil.Error:
+            continue  # Process exited while we were looking
+    return total / 1024**2
+
+
+class BrowserMemoryBudget:
+    """Decides when browser memory use calls for a context recycle."""
+
+    def __init__(
+        self,
+        max_memory_mb: float | None = DEFAULT_BROWSER_MAX_MEMORY_MB,
+        memory_fn: Callable[[], float | None] = browser_memory_mb,
+        check_interval_seconds: float = MEMORY_CHECK_INTERVAL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_memory_mb = max_memory_mb
+        self.memory_fn = memory_fn
+        self.check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self._checked_at: float | None = None
+
+    def exceeded(self) -> float | None:
+        """Browser memory in MB if it is over budget, otherwise None.
+
+        Memory is measured at most once per check interval, so a reading that
+        stays over budget right after a recycle doesn't trigger another one.
+        """
+        if not self.max_memory_mb:
+            return None
+        now = self._clock()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self.check_interval_seconds
+        ):
+            return None
+        self._checked_at = now
+        memory_mb = self.memory_fn()
+        if memory_mb is not None and memory_mb > self.max_memory_mb:
+            return memory_mb
+        return None
+
+
+@dataclass
+class BrowserRecycleStats:
+    """Counts context recycles and browser restarts and the time they took."""
+
+    context_recycles: int = 0
+    recycle_seconds: float = 0.0
+    browser_restarts: int = 0
+    restart_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_recycle(self, seconds: float) -> None:
+        with self._lock:
+            self.context_recycles += 1
+            self.recycle_seconds += seconds
+
+    def record_restart(self, seconds: float) -> None:
+        with self._lock:
+            self.browser_restarts += 1
+            self.restart_seconds += seconds
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        avg_recycle = (
+            self.recycle_seconds / self.context_recycles if self.context_recycles else 0
+        )
+        return (
+            f"Browser: {self.context_recycles} context recycles "
+            f"({self.recycle_seconds:.1f}s, avg {avg_recycle:.2f}s), "
+            f"{self.browser_restarts} full restarts ({self.restart_seconds:.1f}s lost)"
+        )
+
+
+def recycle_or_relaunch(
+    browser,
+    page,
+    user_agent: str,
+    relaunch: Callable[[], tuple],
+    stats: BrowserRecycleStats,
+) -> tuple:
+    """Give the crawl a fresh page, relaunching the browser only if needed.
+
+    relaunch closes the old browser and returns a new (browser, page). It is
+    used when the browser has disconnected or can't open a new context.
+    Returns (browser, page, relaunched).
+    """
+    start = time.perf_counter()
+    if browser is not None and browser.is_connected():
+        try:
+            page = recycle_page(browser, page, user_agent)
+            stats.record_recycle(time.perf_counter() - start)
+            return browser, page, False
+        except Exception as e:
+            logging.warning(f"Browser context recycle failed, restarting browser: {e}")
+    browser, page = relaunch()
+    stats.record_restart(time.perf_counter() - start)
+    return browser, page, True
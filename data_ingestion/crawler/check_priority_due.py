@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """
 Script to check how many pages with different priorities are due for re-crawling.
-This helps understand the current state of the crawl queue.
+This helps understand the current state of the crawl queue. It opens the queue
+read-only, so it can run while the crawler daemon is writing to it.
 
 Usage:
     python check_priority_due.py --site ananda-public
 """
 
 import argparse
+import os
 import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.queue_db import connect_read_only  # noqa: E402
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -46,7 +52,7 @@ def check_priority_due_counts(site_id: str):
         return
 
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = connect_read_only(db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
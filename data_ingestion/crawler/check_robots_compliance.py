@@ -6,15 +6,21 @@ and didn't crawl any disallowed URLs.
 
 import argparse
 import logging
+import os
 import sqlite3
 import subprocess
 import sys
+from contextlib import closing
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
 import requests
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.queue_db import DEFAULT_BUSY_TIMEOUT_MS, connect_read_only  # noqa: E402
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -187,7 +193,8 @@ def get_crawled_urls(site_id: str) -> list:
         sys.exit(1)
 
     urls = []
-    with sqlite3.connect(db_file) as conn:
+    # Read-only, so the check never blocks the crawler daemon
+    with closing(connect_read_only(db_file)) as conn:
         cursor = conn.cursor()
 
         # Get all URLs that have been successfully processed (visited status)
@@ -329,7 +336,8 @@ def clean_disallowed_urls(site_id: str, violations: list) -> None:
         return
 
     try:
-        with sqlite3.connect(db_file) as conn:
+        # Wait for the crawler's grouped commits instead of failing as locked
+        with sqlite3.connect(db_file, timeout=DEFAULT_BUSY_TIMEOUT_MS / 1000) as conn:
             cursor = conn.cursor()
             removed_count = 0
 
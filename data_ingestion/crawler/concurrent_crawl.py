@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+"""
+Concurrent multi-page crawl workers for the website crawler.
+
+The single-page loop in website_crawler.py waits for navigation, chunking,
+embedding, upserting and a global crawl delay before it starts the next URL.
+This module lets several browser pages fetch at the same time:
+
+- Each worker thread owns its own crawl session (Playwright driver, browser,
+  page and SQLite connection), because Playwright's sync API and sqlite3
+  connections are bound to the thread that created them.
+- The main thread claims URLs from crawl_queue and hands them to the workers
+  through a bounded task queue, then processes finished pages from a result
+  queue, so chunking/embedding/upserting stays on the crawler's own connection.
+- Politeness is enforced per host instead of with a global sleep: requests to
+  the same host are spaced at least ``min_interval_seconds`` apart no matter
+  which worker issues them, while different hosts do not wait on each other.
+- Every worker keeps its own stats so throughput can be reported as
+  pages/minute per worker.
+- After a page budget, an optional per-session check (e.g. the memory of its
+  browser) or a failed page, a worker asks its session for a fresh page. The session
+  recycles its browser context and relaunches the browser only if it crashed.
+- A worker whose session can't be created or whose loop fails hands its
+  current URL back as a failed result. When the last worker stops, queued URLs
+  are handed back the same way, so the main thread never waits on URLs no
+  worker will fetch.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+from urllib.parse import urlparse
+
+# How often the main loop logs the per-worker throughput report
+WORKER_REPORT_INTERVAL_SECONDS = 300  # 5 minutes
+
+
+def host_key(url: str) -> str:
+    """Return the politeness key for a URL (lowercased host without www.)."""
+    netloc = urlparse(url).netloc.lower()
+    if not netloc:
+        # Queue URLs are stored without a scheme (e.g. 'example.com/path')
+        netloc = url.split("/", 1)[0].lower()
+    return netloc.removeprefix("www.")
+
+
+class HostPolitenessBudget:
+    """Per-host request spacing shared by all crawl workers.
+
+    Each call to reserve() books the next free request slot for the URL's host
+    and returns how long the caller has to wait before using it. Slots for one
+    host are at least ``min_interval_seconds`` apart, so N workers hitting the
+    same host never exceed the configured request rate, while workers on
+    different hosts proceed independently.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval_seconds = max(0.0, float(min_interval_seconds))
+        self._clock = clock
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """Book the next request slot for the URL's host and return the wait in seconds."""
+        host = host_key(url)
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval_seconds
+            return slot - now
+
+    def wait(self, url: str, stop_event: threading.Event | None = None) -> float:
+        """Block until the URL's host may be requested again. Returns seconds waited."""
+        delay = self.reserve(url)
+        if delay > 0:
+            if stop_event is not None:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+        return delay
+
+
+@dataclass
+class WorkerStats:
+    """Throughput counters for one crawl worker."""
+
+    worker_id: int
+    started_at: float = field(default_factory=time.time)
+    pages_processed: int = 0
+    pages_failed: int = 0
+    fetch_seconds: float = 0.0
+    politeness_wait_seconds: float = 0.0
+    browser_restarts: int = 0
+    context_recycles: int = 0
+
+    def record_page(self, success: bool) -> None:
+        """Record the outcome of a page handed back by this worker."""
+        if success:
+            self.pages_processed += 1
+        else:
+            self.pages_failed += 1
+
+    def pages_per_minute(self, now: float | None = None) -> float:
+        """Return successfully processed pages per minute since the worker started."""
+        elapsed = (now if now is not None else time.time()) - self.started_at
+        if elapsed <= 0:
+            return 0.0
+        return self.pages_processed / (elapsed / 60)
+
+    def summary(self, now: float | None = None) -> str:
+        """Return a one-line summary suitable for logging."""
+        attempts = self.pages_processed + self.pages_failed
+        avg_fetch = self.fetch_seconds / attempts if attempts else 0.0
+        return (
+            f"Worker {self.worker_id}: {self.pages_per_minute(now):.1f} pages/minute, "
+            f"{self.pages_processed} processed, {self.pages_failed} failed, "
+            f"avg fetch {avg_fetch:.1f}s, politeness wait "
+            f"{self.politeness_wait_seconds:.1f}s, {self.context_recycles} context "
+            f"recycles, {self.browser_restarts} browser restarts"
+        )
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of one page fetched by a worker."""
+
+    worker_id: int
+    url: str
+    content: Any
+    links: list[str]
+    restart_needed: bool
+    fetch_seconds: float
+
+
+def _failed_result(worker_id: int, url: str) -> CrawlResult:
+    """Result for a URL that was never fetched, so it is put back in the queue."""
+    return CrawlResult(
+        worker_id=worker_id,
+        url=url,
+        content=None,
+        links=[],
+        restart_needed=True,
+        fetch_seconds=0.0,
+    )
+
+
+class CrawlSession(Protocol):
+    """Per-worker fetch session. Created, used and closed on the worker thread."""
+
+    def crawl(self, url: str) -> tuple[Any, list[str], bool]: ...
+
+    def recycle(self) -> bool:
+        """Replace the page. Returns True if the browser had to be relaunched."""
+        ...
+
+    def close(self) -> None: ...
+
+
+class CrawlWorkerPool:
+    """Pool of worker threads that fetch queued URLs through their own sessions.
+
+    The caller submits URLs with submit() and drains CrawlResult objects with
+    get_result(). The task queue is bounded to one pending URL per worker so
+    the main thread never claims far more URLs than the workers can start.
+    URLs no worker is left to fetch come back as results with no content and
+    restart_needed set.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        session_factory: Callable[[int], CrawlSession],
+        politeness: HostPolitenessBudget,
+        pages_per_restart: int = 50,
+        recycle_due: Callable[[CrawlSession], bool] | None = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.num_workers = num_workers
+        self.politeness = politeness
+        self.pages_per_restart = pages_per_restart
+        self.recycle_due = recycle_due
+        self.stats = {i: WorkerStats(worker_id=i) for i in range(num_workers)}
+        self._session_factory = session_factory
+        self._tasks: queue.Queue = queue.Queue(maxsize=num_workers)
+        self._results: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._in_flight = 0
+        self._live_workers = 0
+        self._in_flight_lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted URLs whose results have not been collected yet."""
+        with self._in_flight_lock:
+            return self._in_flight
+
+    @property
+    def alive_workers(self) -> int:
+        """Number of workers that haven't stopped."""
+        with self._in_flight_lock:
+            return self._live_workers
+
+    def has_capacity(self) -> bool:
+        """True if another URL can be submitted without waiting behind a busy worker."""
+        return self.in_flight < self.num_workers and self.alive_workers > 0
+
+    def start(self) -> None:
+        """Start all worker threads."""
+        with self._in_flight_lock:
+            self._live_workers = self.num_workers
+        for worker_id in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                args=(worker_id,),
+                name=f"crawl-worker-{worker_id}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+        logging.info(f"Started {self.num_workers} crawl workers")
+
+    def submit(self, url: str) -> None:
+        """Queue a URL for the next free worker."""
+        with self._in_flight_lock:
+            self._in_flight += 1
+        self._tasks.put(url)
+        if self.alive_workers == 0:
+            # The last worker stopped before this URL was queued
+            self._fail_queued_tasks(worker_id=0)
+
+    def get_result(self, timeout: float = 1.0) -> CrawlResult | None:
+        """Return the next finished page, or None if nothing finished within timeout."""
+        try:
+            result = self._results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._in_flight_lock:
+            self._in_flight -= 1
+        return result
+
+    def shutdown(self, timeout: float = 60.0) -> list[str]:
+        """Stop the workers and return URLs that were submitted but never started."""
+        self._stop.set()
+        abandoned = []
+        while True:
+            try:
+                abandoned.append(self._tasks.get_nowait())
+            except queue.Empty:
+                break
+        deadline = time.time() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.time()))
+        still_running = [t.name for t in self._threads if t.is_alive()]
+        if still_running:
+            logging.warning(
+                f"Crawl workers still running after shutdown timeout: {still_running}"
+            )
+        return abandoned
+
+    def log_worker_stats(self) -> None:
+        """Log pages/minute and counters for every worker."""
+        now = time.time()
+        for worker_id in sorted(self.stats):
+            logging.info(self.stats[worker_id].summary(now))
+
+    def _fail_queued_tasks(self, worker_id: int) -> None:
+        """Hand every queued URL back as a failed result of worker_id."""
+        failed = 0
+        while True:
+            try:
+                url = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            self._results.put(_failed_result(worker_id, url))
+            failed += 1
+        if failed:
+            logging.warning(f"No crawl workers left for {failed} queued URLs")
+
+    def _worker_stopped(self, worker_id: int) -> None:
+        """Count a stopped worker; the last one fails the URLs still queued."""
+        with self._in_flight_lock:
+            self._live_workers -= 1
+            last = self._live_workers == 0
+        if last and not self._stop.is_set():
+            self._fail_queued_tasks(worker_id)
+
+    def _fetch(self, worker_id: int, session: CrawlSession, url: str) -> CrawlResult:
+        """Crawl one URL with the worker's session. A crawl error flags a restart."""
+        fetch_start = time.time()
+        try:
+            content, links, restart_needed = session.crawl(url)
+        except Exception as e:
+            logging.error(f"Worker {worker_id} failed crawling {url}: {e}")
+            content, links, restart_needed = None, [], True
+        fetch_seconds = time.time() - fetch_start
+        self.stats[worker_id].fetch_seconds += fetch_seconds
+        return CrawlResult(
+            worker_id=worker_id,
+            url=url,
+            content=content,
+            links=links,
+            restart_needed=restart_needed,
+            fetch_seconds=fetch_seconds,
+        )
+
+    def _worker_loop(self, worker_id: int) -> None:
+        """Fetch URLs from the task queue until the pool is stopped."""
+        stats = self.stats[worker_id]
+        session = None
+        url = None
+        pages_since_restart = 0
+
+        try:
+            session = self._session_factory(worker_id)
+            while not self._stop.is_set():
+                try:
+                    url = self._tasks.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                stats.politeness_wait_seconds += self.politeness.wait(url, self._stop)
+                if self._stop.is_set():
+                    # The URL stays 'pending' in crawl_queue and is claimed next run
+                    break
+
+                result = self._fetch(worker_id, session, url)
+                self._results.put(result)
+                url = None
+
+                pages_since_restart += 1
+                if (
+                    result.restart_needed
+                    or pages_since_restart >= self.pages_per_restart
+                    or (self.recycle_due is not None and self.recycle_due(session))
+                ):
+                    logging.info(
+                        f"Worker {worker_id} recycling browser page after {pages_since_restart} pages"
+                    )
+                    if session.recycle():
+                        stats.browser_restarts += 1
+                    else:
+                        stats.context_recycles += 1
+                    pages_since_restart = 0
+        except Exception as e:
+            logging.error(f"Crawl worker {worker_id} stopped unexpectedly: {e}")
+            if url is not None:
+                self._results.put(_failed_result(worker_id, url))
+        finally:
+            if session is not None:
+                try:
+                    session.close()
+                except Exception as close_err:
+                    logging.warning(
+                        f"Error closing session for worker {worker_id}: {close_err}"
+                    )
+            self._worker_stopped(worker_id)
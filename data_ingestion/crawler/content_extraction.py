@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+"""
+Single-pass main-text extraction for crawled HTML.
+
+WebsiteCrawler.clean_content used to parse every page with BeautifulSoup's
+pure-Python html.parser and then run several soup.select passes: one to find
+and decompose headers, footers, navs, scripts, styles, iframes and sidebars,
+and another to pick the main content area. When no content area matched,
+readability parsed the raw HTML a second time.
+
+extract_main_text gets the same text with one lxml parse and one tree walk:
+
+- Pruned elements (PRUNED_TAGS, class "sidebar") and <template> contents,
+  which get_text leaves out, are skipped, subtree and all. Their tail text,
+  which belongs to the parent, is kept.
+- The first element in document order that matches the main-content
+  selectors (main, article, .content, #content, .entry-content,
+  .main-content, .post-content) supplies the text. The walk stops when that
+  element closes.
+- Body text is collected until then, in case no content area matches.
+- The tree is never modified, so readability gets the parsed document
+  instead of re-parsing the HTML.
+
+Text nodes are joined with single spaces and whitespace is collapsed, which
+matches get_text(separator=" ", strip=True) followed by the crawler's
+whitespace normalization. benchmark_content_extraction.py compares speed and
+output with the BeautifulSoup path on a saved corpus of pages.
+
+The two parsers still differ on some malformed markup. lxml drops CDATA
+sections in HTML, and it merges text split by stray end tags (e.g. "a</div>b"
+inside an unclosed <main>) into one text node, so no space separates the
+pieces. html.parser keeps both.
+"""
+
+import logging
+import re
+
+import lxml.html
+from lxml import etree
+from readability import Document
+
+PRUNED_TAGS = frozenset({"header", "footer", "nav", "script", "style", "iframe"})
+# Not pruned by the BeautifulSoup path, but get_text skips template strings
+UNRENDERED_TAGS = frozenset({"template"})
+PRUNED_CLASSES = frozenset({"sidebar"})
+
+MAIN_CONTENT_TAGS = frozenset({"main", "article"})
+MAIN_CONTENT_CLASSES = frozenset(
+    {"content", "entry-content", "main-content", "post-content"}
+)
+MAIN_CONTENT_IDS = frozenset({"content"})
+
+# content_extractor setting: "lxml" (this module) or "beautifulsoup" (the
+# original html.parser path in WebsiteCrawler)
+DEFAULT_CONTENT_EXTRACTOR = "lxml"
+
+_WHITESPACE = re.compile(r"\s+")
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _normalize(pieces: list[str]) -> str:
+    return _WHITESPACE.sub(" ", " ".join(pieces)).strip()
+
+
+def _classes(element) -> set[str]:
+    class_attr = element.get("class")
+    return set(class_attr.split()) if class_attr else set()
+
+
+def _is_pruned(element) -> bool:
+    return (
+        element.tag in PRUNED_TAGS
+        or element.tag in UNRENDERED_TAGS
+        or not PRUNED_CLASSES.isdisjoint(_classes(element))
+    )
+
+
+def _is_main_content(element) -> bool:
+    return (
+        element.tag in MAIN_CONTENT_TAGS
+        or element.get("id") in MAIN_CONTENT_IDS
+        or not MAIN_CONTENT_CLASSES.isdisjoint(_classes(element))
+    )
+
+
+def parse_html(html_content: str):
+    """Parse a page into an lxml tree, or None if there is nothing to parse."""
+    if not html_content or not html_content.strip():
+        return None
+    try:
+        # Bytes, so pages starting with an XML encoding declaration parse too
+        return lxml.html.document_fromstring(
+            html_content.encode("utf-8", errors="replace"), parser=_HTML_PARSER
+        )
+    except (etree.ParserError, ValueError) as e:
+        logging.warning(f"Could not parse HTML: {e}")
+        return None
+
+
+class _TextWalk:
+    """State of one walk_text pass: the content area, body and text so far."""
+
+    def __init__(self):
+        self.main = self.body = None
+        self.in_main = False
+        self.main_pieces: list[str] = []
+        self.body_pieces: list[str] = []
+
+    def add(self, text: str | None) -> None:
+        if text:
+            if self.in_main:
+                self.main_pieces.append(text)
+            if self.body is not None:
+                self.body_pieces.append(text)
+
+    def open(self, element) -> None:
+        if self.body is None and element.tag == "body":
+            self.body = element
+        if self.main is None and _is_main_content(element):
+            self.main = element
+            self.in_main = True
+        self.add(element.text)
+
+    def close(self, element) -> bool:
+        """Handle a closing tag, comment or PI; True when the walk can stop."""
+        if element is self.main:
+            if _normalize(self.main_pieces):
+                return True
+            # Empty content area: keep collecting body text for the fallback
+            self.in_main = False
+        elif element is self.body:
+            return True
+        # Only the tail text belongs to the surrounding content
+        self.add(element.tail)
+        return False
+
+
+def walk_text(root) -> tuple[str, str]:
+    """Return (main content text, body text) from one walk over the tree.
+
+    Body text is only complete when no main content area was found (or it
+    was empty); otherwise the walk stops as soon as the content area closes.
+    """
+    state = _TextWalk()
+    walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+    for event, element in walker:
+        if event != "start":
+            if state.close(element):
+                break
+        elif _is_pruned(element):
+            walker.skip_subtree()
+        else:
+            state.open(element)
+    return _normalize(state.main_pieces), _normalize(state.body_pieces)
+
+
+def readability_text(root) -> str:
+    """Main text according to readability, or "" if it fails."""
+    try:
+        summary_html = Document(root).summary()
+        summary = lxml.html.document_fromstring(summary_html)
+        return _normalize(list(summary.itertext()))
+    except Exception as e:
+        logging.error(f"Readability fallback failed: {e}")
+        return ""
+
+
+def extract_main_text(html_content: str) -> str:
+    """Extract a page's main text: content area, then readability, then body."""
+    root = parse_html(html_content)
+    if root is None:
+        return ""
+    return main_text(root)
+
+
+def main_text(root) -> str:
+    """extract_main_text for a page parse_html already parsed.
+
+    readability may modify the tree, so read anything else from it first.
+    """
+    text, body_text = walk_text(root)
+    if text:
+        return text
+
+    logging.warning("No specific content area found, attempting readability fallback")
+    return readability_text(root) or body_text
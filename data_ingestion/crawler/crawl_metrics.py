@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+Throughput and latency metrics for the website crawler.
+
+The daemon logs pages/minute at the end of a run, but nothing shows where a
+long-running crawl spends its time. CrawlMetrics records:
+
+- A latency histogram per crawl stage: browser navigation (goto), waiting for
+  the page to be ready, menu expansion, extraction, chunking, embedding,
+  Pinecone upsert and SQLite commits.
+- Pages processed in total and over the last few minutes.
+
+The crawler writes the metrics, together with queue depth by status, to a
+Prometheus text-format file (see write_textfile). The file can be read
+directly, or exported with node_exporter's textfile collector. It is replaced
+atomically, so readers never see a partial file.
+
+Stages are timed from worker and pipeline threads, so recording is
+thread-safe. Queue depth is passed in by the caller, which owns the database
+connection.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+STAGES = (
+    "goto",
+    "page_ready",
+    "menu_expansion",
+    "extraction",
+    "chunking",
+    "embedding",
+    "upsert",
+    "db_commit",
+)
+
+# Upper bounds in seconds; SQLite commits sit at the low end, navigation and
+# embedding calls at the high end
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+DEFAULT_METRICS_INTERVAL_SECONDS = 60
+PAGES_PER_MINUTE_WINDOW_SECONDS = 300
+
+METRIC_PREFIX = "crawler"
+
+
+class StageHistogram:
+    """Cumulative latency histogram for one stage (not thread-safe by itself)."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+
+
+class CrawlMetrics:
+    """Stage latencies and page throughput, rendered in Prometheus text format."""
+
+    def __init__(
+        self,
+        site_id: str,
+        window_seconds: float = PAGES_PER_MINUTE_WINDOW_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.site_id = site_id
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._histograms = {stage: StageHistogram() for stage in STAGES}
+        self._page_times: deque[float] = deque()
+        self.pages_total = 0
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record one duration for a stage from STAGES."""
+        with self._lock:
+            self._histograms[stage].observe(seconds)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time the body of a with-block as one observation of `stage`.
+
+        Failed calls are recorded too; slow timeouts are part of the picture.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def record_page(self) -> None:
+        """Count one processed page."""
+        now = self._clock()
+        with self._lock:
+            self.pages_total += 1
+            self._page_times.append(now)
+            self._trim(now)
+
+    def pages_per_minute(self) -> float:
+        """Pages processed per minute over the recent window."""
+        now = self._clock()
+        with self._lock:
+            self._trim(now)
+            return len(self._page_times) * 60 / self.window_seconds
+
+    def _trim(self, now: float) -> None:
+        while self._page_times and now - self._page_times[0] > self.window_seconds:
+            self._page_times.popleft()
+
+    def render(self, queue_depth: dict[str, int] | None = None) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        site = _label_value(self.site_id)
+        name = f"{METRIC_PREFIX}_stage_duration_seconds"
+        lines = [
+            f"# HELP {name} Time spent per crawl stage.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in self._histograms.items():
+                labels = f'site="{site}",stage="{stage}"'
+                for bound, count in zip(
+                    histogram.buckets, histogram.counts, strict=True
+                ):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.total:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+            pages_total = self.pages_total
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_pages_processed_total Pages processed.",
+            f"# TYPE {METRIC_PREFIX}_pages_processed_total counter",
+            f'{METRIC_PREFIX}_pages_processed_total{{site="{site}"}} {pages_total}',
+            f"# HELP {METRIC_PREFIX}_pages_per_minute Pages per minute over the "
+            f"last {self.window_seconds:.0f} seconds.",
+            f"# TYPE {METRIC_PREFIX}_pages_per_minute gauge",
+            f'{METRIC_PREFIX}_pages_per_minute{{site="{site}"}} '
+            f"{self.pages_per_minute():.2f}",
+        ]
+        if queue_depth is not None:
+            lines += [
+                f"# HELP {METRIC_PREFIX}_queue_urls URLs in crawl_queue by status.",
+                f"# TYPE {METRIC_PREFIX}_queue_urls gauge",
+            ]
+            for status, count in sorted(queue_depth.items()):
+                lines.append(
+                    f'{METRIC_PREFIX}_queue_urls{{site="{site}",'
+                    f'status="{_label_value(status)}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(
+        self, path: Path, queue_depth: dict[str, int] | None = None
+    ) -> None:
+        """Atomically replace `path` with the current metrics."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self.render(queue_depth))
+        os.replace(tmp_path, path)
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
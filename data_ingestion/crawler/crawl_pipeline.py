@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+Staged page-processing pipeline for the website crawler.
+
+In the classic loop, _process_page_content chunks, embeds and upserts each page
+inline, so the browser sits idle while OpenAI and Pinecone calls are in flight.
+This module splits that work into stages connected by bounded queues:
+
+    fetch (browser workers) -> clean -> chunk -> embed -> upsert -> mark status
+
+- Every stage has its own thread count and input queue size, so slow network
+  stages (embed, upsert) can get more threads than CPU-bound ones (clean, chunk).
+- Queues are bounded. When an API slows down, its input queue fills, upstream
+  stages block on put(), and eventually the crawl loop stops claiming new URLs.
+  Memory stays flat instead of growing with a backlog of fetched pages.
+- The final "mark status" step is not a stage thread: finished jobs land in a
+  bounded output queue that the crawl loop drains on the thread that owns the
+  SQLite connection.
+- A stage that raises stores the exception on the job; later stages pass the
+  job through untouched so the crawl loop can mark the URL failed or pending.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Default thread count per stage; network-bound stages get more threads
+DEFAULT_STAGE_WORKERS = {"clean": 1, "chunk": 1, "embed": 2, "upsert": 2}
+DEFAULT_STAGE_QUEUE_SIZE = 4
+
+# How long blocked queue operations wait before re-checking for shutdown
+_QUEUE_POLL_SECONDS = 0.5
+
+
+@dataclass
+class PageJob:
+    """A fetched page moving through the processing stages."""
+
+    url: str
+    content: Any
+    links: list[str]
+    worker_id: int | None = None
+    previous_hash: str | None = None
+    chunks: list[str] | None = None
+    content_hash: str | None = None
+    unchanged: bool = False
+    vectors: list[dict] | None = None
+    # Vector IDs recorded for the page before this crawl; not re-embedded
+    known_vector_ids: frozenset[str] = frozenset()
+    vector_ids: list[str] | None = None
+    error: Exception | None = None
+    failed_stage: str | None = None
+    failed_at: float | None = None
+
+
+@dataclass
+class StageSpec:
+    """Name, work function and sizing for one pipeline stage."""
+
+    name: str
+    fn: Callable[[PageJob], None]
+    workers: int = 1
+    queue_size: int = DEFAULT_STAGE_QUEUE_SIZE
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+
+    name: str
+    processed: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, busy: float, blocked: float, failed: bool) -> None:
+        with self._lock:
+            self.processed += 1
+            self.busy_seconds += busy
+            self.blocked_seconds += blocked
+            if failed:
+                self.errors += 1
+
+
+def build_stage_specs(
+    stage_fns: dict[str, Callable[[PageJob], None]],
+    stage_workers: dict[str, int] | None = None,
+    queue_size: int = DEFAULT_STAGE_QUEUE_SIZE,
+) -> list[StageSpec]:
+    """Build stage specs in the given order, applying per-stage worker overrides."""
+    workers = {**DEFAULT_STAGE_WORKERS, **(stage_workers or {})}
+    return [
+        StageSpec(
+            name=name,
+            fn=fn,
+            workers=max(1, int(workers.get(name, 1))),
+            queue_size=max(1, int(queue_size)),
+        )
+        for name, fn in stage_fns.items()
+    ]
+
+
+class StagedPipeline:
+    """Runs PageJobs through a chain of threaded stages with bounded queues."""
+
+    def __init__(self, stages: list[StageSpec], output_queue_size: int | None = None):
+        if not stages:
+            raise ValueError("StagedPipeline needs at least one stage")
+        self.stages = stages
+        self.stats = {spec.name: StageStats(name=spec.name) for spec in stages}
+        self._queues = [queue.Queue(maxsize=spec.queue_size) for spec in stages]
+        self._output: queue.Queue = queue.Queue(
+            maxsize=output_queue_size or stages[-1].queue_size
+        )
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not yet collected with get_output()."""
+        with self._pending_lock:
+            return self._pending
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs the pipeline can hold before submit() blocks."""
+        total = self._output.maxsize
+        for spec in self.stages:
+            total += spec.queue_size + spec.workers
+        return total
+
+    def queue_depths(self) -> dict[str, int]:
+        """Current number of jobs waiting in front of each stage."""
+        depths = {
+            spec.name: q.qsize()
+            for spec, q in zip(self.stages, self._queues, strict=True)
+        }
+        depths["output"] = self._output.qsize()
+        return depths
+
+    def start(self) -> None:
+        """Start the stage threads."""
+        for index, spec in enumerate(self.stages):
+            out_q = (
+                self._queues[index + 1]
+                if index + 1 < len(self._queues)
+                else self._output
+            )
+            for n in range(spec.workers):
+                thread = threading.Thread(
+                    target=self._stage_loop,
+                    args=(spec, self._queues[index], out_q),
+                    name=f"pipeline-{spec.name}-{n}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        sizing = ", ".join(
+            f"{spec.name}={spec.workers}x/q{spec.queue_size}" for spec in self.stages
+        )
+        logging.info(f"Started processing pipeline ({sizing})")
+
+    def try_submit(self, job: PageJob) -> bool:
+        """Queue a job for the first stage. Returns False if that stage is full."""
+        try:
+            self._queues[0].put_nowait(job)
+        except queue.Full:
+            return False
+        with self._pending_lock:
+            self._pending += 1
+        return True
+
+    def get_output(self, timeout: float = 0.0) -> PageJob | None:
+        """Return the next finished job, or None if none is ready."""
+        try:
+            if timeout > 0:
+                job = self._output.get(timeout=timeout)
+            else:
+                job = self._output.get_nowait()
+        except queue.Empty:
+            return None
+        with self._pending_lock:
+            self._pending -= 1
+        return job
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """Stop all stage threads. Jobs still queued are dropped."""
+        self._stop.set()
+        deadline = time.time() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.time()))
+
+    def log_stats(self) -> None:
+        """Log per-stage throughput and queue depth."""
+        depths = self.queue_depths()
+        for spec in self.stages:
+            stats = self.stats[spec.name]
+            avg = stats.busy_seconds / stats.processed if stats.processed else 0.0
+            logging.info(
+                f"Stage {spec.name}: {stats.processed} jobs, {stats.errors} errors, "
+                f"avg {avg:.2f}s, blocked {stats.blocked_seconds:.1f}s, "
+                f"queued {depths[spec.name]}"
+            )
+
+    def _put(self, out_q: queue.Queue, job: PageJob) -> float:
+        """Blocking put that still honors shutdown. Returns seconds spent blocked."""
+        start = time.time()
+        while not self._stop.is_set():
+            try:
+                out_q.put(job, timeout=_QUEUE_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        return time.time() - start
+
+    def _stage_loop(
+        self, spec: StageSpec, in_q: queue.Queue, out_q: queue.Queue
+    ) -> None:
+        stats = self.stats[spec.name]
+        while not self._stop.is_set():
+            try:
+                job = in_q.get(timeout=_QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+            start = time.time()
+            failed = False
+            if job.error is None:
+                try:
+                    spec.fn(job)
+                except Exception as e:
+                    logging.debug(f"Stage {spec.name} failed for {job.url}: {e}")
+                    job.error = e
+                    job.failed_stage = spec.name
+                    job.failed_at = time.time()
+                    failed = True
+            busy = time.time() - start
+
+            blocked = self._put(out_q, job)
+            stats.record(busy, blocked, failed)
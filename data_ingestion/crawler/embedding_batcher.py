@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""
+Cross-page embedding batcher for the website crawler.
+
+create_embeddings sends every chunk of a page in one embed_documents() call.
+With the staged pipeline, several embed threads run at the same time, each
+holding one page. This batcher merges their requests so the crawl makes a few
+large embedding calls instead of one call per page:
+
+- Callers block in embed() until their texts have been embedded.
+- A batch is flushed as soon as it holds ``max_texts`` texts or roughly
+  ``max_tokens`` tokens, or when every expected caller is already waiting.
+- Otherwise the oldest waiting request triggers a flush after
+  ``max_wait_seconds``, so a quiet crawl never stalls on a half-full batch.
+- The flush runs on the calling thread that triggered it. There is no
+  background thread to start or stop.
+
+Token counts use the same rough 4 characters per token estimate as
+utils.embeddings_utils.estimate_batch_size. The thresholds only decide when to
+flush; the embeddings client still splits oversized requests itself.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+DEFAULT_BATCH_MAX_TEXTS = 500
+DEFAULT_BATCH_MAX_TOKENS = 100_000
+DEFAULT_BATCH_MAX_WAIT_SECONDS = 1.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate used for batch thresholds (1 token ≈ 4 characters)."""
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class _EmbedRequest:
+    """Texts from one caller waiting to be embedded."""
+
+    texts: list[str]
+    tokens: int
+    done: threading.Event = field(default_factory=threading.Event)
+    taken: bool = False
+    vectors: list[list[float]] | None = None
+    error: Exception | None = None
+
+
+@dataclass
+class BatcherStats:
+    """Counters for the embedding batcher."""
+
+    requests: int = 0
+    texts: int = 0
+    api_calls: int = 0
+    flushes_by_size: int = 0
+    flushes_by_timeout: int = 0
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        avg = self.texts / self.api_calls if self.api_calls else 0.0
+        return (
+            f"Embedding batcher: {self.requests} pages, {self.texts} chunks in "
+            f"{self.api_calls} calls (avg {avg:.1f} chunks/call, "
+            f"{self.flushes_by_timeout} timeout flushes)"
+        )
+
+
+class EmbeddingBatcher:
+    """Merges concurrent embed requests into large embedding calls."""
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        max_texts: int = DEFAULT_BATCH_MAX_TEXTS,
+        max_tokens: int = DEFAULT_BATCH_MAX_TOKENS,
+        max_wait_seconds: float = DEFAULT_BATCH_MAX_WAIT_SECONDS,
+        expected_callers: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.embed_fn = embed_fn
+        self.max_texts = max(1, int(max_texts))
+        self.max_tokens = max(1, int(max_tokens))
+        self.max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self.expected_callers = expected_callers
+        self.stats = BatcherStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: list[_EmbedRequest] = []
+        self._pending_texts = 0
+        self._pending_tokens = 0
+        self._oldest_at: float | None = None
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, possibly together with other callers' texts."""
+        if not texts:
+            return []
+        request = _EmbedRequest(
+            texts=list(texts), tokens=sum(estimate_tokens(t) for t in texts)
+        )
+        with self._lock:
+            self._add_locked(request)
+            batch = None
+            if self._is_full_locked():
+                batch = self._take_locked()
+                self.stats.flushes_by_size += 1
+        if batch:
+            self._run_batch(batch)
+
+        while not request.done.wait(self._wait_timeout(request)):
+            with self._lock:
+                batch = None
+                if not request.taken:
+                    batch = self._take_locked()
+                    self.stats.flushes_by_timeout += 1
+            if batch:
+                self._run_batch(batch)
+
+        if request.error is not None:
+            raise request.error
+        return request.vectors
+
+    def flush(self) -> None:
+        """Embed everything that is currently waiting."""
+        with self._lock:
+            batch = self._take_locked()
+        if batch:
+            self._run_batch(batch)
+
+    def _add_locked(self, request: _EmbedRequest) -> None:
+        self._pending.append(request)
+        self._pending_texts += len(request.texts)
+        self._pending_tokens += request.tokens
+        if self._oldest_at is None:
+            self._oldest_at = self._clock()
+        self.stats.requests += 1
+        self.stats.texts += len(request.texts)
+
+    def _is_full_locked(self) -> bool:
+        if self._pending_texts >= self.max_texts:
+            return True
+        if self._pending_tokens >= self.max_tokens:
+            return True
+        # Nobody else can join the batch once every caller is waiting on it
+        return bool(self.expected_callers) and (
+            len(self._pending) >= self.expected_callers
+        )
+
+    def _take_locked(self) -> list[_EmbedRequest]:
+        batch = self._pending
+        for request in batch:
+            request.taken = True
+        self._pending = []
+        self._pending_texts = 0
+        self._pending_tokens = 0
+        self._oldest_at = None
+        return batch
+
+    def _wait_timeout(self, request: _EmbedRequest) -> float | None:
+        """Seconds until the oldest pending request is due, None once taken."""
+        with self._lock:
+            if request.taken or self._oldest_at is None:
+                return None
+            due = self._oldest_at + self.max_wait_seconds
+            return max(0.0, due - self._clock())
+
+    def _run_batch(self, batch: list[_EmbedRequest]) -> None:
+        """Embed a batch in one call and hand each caller its slice."""
+        texts = [text for request in batch for text in request.texts]
+        try:
+            vectors = self.embed_fn(texts)
+            with self._lock:
+                self.stats.api_calls += 1
+            start = 0
+            for request in batch:
+                end = start + len(request.texts)
+                request.vectors = vectors[start:end]
+                start = end
+        except Exception as e:
+            logging.debug(f"Embedding batch of {len(texts)} texts failed: {e}")
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Conditional HTTP revalidation for website crawler recrawls.
+
+Most due recrawls return a page that has not changed since the last visit,
+yet each one costs a full Playwright navigation. When the last visit stored
+the page's ETag and/or Last-Modified header, the crawler first sends a
+lightweight conditional request:
+
+- A HEAD request carrying If-None-Match / If-Modified-Since.
+- If the server rejects HEAD (405/501), a conditional GET whose body is never
+  read.
+
+A 304 means the page is unchanged. A 200 that echoes the stored validators
+also counts as unchanged. In both cases the URL is rescheduled without
+opening a browser. Any other answer, or any network error, falls back to the
+normal browser fetch, so revalidation can only save work and never drops a
+page.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+
+NOT_MODIFIED = "not_modified"
+MODIFIED = "modified"
+UNKNOWN = "unknown"
+
+DEFAULT_REVALIDATION_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class CacheValidators:
+    """HTTP cache validators stored per URL in crawl_queue."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.etag and not self.last_modified
+
+    @classmethod
+    def from_headers(cls, get_header) -> "CacheValidators":
+        """Build validators from a header lookup such as response.header_value."""
+        return cls(etag=get_header("etag"), last_modified=get_header("last-modified"))
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that ask the server to answer 304 if unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def matches(self, other: "CacheValidators") -> bool:
+        """True if a fresh response carries the same validators we stored."""
+        if self.etag and other.etag:
+            return _strip_weak(self.etag) == _strip_weak(other.etag)
+        if self.last_modified and other.last_modified:
+            return self.last_modified == other.last_modified
+        return False
+
+
+def _strip_weak(etag: str) -> str:
+    # Weak comparison: W/"abc" and "abc" name the same representation
+    return etag.removeprefix("W/")
+
+
+@dataclass
+class RevalidationResult:
+    """Outcome of one conditional request."""
+
+    outcome: str
+    validators: CacheValidators
+    status_code: int | None = None
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class RevalidationStats:
+    """Counters shared by all crawl workers."""
+
+    checks: int = 0
+    not_modified: int = 0
+    modified: int = 0
+    inconclusive: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        avg_ms = self.seconds / self.checks * 1000 if self.checks else 0.0
+        return (
+            f"Conditional revalidation: {self.checks} checks, "
+            f"{self.not_modified} unchanged (browser fetch skipped), "
+            f"{self.modified} changed, {self.inconclusive} inconclusive, "
+            f"avg {avg_ms:.0f} ms"
+        )
+
+
+class HttpRevalidator:
+    """Sends conditional requests with a pooled HTTP session."""
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout_seconds: float = DEFAULT_REVALIDATION_TIMEOUT_SECONDS,
+        session: requests.Session | None = None,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.session = session or requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        self.stats = RevalidationStats()
+        self._lock = threading.Lock()
+
+    def revalidate(self, url: str, stored: CacheValidators) -> RevalidationResult:
+        """Ask the server whether the page changed since the stored validators."""
+        start = time.time()
+        try:
+            response = self._conditional_request(url, stored)
+            fresh = CacheValidators.from_headers(response.headers.get)
+            if response.status_code == 304:
+                # 304 responses may omit validators; keep what we had
+                outcome = NOT_MODIFIED
+                fresh = CacheValidators(
+                    etag=fresh.etag or stored.etag,
+                    last_modified=fresh.last_modified or stored.last_modified,
+                )
+            elif response.status_code == 200 and stored.matches(fresh):
+                outcome = NOT_MODIFIED
+            elif response.status_code == 200:
+                outcome = MODIFIED
+            else:
+                outcome = UNKNOWN
+            result = RevalidationResult(outcome, fresh, response.status_code)
+        except requests.RequestException as e:
+            logging.debug(f"Conditional request failed for {url}: {e}")
+            result = RevalidationResult(UNKNOWN, stored)
+        result.elapsed_seconds = time.time() - start
+        self._record(result)
+        return result
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _conditional_request(
+        self, url: str, stored: CacheValidators
+    ) -> requests.Response:
+        headers = stored.conditional_headers()
+        response = self.session.head(
+            url,
+            headers=headers,
+            timeout=self.timeout_seconds,
+            allow_redirects=False,
+        )
+        if response.status_code in (405, 501):
+            # Server does not support HEAD; a conditional GET without reading
+            # the body still returns status and headers
+            response = self.session.get(
+                url,
+                headers=headers,
+                timeout=self.timeout_seconds,
+                allow_redirects=False,
+                stream=True,
+            )
+            response.close()
+        return response
+
+    def _record(self, result: RevalidationResult) -> None:
+        with self._lock:
+            self.stats.checks += 1
+            self.stats.seconds += result.elapsed_seconds
+            if result.outcome == NOT_MODIFIED:
+                self.stats.not_modified += 1
+            elif result.outcome == MODIFIED:
+                self.stats.modified += 1
+            else:
+                self.stats.inconclusive += 1
@@ -0,0 +1,527 @@
+#!/usr/bin/env python
+"""
+Crawl several sites from one process with a shared page budget.
+
+Running one website_crawler.py daemon per site means one Firefox, one spaCy
+model and one OpenAI client per site, and no way to split a global crawl
+rate between them. This orchestrator runs every site's queue in a single
+process:
+
+- One browser. Each site crawls in its own browser context (page), which is
+  recycled every browser_context_max_pages pages like the single-site crawl.
+  A browser crash relaunches Firefox once for all sites.
+- One spaCy text splitter per embedding model, and one embeddings client and
+  EmbeddingBatcher per embedding model/API key. Chunking and embedding run in
+  each site's staged pipeline (see crawl_pipeline.py), and the shared batcher
+  merges embed calls across sites.
+- A SiteScheduler (see site_scheduler.py) splits --pages-per-minute across
+  sites by site_priority and due-URL count, and picks which site fetches
+  next. Each site keeps its own queue database, Pinecone index and metrics
+  file.
+
+Sitemap syncs and Pinecone cleanup of removed pages run for every site before
+each rebalance. CSV export checks need the single-site daemon.
+
+Each site's .env.<site> file is applied to os.environ only while that site
+is set up or its queue and vectors are updated, so sites with different
+Pinecone indexes can share the process. Splitters and embeddings clients are
+created inside it and keep their model, since pipeline stage threads run
+outside any site's environment. All SQLite work happens on the main
+thread. The per-site lock files of website_crawler.py are held for the whole
+run, so a single-site daemon for the same site won't start alongside it.
+
+Usage:
+    python multi_site_crawler.py --sites ananda-public photo --pages-per-minute 90
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.browser_recycling import open_page, recycle_or_relaunch  # noqa: E402
+from crawler.concurrent_crawl import CrawlResult  # noqa: E402
+from crawler.crawl_pipeline import PageJob, StagedPipeline  # noqa: E402
+from crawler.embedding_batcher import EmbeddingBatcher  # noqa: E402
+from crawler.site_scheduler import (  # noqa: E402
+    DEFAULT_GLOBAL_PAGES_PER_MINUTE,
+    DEFAULT_REBALANCE_SECONDS,
+    DEFAULT_SITE_PRIORITY,
+    SiteDemand,
+    SiteScheduler,
+)
+from crawler.website_crawler import (  # noqa: E402
+    USER_AGENT,
+    WebsiteCrawler,
+    _build_crawl_pipeline,
+    _cleanup_browser_resources,
+    _cleanup_orphaned_processes,
+    _finish_pipeline_job,
+    _handle_rate_limit_sleep,
+    _is_pipeline_candidate,
+    _process_page_content,
+    _process_pinecone_deletions,
+    _process_sitemap_updates,
+    _relaunch_browser,
+    _setup_browser_with_timeout,
+    initialize_pinecone,
+    load_config,
+)
+from dotenv import dotenv_values  # noqa: E402
+from playwright.sync_api import sync_playwright  # noqa: E402
+from utils.pinecone_utils import get_pinecone_ingest_index_name  # noqa: E402
+from utils.progress_utils import is_exiting, setup_signal_handlers  # noqa: E402
+
+# Sleep between loop passes while fetched pages are still in a pipeline, and
+# while no site has due URLs
+PIPELINE_POLL_SECONDS = 0.5
+IDLE_SLEEP_SECONDS = 30
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Crawl several sites in one process with a shared page budget"
+    )
+    parser.add_argument(
+        "--sites", nargs="+", required=True, help="Site IDs (e.g., ananda-public)"
+    )
+    parser.add_argument(
+        "--pages-per-minute",
+        type=float,
+        default=DEFAULT_GLOBAL_PAGES_PER_MINUTE,
+        help=f"Global fetch rate shared by all sites (default: "
+        f"{DEFAULT_GLOBAL_PAGES_PER_MINUTE})",
+    )
+    parser.add_argument(
+        "--rebalance-seconds",
+        type=float,
+        default=DEFAULT_REBALANCE_SECONDS,
+        help="How often site shares are recomputed from due URLs "
+        f"(default: {DEFAULT_REBALANCE_SECONDS})",
+    )
+    parser.add_argument(
+        "--stop-after",
+        type=int,
+        help="Stop after processing this many pages across all sites.",
+    )
+    parser.add_argument(
+        "--max-runtime-minutes",
+        type=int,
+        default=45,
+        help="Maximum runtime in minutes before exiting (default: 45). Use 0 for unlimited.",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging.")
+    return parser.parse_args()
+
+
+@contextmanager
+def site_environment(env: dict[str, str]) -> Iterator[None]:
+    """Apply a site's .env values to os.environ for the duration of the block."""
+    previous = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@dataclass
+class SiteRun:
+    """One site's crawler, vector index and crawl state in the orchestrator."""
+
+    site_id: str
+    crawler: WebsiteCrawler
+    pinecone_index: object
+    index_name: str
+    env: dict[str, str]
+    pipeline: StagedPipeline | None = None
+    embedding_key: tuple = ()
+    page: object = None
+    pages_since_recycle: int = 0
+    pages_processed: int = 0
+    lock_file: str | None = None
+    in_flight: set[str] = field(default_factory=set)
+    waiting: deque = field(default_factory=deque)
+
+    def demand(self) -> SiteDemand:
+        delay = self.crawler.crawl_delay_seconds
+        return SiteDemand(
+            self.site_id,
+            due_urls=self.crawler.count_due_urls(),
+            priority=self.crawler.config.get("site_priority", DEFAULT_SITE_PRIORITY),
+            max_pages_per_minute=60 / delay if delay and delay > 0 else None,
+        )
+
+
+class SharedModels:
+    """The spaCy splitters, embeddings clients and batchers shared by all sites."""
+
+    def __init__(self):
+        self.text_splitters: dict[str | None, object] = {}
+        self.embeddings: dict[tuple, object] = {}
+
+    def attach(self, crawler: WebsiteCrawler) -> tuple:
+        """Point a crawler at the shared models. Call inside its site environment.
+
+        Returns the key of the embeddings client it uses.
+        """
+        key = (
+            os.environ.get("OPENAI_INGEST_EMBEDDINGS_MODEL"),
+            os.environ.get("OPENAI_API_KEY"),
+        )
+        # Token counts and chunk cache keys depend on the embedding model
+        if key[0] not in self.text_splitters:
+            self.text_splitters[key[0]] = crawler.text_splitter
+        crawler._text_splitter = self.text_splitters[key[0]]
+        if key not in self.embeddings:
+            self.embeddings[key] = crawler.embeddings
+        crawler._embeddings = self.embeddings[key]
+        crawler._embedding_model_name = key[0]
+        return key
+
+    def create_batchers(self, sites: list[SiteRun]) -> list[EmbeddingBatcher]:
+        """Give all sites with the same embeddings client one batcher."""
+        groups: dict[tuple, list[SiteRun]] = defaultdict(list)
+        for site in sites:
+            groups[site.embedding_key].append(site)
+        batchers = []
+        for key, group in groups.items():
+            crawler = group[0].crawler
+            embed_workers = sum(
+                spec.workers
+                for site in group
+                for spec in site.pipeline.stages
+                if spec.name == "embed"
+            )
+            batcher = EmbeddingBatcher(
+                self.embeddings[key].embed_documents,
+                max_texts=crawler.embedding_batch_max_texts,
+                max_tokens=crawler.embedding_batch_max_tokens,
+                max_wait_seconds=crawler.embedding_batch_max_wait_seconds,
+                expected_callers=embed_workers,
+            )
+            for site in group:
+                site.crawler.embedding_batcher = batcher
+            logging.info(
+                f"Shared embedding batcher for {', '.join(s.site_id for s in group)} "
+                f"({embed_workers} embed threads)"
+            )
+            batchers.append(batcher)
+        return batchers
+
+
+def _acquire_site_lock(site_id: str) -> str | None:
+    """Take website_crawler.py's lock file for a site, or None if it is running."""
+    lock_file = f"/tmp/crawler_{site_id}.lock"
+    if os.path.exists(lock_file):
+        try:
+            with open(lock_file) as f:
+                os.kill(int(f.read().strip()), 0)
+            logging.error(f"Crawler for site '{site_id}' is already running")
+            return None
+        except (ValueError, OSError):
+            logging.info(f"Removing stale lock file {lock_file}")
+    with open(lock_file, "w") as f:
+        f.write(str(os.getpid()))
+    return lock_file
+
+
+def open_site(site_id: str, shared: SharedModels) -> SiteRun | None:
+    """Set up one site's crawler, Pinecone index and pipeline, or None on error."""
+    config = load_config(site_id)
+    env_file = PROJECT_ROOT / f".env.{site_id}"
+    if config is None or not env_file.exists():
+        logging.error(f"Skipping site '{site_id}': missing config or {env_file}")
+        return None
+    lock_file = _acquire_site_lock(site_id)
+    if lock_file is None:
+        return None
+
+    env = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    with site_environment(env):
+        crawler = WebsiteCrawler(site_id, config)
+        pinecone_index = initialize_pinecone(str(env_file))
+        if pinecone_index is None:
+            crawler.close()
+            os.remove(lock_file)
+            return None
+        site = SiteRun(
+            site_id,
+            crawler,
+            pinecone_index,
+            get_pinecone_ingest_index_name(),
+            env,
+            lock_file=lock_file,
+        )
+        site.embedding_key = shared.attach(crawler)
+        crawler.defer_content_cleaning = True
+        site.pipeline = _build_crawl_pipeline(crawler, pinecone_index, site.index_name)
+    return site
+
+
+class SharedBrowser:
+    """One Firefox shared by all sites, with one page (context) per site."""
+
+    def __init__(self, p, sites: list[SiteRun]):
+        self.p = p
+        self.sites = sites
+        self.browser, first_page = _setup_browser_with_timeout(
+            p, timeout_seconds=120, cleanup_orphans=False
+        )
+        sites[0].page = first_page
+
+    def page_for(self, site: SiteRun):
+        if site.page is None:
+            site.page = open_page(self.browser, USER_AGENT)
+        return site.page
+
+    def recycle(self, site: SiteRun, reason: str) -> None:
+        """Give a site a fresh context; relaunch Firefox if it has crashed."""
+        logging.info(f"Recycling browser context for {site.site_id} ({reason})")
+        site.pages_since_recycle = 0
+        self.browser, site.page, relaunched = recycle_or_relaunch(
+            self.browser,
+            site.page,
+            USER_AGENT,
+            lambda: _relaunch_browser(self.p, site.page, self.browser),
+            site.crawler.browser_stats,
+        )
+        if relaunched:
+            # Pages of the other sites died with the old browser
+            for other in self.sites:
+                if other is not site:
+                    other.page = None
+
+    def close(self) -> None:
+        _cleanup_browser_resources(self.browser)
+
+
+def _feed_site_pipeline(site: SiteRun) -> None:
+    while site.waiting and site.pipeline.try_submit(site.waiting[0]):
+        site.waiting.popleft()
+
+
+def _drain_site(site: SiteRun) -> tuple[int, bool]:
+    """Mark a site's finished pipeline jobs. Returns (pages_inc, rate_limit_hit)."""
+    pages_inc = 0
+    rate_limit_hit = False
+    while (job := site.pipeline.get_output()) is not None:
+        site.in_flight.discard(job.url)
+        with site_environment(site.env):
+            job_pages, job_rate_limited = _finish_pipeline_job(
+                job, site.crawler, site.pinecone_index
+            )
+        pages_inc += job_pages
+        rate_limit_hit = rate_limit_hit or job_rate_limited
+    _feed_site_pipeline(site)
+    site.pages_processed += pages_inc
+    return pages_inc, rate_limit_hit
+
+
+def _handle_fetched_page(site: SiteRun, result: CrawlResult) -> int:
+    """Queue a fetched page for the site's pipeline or finish it. Returns pages_inc."""
+    crawler = site.crawler
+    if _is_pipeline_candidate(result):
+        site.in_flight.add(result.url)
+        site.waiting.append(
+            PageJob(
+                url=result.url,
+                content=result.content,
+                links=result.links,
+                previous_hash=crawler.get_stored_content_hash(result.url),
+                known_vector_ids=frozenset(
+                    crawler.get_vector_manifest(result.url) or ()
+                ),
+            )
+        )
+        _feed_site_pipeline(site)
+        return 0
+    # Failed fetches, login redirects and 304s need no chunking or embedding
+    with site_environment(site.env):
+        pages_inc, _restart_inc, _rate_limited = _process_page_content(
+            result.content,
+            result.links,
+            result.url,
+            crawler,
+            site.pinecone_index,
+            site.index_name,
+        )
+    crawler.commit_db_changes()
+    if pages_inc > 0:
+        crawler.record_page_processed()
+    site.pages_processed += pages_inc
+    return pages_inc
+
+
+def crawl_next_page(
+    site: SiteRun, browser: SharedBrowser, scheduler: SiteScheduler
+) -> int:
+    """Fetch one URL from a site's queue. Returns pages processed."""
+    crawler = site.crawler
+    urls = crawler.claim_next_urls(1, exclude=site.in_flight)
+    if not urls:
+        scheduler.mark_idle(site.site_id)
+        return 0
+    url = urls[0]
+    scheduler.record_page(site.site_id)
+    if crawler.should_skip_url(url):
+        crawler.mark_url_status(url, "failed", "Skipped by pattern rule")
+        return 0
+
+    start = time.perf_counter()
+    content, links, restart_needed = crawler.crawl_page(
+        browser.browser, browser.page_for(site), url
+    )
+    site.pages_since_recycle += 1
+    if restart_needed:
+        crawler.mark_url_status(url, "pending")
+        browser.recycle(site, "page error")
+        return 0
+    if site.pages_since_recycle >= crawler.browser_context_max_pages:
+        browser.recycle(site, f"{site.pages_since_recycle} pages")
+
+    result = CrawlResult(
+        0, url, content, links, restart_needed, time.perf_counter() - start
+    )
+    return _handle_fetched_page(site, result)
+
+
+def _rebalance(sites: dict[str, SiteRun], scheduler: SiteScheduler) -> None:
+    """Run each site's queue upkeep, then recompute the site shares."""
+    for site in sites.values():
+        with site_environment(site.env):
+            _process_sitemap_updates(site.crawler)
+            _process_pinecone_deletions(site.crawler, site.pinecone_index)
+    scheduler.rebalance(site.demand() for site in sites.values())
+
+
+def _commit_sites(sites: Iterable[SiteRun]) -> None:
+    """Commit every site's grouped queue writes, e.g. before a long sleep."""
+    for site in sites:
+        site.crawler.commit_db_changes(force=True)
+
+
+def _pick_site(sites: dict[str, SiteRun], scheduler: SiteScheduler) -> SiteRun | None:
+    """Site to fetch from now, or None after sleeping until one may be due."""
+    if scheduler.rebalance_due():
+        _rebalance(sites, scheduler)
+    site_id, wait = scheduler.next_site()
+    busy = any(site.in_flight for site in sites.values())
+    if site_id is None:
+        if not busy:
+            _commit_sites(sites.values())
+        time.sleep(PIPELINE_POLL_SECONDS if busy else IDLE_SLEEP_SECONDS)
+        return None
+    if wait > 0:
+        time.sleep(min(wait, PIPELINE_POLL_SECONDS))
+        return None
+    site = sites[site_id]
+    if site.waiting:
+        # The site's pipeline is full; let the other sites go first
+        scheduler.defer(site_id, PIPELINE_POLL_SECONDS)
+        return None
+    return site
+
+
+def run_sites(
+    sites: list[SiteRun], scheduler: SiteScheduler, args: argparse.Namespace
+) -> int:
+    """Crawl all sites until the runtime or page limit. Returns pages processed."""
+    start_time = time.time()
+    max_runtime_seconds = (
+        args.max_runtime_minutes * 60 if args.max_runtime_minutes > 0 else float("inf")
+    )
+    by_id = {site.site_id: site for site in sites}
+    pages_processed = 0
+    with sync_playwright() as p:
+        _cleanup_orphaned_processes()
+        browser = SharedBrowser(p, sites)
+        for site in sites:
+            site.pipeline.start()
+        try:
+            while not is_exiting():
+                if time.time() - start_time >= max_runtime_seconds:
+                    logging.info("Reached maximum runtime, exiting cleanly")
+                    break
+                if args.stop_after and pages_processed >= args.stop_after:
+                    logging.info(f"Reached stop limit of {args.stop_after} pages.")
+                    break
+                drained = [_drain_site(site) for site in sites]
+                pages_processed += sum(pages for pages, _ in drained)
+                if any(rate_limited for _, rate_limited in drained):
+                    # All sites share the OpenAI rate limit
+                    _commit_sites(sites)
+                    if _handle_rate_limit_sleep(start_time, max_runtime_seconds):
+                        break
+                    continue
+                site = _pick_site(by_id, scheduler)
+                if site is not None:
+                    pages_processed += crawl_next_page(site, browser, scheduler)
+                for site in sites:
+                    site.crawler.write_metrics()
+        finally:
+            for site in sites:
+                # Pages still in a pipeline keep their 'pending' status
+                site.pipeline.shutdown()
+            browser.close()
+            _cleanup_orphaned_processes()
+    return pages_processed
+
+
+def close_sites(sites: list[SiteRun]) -> None:
+    """Log per-site summaries, write final metrics and release the site locks."""
+    for site in sites:
+        logging.info(f"=== {site.site_id}: {site.pages_processed} pages processed ===")
+        site.crawler.log_avoided_work_summary()
+        site.crawler.write_metrics(force=True)
+        site.crawler.commit_db_changes(force=True)
+        site.crawler.close()
+        if site.lock_file:
+            with suppress(OSError):
+                os.remove(site.lock_file)
+
+
+def main() -> None:
+    args = parse_arguments()
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    setup_signal_handlers()
+
+    shared = SharedModels()
+    sites = [site for site_id in args.sites if (site := open_site(site_id, shared))]
+    if not sites:
+        logging.error("No sites could be set up, exiting")
+        sys.exit(1)
+    batchers = shared.create_batchers(sites)
+    scheduler = SiteScheduler(args.pages_per_minute, args.rebalance_seconds)
+
+    pages_processed = 0
+    try:
+        pages_processed = run_sites(sites, scheduler, args)
+    finally:
+        logging.info(scheduler.summary())
+        for batcher in batchers:
+            logging.info(batcher.stats.summary())
+        close_sites(sites)
+    logging.info(f"Completed processing {pages_processed} pages across all sites.")
+
+
+if __name__ == "__main__":
+    main()
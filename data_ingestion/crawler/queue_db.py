@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Connection settings and group commits for the crawl queue database.
+
+The crawler used to open its SQLite queue with the default rollback journal
+and commit after nearly every URL: once when a due re-crawl was reset to
+pending, once in mark_url_status and once more in commit_db_changes after
+each page. Every commit is an fsync, and while the daemon held the write
+lock, tools reading the same file (check_priority_due.py,
+check_robots_compliance.py) had to wait, and could make the crawler wait.
+
+This module changes both:
+
+- configure_connection switches the database to WAL journaling. Readers see
+  the last committed state and never block the writer, and the writer never
+  blocks readers. synchronous=NORMAL only syncs the WAL at checkpoints, which
+  in WAL mode can lose the last transactions on power loss but never
+  corrupts the database. The page cache and busy timeout are set too.
+- CommitBudget groups queue writes into one transaction until
+  db_commit_max_writes writes or db_commit_max_seconds seconds have
+  accumulated. The crawler forces a commit before claiming URLs for other
+  connections, before long sleeps and on shutdown. A crash loses at most one
+  budget of status updates; those URLs are simply crawled again.
+- connect_read_only opens a separate query_only connection for tools that
+  only read the queue, so they can run next to the daemon at any time.
+
+WAL mode is stored in the database file, so once the crawler has opened it,
+every later connection (including the sqlite3 shell) uses WAL too.
+"""
+
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+DEFAULT_COMMIT_MAX_WRITES = 100
+DEFAULT_COMMIT_MAX_SECONDS = 5.0
+DEFAULT_CACHE_SIZE_MB = 32
+# Several connections can write to the same queue; wait instead of failing
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+
+def configure_connection(
+    conn: sqlite3.Connection,
+    cache_size_mb: float = DEFAULT_CACHE_SIZE_MB,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+) -> str:
+    """Apply the crawler's journal, sync and cache settings. Returns the journal mode.
+
+    In-memory databases report "memory", since they cannot use WAL.
+    """
+    journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # A negative cache_size is in KiB rather than pages
+    conn.execute(f"PRAGMA cache_size = {-int(cache_size_mb * 1024)}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    return journal_mode
+
+
+def connect_read_only(
+    db_path: str | Path, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS
+) -> sqlite3.Connection:
+    """Open a query-only connection to a queue database without taking write locks."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    return conn
+
+
+class CommitBudget:
+    """Decides when grouped queue writes should be committed.
+
+    Thread-compatible only: like the connection it guards, it is used from
+    the thread that owns the crawler's database connection.
+    """
+
+    def __init__(
+        self,
+        max_writes: int = DEFAULT_COMMIT_MAX_WRITES,
+        max_seconds: float = DEFAULT_COMMIT_MAX_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_writes = max(1, int(max_writes))
+        self.max_seconds = max_seconds
+        self.pending = 0
+        self.writes = 0
+        self.commits = 0
+        self._clock = clock
+        self._first_pending_at: float | None = None
+
+    def record_write(self) -> None:
+        """Count one write made in the open transaction."""
+        if self.pending == 0:
+            self._first_pending_at = self._clock()
+        self.pending += 1
+        self.writes += 1
+
+    def due(self) -> bool:
+        """True when the pending writes have used up the count or time budget."""
+        if self.pending == 0:
+            return False
+        return (
+            self.pending >= self.max_writes
+            or self._clock() - self._first_pending_at >= self.max_seconds
+        )
+
+    def committed(self) -> None:
+        """Record that the open transaction was committed."""
+        if self.pending:
+            self.commits += 1
+        self.pending = 0
+        self._first_pending_at = None
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        per_commit = self.writes / self.commits if self.commits else 0.0
+        return (
+            f"Queue DB: {self.writes} writes in {self.commits} commits "
+            f"({per_commit:.1f} writes/commit, {self.pending} pending)"
+        )
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Fair scheduling of several site queues under one global page rate.
+
+The multi-site orchestrator (multi_site_crawler.py) crawls several sites in
+one process with a shared page budget (``--pages-per-minute``). This module
+decides how that budget is split and which site fetches next:
+
+- Every rebalance, each site reports a SiteDemand: its priority (the
+  ``site_priority`` config key), how many URLs are due, and the fastest rate
+  its crawl_delay_seconds allows.
+- fair_share_rates splits the global rate by weighted max-min fairness. A
+  site's weight is its priority times log2(1 + due URLs), so a large backlog
+  earns a bigger share without starving sites with a few due pages. No site
+  gets more than it can use: its politeness limit, or enough to clear its
+  due URLs before the next rebalance. Whatever a capped site can't use goes
+  to the others.
+- SiteScheduler turns the rates into per-site fetch slots spaced 60/rate
+  seconds apart and always picks the site whose slot comes first. Slots
+  never accumulate credit, so an idle period doesn't turn into a burst, and
+  the sum of the site rates never exceeds the global one.
+"""
+
+import logging
+import math
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+DEFAULT_GLOBAL_PAGES_PER_MINUTE = 60
+DEFAULT_REBALANCE_SECONDS = 60
+DEFAULT_SITE_PRIORITY = 1.0
+
+
+@dataclass
+class SiteDemand:
+    """What one site could crawl right now."""
+
+    site_id: str
+    due_urls: int
+    priority: float = DEFAULT_SITE_PRIORITY
+    max_pages_per_minute: float | None = None
+
+    @property
+    def weight(self) -> float:
+        if self.due_urls <= 0 or self.priority <= 0:
+            return 0.0
+        return self.priority * math.log2(1 + self.due_urls)
+
+    def cap(self, horizon_minutes: float) -> float:
+        """Highest useful rate: clear the due URLs within the horizon, politely."""
+        cap = self.due_urls / horizon_minutes if horizon_minutes > 0 else math.inf
+        if self.max_pages_per_minute:
+            cap = min(cap, self.max_pages_per_minute)
+        return cap
+
+
+def fair_share_rates(
+    demands: Iterable[SiteDemand],
+    pages_per_minute: float,
+    horizon_minutes: float = DEFAULT_REBALANCE_SECONDS / 60,
+) -> dict[str, float]:
+    """Split pages_per_minute across sites by weighted max-min fairness."""
+    demands = list(demands)
+    rates = {demand.site_id: 0.0 for demand in demands}
+    active = [demand for demand in demands if demand.weight > 0]
+    remaining = float(pages_per_minute)
+    while active and remaining > 1e-9:
+        total_weight = sum(demand.weight for demand in active)
+        capped = [
+            demand
+            for demand in active
+            if remaining * demand.weight / total_weight >= demand.cap(horizon_minutes)
+        ]
+        if not capped:
+            for demand in active:
+                rates[demand.site_id] = remaining * demand.weight / total_weight
+            break
+        # Sites that need less than their share take only what they can use
+        for demand in capped:
+            rates[demand.site_id] = demand.cap(horizon_minutes)
+            remaining -= rates[demand.site_id]
+            active.remove(demand)
+    return rates
+
+
+class SiteScheduler:
+    """Paces fetches across sites according to their fair-share rates."""
+
+    def __init__(
+        self,
+        pages_per_minute: float = DEFAULT_GLOBAL_PAGES_PER_MINUTE,
+        rebalance_seconds: float = DEFAULT_REBALANCE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.pages_per_minute = pages_per_minute
+        self.rebalance_seconds = rebalance_seconds
+        self.rates: dict[str, float] = {}
+        self.pages: Counter[str] = Counter()
+        self._clock = clock
+        self._next_slot: dict[str, float] = {}
+        self._rebalanced_at: float | None = None
+
+    def rebalance_due(self) -> bool:
+        return (
+            self._rebalanced_at is None
+            or self._clock() - self._rebalanced_at >= self.rebalance_seconds
+        )
+
+    def rebalance(self, demands: Iterable[SiteDemand]) -> dict[str, float]:
+        """Recompute every site's rate from its current demand."""
+        demands = list(demands)
+        self.rates = fair_share_rates(
+            demands, self.pages_per_minute, self.rebalance_seconds / 60
+        )
+        self._rebalanced_at = now = self._clock()
+        for site_id, rate in self.rates.items():
+            if rate > 0:
+                self._next_slot.setdefault(site_id, now)
+        logging.info(
+            "Site shares (pages/min): "
+            + ", ".join(
+                f"{d.site_id} {self.rates[d.site_id]:.1f} "
+                f"(priority {d.priority:g}, {d.due_urls} due)"
+                for d in demands
+            )
+        )
+        return self.rates
+
+    def next_site(self) -> tuple[str | None, float]:
+        """Site whose fetch slot comes first and seconds until it, or (None, 0)."""
+        active = [site_id for site_id, rate in self.rates.items() if rate > 0]
+        if not active:
+            return None, 0.0
+        site_id = min(active, key=lambda site: self._next_slot[site])
+        return site_id, max(0.0, self._next_slot[site_id] - self._clock())
+
+    def record_page(self, site_id: str) -> None:
+        """Count a fetch and move the site's next slot one interval later."""
+        self.pages[site_id] += 1
+        rate = self.rates.get(site_id, 0.0)
+        if rate > 0:
+            slot = max(self._next_slot.get(site_id, 0.0), self._clock())
+            self._next_slot[site_id] = slot + 60 / rate
+
+    def defer(self, site_id: str, seconds: float) -> None:
+        """Push a site's next slot back without counting a fetch."""
+        if site_id in self._next_slot:
+            self._next_slot[site_id] = self._clock() + seconds
+
+    def mark_idle(self, site_id: str) -> None:
+        """Stop scheduling a site with nothing to crawl until the next rebalance."""
+        self.rates[site_id] = 0.0
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        per_site = ", ".join(
+            f"{site} {count}" for site, count in sorted(self.pages.items())
+        )
+        return (
+            f"Multi-site crawl: {sum(self.pages.values())} pages fetched "
+            f"({per_site or 'none'})"
+        )
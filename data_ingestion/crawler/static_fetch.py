@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Static-HTML fetch path for the website crawler.
+
+Most WordPress pages are fully rendered on the server. For those, a Playwright
+navigation adds a browser round trip plus _wait_for_page_ready and
+_expand_menus, and the browser's memory growth forces periodic restarts. This
+module fetches pages with a pooled HTTP client instead. The crawler parses the
+HTML once with content_extraction.parse_html and takes the title, links and
+main text from that tree.
+
+The crawler falls back to Playwright for:
+
+- URLs matching one of the site's ``browser_required_patterns`` regexes, for
+  pages known to render their content with JavaScript.
+- Responses that are not a plain 200 text/html page: errors, non-HTML
+  content, or redirects to a login page.
+- Pages whose cleaned text is shorter than ``static_fetch_min_chars``.
+  Usually this means the content is injected client-side.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_STATIC_FETCH_TIMEOUT_SECONDS = 20
+DEFAULT_STATIC_FETCH_MIN_CHARS = 200
+DEFAULT_HTTP_POOL_SIZE = 10
+
+
+def create_http_session(user_agent: str, pool_size: int) -> requests.Session:
+    """Create a requests session whose connection pool fits all crawl workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+@dataclass
+class StaticPage:
+    """Response of a static fetch."""
+
+    url: str
+    final_url: str
+    status_code: int
+    content_type: str
+    html: str
+    headers: dict
+    elapsed_seconds: float
+
+
+@dataclass
+class StaticFetchStats:
+    """Counters shared by all crawl workers."""
+
+    static_pages: int = 0
+    static_seconds: float = 0.0
+    fallbacks: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        total_fallbacks = sum(self.fallbacks.values())
+        rate = self.static_pages / self.static_seconds if self.static_seconds else 0.0
+        reasons = ", ".join(f"{k}={v}" for k, v in sorted(self.fallbacks.items()))
+        return (
+            f"Static fetch: {self.static_pages} pages ({rate:.1f} pages/sec), "
+            f"{total_fallbacks} browser fallbacks ({reasons or 'none'})"
+        )
+
+
+class StaticFetcher:
+    """Fetches pages over plain HTTP and decides when the browser is needed."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        browser_required_patterns: list[str] | None = None,
+        min_chars: int = DEFAULT_STATIC_FETCH_MIN_CHARS,
+        timeout_seconds: float = DEFAULT_STATIC_FETCH_TIMEOUT_SECONDS,
+    ):
+        self.session = session
+        self.min_chars = min_chars
+        self.timeout_seconds = timeout_seconds
+        self.browser_required = [
+            re.compile(pattern) for pattern in browser_required_patterns or []
+        ]
+        self.stats = StaticFetchStats()
+        self._lock = threading.Lock()
+
+    def requires_browser(self, url: str) -> bool:
+        """True if the site config says this URL must be rendered in a browser."""
+        return any(pattern.search(url) for pattern in self.browser_required)
+
+    def fetch(self, url: str) -> StaticPage:
+        """GET the page. Raises requests.RequestException on network errors."""
+        start = time.time()
+        response = self.session.get(url, timeout=self.timeout_seconds)
+        return StaticPage(
+            url=url,
+            final_url=response.url,
+            status_code=response.status_code,
+            content_type=response.headers.get("content-type", ""),
+            html=response.text,
+            headers=response.headers,
+            elapsed_seconds=time.time() - start,
+        )
+
+    def record_static_page(self, seconds: float) -> None:
+        with self._lock:
+            self.stats.static_pages += 1
+            self.stats.static_seconds += seconds
+
+    def record_fallback(self, url: str, reason: str) -> None:
+        logging.debug(f"Static fetch fell back to browser for {url}: {reason}")
+        with self._lock:
+            self.stats.fallbacks[reason] = self.stats.fallbacks.get(reason, 0) + 1
+
+
+def is_plain_html_response(page: StaticPage) -> bool:
+    """True for a 200 response carrying HTML."""
+    return page.status_code == 200 and page.content_type.lower().startswith("text/html")
+
+
+def extract_title(root: lxml.html.HtmlElement) -> str:
+    """Page title, or the crawler's usual placeholder."""
+    title = root.find(".//title")
+    if title is not None and title.text:
+        return title.text.strip() or "No Title Found"
+    return "No Title Found"
+
+
+def extract_links(root: lxml.html.HtmlElement, base_url: str) -> list[str]:
+    """Absolute link targets, skipping in-page anchors like the browser path does."""
+    links = []
+    for href in root.xpath("//a/@href"):
+        raw = href.strip()
+        # urljoin drops an empty fragment that a browser's a.href would keep
+        if not raw or raw.endswith("#"):
+            continue
+        href = urljoin(base_url, raw)
+        if "/#" not in href:
+            links.append(href)
+    return links
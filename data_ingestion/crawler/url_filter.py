@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""
+Precompiled URL filters for the website crawler.
+
+Every link found on a page goes through should_skip_url and is_valid_url, so
+nav-heavy pages run these checks hundreds of times each. UrlFilter builds
+everything from the site config once per crawler:
+
+- The site's ``skip_patterns`` become one alternation regex, so each URL
+  needs a single search instead of one per pattern.
+- Non-HTML file extensions live in a set and are found with one lookup of the
+  path's suffix, not a loop of ``endswith`` calls.
+- robots.txt decisions are memoized per URL prefix (see RobotsDecisionCache).
+"""
+
+import re
+from urllib.parse import urlsplit
+
+# Media, documents, feeds and static assets that never contain page text
+NON_HTML_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".svg",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".zip",
+        ".rar",
+        ".mp3",
+        ".mp4",
+        ".m4a",
+        ".wav",
+        ".aac",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webp",
+        ".rss",
+        ".xml",
+        ".ico",
+        ".css",
+        ".js",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".eot",
+    }
+)
+
+# WordPress paths that serve feeds, uploads or admin screens
+NON_HTML_PATH_SEGMENTS = (
+    "/feed/",
+    "/wp-content/uploads/",
+    "/wp-includes/",
+    "/wp-admin/",
+)
+
+# Query parameters of calendar/export links that serve non-HTML content
+CALENDAR_QUERY_PARAMS = ("ical", "export", "format=ical", "format=ics")
+
+ROBOTS_CACHE_MAX_ENTRIES = 50_000
+
+# Patterns that change meaning when joined into one alternation
+_UNCOMBINABLE_PATTERN = re.compile(r"\\\d|\(\?P=|^\(\?[aiLmsux]+\)")
+
+
+def compile_skip_patterns(patterns: list[str]) -> list[re.Pattern]:
+    """Compile skip patterns into as few regexes as possible.
+
+    Plain patterns are joined into one alternation. Patterns with
+    backreferences or global inline flags are compiled on their own. Raises
+    re.error for an invalid pattern.
+    """
+    combinable = [p for p in patterns if not _UNCOMBINABLE_PATTERN.search(p)]
+    compiled = [re.compile(p) for p in patterns if p not in combinable]
+    if len(combinable) == 1:
+        compiled.insert(0, re.compile(combinable[0]))
+    elif combinable:
+        try:
+            compiled.insert(0, re.compile("|".join(f"(?:{p})" for p in combinable)))
+        except re.error:
+            # e.g. the same group name in two patterns
+            compiled[:0] = [re.compile(p) for p in combinable]
+    return compiled
+
+
+def has_non_html_extension(path: str) -> bool:
+    """True if a lowercase URL path ends in a media or asset extension."""
+    _, dot, suffix = path.rpartition(".")
+    return bool(dot) and f".{suffix}" in NON_HTML_EXTENSIONS
+
+
+def _robots_key_length(parser) -> int | None:
+    """Length of URL remainder that decides every robots.txt rule, if known.
+
+    RobotFileParser matches rules with ``startswith`` on the quoted path, so
+    URLs that agree on a long enough prefix always get the same decision.
+    Unquoting can shrink the URL threefold (``%41`` -> ``A``), and one
+    percent-encoded character spans up to 12 characters, hence the margin.
+    Returns None for parsers whose rules can't be read.
+    """
+    try:
+        entries = list(parser.entries)
+        if parser.default_entry:
+            entries.append(parser.default_entry)
+        longest = max(
+            (len(line.path) for entry in entries for line in entry.rulelines),
+            default=0,
+        )
+    except (AttributeError, TypeError):
+        return None
+    return 3 * longest + 12
+
+
+class RobotsDecisionCache:
+    """Memoizes robots.txt decisions per URL prefix for one parser at a time."""
+
+    def __init__(self, user_agent: str, max_entries: int = ROBOTS_CACHE_MAX_ENTRIES):
+        self.user_agent = user_agent
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._parser = None
+        self._key_length: int | None = None
+        self._decisions: dict[str, bool] = {}
+
+    def can_fetch(self, parser, url: str) -> bool:
+        """Same answer as parser.can_fetch, reused for URLs with the same prefix."""
+        if parser is not self._parser:
+            # robots.txt was reloaded; earlier decisions may no longer hold
+            self._parser = parser
+            self._key_length = _robots_key_length(parser)
+            self._decisions = {}
+        if self._key_length is None:
+            return parser.can_fetch(self.user_agent, url)
+
+        parts = urlsplit(url)
+        start = len(parts.scheme) + 3 + len(parts.netloc)
+        key = url[start : start + self._key_length]
+        decision = self._decisions.get(key)
+        if decision is not None:
+            self.hits += 1
+            return decision
+
+        self.misses += 1
+        decision = parser.can_fetch(self.user_agent, url)
+        if len(self._decisions) >= self.max_entries:
+            self._decisions.clear()
+        self._decisions[key] = decision
+        return decision
+
+
+class UrlFilter:
+    """URL checks compiled once from a site config."""
+
+    def __init__(self, skip_patterns: list[str], user_agent: str):
+        self.skip_regexes = compile_skip_patterns(skip_patterns)
+        self.robots = RobotsDecisionCache(user_agent)
+
+    def matches_skip_pattern(self, url: str) -> bool:
+        return any(regex.search(url) for regex in self.skip_regexes)
+
+    @staticmethod
+    def is_calendar_export(query: str) -> bool:
+        """True for calendar/export query strings, e.g. ``?ical=1``."""
+        query = query.lower()
+        return any(param in query for param in CALENDAR_QUERY_PARAMS)
+
+    @staticmethod
+    def is_non_html_path(path: str) -> bool:
+        """True for lowercase paths of media files, feeds and WordPress assets."""
+        return has_non_html_extension(path) or any(
+            segment in path for segment in NON_HTML_PATH_SEGMENTS
+        )
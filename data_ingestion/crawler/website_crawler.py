@@ -14,6 +14,8 @@
 #   -c, --clear-vectors: Clear existing web content vectors for this site before crawling.
 #   --stop-after: Stop crawling after processing this many pages (useful for testing).
 #   --debug: Enable debug mode with detailed logging and page screenshots.
+#   --workers: Number of concurrent browser pages (default: crawl_workers from config, or 1).
+#   --pipeline: Run clean/chunk/embed/upsert as a staged pipeline with bounded queues.
 #
 # Example usage:
 #   website_crawler.py --site ananda-public
@@ -21,6 +23,7 @@
 #   website_crawler.py --site ananda-public --clear-vectors
 #   website_crawler.py --site ananda-public --stop-after 5
 #   website_crawler.py --site ananda-public --debug
+#   website_crawler.py --site ananda-public --workers 4
 
 # Standard library imports
 import argparse
@@ -39,6 +42,8 @@ import sys
 import tempfile
 import time
 import traceback
+from collections import deque
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -47,6 +52,7 @@ from urllib.robotparser import RobotFileParser
 
 # Third party imports
 import pinecone
+import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from playwright.sync_api import TimeoutError as PlaywrightTimeout
@@ -74,6 +80,70 @@ except ImportError:
 
 # Import shared utility
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawler.browser_recycling import (
+    DEFAULT_BROWSER_MAX_MEMORY_MB,
+    DEFAULT_CONTEXT_MAX_PAGES,
+    BrowserMemoryBudget,
+    BrowserRecycleStats,
+    browser_memory_mb,
+    recycle_or_relaunch,
+    start_playwright,
+)
+from crawler.concurrent_crawl import (
+    WORKER_REPORT_INTERVAL_SECONDS,
+    CrawlResult,
+    CrawlWorkerPool,
+    HostPolitenessBudget,
+)
+from crawler.content_extraction import (
+    DEFAULT_CONTENT_EXTRACTOR,
+    main_text,
+    parse_html,
+)
+from crawler.crawl_metrics import DEFAULT_METRICS_INTERVAL_SECONDS, CrawlMetrics
+from crawler.crawl_pipeline import (
+    DEFAULT_STAGE_QUEUE_SIZE,
+    PageJob,
+    StagedPipeline,
+    build_stage_specs,
+)
+from crawler.embedding_batcher import (
+    DEFAULT_BATCH_MAX_TEXTS,
+    DEFAULT_BATCH_MAX_TOKENS,
+    DEFAULT_BATCH_MAX_WAIT_SECONDS,
+    EmbeddingBatcher,
+)
+from crawler.http_revalidation import NOT_MODIFIED, CacheValidators, HttpRevalidator
+from crawler.queue_db import (
+    DEFAULT_CACHE_SIZE_MB,
+    DEFAULT_COMMIT_MAX_SECONDS,
+    DEFAULT_COMMIT_MAX_WRITES,
+    CommitBudget,
+    configure_connection,
+)
+from crawler.resource_blocking import create_resource_blocker
+from crawler.sitemap_seeding import (
+    DEFAULT_SITEMAP_CHECK_INTERVAL_HOURS,
+    RECORD_LASTMOD,
+    RESCHEDULE,
+    SitemapEntry,
+    SitemapReader,
+    SitemapStats,
+    batched,
+    sitemap_lastmod_action,
+)
+from crawler.static_fetch import (
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_STATIC_FETCH_MIN_CHARS,
+    StaticFetcher,
+    create_http_session,
+    extract_links,
+    extract_title,
+    is_plain_html_response,
+)
+from crawler.url_filter import UrlFilter
+from utils.chunk_cache import ChunkCache
+from utils.embedding_cache import CachedEmbeddings, EmbeddingCache
 from utils.pinecone_utils import (
     clear_library_vectors,
     create_pinecone_index_if_not_exists,
@@ -96,6 +166,16 @@ httpx_logger.setLevel(logging.WARNING)
 # Define User-Agent constant
 USER_AGENT = "Ananda Chatbot Crawler"
 
+# How long a URL handed out by claim_next_urls stays reserved if it is never marked
+CLAIM_LEASE_SECONDS = 15 * 60
+
+# URLs per "IN (...)" lookup, well under SQLite's bound-parameter limit
+BULK_QUERY_CHUNK_SIZE = 500
+
+# content_hash of a page whose text was embedded (a SHA-256), as opposed to
+# markers like "non_html" or "pinecone_cleaned"
+EMBEDDED_CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 # Constants
 MAX_PLAYWRIGHT_FIREFOX_PROCS = 3  # Soft cap before we start force-cleaning
 CLEANUP_AGE_SECONDS = 600  # 10 minutes
@@ -234,6 +314,19 @@ def ensure_scheme(url: str, default_scheme: str = "https") -> str:
     return url
 
 
+def _schedule_sort_key(row) -> tuple:
+    """Sort key matching the crawl queue's scheduling ORDER BY."""
+    return (
+        -(row["priority"] or 0),
+        row["status"] != "pending",
+        row["last_crawl"] is not None,
+        row["retry_count"] or 0,
+        row["next_crawl"] is not None,  # SQLite sorts NULL first
+        row["next_crawl"] or "",
+        row["url"],
+    )
+
+
 class WebsiteCrawler:
     def __init__(
         self,
@@ -252,8 +345,91 @@ class WebsiteCrawler:
         self.domain = self.config["domain"]
         self.start_url = ensure_scheme(self.domain)  # Start URL is now just the domain
         self.skip_patterns = self.config.get("skip_patterns", [])
+        self.url_filter = UrlFilter(self.skip_patterns, USER_AGENT)
         self.crawl_frequency_days = self.config.get("crawl_frequency_days", 14)
         self.crawl_delay_seconds = self.config.get("crawl_delay_seconds", 1)
+        # Number of concurrent browser pages (1 = classic single-page loop)
+        self.crawl_workers = self.config.get("crawl_workers", 1)
+        # Fixed pause before each page-ready check; concurrent workers set this to 0
+        # because the per-host politeness budget already spaces their requests
+        self.page_ready_delay_seconds = 1.0
+
+        # Staged processing pipeline (clean -> chunk -> embed -> upsert) sizing
+        self.pipeline_enabled = self.config.get("pipeline_enabled", False)
+        self.pipeline_stage_workers = self.config.get("pipeline_stage_workers", {})
+        self.pipeline_queue_size = self.config.get(
+            "pipeline_queue_size", DEFAULT_STAGE_QUEUE_SIZE
+        )
+        # Reuse chunks of pages whose cleaned text was chunked before, e.g.
+        # after --fresh-start (see utils/chunk_cache.py)
+        self.chunk_cache_enabled = self.config.get("chunk_cache_enabled", True)
+        # Reuse vectors of chunk texts embedded before, by any ingestion script
+        self.embedding_cache_enabled = self.config.get("embedding_cache_enabled", True)
+        # When True, crawl_page returns raw HTML and the pipeline's clean stage
+        # runs clean_content off the browser thread
+        self.defer_content_cleaning = False
+        # Main-text extraction: single-pass lxml walk, or "beautifulsoup" for
+        # the original html.parser implementation
+        self.content_extractor = self.config.get(
+            "content_extractor", DEFAULT_CONTENT_EXTRACTOR
+        )
+
+        # Cross-page embedding batching for the pipeline's embed stage
+        self.embedding_batching_enabled = self.config.get(
+            "embedding_batching_enabled", False
+        )
+        self.embedding_batch_max_texts = self.config.get(
+            "embedding_batch_max_texts", DEFAULT_BATCH_MAX_TEXTS
+        )
+        self.embedding_batch_max_tokens = self.config.get(
+            "embedding_batch_max_tokens", DEFAULT_BATCH_MAX_TOKENS
+        )
+        self.embedding_batch_max_wait_seconds = self.config.get(
+            "embedding_batch_max_wait_seconds", DEFAULT_BATCH_MAX_WAIT_SECONDS
+        )
+        self.embedding_batcher: EmbeddingBatcher | None = None
+
+        # Pooled HTTP client shared by revalidation and the static fetch path
+        pool_size = self.crawl_workers if isinstance(self.crawl_workers, int) else 1
+        self.http_session = create_http_session(
+            USER_AGENT, max(pool_size, DEFAULT_HTTP_POOL_SIZE)
+        )
+
+        # Send a conditional HEAD/GET before re-navigating pages with stored
+        # ETag/Last-Modified validators
+        self.revalidator: HttpRevalidator | None = None
+        if self.config.get("http_revalidation_enabled", True) is True:
+            self.revalidator = HttpRevalidator(USER_AGENT, session=self.http_session)
+
+        # Fetch server-rendered pages over plain HTTP; Playwright only for pages
+        # matching browser_required_patterns or failing the content check
+        self.static_fetcher: StaticFetcher | None = None
+        if self.config.get("static_fetch_enabled", False) is True:
+            self.static_fetcher = StaticFetcher(
+                self.http_session,
+                browser_required_patterns=self.config.get(
+                    "browser_required_patterns", []
+                ),
+                min_chars=self.config.get(
+                    "static_fetch_min_chars", DEFAULT_STATIC_FETCH_MIN_CHARS
+                ),
+            )
+
+        # Seed and refresh the queue from sitemap.xml (Sitemap: lines in
+        # robots.txt, or the sitemap_urls setting)
+        self.sitemap_reader: SitemapReader | None = None
+        if self.config.get("sitemap_seeding_enabled", False) is True:
+            self.sitemap_reader = SitemapReader(self.http_session)
+        self.sitemap_check_interval_hours = self.config.get(
+            "sitemap_check_interval_hours", DEFAULT_SITEMAP_CHECK_INTERVAL_HOURS
+        )
+
+        # Recrawled pages whose content hash matched, so chunking/embedding was skipped
+        self.unchanged_pages_skipped = 0
+        self.unchanged_chars_skipped = 0
+        # Chunks of changed pages whose vector was kept instead of re-embedded
+        self.chunks_reused = 0
+        self.chunks_embedded = 0
 
         # CSV mode configuration
         self.csv_export_url = self.config.get("csv_export_url")
@@ -288,6 +464,40 @@ class WebsiteCrawler:
         # Initialize health monitor
         self.health_monitor = HealthMonitor(self)
 
+        # Browser pages get a fresh context after browser_context_max_pages pages
+        # or when Firefox outgrows browser_max_memory_mb. The browser itself is
+        # relaunched only after a crash.
+        self.browser_context_max_pages = self.config.get(
+            "browser_context_max_pages", DEFAULT_CONTEXT_MAX_PAGES
+        )
+        self.browser_memory_budget = BrowserMemoryBudget(
+            self.config.get("browser_max_memory_mb", DEFAULT_BROWSER_MAX_MEMORY_MB)
+        )
+        self.browser_stats = BrowserRecycleStats()
+
+        # Crawl pages skip images, media, fonts and tracker requests
+        # (resource_blocking_enabled: false loads everything)
+        self.resource_blocker = create_resource_blocker(self.config)
+
+        # Stage latencies and throughput, written to a Prometheus text file
+        # (defaults to db/crawler_metrics_<site>.prom; metrics_enabled: false
+        # turns it off)
+        self.metrics = CrawlMetrics(site_id)
+        self.metrics_file: Path | None = None
+        if self.config.get("metrics_file"):
+            self.metrics_file = Path(self.config["metrics_file"])
+        self.metrics_interval_seconds = self.config.get(
+            "metrics_interval_seconds", DEFAULT_METRICS_INTERVAL_SECONDS
+        )
+        self.metrics_written_at = 0.0
+
+        # Queue writes are committed in groups of db_commit_max_writes writes
+        # or every db_commit_max_seconds seconds (see crawler/queue_db.py)
+        self.commit_budget = CommitBudget(
+            self.config.get("db_commit_max_writes", DEFAULT_COMMIT_MAX_WRITES),
+            self.config.get("db_commit_max_seconds", DEFAULT_COMMIT_MAX_SECONDS),
+        )
+
         # Set up SQLite database for crawl queue (skip for tests)
         self.conn = None
         self.cursor = None
@@ -309,10 +519,25 @@ class WebsiteCrawler:
         db_dir = Path(__file__).parent / "db"
         db_dir.mkdir(exist_ok=True)
         self.db_file = db_dir / f"crawler_queue_{self.site_id}.db"
+        if (
+            self.metrics_file is None
+            and self.config.get("metrics_enabled") is not False
+        ):
+            self.metrics_file = db_dir / f"crawler_metrics_{self.site_id}.prom"
+        self._connect_database()
+        self._create_schema()
+
+    def _connect_database(self) -> None:
+        """Open the queue database in WAL mode with the crawler's cache settings."""
         self.conn = sqlite3.connect(str(self.db_file))
+        configure_connection(
+            self.conn, self.config.get("db_cache_size_mb", DEFAULT_CACHE_SIZE_MB)
+        )
         self.conn.row_factory = sqlite3.Row  # Allow dictionary-like access to rows
         self.cursor = self.conn.cursor()
 
+    def _create_schema(self):
+        """Create queue tables and scheduler indexes on the open connection."""
         # Create crawl_queue table if it doesn't exist
         self.cursor.execute("""
         CREATE TABLE IF NOT EXISTS crawl_queue (
@@ -327,8 +552,26 @@ class WebsiteCrawler:
             retry_after TIMESTAMP,
             failure_type TEXT,
             priority INTEGER DEFAULT 0,
-            modified_date TIMESTAMP
+            modified_date TIMESTAMP,
+            etag TEXT,
+            last_modified TEXT,
+            claimed_until TIMESTAMP
         )""")
+        self._add_missing_columns(
+            "crawl_queue",
+            {"etag": "TEXT", "last_modified": "TEXT", "claimed_until": "TIMESTAMP"},
+        )
+
+        # Scheduler indexes. Pending URLs are read in full ORDER BY order straight
+        # from the first index; visited URLs are range-scanned by next_crawl so
+        # an idle queue answers "nothing due" without touching every row.
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_crawl_queue_pending_order ON crawl_queue (
+            priority DESC, last_crawl IS NULL DESC, retry_count, next_crawl, url
+        ) WHERE status = 'pending'""")
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_crawl_queue_visited_due
+        ON crawl_queue (next_crawl) WHERE status = 'visited'""")
 
         # Create CSV tracking table if it doesn't exist
         self.cursor.execute("""
@@ -339,6 +582,23 @@ class WebsiteCrawler:
             last_error TEXT
         )""")
 
+        # Pinecone vector IDs last upserted for each URL, so stale vectors can be
+        # found and deleted without a metadata query
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS vector_manifest (
+            url TEXT NOT NULL,
+            vector_id TEXT NOT NULL,
+            PRIMARY KEY (url, vector_id)
+        ) WITHOUT ROWID""")
+
+        # Track when sitemaps were last read
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sitemap_tracking (
+            id INTEGER PRIMARY KEY,
+            last_check_time TEXT,
+            last_error TEXT
+        )""")
+
         # Create removal log table to track processed removals and prevent redundant work
         self.cursor.execute("""
         CREATE TABLE IF NOT EXISTS removal_log (
@@ -348,6 +608,17 @@ class WebsiteCrawler:
 
         self.conn.commit()
 
+    def _add_missing_columns(self, table: str, columns: dict[str, str]) -> None:
+        """Add columns introduced after a queue database was first created."""
+        self.cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in self.cursor.fetchall()}
+        for name, column_type in columns.items():
+            if name not in existing:
+                logging.info(f"Adding {name} column to {table}")
+                self.cursor.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"
+                )
+
     @property
     def text_splitter(self):
         """Lazy initialization of text splitter to avoid loading spaCy models in tests."""
@@ -356,6 +627,9 @@ class WebsiteCrawler:
             self._text_splitter = SpacyTextSplitter(
                 chunk_size=250,  # Historical web content chunk size
                 chunk_overlap=50,  # Historical 20% overlap
+                chunk_cache=ChunkCache() if self.chunk_cache_enabled else None,
+                # Pin the model: pipeline threads may run outside this site's environment
+                embedding_model=os.getenv("OPENAI_INGEST_EMBEDDINGS_MODEL"),
             )
         return self._text_splitter
 
@@ -370,6 +644,10 @@ class WebsiteCrawler:
                 )
             self._embedding_model_name = model_name
             self._embeddings = OpenAIEmbeddings(model=model_name, chunk_size=1000)
+            if self.embedding_cache_enabled:
+                self._embeddings = CachedEmbeddings(
+                    self._embeddings, EmbeddingCache(), model=model_name
+                )
         return self._embeddings
 
     def _run_initialization_logic(self):
@@ -405,8 +683,13 @@ class WebsiteCrawler:
         if self._text_splitter is not None:
             logging.info("=== WEBSITE CRAWLER CHUNKING METRICS ===")
             self._text_splitter.metrics.print_summary()
+        if isinstance(self._embeddings, CachedEmbeddings):
+            logging.info(self._embeddings.cache.summary())
 
         if hasattr(self, "conn") and self.conn:
+            # sqlite3 does not commit on close; flush grouped queue writes
+            self.commit_db_changes(force=True)
+            logging.info(self.commit_budget.summary())
             self.conn.close()
 
     def _is_robots_cache_expired(self) -> bool:
@@ -516,6 +799,52 @@ class WebsiteCrawler:
             logging.error(f"Error adding URL to queue: {e}")
             return "error"
 
+    def add_new_urls_to_queue(self, urls: Iterable[str], priority: int = 0) -> int:
+        """Queue every URL not already in crawl_queue, in one transaction.
+
+        Bulk counterpart of add_url_to_queue for link discovery: URLs are
+        normalized and deduplicated in memory, known URLs are filtered out with
+        set-based lookups, and only new ones are inserted. Existing rows are
+        never updated. Returns the number of URLs inserted.
+        """
+        normalized = {self.normalize_url(url) for url in urls}
+        if not normalized:
+            return 0
+
+        try:
+            candidates = sorted(normalized)
+            existing = set()
+            for start in range(0, len(candidates), BULK_QUERY_CHUNK_SIZE):
+                chunk = candidates[start : start + BULK_QUERY_CHUNK_SIZE]
+                self.cursor.execute(
+                    "SELECT url FROM crawl_queue "
+                    f"WHERE url IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                existing.update(row[0] for row in self.cursor.fetchall())
+
+            new_urls = [url for url in candidates if url not in existing]
+            if not new_urls:
+                return 0
+
+            # OR IGNORE covers a row added by another process since the lookup
+            self.cursor.executemany(
+                """
+                INSERT OR IGNORE INTO crawl_queue
+                (url, next_crawl, crawl_frequency, status, priority)
+                VALUES (?, datetime('now'), ?, 'pending', ?)
+                """,
+                [(url, self.crawl_frequency_days, priority) for url in new_urls],
+            )
+            self._record_queue_write()
+            logging.debug(f"Queued {len(new_urls)} new URLs ({len(existing)} known)")
+            return len(new_urls)
+        except Exception as e:
+            # No rollback: it would also discard the grouped status updates,
+            # and rows already inserted OR IGNORE are harmless
+            logging.error(f"Error bulk adding URLs to queue: {e}")
+            return 0
+
     def retry_failed_urls(self):
         """Reset failed URLs to pending status for retry"""
         try:
@@ -552,53 +881,119 @@ class WebsiteCrawler:
         )
         return bool(self.cursor.fetchone())
 
-    def get_next_url_to_crawl(self) -> str | None:
-        """Get the next URL to crawl from the queue"""
-        try:
-            # Get URLs that are due for crawling, including visited URLs due for re-crawling
-            # and pending URLs, respecting retry_after for temporary failures
-            self.cursor.execute("""
-            SELECT url FROM crawl_queue 
-            WHERE (
-                (status = 'pending' AND (retry_after IS NULL OR retry_after <= datetime('now'))) 
-                OR 
-                (status = 'visited' AND next_crawl <= datetime('now'))
+    def _select_due_urls(self, limit: int, exclude: set[str] | None = None) -> list:
+        """Return up to `limit` due queue rows in scheduling order.
+
+        Order: highest priority first, then pending before due re-crawls, new
+        URLs first, fewest retries, longest overdue, then alphabetical. Pending
+        and visited URLs are read with separate index-backed queries and merged
+        here, which gives the same order as one sorted scan over both.
+        """
+        exclude_clause = ""
+        params: tuple = ()
+        if exclude:
+            exclude_clause = f"AND url NOT IN ({','.join('?' * len(exclude))})"
+            params = tuple(exclude)
+        unclaimed = "(claimed_until IS NULL OR claimed_until <= datetime('now'))"
+
+        self.cursor.execute(
+            f"""
+            SELECT url, status, priority, last_crawl, retry_count, next_crawl
+            FROM crawl_queue
+            WHERE status = 'pending'
+              AND (retry_after IS NULL OR retry_after <= datetime('now'))
+              AND {unclaimed} {exclude_clause}
+            ORDER BY priority DESC, last_crawl IS NULL DESC, retry_count ASC,
+                     next_crawl ASC, url ASC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        rows = self.cursor.fetchall()
+        self.cursor.execute(
+            f"""
+            SELECT url, status, priority, last_crawl, retry_count, next_crawl
+            FROM crawl_queue
+            WHERE status = 'visited' AND next_crawl <= datetime('now')
+              AND {unclaimed} {exclude_clause}
+            ORDER BY priority DESC, retry_count ASC, next_crawl ASC, url ASC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        rows.extend(self.cursor.fetchall())
+        rows.sort(key=_schedule_sort_key)
+        return rows[:limit]
+
+    def _reset_due_recrawls(self, rows: list) -> int:
+        """Move visited URLs that are due for re-crawling back to pending.
+
+        Returns the number of URLs moved.
+        """
+        recrawls = [(row["url"],) for row in rows if row["status"] == "visited"]
+        for (url,) in recrawls:
+            logging.info(f"Re-crawling due URL: {url}")
+        if recrawls:
+            self.cursor.executemany(
+                """
+                UPDATE crawl_queue
+                SET status = 'pending', next_crawl = datetime('now')
+                WHERE url = ?
+                """,
+                recrawls,
             )
-            ORDER BY 
-                priority DESC,           -- Highest priority first
-                status = 'pending' DESC,  -- Prioritize pending URLs first
-                last_crawl IS NULL DESC,  -- Then new URLs
-                retry_count ASC,         -- Then URLs with fewer retries
-                next_crawl ASC,          -- Then URLs due longest ago
-                url ASC                  -- Finally alphabetical for consistency
-            LIMIT 1
-            """)
-            result = self.cursor.fetchone()
-            if result:
-                url = result[0]
-                # If this is a visited URL due for re-crawling, reset it to pending
-                self.cursor.execute(
-                    "SELECT status FROM crawl_queue WHERE url = ?",
-                    (self.normalize_url(url),),
-                )
-                status_result = self.cursor.fetchone()
-                if status_result and status_result[0] == "visited":
-                    logging.info(f"Re-crawling due URL: {url}")
-                    self.cursor.execute(
-                        """
-                        UPDATE crawl_queue 
-                        SET status = 'pending', next_crawl = datetime('now')
-                        WHERE url = ?
-                    """,
-                        (self.normalize_url(url),),
-                    )
-                    self.conn.commit()
-                return url
-            return None
+        return len(recrawls)
+
+    def get_next_url_to_crawl(self, exclude: set[str] | None = None) -> str | None:
+        """Get the next URL to crawl from the queue.
+
+        Args:
+            exclude: Queue URLs to leave out, e.g. URLs already handed to
+                concurrent crawl workers but not yet marked.
+        """
+        try:
+            rows = self._select_due_urls(1, exclude)
+            if not rows:
+                return None
+            if self._reset_due_recrawls(rows):
+                self._record_queue_write()
+            return rows[0]["url"]
         except Exception as e:
             logging.error(f"Error getting next URL to crawl: {e}")
             return None
 
+    def claim_next_urls(
+        self,
+        count: int,
+        exclude: set[str] | None = None,
+        lease_seconds: int = CLAIM_LEASE_SECONDS,
+    ) -> list[str]:
+        """Atomically claim up to `count` due URLs for crawling.
+
+        Claimed URLs get a lease (claimed_until) so other callers, including
+        crawlers on other connections, skip them until they are marked or the
+        lease runs out. The whole claim runs in one IMMEDIATE transaction.
+        """
+        if count < 1:
+            return []
+        try:
+            # BEGIN IMMEDIATE cannot start inside a transaction, and other
+            # connections must see the grouped writes before the claim
+            self.commit_db_changes(force=True)
+            self.cursor.execute("BEGIN IMMEDIATE")
+            rows = self._select_due_urls(count, exclude)
+            self._reset_due_recrawls(rows)
+            self.cursor.executemany(
+                "UPDATE crawl_queue SET claimed_until = datetime('now', ?) WHERE url = ?",
+                [(f"+{int(lease_seconds)} seconds", row["url"]) for row in rows],
+            )
+            self.conn.commit()
+            return [row["url"] for row in rows]
+        except Exception as e:
+            self.conn.rollback()
+            logging.error(f"Error claiming URLs to crawl: {e}")
+            return []
+
     def _handle_404_retry_logic(
         self, normalized_url: str, error_msg: str, now: str
     ) -> bool:
@@ -760,8 +1155,13 @@ class WebsiteCrawler:
         status: str,
         error_msg: str | None = None,
         content_hash: str | None = None,
+        validators: CacheValidators | None = None,
     ):
-        """Update URL status in the database"""
+        """Update URL status in the database.
+
+        For 'visited', validators are the ETag/Last-Modified of the response and
+        replace whatever was stored; None clears them.
+        """
         normalized_url = self.normalize_url(url)
         now = datetime.now().isoformat()
 
@@ -771,14 +1171,24 @@ class WebsiteCrawler:
                 next_crawl = self._calculate_next_crawl_with_jitter(
                     self.crawl_frequency_days
                 ).isoformat()
+                validators = validators or CacheValidators()
                 self.cursor.execute(
                     """
                 UPDATE crawl_queue 
                 SET status = ?, last_crawl = ?, next_crawl = ?, content_hash = ?,
-                    retry_count = 0, retry_after = NULL, failure_type = NULL, priority = 0
+                    retry_count = 0, retry_after = NULL, failure_type = NULL, priority = 0,
+                    etag = ?, last_modified = ?
                 WHERE url = ?
                 """,
-                    (status, now, next_crawl, content_hash, normalized_url),
+                    (
+                        status,
+                        now,
+                        next_crawl,
+                        content_hash,
+                        validators.etag,
+                        validators.last_modified,
+                        normalized_url,
+                    ),
                 )
             elif status == "deleted":
                 # Mark URL as deleted - no next crawl time needed
@@ -832,22 +1242,88 @@ class WebsiteCrawler:
                     (status, now, normalized_url),
                 )
 
-            self.conn.commit()
+            # A marked URL is no longer reserved by claim_next_urls
+            self.cursor.execute(
+                "UPDATE crawl_queue SET claimed_until = NULL "
+                "WHERE url = ? AND claimed_until IS NOT NULL",
+                (normalized_url,),
+            )
+            self._record_queue_write()
             return True
         except Exception as e:
             logging.error(f"Error updating URL status: {e}")
             return False
 
-    def commit_db_changes(self):
-        """Commit any pending database changes"""
+    def _record_queue_write(self) -> None:
+        """Count a queue write and commit the group once its budget is used up."""
+        self.commit_budget.record_write()
+        if self.commit_budget.due():
+            self.commit_db_changes(force=True)
+
+    def commit_db_changes(self, force: bool = False):
+        """Commit pending database changes once the commit budget is used up.
+
+        Args:
+            force: Commit now, e.g. before sleeping or closing the connection.
+        """
+        if not force and not self.commit_budget.due():
+            return True
         try:
-            self.conn.commit()
+            with self.metrics.timed("db_commit"):
+                self.conn.commit()
+            self.commit_budget.committed()
             logging.debug("Database changes committed")
             return True
         except Exception as e:
             logging.error(f"Error committing database changes: {e}")
             return False
 
+    def get_queue_depth(self) -> dict[str, int]:
+        """URL count per crawl_queue status."""
+        self.cursor.execute("SELECT status, COUNT(*) FROM crawl_queue GROUP BY status")
+        return {row[0]: row[1] for row in self.cursor.fetchall()}
+
+    def count_due_urls(self) -> int:
+        """Number of URLs that get_next_url_to_crawl could return right now."""
+        if self.cursor is None:
+            return 0
+        self.cursor.execute(
+            """
+            SELECT COUNT(*) FROM crawl_queue
+            WHERE ((status = 'pending'
+                    AND (retry_after IS NULL OR retry_after <= datetime('now')))
+                   OR (status = 'visited' AND next_crawl <= datetime('now')))
+              AND (claimed_until IS NULL OR claimed_until <= datetime('now'))
+            """
+        )
+        return self.cursor.fetchone()[0]
+
+    def write_metrics(self, force: bool = False) -> bool:
+        """Write the metrics file if metrics_interval_seconds have passed.
+
+        Must run on the thread that owns the database connection. Returns True
+        if the file was written.
+        """
+        if self.metrics_file is None or self.cursor is None:
+            return False
+        now = time.time()
+        if not force and now - self.metrics_written_at < self.metrics_interval_seconds:
+            return False
+        self.metrics_written_at = now
+        try:
+            self.metrics.write_textfile(self.metrics_file, self.get_queue_depth())
+            return True
+        except Exception as e:
+            logging.warning(
+                f"Could not write crawler metrics to {self.metrics_file}: {e}"
+            )
+            return False
+
+    def record_page_processed(self) -> None:
+        """Note a processed page for the health monitor and throughput metrics."""
+        self.health_monitor.update_progress()
+        self.metrics.record_page()
+
     def get_queue_stats(self) -> dict:
         """Get statistics about the crawl queue"""
         stats = {
@@ -952,16 +1428,11 @@ class WebsiteCrawler:
     def should_skip_url(self, url: str) -> bool:
         """Check if URL should be skipped based on patterns"""
         # Check standard skip patterns
-        if any(re.search(pattern, url) for pattern in self.skip_patterns):
+        if self.url_filter.matches_skip_pattern(url):
             return True
 
-        # Check for calendar/export URLs that serve non-HTML content
-        parsed = urlparse(url)
-        query_params = parsed.query.lower()
-
-        # Skip URLs with calendar/export parameters
-        calendar_params = ["ical", "ical=1", "export", "format=ical", "format=ics"]
-        if any(param in query_params for param in calendar_params):
+        # Skip URLs with calendar/export parameters that serve non-HTML content
+        if self.url_filter.is_calendar_export(urlparse(url).query):
             logging.debug(f"Skipping calendar/export URL: {url}")
             return True
 
@@ -982,7 +1453,7 @@ class WebsiteCrawler:
             # Check robots.txt compliance (refresh cache if needed)
             self._ensure_robots_cache_fresh()
             if self.robots_parser:
-                if not self.robots_parser.can_fetch(USER_AGENT, url):
+                if not self.url_filter.robots.can_fetch(self.robots_parser, url):
                     logging.debug(f"Robots.txt disallows crawling: {url}")
                     return False
             else:
@@ -996,47 +1467,7 @@ class WebsiteCrawler:
                 return False
 
             # Skip media files and other non-HTML content
-            skip_extensions = [
-                ".jpg",
-                ".jpeg",
-                ".png",
-                ".gif",
-                ".svg",
-                ".pdf",
-                ".doc",
-                ".docx",
-                ".xls",
-                ".xlsx",
-                ".zip",
-                ".rar",
-                ".mp3",
-                ".mp4",
-                ".m4a",  # Added missing audio format
-                ".wav",  # Added missing audio format
-                ".aac",  # Added missing audio format
-                ".avi",
-                ".mov",
-                ".wmv",
-                ".flv",
-                ".webp",
-                ".rss",
-                ".xml",  # Added feed types
-                ".ico",  # Favicon files
-                ".css",  # Stylesheet files
-                ".js",  # JavaScript files
-                ".woff",
-                ".woff2",
-                ".ttf",
-                ".eot",  # Font files
-            ]
-            # Check for media extensions and common non-HTML paths
-            if (
-                any(path.endswith(ext) for ext in skip_extensions)
-                or "/feed/" in path
-                or "/wp-content/uploads/" in path
-                or "/wp-includes/" in path
-                or "/wp-admin/" in path
-            ):
+            if self.url_filter.is_non_html_path(path):
                 logging.debug(f"Skipping non-HTML content: {url}")
                 return False
 
@@ -1173,6 +1604,19 @@ class WebsiteCrawler:
 
     def clean_content(self, html_content: str) -> str:
         """Clean HTML content and extract main text."""
+        if self.content_extractor == "beautifulsoup":
+            return self._clean_content_with_soup(html_content)
+        return self._clean_parsed_content(parse_html(html_content))
+
+    def _clean_parsed_content(self, root) -> str:
+        """clean_content for a page parse_html already parsed (lxml extractor)."""
+        text = main_text(root) if root is not None else ""
+        if not text:
+            logging.warning("No content extracted after fallback attempts")
+        return text
+
+    def _clean_content_with_soup(self, html_content: str) -> str:
+        """Original extraction: html.parser, selector passes, readability reparse."""
         soup = BeautifulSoup(html_content, "html.parser")
 
         # Log debug info and remove unwanted elements
@@ -1323,7 +1767,8 @@ class WebsiteCrawler:
         body_timeout = 30000  # Increased from 15s to 30s for slow-loading pages
 
         # Add small delay between requests to be more respectful to the server
-        time.sleep(1.0)  # 1 second delay between page requests
+        if self.page_ready_delay_seconds > 0:
+            time.sleep(self.page_ready_delay_seconds)
 
         # First check if page is in a reasonable load state
         try:
@@ -1456,8 +1901,11 @@ class WebsiteCrawler:
         html_content = page.content()
         logging.debug(f"Raw HTML content length: {len(html_content)}")
 
-        clean_text = self.clean_content(html_content)
-        logging.debug(f"Cleaned text length: {len(clean_text)}")
+        if self.defer_content_cleaning:
+            clean_text = html_content
+        else:
+            clean_text = self.clean_content(html_content)
+            logging.debug(f"Cleaned text length: {len(clean_text)}")
 
         # Take screenshot in debug mode
         if self.debug:
@@ -1471,7 +1919,12 @@ class WebsiteCrawler:
         return title, clean_text
 
     def _create_page_content(
-        self, url: str, title: str, clean_text: str, schemed_valid_links: list[str]
+        self,
+        url: str,
+        title: str,
+        clean_text: str,
+        schemed_valid_links: list[str],
+        already_clean: bool = False,
     ) -> tuple[PageContent | None, list[str]]:
         """Create final PageContent object and return with links."""
         if not clean_text.strip() and title == "No Title Found":
@@ -1484,6 +1937,9 @@ class WebsiteCrawler:
             content=clean_text,
             metadata={"type": "text", "source": url},
         )
+        if self.defer_content_cleaning and not already_clean:
+            # Content is still raw HTML; the pipeline's clean stage handles it
+            page_content.metadata["needs_cleaning"] = True
 
         logging.debug(
             f"Created PageContent object with {len(clean_text)} chars of content and {len(schemed_valid_links)} valid links"
@@ -1503,19 +1959,22 @@ class WebsiteCrawler:
             return None, []
 
         # Wait for page to be ready
-        self._wait_for_page_ready(page, url)
+        with self.metrics.timed("page_ready"):
+            self._wait_for_page_ready(page, url)
 
         # Validate content presence
         self._validate_content_presence(page, url)
 
         # Handle menu expansion
-        self._expand_menus(page, url)
+        with self.metrics.timed("menu_expansion"):
+            self._expand_menus(page, url)
 
-        # Extract and filter links
-        valid_links = self._extract_links(page, url)
+        with self.metrics.timed("extraction"):
+            # Extract and filter links
+            valid_links = self._extract_links(page, url)
 
-        # Extract title and content
-        title, clean_text = self._extract_title_and_content(page, url)
+            # Extract title and content
+            title, clean_text = self._extract_title_and_content(page, url)
 
         # Process links with schemes
         schemed_valid_links = [ensure_scheme(link) for link in valid_links]
@@ -1558,6 +2017,132 @@ class WebsiteCrawler:
         logging.error(traceback.format_exc())
         return False, False
 
+    def get_cache_validators(self, url: str) -> CacheValidators | None:
+        """Return stored validators if the URL may be revalidated instead of fetched.
+
+        Pages queued with a raised priority (e.g. reported as modified by the CSV
+        export) are always fetched.
+        """
+        if self.cursor is None:
+            return None
+        self.cursor.execute(
+            "SELECT etag, last_modified, content_hash, priority FROM crawl_queue WHERE url = ?",
+            (self.normalize_url(url),),
+        )
+        row = self.cursor.fetchone()
+        if not row or not row["content_hash"] or (row["priority"] or 0) > 0:
+            return None
+        validators = CacheValidators(row["etag"], row["last_modified"])
+        return None if validators.is_empty else validators
+
+    def _revalidate_before_fetch(self, url: str) -> PageContent | None:
+        """Reschedule an unchanged page without a browser navigation.
+
+        Returns a 'not_modified' marker PageContent when the server confirms the
+        stored validators, otherwise None so the caller fetches the page.
+        """
+        if self.revalidator is None:
+            return None
+        validators = self.get_cache_validators(url)
+        if validators is None:
+            return None
+
+        result = self.revalidator.revalidate(url, validators)
+        if result.outcome != NOT_MODIFIED:
+            return None
+
+        logging.info(f"Not modified since last crawl (HTTP revalidation): {url}")
+        self.mark_url_status(
+            url,
+            "visited",
+            content_hash=self.get_stored_content_hash(url),
+            validators=result.validators,
+        )
+        return PageContent(
+            url=url,
+            title="Not Modified",
+            content="",
+            metadata={"type": "not_modified", "source": url},
+        )
+
+    def _attach_cache_validators(self, content: PageContent | None, get_header) -> None:
+        """Record the response's ETag/Last-Modified so they are stored on visit."""
+        if content is None:
+            return
+        validators = CacheValidators.from_headers(get_header)
+        content.metadata["etag"] = validators.etag
+        content.metadata["last_modified"] = validators.last_modified
+
+    def _fetch_without_browser(
+        self, url: str
+    ) -> tuple[PageContent | None, list[str]] | None:
+        """Try revalidation, then the static fast path.
+
+        Returns (content, links) if either handled the URL, or None if the page
+        needs a browser navigation.
+        """
+        not_modified = self._revalidate_before_fetch(url)
+        if not_modified is not None:
+            return not_modified, []
+        return self._try_static_fetch(url)
+
+    def _try_static_fetch(
+        self, url: str
+    ) -> tuple[PageContent | None, list[str]] | None:
+        """Fetch and extract a server-rendered page without Playwright.
+
+        Returns None (after recording why) when the page should go through the
+        browser instead.
+        """
+        fetcher = self.static_fetcher
+        if fetcher is None:
+            return None
+        if fetcher.requires_browser(url):
+            fetcher.record_fallback(url, "site_rule")
+            return None
+        try:
+            static_page = fetcher.fetch(url)
+        except requests.RequestException as e:
+            fetcher.record_fallback(url, f"error:{type(e).__name__}")
+            return None
+        if not is_plain_html_response(static_page):
+            fetcher.record_fallback(url, f"status:{static_page.status_code}")
+            return None
+        if self._is_wordpress_login_redirect(static_page.final_url, url):
+            fetcher.record_fallback(url, "login_redirect")
+            return None
+
+        with self.metrics.timed("extraction"):
+            root = parse_html(static_page.html)
+            if root is None:
+                title, page_links = "No Title Found", []
+            else:
+                # Title and links first: readability may modify the tree
+                title = extract_title(root)
+                page_links = extract_links(root, static_page.final_url)
+            if self.content_extractor == "beautifulsoup":
+                clean_text = self.clean_content(static_page.html)
+            else:
+                clean_text = self._clean_parsed_content(root)
+        if len(clean_text) < fetcher.min_chars:
+            fetcher.record_fallback(url, "thin_content")
+            return None
+
+        fetcher.record_static_page(static_page.elapsed_seconds)
+        links = [ensure_scheme(link) for link in page_links if self.is_valid_url(link)]
+        content, links = self._create_page_content(
+            url, title, clean_text, links, already_clean=True
+        )
+        self._attach_cache_validators(content, static_page.headers.get)
+        if content is not None:
+            content.metadata["fetch_path"] = "static"
+        return content, links
+
+    def _install_resource_blocking(self, page) -> None:
+        """Skip images, media, fonts and trackers on this page, if enabled."""
+        if self.resource_blocker is not None:
+            self.resource_blocker.install(page)
+
     def crawl_page(
         self, browser, page, url: str
     ) -> tuple[PageContent | None, list[str], bool]:
@@ -1568,14 +2153,21 @@ class WebsiteCrawler:
 
         url = ensure_scheme(url)
 
+        without_browser = self._fetch_without_browser(url)
+        if without_browser is not None:
+            content, links = without_browser
+            return content, links, False
+
         while retries > 0:
             try:
                 logging.debug(
                     f"Attempting to navigate to {url} (Attempts left: {retries})"
                 )
                 page.set_default_timeout(30000)
+                self._install_resource_blocking(page)
 
-                response = page.goto(url, wait_until="commit")
+                with self.metrics.timed("goto"):
+                    response = page.goto(url, wait_until="commit")
 
                 # Check if we were redirected to a WordPress login page
                 final_url = page.url
@@ -1608,6 +2200,7 @@ class WebsiteCrawler:
                     continue
 
                 content, links = self._extract_page_content(page, url)
+                self._attach_cache_validators(content, response.header_value)
                 return content, links, False
 
             except Exception as e:
@@ -1638,15 +2231,12 @@ class WebsiteCrawler:
 
         return None, [], restart_needed
 
-    def create_embeddings(
+    def chunk_vector_ids(
         self, chunks: list[str], url: str, page_title: str
-    ) -> list[dict]:
-        """Create embeddings for text chunks using shared embeddings instance."""
-        vectors = []
-
-        for i, chunk in enumerate(chunks):
-            vector = self.embeddings.embed_query(chunk)
-            chunk_id = generate_vector_id(
+    ) -> list[str]:
+        """Pinecone IDs for a page's chunks. IDs hash the chunk text."""
+        return [
+            generate_vector_id(
                 library_name=self.domain,
                 title=page_title,
                 chunk_index=i,
@@ -1656,18 +2246,49 @@ class WebsiteCrawler:
                 author=None,  # Web content typically doesn't have individual authors
                 chunk_text=chunk,
             )
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def create_embeddings(
+        self,
+        chunks: list[str],
+        url: str,
+        page_title: str,
+        known_ids: Collection[str] = (),
+    ) -> list[dict]:
+        """Create embeddings for text chunks using shared embeddings instance.
+
+        All chunks of the page go out in one embed_documents() call. When the
+        pipeline's embedding batcher is active, the call is merged with other
+        pages' chunks.
+
+        Chunks whose ID is in known_ids (the page's vector manifest) are
+        already stored with the same text and position, so they are neither
+        embedded nor returned. reused_vectors() re-upserts them when their
+        total_chunks changed.
+        """
+        vectors = []
+        if not chunks:
+            return vectors
+
+        chunk_ids = self.chunk_vector_ids(chunks, url, page_title)
+        changed = [
+            i for i, chunk_id in enumerate(chunk_ids) if chunk_id not in known_ids
+        ]
+        if not changed:
+            logging.debug(f"All {len(chunks)} chunks unchanged for {url}")
+            return vectors
+        changed_chunks = [chunks[i] for i in changed]
+
+        with self.metrics.timed("embedding"):
+            if self.embedding_batcher is not None:
+                chunk_vectors = self.embedding_batcher.embed(changed_chunks)
+            else:
+                chunk_vectors = self.embeddings.embed_documents(changed_chunks)
 
-            chunk_metadata = {
-                "type": "text",
-                "url": url,
-                "source": url,
-                "title": page_title,
-                "library": self.domain,
-                "text": chunk,
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "crawl_timestamp": datetime.now().isoformat(),
-            }
+        for i, vector in zip(changed, chunk_vectors, strict=True):
+            chunk, chunk_id = chunks[i], chunk_ids[i]
+            chunk_metadata = self._chunk_metadata(chunks, i, url, page_title)
 
             vectors.append(
                 {"id": chunk_id, "values": vector, "metadata": chunk_metadata}
@@ -1679,6 +2300,63 @@ class WebsiteCrawler:
 
         return vectors
 
+    def _chunk_metadata(
+        self, chunks: list[str], i: int, url: str, page_title: str
+    ) -> dict:
+        """Pinecone metadata of a page's i-th chunk."""
+        return {
+            "type": "text",
+            "url": url,
+            "source": url,
+            "title": page_title,
+            "library": self.domain,
+            "text": chunks[i],
+            "chunk_index": i,
+            "total_chunks": len(chunks),
+            "crawl_timestamp": datetime.now().isoformat(),
+        }
+
+    def reused_vectors(
+        self,
+        index: pinecone.Index,
+        chunks: list[str],
+        url: str,
+        page_title: str,
+        known_ids: Collection[str],
+    ) -> list[dict]:
+        """Reused chunks with fresh metadata, if the page's chunk count changed.
+
+        create_embeddings skips chunks in known_ids, but their stored
+        total_chunks is wrong once the page has a different number of chunks.
+        Their values are then fetched from Pinecone, 100 IDs per request, so
+        they can be upserted again with the changed chunks.
+        """
+        if not known_ids or len(known_ids) == len(chunks):
+            return []
+        positions = {
+            chunk_id: i
+            for i, chunk_id in enumerate(self.chunk_vector_ids(chunks, url, page_title))
+            if chunk_id in known_ids
+        }
+        reused_ids = list(positions)
+        vectors = []
+        batch_size = 100
+        for start in range(0, len(reused_ids), batch_size):
+            batch_ids = reused_ids[start : start + batch_size]
+            try:
+                fetched = index.fetch(ids=batch_ids).vectors
+            except Exception as e:
+                logging.error(f"Error fetching reused vectors for {url}: {e}")
+                continue
+            for vector_id, vector in fetched.items():
+                metadata = self._chunk_metadata(
+                    chunks, positions[vector_id], url, page_title
+                )
+                vectors.append(
+                    {"id": vector_id, "values": vector.values, "metadata": metadata}
+                )
+        return vectors
+
     def get_urls_pending_pinecone_deletion(self) -> list[str]:
         """Get URLs marked as 'deleted' that need Pinecone cleanup."""
         try:
@@ -1705,9 +2383,90 @@ class WebsiteCrawler:
             logging.error(f"Error marking Pinecone cleanup complete for {url}: {e}")
             return False
 
-    def remove_url_from_pinecone(self, pinecone_index, url: str) -> int:
-        """
-        Remove all vectors for a specific URL from Pinecone using precise metadata queries.
+    def get_vector_manifest(self, url: str) -> list[str] | None:
+        """Vector IDs last upserted for a URL, or None if none are recorded."""
+        if self.cursor is None:
+            return None
+        self.cursor.execute(
+            "SELECT vector_id FROM vector_manifest WHERE url = ?",
+            (self.normalize_url(url),),
+        )
+        rows = self.cursor.fetchall()
+        return [row[0] for row in rows] if rows else None
+
+    def _replace_vector_manifest(self, url: str, vector_ids: list[str]) -> None:
+        """Store the vector IDs a URL now has in Pinecone."""
+        if self.cursor is None:
+            return
+        normalized_url = self.normalize_url(url)
+        self.cursor.execute(
+            "DELETE FROM vector_manifest WHERE url = ?", (normalized_url,)
+        )
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO vector_manifest (url, vector_id) VALUES (?, ?)",
+            [(normalized_url, vector_id) for vector_id in vector_ids],
+        )
+        self._record_queue_write()
+
+    def _query_vector_ids(self, pinecone_index, url: str) -> list[str]:
+        """Find a URL's vectors with a metadata-filtered Pinecone query.
+
+        Only needed for pages embedded before vector manifests were recorded.
+        """
+        # Use a dummy vector for the query (we only care about metadata filtering)
+        vector_dimension = int(os.getenv("OPENAI_EMBEDDING_DIMENSION", 3072))
+        dummy_vector = [0.0] * vector_dimension
+
+        # Normalize URL for consistent matching (same as our query scripts)
+        normalized_url = self.normalize_url(url)
+        logging.debug(
+            f"Querying Pinecone for vectors with normalized URL: {normalized_url}"
+        )
+
+        # Try both 'url' and 'source' fields since the metadata structure may vary
+        query_response = pinecone_index.query(
+            vector=dummy_vector,
+            filter={"$or": [{"url": normalized_url}, {"source": normalized_url}]},
+            top_k=1000,  # Get up to 1000 matching vectors (should be more than enough for one page)
+            include_metadata=True,
+            include_values=False,  # We don't need the vector values
+        )
+        return [match.id for match in query_response.matches]
+
+    def _delete_vector_ids(
+        self, pinecone_index, vector_ids: list[str], url: str
+    ) -> list[str]:
+        """Delete vectors in batches. Returns the IDs that could not be deleted."""
+        failed = []
+        # Delete vectors in batches of 100 (Pinecone batch limit)
+        batch_size = 100
+        for i in range(0, len(vector_ids), batch_size):
+            batch_ids = vector_ids[i : i + batch_size]
+            try:
+                if self.dry_run:
+                    logging.info(
+                        f"[DRY RUN] Would delete batch of {len(batch_ids)} vectors for URL: {url}"
+                    )
+                    logging.debug(
+                        f"[DRY RUN] Vector IDs: {batch_ids[:3]}{'...' if len(batch_ids) > 3 else ''}"
+                    )
+                else:
+                    pinecone_index.delete(ids=batch_ids)
+                    logging.debug(
+                        f"Deleted batch of {len(batch_ids)} vectors for URL: {url}"
+                    )
+            except Exception as e:
+                logging.error(f"Failed to delete vector batch for URL {url}: {e}")
+                # Continue with remaining batches
+                failed.extend(batch_ids)
+        return failed
+
+    def remove_url_from_pinecone(self, pinecone_index, url: str) -> int:
+        """
+        Remove all vectors for a specific URL from Pinecone.
+
+        Vector IDs come from the URL's stored manifest. Pages embedded before
+        manifests existed fall back to a metadata-filtered query.
 
         Args:
             pinecone_index: Pinecone index instance
@@ -1719,65 +2478,22 @@ class WebsiteCrawler:
         deleted_count = 0
 
         try:
-            # Query Pinecone to find all vectors with this URL in metadata
-            # Use a dummy vector for the query (we only care about metadata filtering)
-            # Get vector dimension from environment
-            vector_dimension = int(os.getenv("OPENAI_EMBEDDING_DIMENSION", 3072))
-            dummy_vector = [0.0] * vector_dimension
-
-            # Normalize URL for consistent matching (same as our query scripts)
-            normalized_url = self.normalize_url(url)
-            logging.debug(
-                f"Querying Pinecone for vectors with normalized URL: {normalized_url}"
-            )
-
-            # Query with metadata filter to find vectors for this URL
-            # Try both 'url' and 'source' fields since the metadata structure may vary
-            query_response = pinecone_index.query(
-                vector=dummy_vector,
-                filter={"$or": [{"url": normalized_url}, {"source": normalized_url}]},
-                top_k=1000,  # Get up to 1000 matching vectors (should be more than enough for one page)
-                include_metadata=True,
-                include_values=False,  # We don't need the vector values
-            )
+            vector_ids = self.get_vector_manifest(url)
+            if vector_ids is None:
+                vector_ids = self._query_vector_ids(pinecone_index, url)
 
-            if not query_response.matches:
+            if not vector_ids:
                 logging.info(f"No vectors found in Pinecone for URL: {url}")
                 return 0
 
-            # Extract vector IDs from the matches
-            vector_ids = [match.id for match in query_response.matches]
             logging.info(f"Found {len(vector_ids)} vectors to delete for URL: {url}")
+            failed = self._delete_vector_ids(pinecone_index, vector_ids, url)
+            deleted_count = len(vector_ids) - len(failed)
+            if not self.dry_run:
+                # Keep failed IDs so a later removal can retry them
+                self._replace_vector_manifest(url, failed)
 
-            if vector_ids:
-                # Delete vectors in batches of 100 (Pinecone batch limit)
-                batch_size = 100
-                for i in range(0, len(vector_ids), batch_size):
-                    batch_ids = vector_ids[i : i + batch_size]
-                    try:
-                        if self.dry_run:
-                            logging.info(
-                                f"[DRY RUN] Would delete batch of {len(batch_ids)} vectors for URL: {url}"
-                            )
-                            logging.debug(
-                                f"[DRY RUN] Vector IDs: {batch_ids[:3]}{'...' if len(batch_ids) > 3 else ''}"
-                            )
-                        else:
-                            pinecone_index.delete(ids=batch_ids)
-                            logging.debug(
-                                f"Deleted batch of {len(batch_ids)} vectors for URL: {url}"
-                            )
-                        deleted_count += len(batch_ids)
-                    except Exception as e:
-                        logging.error(
-                            f"Failed to delete vector batch for URL {url}: {e}"
-                        )
-                        # Continue with remaining batches
-                        continue
-
-                logging.info(
-                    f"Successfully deleted {deleted_count} vectors for URL: {url}"
-                )
+            logging.info(f"Successfully deleted {deleted_count} vectors for URL: {url}")
 
         except Exception as e:
             logging.error(f"Error removing URL from Pinecone {url}: {e}")
@@ -1785,16 +2501,92 @@ class WebsiteCrawler:
 
         return deleted_count
 
-    def should_process_content(self, url: str, current_hash: str) -> bool:
-        """Check if content has changed and should be processed"""
+    def sync_vector_manifest(
+        self, pinecone_index, url: str, vector_ids: list[str]
+    ) -> int:
+        """Record a re-embedded page's vector IDs and delete the ones it lost.
+
+        Call after the new vectors were upserted, before the page's new content
+        hash is stored. Chunk IDs hash the chunk text, so every edited or
+        dropped chunk leaves a stale vector behind. Returns the number of stale
+        vectors deleted.
+        """
+        if self.dry_run:
+            return 0
+        try:
+            previous = self.get_vector_manifest(url)
+            current = set(vector_ids)
+            if previous is None and self._embedded_before_manifests(url):
+                # Embedded before manifests existed: look its vectors up once
+                previous = self._query_vector_ids(pinecone_index, url)
+            else:
+                # A page without a manifest or an earlier embed has no vectors yet
+                previous = previous or []
+                reused = len(current.intersection(previous))
+                self.chunks_reused += reused
+                self.chunks_embedded += len(current) - reused
+            stale = [vector_id for vector_id in previous if vector_id not in current]
+            failed = []
+            if stale:
+                failed = self._delete_vector_ids(pinecone_index, stale, url)
+                logging.debug(
+                    f"Deleted {len(stale) - len(failed)} stale vectors for {url}"
+                )
+            self._replace_vector_manifest(url, list(vector_ids) + failed)
+            return len(stale) - len(failed)
+        except Exception as e:
+            logging.error(f"Error syncing vector manifest for {url}: {e}")
+            return 0
+
+    def _embedded_before_manifests(self, url: str) -> bool:
+        """True if a URL without a vector manifest was embedded by an earlier crawl."""
+        stored_hash = self.get_stored_content_hash(url)
+        return bool(
+            stored_hash and EMBEDDED_CONTENT_HASH_PATTERN.fullmatch(stored_hash)
+        )
+
+    def get_stored_content_hash(self, url: str) -> str | None:
+        """Return the content hash recorded at the last crawl, if any."""
         self.cursor.execute(
             "SELECT content_hash FROM crawl_queue WHERE url = ?",
             (self.normalize_url(url),),
         )
         result = self.cursor.fetchone()
+        return result[0] if result else None
+
+    def should_process_content(self, url: str, current_hash: str) -> bool:
+        """Check if content has changed and should be processed"""
+        stored_hash = self.get_stored_content_hash(url)
 
         # If never seen before or hash has changed, process it
-        return bool(not result or not result[0] or result[0] != current_hash)
+        return bool(not stored_hash or stored_hash != current_hash)
+
+    def record_unchanged_page(self, url: str, content_chars: int) -> None:
+        """Count a recrawl whose chunking and embedding were skipped."""
+        self.unchanged_pages_skipped += 1
+        self.unchanged_chars_skipped += content_chars
+        logging.info(f"Content unchanged for {url}, skipping chunking and embeddings")
+
+    def log_avoided_work_summary(self) -> None:
+        """Log how much chunking/embedding work unchanged-content checks saved."""
+        logging.info(
+            f"Unchanged pages skipped: {self.unchanged_pages_skipped} "
+            f"({self.unchanged_chars_skipped / 1024:.1f} KB of text not chunked "
+            f"or embedded)"
+        )
+        if self.chunks_reused:
+            logging.info(
+                f"Unchanged chunks of changed pages reused: {self.chunks_reused} "
+                f"({self.chunks_embedded} chunks embedded)"
+            )
+        if self.browser_stats.context_recycles or self.browser_stats.browser_restarts:
+            logging.info(self.browser_stats.summary())
+        if self.resource_blocker is not None:
+            logging.info(self.resource_blocker.summary())
+        if self.revalidator is not None:
+            logging.info(self.revalidator.stats.summary())
+        if self.static_fetcher is not None:
+            logging.info(self.static_fetcher.stats.summary())
 
     def parse_csv_date(self, date_str: str) -> datetime | None:
         """Parse CSV date format like '2025-07-13 12:45:35' to datetime object"""
@@ -2481,6 +3273,163 @@ class WebsiteCrawler:
 
         return added_count
 
+    def get_sitemap_urls(self) -> list[str]:
+        """Sitemaps to read: configured, listed in robots.txt, or /sitemap.xml."""
+        configured = self.config.get("sitemap_urls")
+        if configured:
+            return list(configured)
+        listed = self.robots_parser.site_maps() if self.robots_parser else None
+        return listed or [f"{self.start_url.rstrip('/')}/sitemap.xml"]
+
+    def should_check_sitemaps(self) -> bool:
+        """True if sitemap seeding is enabled and the check interval has passed."""
+        if self.sitemap_reader is None:
+            return False
+        try:
+            self.cursor.execute("SELECT last_check_time FROM sitemap_tracking LIMIT 1")
+            result = self.cursor.fetchone()
+            if result and result[0]:
+                since_last = datetime.now() - datetime.fromisoformat(result[0])
+                if since_last < timedelta(hours=self.sitemap_check_interval_hours):
+                    logging.debug(
+                        f"Sitemap check skipped - last check {since_last} ago"
+                    )
+                    return False
+        except Exception as e:
+            logging.error(f"Error checking sitemap timing: {e}")
+        return True
+
+    def update_sitemap_tracking(self, error: str | None = None) -> None:
+        """Record the time (and any error) of the latest sitemap check."""
+        try:
+            now = datetime.now().isoformat()
+            self.cursor.execute("SELECT id FROM sitemap_tracking LIMIT 1")
+            record = self.cursor.fetchone()
+            if record:
+                self.cursor.execute(
+                    "UPDATE sitemap_tracking SET last_check_time = ?, last_error = ? "
+                    "WHERE id = ?",
+                    (now, error, record[0]),
+                )
+            else:
+                self.cursor.execute(
+                    "INSERT INTO sitemap_tracking (last_check_time, last_error) "
+                    "VALUES (?, ?)",
+                    (now, error),
+                )
+            self.conn.commit()
+        except Exception as e:
+            logging.error(f"Error updating sitemap tracking: {e}")
+
+    def sync_sitemap_entries(
+        self, entries: Iterable[SitemapEntry], stats: SitemapStats | None = None
+    ) -> SitemapStats:
+        """Load sitemap entries into crawl_queue in batches.
+
+        New URLs are queued with their lastmod as modified_date. Known URLs are
+        only rescheduled when their lastmod moved past the last crawl; see
+        sitemap_lastmod_action.
+        """
+        stats = stats or SitemapStats()
+        # A failed batch is rolled back; keep grouped writes out of it
+        self.commit_db_changes(force=True)
+        for batch in batched(entries, BULK_QUERY_CHUNK_SIZE):
+            try:
+                self._apply_sitemap_batch(batch, stats)
+            except Exception as e:
+                self.conn.rollback()
+                logging.error(f"Error loading sitemap batch: {e}")
+                stats.errors.append(str(e))
+        return stats
+
+    def _apply_sitemap_batch(
+        self, batch: list[SitemapEntry], stats: SitemapStats
+    ) -> None:
+        """Insert, reschedule or annotate one batch of sitemap entries."""
+        lastmods = {}
+        for entry in batch:
+            if not self.is_valid_url(entry.loc) or self.should_skip_url(entry.loc):
+                stats.filtered += 1
+                continue
+            url = self.normalize_url(entry.loc)
+            # A URL listed twice keeps its newest known lastmod
+            known = [
+                lastmod for lastmod in (lastmods.get(url), entry.lastmod) if lastmod
+            ]
+            lastmods[url] = max(known, default=None)
+        if not lastmods:
+            return
+
+        self.cursor.execute(
+            "SELECT url, status, last_crawl, modified_date FROM crawl_queue "
+            f"WHERE url IN ({','.join('?' * len(lastmods))})",
+            list(lastmods),
+        )
+        existing = {row["url"]: row for row in self.cursor.fetchall()}
+
+        inserts, reschedules, recorded = [], [], []
+        for url, lastmod in lastmods.items():
+            row = existing.get(url)
+            if row is None:
+                inserts.append((url, self.crawl_frequency_days, lastmod))
+                continue
+            action = sitemap_lastmod_action(
+                row["status"], row["last_crawl"], row["modified_date"], lastmod
+            )
+            if action == RESCHEDULE:
+                reschedules.append((lastmod, url))
+            elif action == RECORD_LASTMOD:
+                recorded.append((lastmod, url))
+            else:
+                stats.unchanged += 1
+
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO crawl_queue
+            (url, next_crawl, crawl_frequency, status, priority, modified_date)
+            VALUES (?, datetime('now'), ?, 'pending', 0, ?)
+            """,
+            inserts,
+        )
+        self.cursor.executemany(
+            """
+            UPDATE crawl_queue
+            SET status = 'pending', next_crawl = datetime('now'), modified_date = ?
+            WHERE url = ?
+            """,
+            reschedules,
+        )
+        self.cursor.executemany(
+            "UPDATE crawl_queue SET modified_date = ? WHERE url = ?", recorded
+        )
+        self.conn.commit()
+        stats.inserted += len(inserts)
+        stats.rescheduled += len(reschedules)
+        stats.lastmod_recorded += len(recorded)
+
+    def check_and_process_sitemaps(self) -> int:
+        """Sync the queue with the site's sitemaps if due.
+
+        Returns the number of URLs queued or rescheduled.
+        """
+        if not self.should_check_sitemaps():
+            return 0
+
+        start = time.time()
+        sitemap_urls = self.get_sitemap_urls()
+        logging.info(f"Reading sitemaps: {', '.join(sitemap_urls)}")
+        stats = SitemapStats()
+        self.sync_sitemap_entries(
+            self.sitemap_reader.iter_entries(sitemap_urls, stats), stats
+        )
+        logging.info(f"{stats.summary()} in {time.time() - start:.1f}s")
+
+        error = None
+        if stats.errors and not stats.sitemaps:
+            error = f"No sitemap could be read ({', '.join(stats.errors)})"
+        self.update_sitemap_tracking(error)
+        return stats.inserted + stats.rescheduled
+
     def _calculate_next_crawl_with_jitter(self, base_frequency_days: int) -> datetime:
         """Calculate next crawl time with 12% jitter to prevent synchronized re-crawling.
 
@@ -2535,8 +3484,11 @@ def create_chunks_from_page(page_content, text_splitter) -> list[str]:
     return chunks
 
 
-def upsert_to_pinecone(vectors: list[dict], index: pinecone.Index, index_name: str):
-    """Upsert vectors to Pinecone index."""
+def upsert_to_pinecone(
+    vectors: list[dict], index: pinecone.Index, index_name: str
+) -> list[str]:
+    """Upsert vectors to Pinecone index. Returns the IDs of vectors that failed."""
+    failed_ids = []
     if vectors:
         batch_size = 100  # Pinecone recommends batches of 100 or less
         total_vectors = len(vectors)
@@ -2568,8 +3520,9 @@ def upsert_to_pinecone(vectors: list[dict], index: pinecone.Index, index_name: s
                     raise Exception(f"Vector ID sanitization error: {error_msg}") from e
 
                 # For other errors, continue with next batch
-                pass
+                failed_ids.extend(vector["id"] for vector in batch)
         logging.info(f"Upsert of {total_vectors} vectors complete.")
+    return failed_ids
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -2613,6 +3566,16 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Run in non-interactive mode (auto-continue on health check warnings, suitable for daemons).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of concurrent browser pages (default: crawl_workers from site config, or 1).",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Chunk, embed and upsert in a staged pipeline so browsers keep fetching (also: pipeline_enabled in site config).",
+    )
     parser.add_argument(
         "--max-runtime-minutes",
         type=int,
@@ -3257,7 +4220,9 @@ def _cleanup_orphaned_processes() -> None:
         logging.debug(f"Error in orphaned process cleanup: {e}")
 
 
-def _setup_browser_with_timeout(p, timeout_seconds: int = 120) -> tuple:
+def _setup_browser_with_timeout(
+    p, timeout_seconds: int = 120, cleanup_orphans: bool = True
+) -> tuple:
     """Setup browser with timeout to prevent indefinite hangs.
 
     Note: We pass a longer timeout to Playwright itself rather than
@@ -3265,11 +4230,15 @@ def _setup_browser_with_timeout(p, timeout_seconds: int = 120) -> tuple:
     """
     # Convert seconds to milliseconds for Playwright
     timeout_ms = timeout_seconds * 1000
-    return _setup_browser(p, timeout_ms=timeout_ms)
+    return _setup_browser(p, timeout_ms=timeout_ms, cleanup_orphans=cleanup_orphans)
+
 
+def _setup_browser(p, timeout_ms: int = 60000, cleanup_orphans: bool = True) -> tuple:
+    """Setup and return browser and page with retry logic and resource cleanup.
 
-def _setup_browser(p, timeout_ms: int = 60000) -> tuple:
-    """Setup and return browser and page with retry logic and resource cleanup."""
+    Concurrent crawl workers pass cleanup_orphans=False: the orphan killer cannot
+    tell a sibling worker's live browser from a leftover one.
+    """
     max_retries = 3
     base_delay = 15  # seconds - increased delay for better recovery
 
@@ -3300,10 +4269,11 @@ def _setup_browser(p, timeout_ms: int = 60000) -> tuple:
                     time.sleep(2)  # Give OS time to reclaim memory
 
             # Kill any orphaned Firefox processes before launching new one
-            _cleanup_orphaned_processes()
+            if cleanup_orphans:
+                _cleanup_orphaned_processes()
 
-            # Always add a small delay after cleanup to let ports/resources free up
-            time.sleep(3)
+                # Always add a small delay after cleanup to let ports/resources free up
+                time.sleep(3)
 
             # Add increased delay between attempts to let system recover
             if attempt > 0:
@@ -3439,16 +4409,13 @@ def _setup_browser(p, timeout_ms: int = 60000) -> tuple:
     raise Exception("Unexpected error in browser setup")
 
 
-def _handle_browser_restart(
-    p,
-    page,
-    browser,
+def _log_batch_stats(
     pages_since_restart: int,
     batch_results: list,
     batch_start_time: float,
     crawler: WebsiteCrawler,
-) -> tuple:
-    """Handle browser restart logic and stats calculation with enhanced resource management."""
+) -> None:
+    """Log throughput and queue stats for the pages since the last recycle."""
     batch_attempts = len(batch_results)
     batch_successes = batch_results.count(True)
     batch_success_rate = (
@@ -3474,15 +4441,46 @@ def _handle_browser_restart(
         f"- Session success rate: {round(batch_success_rate)}% (last {batch_attempts} attempts)\n"
         f"- Queue: {stats['pending_retry']} awaiting retry, {stats['high_priority']} high priority\n"
         f"- Average retries per URL with retries: {stats['avg_retry_count']}\n"
+        f"- {crawler.browser_stats.summary()}\n"
         f"--- End Stats ---"
     )
     for line in stats_message.split("\n"):
         logging.info(line)
 
+
+def _handle_browser_restart(
+    p,
+    page,
+    browser,
+    pages_since_restart: int,
+    batch_results: list,
+    batch_start_time: float,
+    crawler: WebsiteCrawler,
+    reason: str = "page error",
+) -> tuple:
+    """Give the crawl a fresh page after a page budget or a page error.
+
+    The page's browser context is recycled on the running browser. The browser
+    is only relaunched (see _relaunch_browser) if it crashed or can't open a
+    new context.
+    """
+    _log_batch_stats(pages_since_restart, batch_results, batch_start_time, crawler)
     logging.info(
-        f"Restarting browser after {pages_since_restart} pages (or due to error)..."
+        f"Recycling browser context after {pages_since_restart} pages ({reason})..."
+    )
+    browser, page, _relaunched = recycle_or_relaunch(
+        browser,
+        page,
+        USER_AGENT,
+        lambda: _relaunch_browser(p, page, browser),
+        crawler.browser_stats,
     )
+    return browser, page, time.time(), []
 
+
+def _relaunch_browser(p, page, browser) -> tuple:
+    """Close the browser and launch a new one. Returns (browser, page)."""
+    logging.info("Restarting browser...")
     # Enhanced browser cleanup with timeout protection and process killing
     cleanup_start = time.time()
     cleanup_success = False
@@ -3537,7 +4535,7 @@ def _handle_browser_restart(
     try:
         browser, page = _setup_browser_with_timeout(p, timeout_seconds=120)
         logging.info("Browser restarted successfully.")
-        return browser, page, time.time(), []
+        return browser, page
     except Exception as restart_err:
         logging.error(
             f"Critical error: Browser restart failed completely: {restart_err}"
@@ -3546,6 +4544,77 @@ def _handle_browser_restart(
         raise
 
 
+def _is_rate_limit_error(e: Exception) -> bool:
+    """Check for OpenAI rate limit errors by message content (more reliable than exception type)."""
+    error_message = str(e).lower()
+    return (
+        "rate limit" in error_message
+        or "rate_limit_exceeded" in error_message
+        or "requests per day" in error_message
+        or "429" in error_message
+    )
+
+
+def _queue_new_links(crawler: WebsiteCrawler, new_links: list) -> None:
+    """Add newly discovered links to the crawl queue."""
+    crawler.add_new_urls_to_queue(
+        link
+        for link in dict.fromkeys(new_links)  # nav links repeat on every page
+        if crawler.is_valid_url(link) and not crawler.should_skip_url(link)
+    )
+
+
+def _page_content_hash(content) -> str:
+    """SHA-256 of the page text, as stored in crawl_queue.content_hash."""
+    return hashlib.sha256(content.content.encode()).hexdigest()
+
+
+def _content_validators(content) -> CacheValidators:
+    """ETag/Last-Modified that crawl_page recorded on the page metadata."""
+    return CacheValidators(
+        etag=content.metadata.get("etag"),
+        last_modified=content.metadata.get("last_modified"),
+    )
+
+
+def _chunk_embed_and_upsert(
+    content,
+    url: str,
+    crawler: WebsiteCrawler,
+    pinecone_index,
+    index_name: str,
+) -> None:
+    """Chunk, embed and upsert a changed page."""
+    with crawler.metrics.timed("chunking"):
+        chunks = create_chunks_from_page(content, crawler.text_splitter)
+    if not chunks:
+        # The page's hash is still stored, so it isn't re-chunked until it changes
+        logging.warning(f"No content chunks created for {url}")
+        # Drop the vectors of a page that used to have content
+        crawler.sync_vector_manifest(pinecone_index, url, [])
+        return
+
+    # Only chunks whose text or position changed since the last embed are embedded
+    known_ids = set(crawler.get_vector_manifest(url) or ())
+    embeddings = crawler.create_embeddings(chunks, url, content.title, known_ids)
+    vector_ids = crawler.chunk_vector_ids(chunks, url, content.title)
+    with crawler.metrics.timed("upsert"):
+        reused = crawler.reused_vectors(
+            pinecone_index, chunks, url, content.title, known_ids
+        )
+        failed_ids = set(
+            upsert_to_pinecone(embeddings + reused, pinecone_index, index_name)
+        )
+    # New vectors that never reached Pinecone must be embedded again on the next
+    # change; reused ones are still stored
+    failed_ids -= known_ids
+    crawler.sync_vector_manifest(
+        pinecone_index, url, [v for v in vector_ids if v not in failed_ids]
+    )
+    logging.debug(f"Successfully processed and upserted: {url}")
+    logging.debug(f"Created {len(chunks)} chunks, {len(embeddings)} embeddings.")
+
+
 def _process_page_content(
     content,
     new_links: list,
@@ -3593,57 +4662,35 @@ def _process_page_content(
             False,
         )  # No pages processed, but increment restart counter to avoid browser restart
 
-    try:
-        chunks = create_chunks_from_page(content, crawler.text_splitter)
-        if chunks:
-            content_hash = hashlib.sha256(content.content.encode()).hexdigest()
-
-            if crawler.should_process_content(url, content_hash):
-                embeddings = crawler.create_embeddings(chunks, url, content.title)
-                upsert_to_pinecone(embeddings, pinecone_index, index_name)
-                logging.debug(f"Successfully processed and upserted: {url}")
-                logging.debug(
-                    f"Created {len(chunks)} chunks, {len(embeddings)} embeddings."
-                )
-            else:
-                logging.info(
-                    f"Content unchanged for {url}, skipping embeddings creation"
-                )
+    if content.metadata.get("type") == "not_modified":
+        # Already rescheduled by crawl_page without a browser navigation
+        return 1, 0, False
 
-            crawler.mark_url_status(url, "visited", content_hash=content_hash)
+    try:
+        # Hash before chunking so unchanged recrawls skip spaCy/tiktoken work too
+        content_hash = _page_content_hash(content)
+        if crawler.should_process_content(url, content_hash):
+            _chunk_embed_and_upsert(content, url, crawler, pinecone_index, index_name)
         else:
-            crawler.mark_url_status(url, "visited", content_hash="no_content")
-            logging.warning(f"No content chunks created for {url}")
-
-        # Add new links to queue
-        for link in new_links:
-            if (
-                crawler.is_valid_url(link)
-                and not crawler.should_skip_url(link)
-                and not crawler.is_url_in_database(link)
-            ):
-                crawler.add_url_to_queue(link)
+            crawler.record_unchanged_page(url, len(content.content))
 
-        return (
-            1,
-            1,
-            False,
-        )  # Increment both counters for successful processing, no rate limit hit
+        crawler.mark_url_status(
+            url,
+            "visited",
+            content_hash=content_hash,
+            validators=_content_validators(content),
+        )
+        _queue_new_links(crawler, new_links)
+
+        # Pages fetched without the browser don't count toward its restart budget
+        restart_inc = 0 if content.metadata.get("fetch_path") == "static" else 1
+        return 1, restart_inc, False  # No rate limit hit
 
     except Exception as e:
         # Log exception type for debugging
         logging.debug(f"Exception type: {type(e).__name__}")
 
-        # Check for rate limit errors by message content (more reliable than exception type)
-        error_message = str(e).lower()
-        is_rate_limit = (
-            "rate limit" in error_message
-            or "rate_limit_exceeded" in error_message
-            or "requests per day" in error_message
-            or "429" in error_message
-        )
-
-        if is_rate_limit:
+        if _is_rate_limit_error(e):
             logging.warning(f"OpenAI rate limit reached for {url}: {e}")
             logging.warning(
                 "Stopping current crawl round and sleeping for 1 hour due to rate limit"
@@ -3782,12 +4829,14 @@ def _initialize_crawl_loop(
     pages_since_restart = 0
     batch_results = []
     batch_start_time = time.time()
-    PAGES_PER_RESTART = 50
+    PAGES_PER_RESTART = crawler.browser_context_max_pages
     stop_after = args.stop_after
 
     if stop_after:
         logging.info(f"Will stop crawling after processing {stop_after} pages")
 
+    _process_sitemap_updates(crawler)
+
     stats = crawler.get_queue_stats()
     logging.info(
         f"Initial queue stats: {stats['pending']} pending, {stats['visited']} visited, {stats['failed']} failed"
@@ -3843,6 +4892,18 @@ def _process_pinecone_deletions(crawler: WebsiteCrawler, pinecone_index) -> int:
     return processed_count
 
 
+def _process_sitemap_updates(crawler: WebsiteCrawler) -> int:
+    """Sync the queue with the site's sitemaps if due. Returns URLs queued."""
+    try:
+        queued = crawler.check_and_process_sitemaps()
+        if queued:
+            logging.info(f"Sitemap check queued {queued} new or changed URLs")
+        return queued
+    except Exception as e:
+        logging.error(f"Error during sitemap check: {e}")
+        return 0
+
+
 def _process_csv_updates(
     crawler: WebsiteCrawler, browser, pinecone_index=None
 ) -> str | None:
@@ -3927,6 +4988,9 @@ def _handle_no_url_processing(
     # Process pending Pinecone deletions for 404'd URLs (high priority)
     _process_pinecone_deletions(crawler, pinecone_index)
 
+    # Pick up new or changed pages listed in the site's sitemaps
+    _process_sitemap_updates(crawler)
+
     # Check for CSV updates before going to sleep (high priority)
     csv_url = _process_csv_updates(crawler, browser, pinecone_index)
     if csv_url:
@@ -3963,6 +5027,7 @@ def _handle_no_url_processing(
         )
 
     # Only sleep if we still don't have a URL to process
+    crawler.commit_db_changes(force=True)
     logging.info("No URLs ready for processing. Sleeping for one hour...\n\n")
     exit_requested = _graceful_sleep(sleep_duration)
     if exit_requested:
@@ -3992,9 +5057,7 @@ def _handle_no_url_processing(
                 crawler.conn.close()
 
             # Recreate the connection
-            crawler.conn = sqlite3.connect(str(crawler.db_file))
-            crawler.conn.row_factory = sqlite3.Row
-            crawler.cursor = crawler.conn.cursor()
+            crawler._connect_database()
             logging.info("Database connection refreshed successfully")
         except Exception as refresh_error:
             logging.error(f"Failed to refresh database connection: {refresh_error}")
@@ -4020,26 +5083,32 @@ def _handle_browser_restart_check(
     crawler: WebsiteCrawler,
     pages_processed: int,
 ) -> tuple[int, int, bool, bool, tuple, bool]:
-    """Handle browser restart if needed."""
+    """Recycle the browser context once the page or memory budget is used up."""
     if pages_since_restart >= PAGES_PER_RESTART:
-        browser, page, batch_start_time, batch_results = _handle_browser_restart(
-            p,
-            page,
-            browser,
-            pages_since_restart,
-            batch_results,
-            batch_start_time,
-            crawler,
-        )
-        return (
-            pages_processed,
-            0,
-            False,
-            True,
-            (browser, page, batch_start_time, batch_results),
-            False,  # Not a rate limit exit
-        )
-    return None  # No restart needed
+        reason = "page budget"
+    else:
+        memory_mb = crawler.browser_memory_budget.exceeded()
+        if memory_mb is None:
+            return None  # No restart needed
+        reason = f"browser memory {memory_mb:.0f} MB"
+    browser, page, batch_start_time, batch_results = _handle_browser_restart(
+        p,
+        page,
+        browser,
+        pages_since_restart,
+        batch_results,
+        batch_start_time,
+        crawler,
+        reason,
+    )
+    return (
+        pages_processed,
+        0,
+        False,
+        True,
+        (browser, page, batch_start_time, batch_results),
+        False,  # Not a rate limit exit
+    )
 
 
 def _handle_crawl_loop_iteration(
@@ -4109,7 +5178,8 @@ def _handle_crawl_loop_iteration(
 
     # Update health monitor progress if we processed a page
     if pages_inc > 0:
-        crawler.health_monitor.update_progress()
+        crawler.record_page_processed()
+    crawler.write_metrics()
 
     # Check if rate limit was hit (separate from should_exit)
     rate_limit_exit = getattr(crawler, "_rate_limit_exit", False)
@@ -4230,7 +5300,11 @@ def _initialize_crawler_runtime(args: argparse.Namespace) -> tuple[float, float]
     return start_time, max_runtime_seconds
 
 
-def _log_crawler_completion(start_time: float, pages_processed: int) -> None:
+def _log_crawler_completion(
+    start_time: float,
+    pages_processed: int,
+    crawler: WebsiteCrawler | None = None,
+) -> None:
     """Log final crawler session statistics."""
     final_elapsed = time.time() - start_time
     logging.info("=== CRAWLER SESSION COMPLETE ===")
@@ -4241,6 +5315,9 @@ def _log_crawler_completion(start_time: float, pages_processed: int) -> None:
     if pages_processed > 0:
         pages_per_minute = pages_processed / (final_elapsed / 60)
         logging.info(f"Pages per minute: {pages_per_minute:.2f}")
+    if crawler is not None:
+        crawler.log_avoided_work_summary()
+        crawler.write_metrics(force=True)
     logging.info("=================================")
 
 
@@ -4346,6 +5423,7 @@ def _run_crawler_main_loop(
 
         # Handle rate limit - sleep for 1 hour and continue
         if rate_limit_hit_flag:
+            crawler.commit_db_changes(force=True)
             if _handle_rate_limit_sleep(start_time, max_runtime_seconds):
                 break
             continue
@@ -4410,6 +5488,644 @@ def _handle_crawler_error(e: Exception) -> None:
         logging.error("========================================")
 
 
+def _create_worker_crawler(crawler: WebsiteCrawler) -> WebsiteCrawler:
+    """Create a fetch-only crawler for a concurrent worker thread.
+
+    Must be called on the worker thread: sqlite3 connections can only be used by
+    the thread that opened them. The worker shares the robots.txt cache of the
+    main crawler and skips the fixed page-ready pause, since the per-host
+    politeness budget already spaces its requests.
+    """
+    worker = WebsiteCrawler(
+        site_id=crawler.site_id,
+        site_config=crawler.config,
+        debug=crawler.debug,
+        skip_db_init=True,
+        skip_robots_init=True,
+        dry_run=crawler.dry_run,
+    )
+    worker.robots_parser = crawler.robots_parser
+    worker.robots_cache_timestamp = crawler.robots_cache_timestamp
+    worker.http_session = crawler.http_session
+    worker.revalidator = crawler.revalidator
+    worker.static_fetcher = crawler.static_fetcher
+    # Fetch stages are timed into the main crawler's metrics, which it writes
+    worker.metrics = crawler.metrics
+    worker.browser_stats = crawler.browser_stats
+    worker.resource_blocker = crawler.resource_blocker
+    worker.page_ready_delay_seconds = 0
+    worker._init_database()
+    worker.metrics_file = None
+    # Commit each write right away: a grouped transaction on the worker's own
+    # connection would hold the write lock the main crawler needs to claim URLs
+    worker.commit_budget = CommitBudget(max_writes=1)
+    return worker
+
+
+class _PlaywrightCrawlSession:
+    """Playwright driver, browser and page owned by one concurrent crawl worker."""
+
+    def __init__(
+        self, crawler: WebsiteCrawler, worker_id: int, defer_cleaning: bool = False
+    ):
+        self.worker_id = worker_id
+        self.worker_crawler = _create_worker_crawler(crawler)
+        self.worker_crawler.defer_content_cleaning = defer_cleaning
+        self.playwright, driver_pid = start_playwright(sync_playwright)
+        self.browser, self.page = _setup_browser_with_timeout(
+            self.playwright, timeout_seconds=120, cleanup_orphans=False
+        )
+        # Each worker's browser runs under its own driver and gets the whole
+        # browser_max_memory_mb; without the driver's pid it is not measured
+        self.memory_budget = BrowserMemoryBudget(
+            crawler.browser_memory_budget.max_memory_mb if driver_pid else None,
+            memory_fn=lambda: browser_memory_mb(driver_pid),
+        )
+
+    def crawl(self, url: str) -> tuple[PageContent | None, list[str], bool]:
+        return self.worker_crawler.crawl_page(self.browser, self.page, url)
+
+    def recycle(self) -> bool:
+        self.browser, self.page, relaunched = recycle_or_relaunch(
+            self.browser,
+            self.page,
+            USER_AGENT,
+            self._relaunch,
+            self.worker_crawler.browser_stats,
+        )
+        return relaunched
+
+    def _relaunch(self) -> tuple:
+        _cleanup_browser(self.page, self.browser)
+        return _setup_browser_with_timeout(
+            self.playwright, timeout_seconds=120, cleanup_orphans=False
+        )
+
+    def close(self) -> None:
+        _cleanup_browser(self.page, self.browser)
+        with suppress(Exception):
+            self.playwright.stop()
+        self.worker_crawler.close()
+
+
+def _browser_memory_exceeded(session: _PlaywrightCrawlSession) -> bool:
+    """True if a worker's own browser has outgrown browser_max_memory_mb."""
+    memory_mb = session.memory_budget.exceeded()
+    if memory_mb is None:
+        return False
+    logging.info(f"Worker {session.worker_id} browser memory {memory_mb:.0f} MB")
+    return True
+
+
+def _use_pipeline(args: argparse.Namespace, crawler: WebsiteCrawler) -> bool:
+    """Return True if pages should go through the staged processing pipeline."""
+    return getattr(args, "pipeline", False) is True or crawler.pipeline_enabled is True
+
+
+def _resolve_worker_count(args: argparse.Namespace, crawler: WebsiteCrawler) -> int:
+    """Return the number of crawl workers (--workers overrides crawl_workers config)."""
+    workers = getattr(args, "workers", None)
+    if not isinstance(workers, int) or workers < 1:
+        workers = crawler.crawl_workers
+    if not isinstance(workers, int) or workers < 1:
+        return 1
+    return workers
+
+
+def _claim_urls_for_workers(
+    crawler: WebsiteCrawler, pool: CrawlWorkerPool, in_flight: set[str]
+) -> bool:
+    """Hand due URLs to idle workers. Returns True if any URL was available."""
+    found_url = False
+    while pool.has_capacity():
+        urls = crawler.claim_next_urls(
+            pool.num_workers - pool.in_flight, exclude=in_flight
+        )
+        if not urls:
+            break
+        found_url = True
+        for url in urls:
+            if crawler.should_skip_url(url):
+                logging.info(f"Skipping URL based on skip patterns: {url}")
+                crawler.mark_url_status(url, "failed", "Skipped by pattern rule")
+                continue
+            in_flight.add(url)
+            pool.submit(url)
+    return found_url
+
+
+def _process_worker_result(
+    result: CrawlResult,
+    crawler: WebsiteCrawler,
+    pool: CrawlWorkerPool,
+    pinecone_index,
+    index_name: str,
+) -> tuple[int, bool]:
+    """Process a page fetched by a worker. Returns (pages_inc, rate_limit_hit)."""
+    if result.restart_needed:
+        logging.warning(
+            f"Worker {result.worker_id} needs a browser restart after attempting {result.url}."
+        )
+        crawler.mark_url_status(result.url, "pending")
+        pool.stats[result.worker_id].record_page(False)
+        return 0, False
+
+    pages_inc, _restart_inc, rate_limit_hit = _process_page_content(
+        result.content, result.links, result.url, crawler, pinecone_index, index_name
+    )
+    crawler.commit_db_changes()
+    pool.stats[result.worker_id].record_page(pages_inc > 0)
+    if pages_inc > 0:
+        crawler.record_page_processed()
+    return pages_inc, rate_limit_hit
+
+
+def _log_worker_throughput(
+    pool: CrawlWorkerPool,
+    pages_processed: int,
+    start_time: float,
+    last_report: float | None = None,
+    pipeline: StagedPipeline | None = None,
+) -> float:
+    """Log per-worker and aggregate pages/minute.
+
+    When last_report is given, only logs once WORKER_REPORT_INTERVAL_SECONDS have
+    passed since then. Returns the time of the latest report.
+    """
+    now = time.time()
+    if last_report is not None and now - last_report < WORKER_REPORT_INTERVAL_SECONDS:
+        return last_report
+
+    elapsed_minutes = (now - start_time) / 60
+    total_ppm = pages_processed / elapsed_minutes if elapsed_minutes > 0 else 0.0
+    logging.info(
+        f"--- Worker throughput: {total_ppm:.1f} pages/minute across {pool.num_workers} workers ---"
+    )
+    pool.log_worker_stats()
+    if pipeline is not None:
+        pipeline.log_stats()
+    return now
+
+
+def _pipeline_clean(crawler: WebsiteCrawler, job: PageJob) -> None:
+    """Clean stage: turn raw HTML from a deferred-cleaning worker into text."""
+    content = job.content
+    if not content.metadata.pop("needs_cleaning", False):
+        return
+    content.content = crawler.clean_content(content.content)
+    if not content.content.strip() and content.title == "No Title Found":
+        raise ValueError(f"No content extracted from {job.url}")
+
+
+def _pipeline_chunk(crawler: WebsiteCrawler, job: PageJob) -> None:
+    """Chunk stage: compare the page hash with the last crawl, then split it."""
+    job.content_hash = _page_content_hash(job.content)
+    if job.previous_hash and job.previous_hash == job.content_hash:
+        job.unchanged = True
+        return
+    with crawler.metrics.timed("chunking"):
+        job.chunks = create_chunks_from_page(job.content, crawler.text_splitter)
+
+
+def _pipeline_embed(crawler: WebsiteCrawler, job: PageJob) -> None:
+    """Embed stage: create vectors for the changed chunks of changed pages."""
+    if job.chunks and not job.unchanged:
+        title = job.content.title
+        job.vectors = crawler.create_embeddings(
+            job.chunks, job.url, title, job.known_vector_ids
+        )
+        # All current IDs, reused ones included, for the manifest update
+        job.vector_ids = crawler.chunk_vector_ids(job.chunks, job.url, title)
+
+
+def _pipeline_upsert(
+    crawler: WebsiteCrawler, pinecone_index, index_name: str, job: PageJob
+) -> None:
+    """Upsert stage: write vectors to Pinecone and release them."""
+    reused = []
+    if job.chunks and job.known_vector_ids:
+        reused = crawler.reused_vectors(
+            pinecone_index, job.chunks, job.url, job.content.title, job.known_vector_ids
+        )
+    if job.vectors or reused:
+        with crawler.metrics.timed("upsert"):
+            failed_ids = set(
+                upsert_to_pinecone(
+                    (job.vectors or []) + reused, pinecone_index, index_name
+                )
+            )
+        # Keep new vectors that never reached Pinecone out of the manifest;
+        # reused ones are still stored
+        failed_ids -= job.known_vector_ids
+        if failed_ids and job.vector_ids is not None:
+            job.vector_ids = [v for v in job.vector_ids if v not in failed_ids]
+        logging.debug(
+            f"Created {len(job.chunks)} chunks, {len(job.vectors or [])} embeddings for {job.url}."
+        )
+        job.vectors = None  # Free memory while the job waits to be marked
+
+
+def _build_crawl_pipeline(
+    crawler: WebsiteCrawler, pinecone_index, index_name: str
+) -> StagedPipeline:
+    """Build the clean -> chunk -> embed -> upsert pipeline from site config."""
+    # Load the splitter and embeddings client here so stage threads never race
+    # on the lazy properties
+    _ = crawler.text_splitter
+    _ = crawler.embeddings
+    stage_fns = {
+        "clean": lambda job: _pipeline_clean(crawler, job),
+        "chunk": lambda job: _pipeline_chunk(crawler, job),
+        "embed": lambda job: _pipeline_embed(crawler, job),
+        "upsert": lambda job: _pipeline_upsert(
+            crawler, pinecone_index, index_name, job
+        ),
+    }
+    stage_workers = crawler.pipeline_stage_workers
+    if not isinstance(stage_workers, dict):
+        stage_workers = {}
+    specs = build_stage_specs(stage_fns, stage_workers, crawler.pipeline_queue_size)
+    if crawler.embedding_batching_enabled is True:
+        embed_workers = next(spec.workers for spec in specs if spec.name == "embed")
+        crawler.embedding_batcher = _create_embedding_batcher(crawler, embed_workers)
+    return StagedPipeline(specs)
+
+
+def _create_embedding_batcher(
+    crawler: WebsiteCrawler, embed_workers: int
+) -> EmbeddingBatcher:
+    """Create the cross-page batcher shared by the embed stage threads."""
+    batcher = EmbeddingBatcher(
+        crawler.embeddings.embed_documents,
+        max_texts=crawler.embedding_batch_max_texts,
+        max_tokens=crawler.embedding_batch_max_tokens,
+        max_wait_seconds=crawler.embedding_batch_max_wait_seconds,
+        expected_callers=embed_workers,
+    )
+    logging.info(
+        f"Cross-page embedding batching enabled (max {batcher.max_texts} chunks, "
+        f"~{batcher.max_tokens} tokens, {batcher.max_wait_seconds}s wait, "
+        f"{embed_workers} embed threads)"
+    )
+    return batcher
+
+
+def _finish_pipeline_job(
+    job: PageJob, crawler: WebsiteCrawler, pinecone_index=None
+) -> tuple[int, bool]:
+    """Mark-status step for a pipeline job. Returns (pages_inc, rate_limit_hit).
+
+    Runs on the main thread, which owns the database connection, so the
+    vector manifest of re-embedded pages is updated here.
+    """
+    url = job.url
+    if job.error is not None:
+        if _is_rate_limit_error(job.error):
+            logging.warning(f"OpenAI rate limit reached for {url}: {job.error}")
+            crawler.mark_url_status(
+                url, "pending", f"Rate limit hit - will retry after sleep: {job.error}"
+            )
+            return 0, True
+        logging.error(
+            f"Failed to process page content {url} ({job.failed_stage} stage): {job.error}"
+        )
+        crawler.mark_url_status(
+            url, "failed", f"Failed during content processing: {str(job.error)}"
+        )
+        return 0, False
+
+    if job.unchanged:
+        crawler.record_unchanged_page(url, len(job.content.content))
+    elif job.chunks:
+        if job.vector_ids is not None and pinecone_index is not None:
+            crawler.sync_vector_manifest(pinecone_index, url, job.vector_ids)
+        logging.debug(f"Successfully processed and upserted: {url}")
+    else:
+        logging.warning(f"No content chunks created for {url}")
+        if pinecone_index is not None:
+            crawler.sync_vector_manifest(pinecone_index, url, [])
+    crawler.mark_url_status(
+        url,
+        "visited",
+        content_hash=job.content_hash,
+        validators=_content_validators(job.content),
+    )
+
+    _queue_new_links(crawler, job.links)
+    crawler.commit_db_changes()
+    crawler.record_page_processed()
+    return 1, False
+
+
+def _is_pipeline_candidate(result: CrawlResult) -> bool:
+    """True if a fetched page needs the chunk/embed/upsert stages."""
+    content = result.content
+    return (
+        not result.restart_needed
+        and content is not None
+        and content.metadata.get("type") not in ("wp_login_redirect", "not_modified")
+    )
+
+
+def _collect_worker_result(
+    crawler: WebsiteCrawler,
+    pool: CrawlWorkerPool,
+    in_flight: set[str],
+    waiting: deque,
+    pipeline: StagedPipeline | None,
+    pinecone_index,
+    index_name: str,
+) -> tuple[int, bool]:
+    """Take one finished fetch and process it or queue it for the pipeline.
+
+    Returns (pages_inc, rate_limit_hit).
+    """
+    result = pool.get_result(timeout=0.2 if pipeline else 1.0)
+    if result is None:
+        return 0, False
+
+    if pipeline is not None and _is_pipeline_candidate(result):
+        waiting.append(
+            PageJob(
+                url=result.url,
+                content=result.content,
+                links=result.links,
+                worker_id=result.worker_id,
+                previous_hash=crawler.get_stored_content_hash(result.url),
+                known_vector_ids=frozenset(
+                    crawler.get_vector_manifest(result.url) or ()
+                ),
+            )
+        )
+        return 0, False
+
+    in_flight.discard(result.url)
+    return _process_worker_result(result, crawler, pool, pinecone_index, index_name)
+
+
+def _feed_pipeline(pipeline: StagedPipeline | None, waiting: deque) -> None:
+    """Move fetched pages into the pipeline until its first stage is full."""
+    while pipeline is not None and waiting and pipeline.try_submit(waiting[0]):
+        waiting.popleft()
+
+
+def _drain_pipeline(
+    crawler: WebsiteCrawler,
+    pool: CrawlWorkerPool,
+    pipeline: StagedPipeline | None,
+    in_flight: set[str],
+    rate_limit_since: float,
+    pinecone_index=None,
+) -> tuple[int, bool]:
+    """Mark every finished pipeline job. Returns (pages_inc, rate_limit_hit).
+
+    Rate limit failures older than rate_limit_since (the end of the last rate
+    limit sleep) only requeue their URL instead of triggering another sleep.
+    """
+    pages_inc = 0
+    rate_limit_hit = False
+    if pipeline is None:
+        return pages_inc, rate_limit_hit
+    while (job := pipeline.get_output()) is not None:
+        in_flight.discard(job.url)
+        job_pages, job_rate_limited = _finish_pipeline_job(job, crawler, pinecone_index)
+        pool.stats[job.worker_id].record_page(job_pages > 0)
+        pages_inc += job_pages
+        if job_rate_limited and (job.failed_at or 0) >= rate_limit_since:
+            rate_limit_hit = True
+    return pages_inc, rate_limit_hit
+
+
+def _handle_idle_workers(
+    crawler: WebsiteCrawler,
+    pool: CrawlWorkerPool,
+    browser,
+    stop_after: int | None,
+    stopping: bool,
+    found_url: bool,
+    pages_processed: int,
+    start_time: float,
+    max_runtime_seconds: float,
+    pinecone_index,
+) -> bool:
+    """Handle a concurrent loop pass with no pages in flight. Returns True to exit."""
+    if stopping:
+        logging.info(f"Reached stop limit of {stop_after} pages. Stopping crawl.")
+        return True
+    if pool.alive_workers == 0:
+        logging.error("All crawl workers have stopped, ending crawl.")
+        return True
+    if found_url:
+        # Only skipped URLs this pass; claim again right away
+        return False
+
+    idle_result = _handle_no_url_processing(
+        crawler,
+        browser,
+        None,
+        pages_processed,
+        0,
+        time.time(),
+        [],
+        start_time,
+        max_runtime_seconds,
+        pinecone_index,
+    )
+    return idle_result[2]  # should_exit
+
+
+def _shutdown_concurrent_crawl(
+    pool: CrawlWorkerPool,
+    pipeline: StagedPipeline | None,
+    pages_processed: int,
+    start_time: float,
+) -> None:
+    """Stop fetch workers and pipeline stages and log final throughput."""
+    abandoned = pool.shutdown()
+    if abandoned:
+        logging.info(
+            f"{len(abandoned)} claimed URLs were not started and remain pending"
+        )
+    if pipeline is not None:
+        # Jobs still in the pipeline keep their 'pending' status and are re-crawled
+        pipeline.shutdown()
+    _log_worker_throughput(pool, pages_processed, start_time, pipeline=pipeline)
+
+
+def _run_concurrent_crawl_loop(
+    crawler: WebsiteCrawler,
+    pinecone_index,
+    index_name: str,
+    num_workers: int,
+    stop_after: int | None,
+    start_time: float,
+    max_runtime_seconds: float,
+    args: argparse.Namespace,
+    browser=None,
+    use_pipeline: bool = False,
+) -> int:
+    """Crawl with several browser pages at once and return the number of pages processed.
+
+    Workers only fetch; the main thread claims URLs and owns the crawler's
+    database connection. Without the pipeline, the main thread also chunks,
+    embeds and upserts each page. With it, those steps run in the staged
+    pipeline (see crawler/crawl_pipeline.py) and the main thread only marks
+    finished pages; it stops claiming URLs while fetched pages wait for room in
+    the pipeline. The crawl_delay_seconds setting becomes a per-host request
+    spacing shared by all workers instead of a sleep after every page.
+    """
+    pages_processed = 0
+    in_flight: set[str] = set()
+    waiting: deque = deque()  # Fetched pages waiting for room in the pipeline
+    rate_limit_since = 0.0
+    politeness = HostPolitenessBudget(crawler.crawl_delay_seconds)
+
+    pipeline = None
+    if use_pipeline:
+        pipeline = _build_crawl_pipeline(crawler, pinecone_index, index_name)
+        pipeline.start()
+
+    pool = CrawlWorkerPool(
+        num_workers,
+        session_factory=lambda worker_id: _PlaywrightCrawlSession(
+            crawler, worker_id, defer_cleaning=use_pipeline
+        ),
+        politeness=politeness,
+        pages_per_restart=crawler.browser_context_max_pages,
+        recycle_due=_browser_memory_exceeded,
+    )
+    pool.start()
+    last_report = time.time()
+
+    try:
+        while not is_exiting():
+            if _check_runtime_limits(
+                start_time, max_runtime_seconds, args, pages_processed
+            ):
+                break
+
+            pages_inc, rate_limit_hit = _drain_pipeline(
+                crawler, pool, pipeline, in_flight, rate_limit_since, pinecone_index
+            )
+
+            stopping = bool(stop_after and pages_processed >= stop_after)
+            found_url = False
+            if not stopping and not waiting:
+                found_url = _claim_urls_for_workers(crawler, pool, in_flight)
+
+            if not in_flight:
+                if _handle_idle_workers(
+                    crawler,
+                    pool,
+                    browser,
+                    stop_after,
+                    stopping,
+                    found_url,
+                    pages_processed,
+                    start_time,
+                    max_runtime_seconds,
+                    pinecone_index,
+                ):
+                    break
+                continue
+
+            # Workers mark failed pages on their own connections; don't hold
+            # the write lock while waiting for them
+            crawler.commit_db_changes(force=True)
+            result_pages, result_rate_limit = _collect_worker_result(
+                crawler, pool, in_flight, waiting, pipeline, pinecone_index, index_name
+            )
+            _feed_pipeline(pipeline, waiting)
+            pages_processed += pages_inc + result_pages
+
+            if rate_limit_hit or result_rate_limit:
+                crawler._rate_limit_exit = False
+                crawler.commit_db_changes(force=True)
+                if _handle_rate_limit_sleep(start_time, max_runtime_seconds):
+                    break
+                rate_limit_since = time.time()
+
+            last_report = _log_worker_throughput(
+                pool, pages_processed, start_time, last_report, pipeline
+            )
+            crawler.write_metrics()
+    finally:
+        _shutdown_concurrent_crawl(pool, pipeline, pages_processed, start_time)
+        if crawler.embedding_batcher is not None:
+            logging.info(crawler.embedding_batcher.stats.summary())
+            crawler.embedding_batcher = None
+        crawler.current_processing_url = None
+
+    return pages_processed
+
+
+def _write_lock_file(lock_file: str | None) -> None:
+    """Create the instance lock file once the browser is up."""
+    if lock_file:
+        logging.info("Browser setup successful, creating lock file")
+        with open(lock_file, "w") as f:
+            f.write(str(os.getpid()))
+
+
+def _run_concurrent_crawl(
+    crawler: WebsiteCrawler,
+    pinecone_index,
+    args: argparse.Namespace,
+    index_name: str,
+    num_workers: int,
+    stop_after: int | None,
+    start_time: float,
+    max_runtime_seconds: float,
+    lock_file: str = None,
+    use_pipeline: bool = False,
+) -> None:
+    """Run the crawl with concurrent browser workers (see crawler/concurrent_crawl.py)."""
+    logging.info(
+        f"Starting concurrent crawl with {num_workers} workers "
+        f"(per-host request spacing: {crawler.crawl_delay_seconds}s, "
+        f"staged pipeline: {'on' if use_pipeline else 'off'})"
+    )
+    # Clean up leftovers once up front; workers launch without the orphan killer
+    _cleanup_orphaned_processes()
+
+    pages_processed = 0
+    browser = None
+    with sync_playwright() as p:
+        # The main thread only needs a browser for CSV exports
+        if crawler.csv_mode_enabled:
+            browser, _page = _setup_browser_with_timeout(
+                p, timeout_seconds=120, cleanup_orphans=False
+            )
+        crawler.health_monitor.start_monitoring()
+        _write_lock_file(lock_file)
+
+        try:
+            pages_processed = _run_concurrent_crawl_loop(
+                crawler,
+                pinecone_index,
+                index_name,
+                num_workers,
+                stop_after,
+                start_time,
+                max_runtime_seconds,
+                args,
+                browser=browser,
+                use_pipeline=use_pipeline,
+            )
+        except SystemExit:
+            logging.info("Received exit signal, shutting down crawler loop.")
+        except Exception as e:
+            _handle_crawler_error(e)
+        finally:
+            _cleanup_browser_resources(browser)
+            _cleanup_orphaned_processes()
+            _log_crawler_completion(start_time, pages_processed, crawler)
+
+    if pages_processed == 0:
+        logging.warning("No pages were crawled successfully in this run.")
+    logging.info(f"Completed processing {pages_processed} pages during this run.")
+
+
 def run_crawl_loop(
     crawler: WebsiteCrawler,
     pinecone_index: pinecone.Index,
@@ -4433,14 +6149,28 @@ def run_crawl_loop(
         stop_after,
     ) = _unpack_crawler_setup(setup_result, args)
 
+    num_workers = _resolve_worker_count(args, crawler)
+    use_pipeline = _use_pipeline(args, crawler)
+    if num_workers > 1 or use_pipeline:
+        _run_concurrent_crawl(
+            crawler,
+            pinecone_index,
+            args,
+            index_name,
+            num_workers,
+            stop_after,
+            start_time,
+            max_runtime_seconds,
+            lock_file,
+            use_pipeline=use_pipeline,
+        )
+        return
+
     with sync_playwright() as p:
         browser, page = _setup_crawler_browser(crawler, p)
 
         # Only create lock file after successful browser setup
-        if lock_file:
-            logging.info("Browser setup successful, creating lock file")
-            with open(lock_file, "w") as f:
-                f.write(str(os.getpid()))
+        _write_lock_file(lock_file)
 
         try:
             pages_processed = _run_crawler_main_loop(
@@ -4470,7 +6200,7 @@ def run_crawl_loop(
             # Final cleanup
             _cleanup_browser_resources(browser)
             _cleanup_orphaned_processes()
-            _log_crawler_completion(start_time, pages_processed)
+            _log_crawler_completion(start_time, pages_processed, crawler)
 
     if pages_processed == 0:
         logging.warning("No pages were crawled successfully in this run.")
@@ -4550,7 +6280,7 @@ def cleanup_and_exit(crawler: WebsiteCrawler) -> None:
     """Perform final cleanup and exit with appropriate code."""
     if "crawler" in locals() and crawler:
         logging.info("Performing final database commit and cleanup...")
-        crawler.commit_db_changes()
+        crawler.commit_db_changes(force=True)
         crawler.close()
 
     if is_exiting():
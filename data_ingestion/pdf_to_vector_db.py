@@ -21,15 +21,19 @@ Run the script with the following options:
 --library-name: Name of the library to process
 --keep-data: Flag to keep existing data in the index (default: false)
 --max-files: Maximum number of files to process (optional, useful for testing)
+--no-embedding-cache: Embed every chunk instead of reusing vectors stored in media/embedding-cache.db
 """
 
 import argparse
 import asyncio
+import bisect
 import json
 import logging
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
 import pdfplumber
 import psutil
@@ -38,6 +42,7 @@ from pinecone import Index
 from tqdm import tqdm
 
 from data_ingestion.utils.checkpoint_utils import pdf_checkpoint_integration
+from data_ingestion.utils.embedding_cache import EmbeddingCache
 from data_ingestion.utils.embeddings_utils import OpenAIEmbeddings
 from data_ingestion.utils.pinecone_utils import (
     clear_library_vectors,
@@ -71,6 +76,11 @@ logger.setLevel(logging.DEBUG)  # Enable DEBUG only for this script
 # Global variable for file path
 file_path = ""
 
+# Page references for streamed chunks: words of each chunk searched for in
+# the document text, and how far ahead of the previous chunk to search
+PAGE_SEARCH_WORDS = 6
+PAGE_SEARCH_WINDOW_CHARS = 100_000
+
 
 def _count_tokens(text: str, model: str = "text-embedding-ada-002") -> int:
     """
@@ -353,39 +363,46 @@ class PyPDFLoader:
 
         return cleaned_text.strip()
 
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        Yield a document per page with text, extracting one page at a time.
+
+        Pages are released once extracted, so memory does not grow with the PDF.
+        Errors are raised; load() turns them into an empty result.
+        """
+        # Open the PDF document with pdfplumber
+        with pdfplumber.open(self.file_path) as pdf:
+            # Extract metadata
+            metadata_dict = pdf.metadata or {}
+
+            for page_num, page in enumerate(pdf.pages):
+                # Extract clean text (filtering headers/footers)
+                text = self._extract_clean_text(page)
+                # pdfplumber caches each page's parsed objects until released
+                page.close()
+
+                # Apply additional text cleaning to remove artifacts
+                if text:
+                    text = self._clean_text_artifacts(text)
+
+                if not text or not text.strip():
+                    continue
+
+                metadata = {
+                    "source": self.file_path,
+                    "page": page_num,
+                    "pdf": {"info": metadata_dict},
+                }
+                yield Document(page_content=text, metadata=metadata)
+
     def load(self):
         """Load a PDF file into documents using pdfplumber with header/footer filtering"""
-        documents = []
         try:
-            # Open the PDF document with pdfplumber
-            with pdfplumber.open(self.file_path) as pdf:
-                # Extract metadata
-                metadata_dict = pdf.metadata or {}
-
-                for page_num, page in enumerate(pdf.pages):
-                    # Extract clean text (filtering headers/footers)
-                    text = self._extract_clean_text(page)
-
-                    # Apply additional text cleaning to remove artifacts
-                    if text:
-                        text = self._clean_text_artifacts(text)
-
-                    if not text or not text.strip():
-                        continue
-
-                    metadata = {
-                        "source": self.file_path,
-                        "page": page_num,
-                        "pdf": {"info": metadata_dict},
-                    }
-                    documents.append(Document(page_content=text, metadata=metadata))
-
+            return list(self.lazy_load())
         except Exception as e:
             logger.error(f"Error reading PDF {self.file_path}: {e}", exc_info=True)
             return []  # Return empty on errors
 
-        return documents
-
 
 class DirectoryLoader:
     """Load documents from a directory"""
@@ -488,83 +505,148 @@ def _extract_document_metadata(raw_doc: Document) -> tuple[str, str, str]:
     return source_url, title, author
 
 
-def _calculate_page_references(
-    docs: list, page_boundaries: list, full_text: str
-) -> list:
+class _ChunkPageLocator:
+    """
+    Find the PDF page each chunk of a document starts on, in chunk order.
+
+    iter_chunks only changes whitespace and joins words hyphenated across
+    lines, so a chunk's first words appear in the document text with
+    whitespace between them and possibly a hyphenated line break inside them.
+    Each search starts where the previous chunk was found, because a chunk's
+    overlap repeats the end of the one before it. A chunk whose words can't be
+    found keeps the previous chunk's page.
+
+    The document text is added with add_text as the splitter reads it, and
+    text before the last search position is dropped, so only the text the
+    splitter has read ahead of its chunks is held.
     """
-    Calculate page references for document chunks efficiently.
 
-    Args:
-        docs: List of document chunks
-        page_boundaries: List of page boundary information
-        full_text: Complete document text
+    def __init__(self):
+        self.text = ""
+        self.text_start = 0  # Document offset of self.text[0]
+        self.position = 0
+        self._page_starts = []
+        self._page_numbers = []
+        self.page_reference = None
+        self.located_count = 0
+
+    def add_text(self, text: str, page_number: int | None = None) -> None:
+        """Append document text; page_number is given for text that starts a page."""
+        if page_number is not None:
+            self._page_starts.append(self.text_start + len(self.text))
+            self._page_numbers.append(page_number)
+        self.text += text
+
+    def locate(self, chunk_text: str) -> str | None:
+        """Page number (as a string) where chunk_text starts, if known."""
+        words = chunk_text.split()[:PAGE_SEARCH_WORDS]
+        if not self._page_starts or not words:
+            return self.page_reference
+
+        pattern = re.compile(
+            r"\s+".join(
+                r"(?:-\s*)?".join(re.escape(char) for char in word) for word in words
+            )
+        )
+        offset = self.position - self.text_start
+        match = pattern.search(self.text, offset, offset + PAGE_SEARCH_WINDOW_CHARS)
+        if match:
+            self.position = self.text_start + match.start()
+            page_index = max(
+                0, bisect.bisect_right(self._page_starts, self.position) - 1
+            )
+            self.page_reference = str(self._page_numbers[page_index])
+            self.located_count += 1
+        else:
+            # Chunks start at least half a chunk apart, even with overlap
+            self.position += len(chunk_text) // 2
+        self._drop_searched_text()
+        return self.page_reference
 
-    Returns:
-        List of documents with page references calculated
+    def _drop_searched_text(self) -> None:
+        """Forget text before the search position; later chunks start after it."""
+        drop = min(self.position - self.text_start, len(self.text))
+        if drop > 0:
+            self.text = self.text[drop:]
+            self.text_start += drop
+
+
+class _PdfPageStream:
     """
-    valid_docs = []
+    A PDF's pages as one document text, extracted and cleaned a page at a time.
 
-    # Create progress bar for page reference calculation
-    config = ProgressConfig(
-        description="Calculating page references",
-        unit="chunk",
-        total=len(docs),
-        show_progress=True,
-    )
+    Iterating yields each page's cleaned text, preceded by the separator
+    _determine_page_separator picks after the page before it, and adds each
+    piece to locator as the splitter reads it. Only the current page is held,
+    instead of the whole document in one string.
+    """
 
-    progress_bar = create_progress_bar(config)
+    def __init__(self, pages: Iterable[Document]):
+        self._pages = iter(pages)
+        self.locator = _ChunkPageLocator()
+        self.page_count = 0
+        # Read the first page with text up front for the document's metadata
+        self._first_page = self._next_page()
+        self.metadata = self._first_page[0].metadata.copy() if self._first_page else {}
+
+    def _next_page(self) -> tuple[Document, str] | None:
+        """Next (page, cleaned text) with text, or None after the last page."""
+        for page_doc in self._pages:
+            self.page_count += 1
+            page_text = clean_document_text((page_doc.page_content or "").strip())
+            if page_text:
+                return page_doc, page_text
+        return None
 
-    try:
-        for i, doc in enumerate(docs):
-            # Check for graceful shutdown
-            if is_exiting():
-                logger.info(
-                    "Graceful shutdown detected during page reference calculation."
-                )
-                break
+    def __iter__(self) -> Iterator[str]:
+        page = self._first_page
+        self._first_page = None
+        previous_end = ""
+        while page is not None:
+            page_doc, page_text = page
+            if previous_end:
+                separator = _determine_page_separator(previous_end, page_text)
+                self.locator.add_text(separator)
+                yield separator
+            # Use actual PDF page number (not sequential index)
+            page_number = page_doc.metadata.get("page", self.page_count - 1) + 1
+            self.locator.add_text(page_text, page_number)
+            yield page_text
+            # _determine_page_separator only looks at the last 50 characters
+            previous_end = page_text[-50:]
+            page = self._next_page()
 
-            if isinstance(doc.page_content, str) and doc.page_content.strip():
-                page_reference = None
-
-                if page_boundaries:
-                    # More efficient approach: estimate position based on chunk sequence
-                    estimated_position = (i / len(docs)) * len(full_text)
-
-                    # Find the page containing this estimated position
-                    for page_boundary in page_boundaries:
-                        if (
-                            page_boundary["start_offset"]
-                            <= estimated_position
-                            <= page_boundary["end_offset"]
-                        ):
-                            page_reference = str(page_boundary["page_number"])
-                            doc.metadata["page"] = page_reference
-                            break
-
-                    # If estimation didn't work, try a few nearby pages
-                    if not page_reference:
-                        for page_boundary in page_boundaries:
-                            # Check if chunk might span this page (with some tolerance)
-                            page_start = page_boundary["start_offset"]
-                            page_end = page_boundary["end_offset"]
-                            tolerance = len(full_text) * 0.02  # 2% tolerance
-
-                            if (
-                                estimated_position >= page_start - tolerance
-                                and estimated_position <= page_end + tolerance
-                            ):
-                                page_reference = str(page_boundary["page_number"])
-                                doc.metadata["page"] = page_reference
-                                break
-
-                valid_docs.append(doc)
 
-            progress_bar.update(1)
+def _iter_chunk_documents(
+    raw_doc: Document,
+    text_splitter: SpacyTextSplitter,
+    page_locator: _ChunkPageLocator,
+    pages: _PdfPageStream | None = None,
+) -> Iterator[Document]:
+    """
+    Split a document with iter_chunks, yielding chunk Documents as they are made.
 
-    finally:
-        progress_bar.close()
+    The text comes from pages when given, otherwise from raw_doc.page_content.
+    Each chunk gets the document's metadata, its chunk index and, when it can
+    be located, the page it starts on.
+    """
+    document_id = raw_doc.metadata.get("source")
+    text = raw_doc.page_content if pages is None else pages
+    chunks = text_splitter.iter_chunks(text, document_id=document_id)
+    for chunk_index, chunk in enumerate(chunks):
+        if is_exiting():
+            logger.info("Graceful shutdown detected while splitting document.")
+            return
+        if not chunk.strip():
+            continue
 
-    return valid_docs
+        chunk_metadata = raw_doc.metadata.copy()
+        chunk_metadata["chunk_index"] = chunk_index
+        chunk_metadata["document_id"] = document_id
+        page_reference = page_locator.locate(chunk)
+        if page_reference:
+            chunk_metadata["page"] = page_reference
+        yield Document(page_content=chunk, metadata=chunk_metadata)
 
 
 async def _process_single_batch(
@@ -636,67 +718,68 @@ async def _process_single_batch(
 
 
 async def _process_chunks_in_batches(
-    valid_docs: list,
+    docs: Iterable[Document],
     pinecone_index,
     embeddings,
     library_name: str,
     batch_size: int = 5,  # Reduced batch size for better stability
-) -> int:
+) -> tuple[int, int]:
     """
     Process document chunks in batches with progress tracking and rate limiting.
 
+    Chunks are taken from docs one batch at a time, so a document streamed from
+    iter_chunks is embedded and upserted while the rest is still being split.
+
     Args:
-        valid_docs: List of validated document chunks
+        docs: Document chunks, e.g. from _iter_chunk_documents
         pinecone_index: Pinecone index for storage
         embeddings: OpenAI embeddings instance
         library_name: Name of the library
         batch_size: Number of chunks to process per batch (reduced from 10 to 5)
 
     Returns:
-        int: Total number of failed chunks across all batches
+        tuple[int, int]: (chunks processed, failed chunks across all batches)
     """
-    # Calculate batch ranges
-    batch_ranges = [
-        (i, min(i + batch_size, len(valid_docs)))
-        for i in range(0, len(valid_docs), batch_size)
-    ]
-
-    # Create progress bar for batch processing
+    # Create progress bar for batch processing (the number of batches isn't known up front)
     config = ProgressConfig(
         description="Processing batches",
         unit="batch",
-        total=len(batch_ranges),
         show_progress=True,
     )
 
     progress_bar = create_progress_bar(config)
+    docs = iter(docs)
+    total_chunks = 0
     total_failed_chunks = 0
 
     try:
-        for batch_num, (start_idx, end_idx) in enumerate(batch_ranges):
+        while True:
             # Check for graceful shutdown before starting each batch
             if is_exiting():
                 logger.info("Graceful shutdown detected during batch processing.")
                 break
 
-            batch = valid_docs[start_idx:end_idx]
+            batch = list(islice(docs, batch_size))
+            if not batch:
+                break
+
+            # Add a small delay between batches to prevent overwhelming APIs
+            if total_chunks:
+                await asyncio.sleep(1.0)  # 1 second delay between batches
 
             # Process the single batch and get failed count
             failed_count = await _process_single_batch(
-                batch, start_idx, pinecone_index, embeddings, library_name
+                batch, total_chunks, pinecone_index, embeddings, library_name
             )
+            total_chunks += len(batch)
             total_failed_chunks += failed_count
 
-            # Add a small delay between batches to prevent overwhelming APIs
-            if batch_num < len(batch_ranges) - 1:  # Don't delay after the last batch
-                await asyncio.sleep(1.0)  # 1 second delay between batches
-
             progress_bar.update(1)
 
     finally:
         progress_bar.close()
 
-    return total_failed_chunks
+    return total_chunks, total_failed_chunks
 
 
 def _split_oversized_chunk(text: str, max_tokens: int = 8192) -> list[str]:
@@ -814,10 +897,14 @@ async def process_document(
     doc_index: int,
     library_name: str,
     text_splitter: SpacyTextSplitter,
+    pages: _PdfPageStream | None = None,
 ) -> tuple[bool, int, int]:
     """
     Processes a single document, splitting it into chunks using spaCy and adding it to the vector store.
 
+    A PDF is passed as pages, streamed to the splitter a page at a time and
+    used to find each chunk's page; raw_doc then only supplies the metadata.
+
     Returns:
         tuple[bool, int, int]: (success, total_chunks, failed_chunks)
     """
@@ -849,34 +936,23 @@ async def process_document(
     # Get document filename for logging context
     doc_filename = os.path.basename(raw_doc.metadata.get("source", "Unknown File"))
 
-    # Split document into chunks
+    # Split document into chunks, embedding each batch as soon as it is split
     logger.info(f"Splitting complete document {doc_filename} into chunks...")
-    docs = text_splitter.split_documents([raw_doc])
-
-    # Calculate page references for chunks
-    page_boundaries = raw_doc.metadata.get("page_boundaries", [])
-    full_text = raw_doc.page_content
+    page_locator = pages.locator if pages is not None else _ChunkPageLocator()
 
-    logger.info(
-        f"Processing {len(docs)} chunks, page_boundaries available: {len(page_boundaries) > 0}"
+    total_chunks, failed_chunks = await _process_chunks_in_batches(
+        _iter_chunk_documents(raw_doc, text_splitter, page_locator, pages),
+        pinecone_index,
+        embeddings,
+        library_name,
     )
 
-    valid_docs = _calculate_page_references(docs, page_boundaries, full_text)
-
-    if valid_docs:
-        logger.info(f"Document {doc_filename} split into {len(valid_docs)} chunks")
-        # Count how many got page references
-        with_page_refs = sum(1 for doc in valid_docs if doc.metadata.get("page"))
+    if total_chunks:
+        logger.info(f"Document {doc_filename} split into {total_chunks} chunks")
         logger.info(
-            f"DEBUG: {with_page_refs}/{len(valid_docs)} chunks got page references"
+            f"DEBUG: {page_locator.located_count}/{total_chunks} chunks got page references"
         )
 
-        # Process chunks in batches
-        failed_chunks = await _process_chunks_in_batches(
-            valid_docs, pinecone_index, embeddings, library_name
-        )
-
-        total_chunks = len(valid_docs)
         success = failed_chunks == 0
 
         if failed_chunks > 0:
@@ -1161,10 +1237,17 @@ def _initialize_pinecone_services(library_name: str, keep_data: bool) -> tuple:
     return pinecone, pinecone_index
 
 
-def _initialize_processing_components() -> tuple:
+def _initialize_processing_components(use_embedding_cache: bool = True) -> tuple:
     """
     Initialize text splitter and OpenAI embeddings.
 
+    No chunk cache: PDFs are streamed to the splitter page by page, and
+    streams are never cached. Pages would have to be extracted on a hit
+    anyway, to find each chunk's page.
+
+    Args:
+        use_embedding_cache: Reuse vectors from previous runs for unchanged chunks
+
     Returns:
         tuple: (text_splitter, embeddings)
     """
@@ -1179,7 +1262,10 @@ def _initialize_processing_components() -> tuple:
             raise ValueError(
                 "OPENAI_INGEST_EMBEDDINGS_MODEL environment variable not set"
             )
-        embeddings = OpenAIEmbeddings(model=model_name)
+        embeddings = OpenAIEmbeddings(
+            model=model_name,
+            cache=EmbeddingCache() if use_embedding_cache else None,
+        )
     except ValueError as e:
         logger.error(f"Error initializing OpenAI Embeddings: {e}")
         sys.exit(1)
@@ -1213,70 +1299,25 @@ def _discover_pdf_files() -> list[str]:
 
 def _assemble_full_document(pages_from_pdf: list) -> Document | None:
     """
-    Assemble pages into a single document with page boundaries tracking.
+    Assemble pages into a single document, joined like _PdfPageStream joins them.
+
+    Ingestion streams pages instead; this is for tools that need the whole text.
 
     Args:
         pages_from_pdf: List of page documents from PDF loader
 
     Returns:
-        Document: Assembled document with page boundaries, or None if no content
+        Document: Assembled document, or None if no content
     """
-    if not pages_from_pdf:
+    pages = _PdfPageStream(pages_from_pdf)
+    full_text = "".join(pages)
+    if not full_text:
         return None
-
-    # Extract metadata from first page (should be consistent across all pages)
-    first_page = pages_from_pdf[0]
-
-    # Concatenate all page content and track page boundaries
-    full_text_parts = []
-    page_boundaries = []  # Track where each page starts/ends in concatenated text
-    current_offset = 0
-
-    for page_index, page_doc in enumerate(pages_from_pdf):
-        if page_doc.page_content and page_doc.page_content.strip():
-            page_text = page_doc.page_content.strip()
-
-            # Add intelligent spacing between pages
-            if page_index > 0:
-                # Get the last few characters of the previous page
-                previous_text = full_text_parts[-1] if full_text_parts else ""
-
-                # Determine appropriate separator based on text flow
-                page_separator = _determine_page_separator(previous_text, page_text)
-                full_text_parts.append(page_separator)
-                current_offset += len(page_separator)
-
-            # Track this page's boundaries in the concatenated text
-            start_offset = current_offset
-            full_text_parts.append(page_text)
-            current_offset += len(page_text)
-            end_offset = current_offset
-
-            # Use actual PDF page number (not sequential index)
-            actual_pdf_page_number = page_doc.metadata.get("page", page_index) + 1
-            page_boundaries.append(
-                {
-                    "page_number": actual_pdf_page_number,
-                    "start_offset": start_offset,
-                    "end_offset": end_offset,
-                }
-            )
-
-    if not full_text_parts:
-        return None
-
-    # Create a single document with all content (no page markers)
-    full_document = Document(
-        page_content=clean_document_text("".join(full_text_parts)),
-        metadata={
-            **first_page.metadata.copy(),
-            "page_boundaries": page_boundaries,
-            "total_pages": len(pages_from_pdf),
-        },
+    return Document(
+        page_content=full_text,
+        metadata={**pages.metadata, "total_pages": len(pages_from_pdf)},
     )
 
-    return full_document
-
 
 async def _process_single_pdf(
     pdf_path: str,
@@ -1307,34 +1348,24 @@ async def _process_single_pdf(
     logger.info(f"Processing PDF file {file_index + 1} of {total_files}: {pdf_path}")
 
     try:
-        pdf_loader = PyPDFLoader(pdf_path)
-        pages_from_pdf = pdf_loader.load()
+        # Pages are extracted as the splitter reads them, so a book-length PDF
+        # is never held in memory as a whole
+        pages = _PdfPageStream(PyPDFLoader(pdf_path).lazy_load())
 
-        if not pages_from_pdf:
+        if not pages.metadata:
             logger.warning(f"No pages or text extracted from {pdf_path}. Skipping.")
             save_checkpoint_func(file_index + 1)
             return False, "No pages or text extracted from PDF"
 
-        logger.info(f"Loaded {len(pages_from_pdf)} pages from {pdf_path}.")
-
-        # Assemble pages into full document
-        full_document = _assemble_full_document(pages_from_pdf)
-
-        if not full_document:
-            logger.warning(
-                f"No text content found in any pages of {pdf_path}. Skipping."
-            )
-            save_checkpoint_func(file_index + 1)
-            return False, "No text content found in any pages"
-
         # Process the complete document
         success, total_chunks, failed_chunks = await process_document(
-            full_document,
+            Document(page_content="", metadata=pages.metadata),
             pinecone_index,
             embeddings,
             0,
             library_name,
             text_splitter,
+            pages=pages,
         )
 
         if not success:
@@ -1364,7 +1395,7 @@ async def _process_single_pdf(
         # Add summary for this PDF
         pdf_filename = os.path.basename(pdf_path)
         logger.info(
-            f"✓ Completed {pdf_filename} - processed {len(pages_from_pdf)} pages as single document"
+            f"✓ Completed {pdf_filename} - processed {pages.page_count} pages as single document"
         )
         logger.info(
             f"Successfully processed PDF file {file_index + 1} of {total_files} ({((file_index + 1) / total_files * 100):.1f}% done in scan)"
@@ -1587,7 +1618,12 @@ def _print_final_statistics(
     )
 
 
-async def run(keep_data: bool, library_name: str, max_files: int | None) -> None:
+async def run(
+    keep_data: bool,
+    library_name: str,
+    max_files: int | None,
+    use_embedding_cache: bool = True,
+) -> None:
     """
     Main function to run the document ingestion process.
     This function orchestrates the entire ingestion workflow.
@@ -1622,7 +1658,7 @@ async def run(keep_data: bool, library_name: str, max_files: int | None) -> None
 
     # Initialize services and components
     pinecone, pinecone_index = _initialize_pinecone_services(library_name, keep_data)
-    text_splitter, embeddings = _initialize_processing_components()
+    text_splitter, embeddings = _initialize_processing_components(use_embedding_cache)
 
     # Discover PDF files to process
     pdf_file_paths = _discover_pdf_files()
@@ -1703,6 +1739,8 @@ async def run(keep_data: bool, library_name: str, max_files: int | None) -> None
         text_splitter,
         failed_files,
     )
+    if embeddings.cache is not None:
+        print(embeddings.cache.summary())
 
 
 def main():
@@ -1732,6 +1770,11 @@ def main():
         type=int,
         help="Maximum number of files to process (useful for testing)",
     )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Embed every chunk instead of reusing vectors from previous runs",
+    )
 
     args = parser.parse_args()
 
@@ -1745,7 +1788,14 @@ def main():
         sys.exit(1)
 
     # Run the ingestion process
-    asyncio.run(run(args.keep_data, args.library_name, args.max_files))
+    asyncio.run(
+        run(
+            args.keep_data,
+            args.library_name,
+            args.max_files,
+            use_embedding_cache=not args.no_embedding_cache,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -41,6 +41,9 @@ Command Line Arguments:
     --overwrite-pdfs: Optional. Force regeneration and upload of PDFs even if they already exist in S3.
     --no-pdf-uploads: Optional. Disable PDF generation and S3 uploads.
     --debug-pdfs: Optional. Enable debug mode for PDF generation.
+    --chunking-workers: Optional. Processes used to chunk each batch with spaCy (default: 1).
+    --no-chunk-cache: Optional. Re-chunk every post instead of reusing chunks stored in media/chunk-cache.db.
+    --no-embedding-cache: Optional. Embed every chunk instead of reusing vectors stored in media/embedding-cache.db.
 
 Example Usage:
     python ingest_db_text.py --site ananda --database wp_ananda --library-name "Ananda Library" --keep-data
@@ -48,6 +51,7 @@ Example Usage:
     python ingest_db_text.py --site ananda --database wp_ananda --library-name "Ananda Library" --no-pinecone
     python ingest_db_text.py --site ananda --database wp_ananda --library-name "Ananda Library" --no-pinecone --overwrite-pdfs
     python ingest_db_text.py --site ananda --database wp_ananda --library-name "Ananda Library" --no-pdf-uploads
+    python ingest_db_text.py --site ananda --database wp_ananda --library-name "Ananda Library" --chunking-workers 4
 """
 
 import argparse
@@ -75,6 +79,8 @@ from reportlab.lib.pdfencrypt import StandardEncryption
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
+from data_ingestion.utils.chunk_cache import ChunkCache
+from data_ingestion.utils.embedding_cache import CachedEmbeddings, EmbeddingCache
 from data_ingestion.utils.pinecone_utils import generate_vector_id
 from data_ingestion.utils.progress_utils import (
     ProgressConfig,
@@ -980,6 +986,22 @@ def parse_arguments():
         action="store_true",
         help="Store PDFs locally for debugging instead of uploading to S3.",
     )
+    parser.add_argument(
+        "--chunking-workers",
+        type=int,
+        default=1,
+        help="Processes used to chunk each batch with spaCy (default: 1, chunk in the main process).",
+    )
+    parser.add_argument(
+        "--no-chunk-cache",
+        action="store_true",
+        help="Re-chunk every post instead of reusing chunks from previous runs.",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Embed every chunk instead of reusing vectors from previous runs, e.g. after a metadata-only change.",
+    )
     return parser.parse_args()
 
 
@@ -1728,8 +1750,8 @@ def _initialize_batch_processing():
     )
 
 
-def _process_document_chunks(post_data: dict, text_splitter) -> tuple[list, int]:
-    """Processes a document by splitting into chunks and preparing chunk data."""
+def _build_chunking_document(post_data: dict) -> Document:
+    """Builds the plain-text document that is split into chunks for a post."""
     post_id = post_data.get("id", "N/A")
 
     # Create document metadata for SpacyTextSplitter
@@ -1744,11 +1766,21 @@ def _process_document_chunks(post_data: dict, text_splitter) -> tuple[list, int]
     # This ensures clean text for embeddings while preserving original HTML for PDF generation
     content_for_chunking = remove_html_tags(post_data["content"])
 
-    # Create Langchain document and split into chunks
-    langchain_doc = Document(
-        page_content=content_for_chunking, metadata=document_metadata
-    )
-    docs = text_splitter.split_documents([langchain_doc])
+    return Document(page_content=content_for_chunking, metadata=document_metadata)
+
+
+def _process_document_chunks(
+    post_data: dict, text_splitter, docs: list | None = None
+) -> tuple[list, int]:
+    """Processes a document by splitting into chunks and preparing chunk data.
+
+    docs holds the post's chunks when they were already split in parallel.
+    """
+    post_id = post_data.get("id", "N/A")
+
+    if docs is None:
+        # Create Langchain document and split into chunks
+        docs = text_splitter.split_documents([_build_chunking_document(post_data)])
 
     if not docs:
         logger.warning(
@@ -1759,6 +1791,19 @@ def _process_document_chunks(post_data: dict, text_splitter) -> tuple[list, int]
     return docs, len(docs)
 
 
+def _next_split_docs(chunked_posts) -> list | None:
+    """Next post's chunks from a parallel split, or None when splitting per post.
+
+    Re-raises the post's splitting error so it is tracked like a serial failure.
+    """
+    if chunked_posts is None:
+        return None
+    docs = next(chunked_posts)
+    if isinstance(docs, Exception):
+        raise docs
+    return docs
+
+
 def _prepare_vector_data(
     docs: list,
     post_data: dict,
@@ -1914,9 +1959,13 @@ def process_and_upsert_batch(
     no_pdf_uploads: bool = False,
     debug_pdfs: bool = False,
     overwrite_pdfs: bool = False,
+    parallel_chunking: bool = False,
 ) -> tuple[bool, list[int]]:
     """Processes a batch of documents: splits, embeds, and upserts to Pinecone, respecting dry_run.
 
+    With parallel_chunking, the whole batch is handed to the text splitter's
+    worker pool up front, and each post is embedded as soon as its chunks arrive.
+
     Returns:
         tuple[bool, list[int]]: A tuple containing:
             - bool: True if any processing errors occurred during the batch, False otherwise.
@@ -1930,6 +1979,13 @@ def process_and_upsert_batch(
         processed_ids_in_batch,
     ) = _initialize_batch_processing()
 
+    chunked_posts = None
+    if parallel_chunking:
+        chunked_posts = text_splitter.iter_split_documents(
+            [_build_chunking_document(post_data) for post_data in batch_data],
+            return_exceptions=True,
+        )
+
     # Process each document in the batch
     for post_data in batch_data:
         post_id = post_data.get("id", "N/A")
@@ -1941,7 +1997,9 @@ def process_and_upsert_batch(
 
         try:
             # Process document chunks - let specific exceptions bubble up
-            docs, chunk_count = _process_document_chunks(post_data, text_splitter)
+            docs, chunk_count = _process_document_chunks(
+                post_data, text_splitter, _next_split_docs(chunked_posts)
+            )
             if not docs:
                 continue
 
@@ -2316,6 +2374,7 @@ def run_ingestion_loop(
                 no_pdf_uploads=args.no_pdf_uploads,
                 debug_pdfs=args.debug_pdfs,
                 overwrite_pdfs=args.overwrite_pdfs,
+                parallel_chunking=args.chunking_workers > 1,
             )
 
             if not batch_had_errors:
@@ -2401,7 +2460,12 @@ def _log_startup_info(args: argparse.Namespace) -> None:
         )
 
 
-def _prepare_models_and_splitter(no_pinecone: bool):
+def _prepare_models_and_splitter(
+    no_pinecone: bool,
+    chunking_workers: int = 1,
+    use_chunk_cache: bool = True,
+    use_embedding_cache: bool = True,
+):
     """Prepare embedding model and text splitter unless Pinecone is disabled.
 
     Returns a tuple of (embeddings_model, text_splitter).
@@ -2415,9 +2479,17 @@ def _prepare_models_and_splitter(no_pinecone: bool):
                 "OPENAI_INGEST_EMBEDDINGS_MODEL environment variable not set"
             )
         embeddings_model = OpenAIEmbeddings(model=model_name, chunk_size=500)
+        if use_embedding_cache:
+            embeddings_model = CachedEmbeddings(
+                embeddings_model, EmbeddingCache(), model=model_name
+            )
         # Historical SQL/database processing used 1000 chars (~250 tokens) with 200 chars (~50 tokens) overlap (20%)
         text_splitter = SpacyTextSplitter(
-            chunk_size=250, chunk_overlap=50, log_summary_on_split=False
+            chunk_size=250,
+            chunk_overlap=50,
+            log_summary_on_split=False,
+            workers=chunking_workers,
+            chunk_cache=ChunkCache() if use_chunk_cache else None,
         )
 
     return embeddings_model, text_splitter
@@ -2485,7 +2557,12 @@ def _handle_rows(
 
     Returns (processed_count_session, skipped_count_session, error_count_session, last_processed_id_session, text_splitter)
     """
-    embeddings_model, text_splitter = _prepare_models_and_splitter(no_pinecone)
+    embeddings_model, text_splitter = _prepare_models_and_splitter(
+        no_pinecone,
+        args.chunking_workers,
+        not args.no_chunk_cache,
+        not args.no_embedding_cache,
+    )
 
     if no_pinecone:
         (
@@ -2505,21 +2582,27 @@ def _handle_rows(
             text_splitter,
         )
 
-    (
-        processed_count_session,
-        skipped_count_session,
-        error_count_session,
-        last_processed_id_session,
-    ) = run_ingestion_loop(
-        all_rows,
-        processed_doc_ids,
-        args,
-        pinecone_index,
-        embeddings_model,
-        text_splitter,
-        checkpoint_file,
-        dry_run,
-    )
+    try:
+        (
+            processed_count_session,
+            skipped_count_session,
+            error_count_session,
+            last_processed_id_session,
+        ) = run_ingestion_loop(
+            all_rows,
+            processed_doc_ids,
+            args,
+            pinecone_index,
+            embeddings_model,
+            text_splitter,
+            checkpoint_file,
+            dry_run,
+        )
+    finally:
+        # Stop the chunking worker processes
+        text_splitter.close()
+        if isinstance(embeddings_model, CachedEmbeddings):
+            logger.info(embeddings_model.cache.summary())
 
     return (
         processed_count_session,
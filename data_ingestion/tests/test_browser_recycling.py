@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Unit tests for browser context recycling."""
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import Mock
+
+from crawler.browser_recycling import (
+    BrowserMemoryBudget,
+    BrowserRecycleStats,
+    browser_memory_mb,
+    open_page,
+    psutil,
+    recycle_or_relaunch,
+    recycle_page,
+    start_playwright,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _browser(connected: bool = True) -> Mock:
+    browser = Mock()
+    browser.is_connected.return_value = connected
+    browser.new_page.return_value.evaluate.return_value = "browser_ready"
+    return browser
+
+
+class TestRecyclePage(unittest.TestCase):
+    def test_open_page_sets_user_agent(self):
+        browser = _browser()
+        page = open_page(browser, "agent")
+        page.set_extra_http_headers.assert_called_once_with({"User-Agent": "agent"})
+
+    def test_unresponsive_page_is_closed_and_raises(self):
+        browser = _browser()
+        browser.new_page.return_value.evaluate.return_value = None
+        with self.assertRaises(RuntimeError):
+            open_page(browser, "agent")
+        browser.new_page.return_value.close.assert_called_once()
+
+    def test_recycle_closes_old_page_even_if_close_fails(self):
+        browser = _browser()
+        old_page = Mock()
+        old_page.close.side_effect = Exception("already closed")
+
+        new_page = recycle_page(browser, old_page, "agent")
+
+        old_page.close.assert_called_once()
+        self.assertIs(new_page, browser.new_page.return_value)
+
+
+class TestRecycleOrRelaunch(unittest.TestCase):
+    def test_connected_browser_is_reused(self):
+        browser = _browser()
+        relaunch = Mock()
+        stats = BrowserRecycleStats()
+
+        result = recycle_or_relaunch(browser, Mock(), "agent", relaunch, stats)
+
+        self.assertEqual(result, (browser, browser.new_page.return_value, False))
+        relaunch.assert_not_called()
+        self.assertEqual(stats.context_recycles, 1)
+        self.assertEqual(stats.browser_restarts, 0)
+
+    def test_crashed_browser_is_relaunched(self):
+        relaunch = Mock(return_value=("new-browser", "new-page"))
+        stats = BrowserRecycleStats()
+
+        result = recycle_or_relaunch(
+            _browser(connected=False), Mock(), "agent", relaunch, stats
+        )
+
+        self.assertEqual(result, ("new-browser", "new-page", True))
+        self.assertEqual(stats.browser_restarts, 1)
+        self.assertEqual(stats.context_recycles, 0)
+
+    def test_failed_recycle_falls_back_to_relaunch(self):
+        browser = _browser()
+        browser.new_page.side_effect = Exception("Target closed")
+        relaunch = Mock(return_value=("new-browser", "new-page"))
+
+        result = recycle_or_relaunch(
+            browser, Mock(), "agent", relaunch, BrowserRecycleStats()
+        )
+
+        self.assertTrue(result[2])
+        relaunch.assert_called_once()
+
+    def test_summary_reports_time_lost(self):
+        stats = BrowserRecycleStats()
+        stats.record_recycle(0.5)
+        stats.record_recycle(0.3)
+        stats.record_restart(42.0)
+        self.assertEqual(
+            stats.summary(),
+            "Browser: 2 context recycles (0.8s, avg 0.40s), "
+            "1 full restarts (42.0s lost)",
+        )
+
+
+class TestBrowserMemoryBudget(unittest.TestCase):
+    def test_reports_over_budget_once_per_interval(self):
+        clock = FakeClock()
+        memory = Mock(return_value=3000.0)
+        budget = BrowserMemoryBudget(
+            2048, memory, check_interval_seconds=10, clock=clock
+        )
+
+        self.assertEqual(budget.exceeded(), 3000.0)
+        self.assertIsNone(budget.exceeded())
+        clock.now += 11
+        self.assertEqual(budget.exceeded(), 3000.0)
+        self.assertEqual(memory.call_count, 2)
+
+    def test_under_budget_unknown_or_disabled(self):
+        self.assertIsNone(BrowserMemoryBudget(2048, lambda: 100.0).exceeded())
+        self.assertIsNone(BrowserMemoryBudget(2048, lambda: None).exceeded())
+        memory = Mock(return_value=9999.0)
+        self.assertIsNone(BrowserMemoryBudget(None, memory).exceeded())
+        memory.assert_not_called()
+
+    def test_memory_of_this_process_tree(self):
+        memory = browser_memory_mb()
+        if memory is not None:
+            self.assertGreaterEqual(memory, 0)
+
+    def test_memory_of_a_process_without_firefox(self):
+        self.assertEqual(browser_memory_mb(_sleeper_pid(self)), 0)
+
+
+def _sleeper_pid(test: unittest.TestCase) -> int:
+    """Start a short-lived child process; it is stopped when the test ends."""
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    test.addCleanup(proc.wait)
+    test.addCleanup(proc.kill)
+    return proc.pid
+
+
+@unittest.skipIf(psutil is None, "psutil is needed to find the driver process")
+class TestStartPlaywright(unittest.TestCase):
+    def test_returns_the_driver_process(self):
+        pids = []
+        playwright = Mock()
+        playwright.start.side_effect = lambda: pids.append(_sleeper_pid(self))
+
+        _, driver_pid = start_playwright(lambda: playwright)
+
+        self.assertEqual(driver_pid, pids[0])
+
+    def test_no_pid_without_a_new_process(self):
+        playwright = Mock()
+
+        self.assertEqual(
+            start_playwright(lambda: playwright), (playwright.start.return_value, None)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
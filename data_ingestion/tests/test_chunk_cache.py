@@ -0,0 +1,247 @@
+"""Tests for the on-disk chunk cache used by SpacyTextSplitter."""
+
+import io
+import multiprocessing
+import pickle
+import random
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from data_ingestion.utils.chunk_cache import ChunkCache, chunk_cache_key
+from data_ingestion.utils.text_splitter_utils import Document, SpacyTextSplitter
+
+WORDS = ["light", "peace", "wisdom", "the", "of", "and", "practice", "teacher"]
+
+
+class FakeNlp:
+    """Whitespace tokenizer standing in for spaCy."""
+
+    def __call__(self, text: str):
+        return [
+            SimpleNamespace(text=m.group(1), whitespace_=m.group(2), is_space=False)
+            for m in re.finditer(r"(\S+)(\s*)", text)
+        ]
+
+    def pipe(self, texts, batch_size: int = 1):
+        return map(self, texts)
+
+
+fake_nlp = FakeNlp()
+
+
+@pytest.fixture(autouse=True)
+def offline_models():
+    """A small BPE encoding and fake spaCy model, since neither can be downloaded."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in WORDS:
+        for piece in (word, " " + word):
+            encoded = piece.encode()
+            for length in range(2, len(encoded) + 1):
+                ranks.setdefault(encoded[:length], len(ranks))
+    encoding = tiktoken.Encoding(
+        name="test_words",
+        pat_str=r""" ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks=ranks,
+        special_tokens={},
+    )
+    with (
+        patch.dict(
+            "os.environ", {"OPENAI_INGEST_EMBEDDINGS_MODEL": "text-embedding-ada-002"}
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+            {"text-embedding-ada-002": encoding},
+            clear=True,
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._SPACY_MODEL_CACHE",
+            {"en_core_web_sm": fake_nlp},
+            clear=True,
+        ),
+    ):
+        yield
+
+
+@pytest.fixture
+def cache(tmp_path):
+    chunk_cache = ChunkCache(tmp_path / "chunk-cache.db")
+    yield chunk_cache
+    chunk_cache.close()
+
+
+def make_text(seed: int) -> str:
+    rng = random.Random(seed)
+    return "\n\n".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 120))) + "."
+        for _ in range(rng.randint(5, 30))
+    )
+
+
+def make_splitter(chunk_cache=None, **kwargs) -> SpacyTextSplitter:
+    return SpacyTextSplitter(
+        log_summary_on_split=False, chunk_cache=chunk_cache, **kwargs
+    )
+
+
+class TestChunkCache:
+    def test_round_trip_and_miss(self, cache):
+        cache.put("a", ["one", "two"], [1, 2])
+
+        assert cache.get("a") == (["one", "two"], [1, 2])
+        assert cache.get("b") is None
+
+    def test_entries_survive_reopening(self, cache, tmp_path):
+        cache.put("a", ["one"], [1])
+        cache.close()
+
+        assert ChunkCache(tmp_path / "chunk-cache.db").get("a") == (["one"], [1])
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        chunk = "wisdom " * 100
+        cache = ChunkCache(tmp_path / "chunk-cache.db", max_size_mb=0.002)
+        cache.put("old", [chunk], [100])
+        cache.put("used", [chunk], [100])
+        cache.get("used")
+
+        cache.put("new", [chunk], [100])
+
+        assert cache.get("old") is None
+        assert cache.get("used") is not None
+        assert cache.get("new") is not None
+        assert cache.stats()["size_bytes"] <= cache.max_size_bytes
+
+    def test_pickled_copy_opens_its_own_connection(self, cache):
+        cache.put("a", ["one"], [1])
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert copy.get("a") == (["one"], [1])
+        assert copy._conn is not cache._conn
+
+    def test_key_depends_on_text_and_config(self):
+        config = {"chunk_size": 250}
+
+        key = chunk_cache_key(["some text"], config)
+
+        assert key == chunk_cache_key(["some text"], dict(config))
+        assert key != chunk_cache_key(["other text"], config)
+        assert key != chunk_cache_key(["some text"], {"chunk_size": 300})
+
+
+class TestSplitterWithChunkCache:
+    def test_split_text_hit_returns_stored_chunks(self, cache):
+        text = make_text(seed=1)
+        expected = make_splitter().split_text(text)
+        make_splitter(cache).split_text(text)
+        splitter = make_splitter(cache)
+
+        with patch.object(
+            SpacyTextSplitter, "_chunk_with_token_counts", side_effect=AssertionError
+        ):
+            chunks = splitter.split_text(text)
+
+        assert chunks == expected
+        assert splitter.metrics.cache_hits == 1
+        assert splitter.metrics.cache_misses == 0
+
+    def test_hit_records_the_same_metrics(self, cache):
+        text = make_text(seed=2)
+        first, second = make_splitter(cache), make_splitter(cache)
+
+        first.split_text(text, document_id="doc")
+        second.split_text(text, document_id="doc")
+
+        summaries = [first.get_metrics_summary(), second.get_metrics_summary()]
+        assert (summaries[0]["cache_misses"], summaries[1]["cache_hits"]) == (1, 1)
+        assert summaries[1]["cache_hit_rate"] == 1.0
+        for summary in summaries:
+            for key in ("cache_hits", "cache_misses", "cache_hit_rate"):
+                del summary[key]
+        assert summaries[0] == summaries[1]
+
+    def test_text_cleaned_to_the_same_result_hits(self, cache):
+        text = make_text(seed=3)
+        splitter = make_splitter(cache)
+
+        splitter.split_text(text)
+        splitter.split_text(text.replace("\n\n", "\n\n\n\n") + "\n")
+
+        assert splitter.metrics.cache_hits == 1
+
+    def test_changed_text_or_settings_miss(self, cache):
+        text = make_text(seed=4)
+        make_splitter(cache).split_text(text)
+
+        other_text = make_splitter(cache)
+        other_text.split_text(text + " wisdom")
+        other_size = make_splitter(cache, chunk_size=100, chunk_overlap=20)
+        chunks = other_size.split_text(text)
+
+        assert other_text.metrics.cache_misses == 1
+        assert other_size.metrics.cache_misses == 1
+        assert chunks == make_splitter(chunk_size=100, chunk_overlap=20).split_text(
+            text
+        )
+
+    def test_engines_share_entries(self, cache):
+        text = make_text(seed=5)
+        make_splitter(cache, chunking_engine="strings").split_text(text)
+        splitter = make_splitter(cache, chunking_engine="offsets")
+
+        splitter.split_text(text)
+
+        assert splitter.metrics.cache_hits == 1
+
+    def test_iter_chunks_hit_yields_stored_chunks(self, cache):
+        text = make_text(seed=6)
+        expected = list(make_splitter().iter_chunks(text))
+        first, second = make_splitter(cache), make_splitter(cache)
+
+        assert list(first.iter_chunks(text, document_id="doc")) == expected
+        assert list(second.iter_chunks(text, document_id="doc")) == expected
+        assert (first.metrics.cache_misses, second.metrics.cache_hits) == (1, 1)
+        assert first.metrics.total_chunks == second.metrics.total_chunks
+
+    def test_iter_chunks_does_not_store_unfinished_documents(self, cache):
+        text = make_text(seed=7)
+        chunks = make_splitter(cache).iter_chunks(text)
+        next(chunks)
+        chunks.close()
+        splitter = make_splitter(cache)
+
+        list(splitter.iter_chunks(text))
+
+        assert splitter.metrics.cache_misses == 1
+
+    def test_iter_chunks_does_not_cache_streams(self, cache):
+        text = make_text(seed=8)
+        splitter = make_splitter(cache)
+
+        list(splitter.iter_chunks(io.StringIO(text)))
+        list(splitter.iter_chunks(io.StringIO(text)))
+
+        assert splitter.metrics.cache_hits + splitter.metrics.cache_misses == 0
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers inherit the stand-in tokenizer and spaCy model by forking",
+    )
+    def test_pool_workers_share_the_cache(self, cache):
+        documents = [
+            Document(make_text(seed), {"source": f"https://example.com/{seed}"})
+            for seed in range(6)
+        ]
+        make_splitter(cache).split_documents(documents[:3])
+        splitter = make_splitter(cache, workers=2)
+
+        try:
+            splitter.split_documents(documents)
+        finally:
+            splitter.close()
+
+        assert splitter.metrics.cache_hits == 3
+        assert splitter.metrics.cache_misses == 3
@@ -0,0 +1,164 @@
+"""Tests for parallel document chunking in SpacyTextSplitter."""
+
+import multiprocessing
+import random
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from data_ingestion.utils.text_splitter_utils import (
+    ChunkingMetrics,
+    Document,
+    SpacyTextSplitter,
+)
+
+WORDS = ["light", "peace", "wisdom", "the", "of", "and", "practice", "teacher"]
+
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers inherit the stand-in tokenizer and spaCy model by forking",
+)
+
+
+class FakeNlp:
+    """Whitespace tokenizer standing in for spaCy."""
+
+    def __call__(self, text: str):
+        return [
+            SimpleNamespace(text=m.group(1), whitespace_=m.group(2), is_space=False)
+            for m in re.finditer(r"(\S+)(\s*)", text)
+        ]
+
+    def pipe(self, texts, batch_size: int = 1):
+        return map(self, texts)
+
+
+fake_nlp = FakeNlp()
+
+
+@pytest.fixture(autouse=True)
+def offline_models():
+    """A small BPE encoding and fake spaCy model, since neither can be downloaded."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in WORDS:
+        for piece in (word, " " + word):
+            encoded = piece.encode()
+            for length in range(2, len(encoded) + 1):
+                ranks.setdefault(encoded[:length], len(ranks))
+    encoding = tiktoken.Encoding(
+        name="test_words",
+        pat_str=r""" ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks=ranks,
+        special_tokens={"<|endoftext|>": len(ranks)},
+    )
+    with (
+        patch.dict(
+            "os.environ", {"OPENAI_INGEST_EMBEDDINGS_MODEL": "text-embedding-ada-002"}
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+            {"text-embedding-ada-002": encoding},
+            clear=True,
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._SPACY_MODEL_CACHE",
+            {"en_core_web_sm": fake_nlp},
+            clear=True,
+        ),
+    ):
+        yield
+
+
+def make_documents(count: int) -> list[Document]:
+    rng = random.Random(count)
+    documents = []
+    for n in range(count):
+        paragraphs = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 120))) + "."
+            for _ in range(rng.randint(1, 30))
+        ]
+        documents.append(
+            Document("\n\n".join(paragraphs), {"source": f"https://example.com/{n}"})
+        )
+    return documents
+
+
+@pytest.fixture
+def pooled_splitter():
+    splitter = SpacyTextSplitter(log_summary_on_split=False, workers=2)
+    yield splitter
+    splitter.close()
+
+
+@requires_fork
+class TestParallelSplitDocuments:
+    def test_same_chunks_and_metrics_as_serial(self, pooled_splitter):
+        documents = make_documents(12)
+        serial = SpacyTextSplitter(log_summary_on_split=False)
+
+        expected = serial.split_documents(documents)
+        chunks = pooled_splitter.split_documents(documents)
+
+        assert [c.page_content for c in chunks] == [c.page_content for c in expected]
+        assert [c.metadata for c in chunks] == [c.metadata for c in expected]
+        assert pooled_splitter.get_metrics_summary() == serial.get_metrics_summary()
+
+    def test_pool_is_reused_until_closed(self, pooled_splitter):
+        pooled_splitter.split_documents(make_documents(3))
+        pool = pooled_splitter._chunking_pool
+
+        pooled_splitter.split_documents(make_documents(4))
+
+        assert pooled_splitter._chunking_pool is pool
+        pooled_splitter.close()
+        assert pooled_splitter._chunking_pool is None
+
+    def test_single_document_is_chunked_in_process(self, pooled_splitter):
+        pooled_splitter.split_documents(make_documents(1))
+
+        assert pooled_splitter._chunking_pool is None
+
+    def test_failed_document_yields_its_exception(self, pooled_splitter):
+        documents = make_documents(4)
+        documents[1].page_content += " <|endoftext|>"
+
+        results = list(
+            pooled_splitter.iter_split_documents(documents, return_exceptions=True)
+        )
+
+        assert isinstance(results[1], ValueError)
+        assert [
+            r[0].metadata["document_id"] for r in results if isinstance(r, list)
+        ] == [
+            "https://example.com/0",
+            "https://example.com/2",
+            "https://example.com/3",
+        ]
+        with pytest.raises(ValueError, match="special token"):
+            pooled_splitter.split_documents(documents)
+
+
+class TestChunkingMetricsMerge:
+    def test_merge_adds_counts_and_keeps_order(self):
+        first, second = ChunkingMetrics(), ChunkingMetrics()
+        first.log_document_metrics(30, 1, [40], [], document_id="a")
+        second.log_document_metrics(1200, 1, [300], [], document_id="b")
+
+        first.merge(second)
+
+        assert (first.total_documents, first.total_chunks) == (2, 2)
+        assert first.word_count_distribution["<200"] == 1
+        assert first.word_count_distribution["1000-4999"] == 1
+        assert first.chunk_size_distribution == {
+            "<125": 1,
+            "125-187": 0,
+            "188-313": 1,
+            "313+": 0,
+        }
+        assert first.edge_cases == [
+            "Very short document: 30 words (ID: a)",
+            "Large document not chunked: 1200 words, 1 chunk (ID: b)",
+        ]
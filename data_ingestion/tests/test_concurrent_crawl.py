@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+"""Unit tests for the concurrent crawl worker pool and per-host politeness budget."""
+
+import threading
+import time
+import unittest
+
+from crawler.concurrent_crawl import (
+    CrawlWorkerPool,
+    HostPolitenessBudget,
+    WorkerStats,
+    host_key,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic politeness tests."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSession:
+    """Crawl session that records calls instead of driving a browser."""
+
+    def __init__(self, worker_id: int, fail_urls: set[str] | None = None):
+        self.worker_id = worker_id
+        self.fail_urls = fail_urls or set()
+        self.crawled: list[str] = []
+        self.restarts = 0
+        self.crashed = False
+        self.closed = False
+
+    def crawl(self, url: str):
+        self.crawled.append(url)
+        if url in self.fail_urls:
+            self.crashed = True
+            raise RuntimeError("browser crashed")
+        return f"content:{url}", [f"{url}/child"], False
+
+    def recycle(self) -> bool:
+        self.restarts += 1
+        relaunched, self.crashed = self.crashed, False
+        return relaunched
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _collect_results(pool: CrawlWorkerPool, count: int, timeout: float = 5.0):
+    results = []
+    deadline = time.time() + timeout
+    while len(results) < count and time.time() < deadline:
+        result = pool.get_result(timeout=0.1)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+class TestHostKey(unittest.TestCase):
+    def test_strips_scheme_and_www(self):
+        self.assertEqual(host_key("https://www.Example.com/path"), "example.com")
+
+    def test_handles_schemeless_queue_urls(self):
+        self.assertEqual(host_key("example.com/some/page"), "example.com")
+
+
+class TestHostPolitenessBudget(unittest.TestCase):
+    def test_same_host_requests_are_spaced(self):
+        clock = FakeClock()
+        budget = HostPolitenessBudget(2.0, clock=clock)
+
+        self.assertEqual(budget.reserve("https://example.com/a"), 0.0)
+        self.assertEqual(budget.reserve("https://example.com/b"), 2.0)
+        self.assertEqual(budget.reserve("https://www.example.com/c"), 4.0)
+
+    def test_different_hosts_do_not_wait_on_each_other(self):
+        clock = FakeClock()
+        budget = HostPolitenessBudget(2.0, clock=clock)
+
+        budget.reserve("https://example.com/a")
+        self.assertEqual(budget.reserve("https://other.org/a"), 0.0)
+
+    def test_slot_frees_up_as_time_passes(self):
+        clock = FakeClock()
+        budget = HostPolitenessBudget(2.0, clock=clock)
+
+        budget.reserve("https://example.com/a")
+        clock.now += 5.0
+        self.assertEqual(budget.reserve("https://example.com/b"), 0.0)
+
+    def test_zero_interval_never_waits(self):
+        budget = HostPolitenessBudget(0)
+        for _ in range(5):
+            self.assertEqual(budget.wait("https://example.com/a"), 0.0)
+
+
+class TestWorkerStats(unittest.TestCase):
+    def test_pages_per_minute(self):
+        stats = WorkerStats(worker_id=0, started_at=100.0)
+        for _ in range(10):
+            stats.record_page(True)
+        stats.record_page(False)
+
+        self.assertAlmostEqual(stats.pages_per_minute(now=220.0), 5.0)
+        self.assertEqual(stats.pages_failed, 1)
+        self.assertIn("5.0 pages/minute", stats.summary(now=220.0))
+
+    def test_pages_per_minute_before_any_time_elapsed(self):
+        stats = WorkerStats(worker_id=0, started_at=100.0)
+        self.assertEqual(stats.pages_per_minute(now=100.0), 0.0)
+
+
+class TestCrawlWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.sessions: dict[int, FakeSession] = {}
+        self.lock = threading.Lock()
+
+    def _factory(self, fail_urls=None):
+        def create(worker_id: int) -> FakeSession:
+            session = FakeSession(worker_id, fail_urls)
+            with self.lock:
+                self.sessions[worker_id] = session
+            return session
+
+        return create
+
+    def test_rejects_zero_workers(self):
+        with self.assertRaises(ValueError):
+            CrawlWorkerPool(0, self._factory(), HostPolitenessBudget(0))
+
+    def test_all_urls_fetched_across_workers(self):
+        pool = CrawlWorkerPool(3, self._factory(), HostPolitenessBudget(0))
+        pool.start()
+        urls = [f"example.com/page-{i}" for i in range(9)]
+        results = []
+        for url in urls:
+            while not pool.has_capacity():
+                result = pool.get_result(timeout=0.1)
+                if result is not None:
+                    results.append(result)
+            pool.submit(url)
+        results.extend(_collect_results(pool, len(urls) - len(results)))
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(sorted(r.url for r in results), sorted(urls))
+        self.assertTrue(all(r.content == f"content:{r.url}" for r in results))
+        self.assertEqual(pool.in_flight, 0)
+        self.assertTrue(all(session.closed for session in self.sessions.values()))
+
+    def test_session_error_flags_restart(self):
+        pool = CrawlWorkerPool(
+            1,
+            self._factory(fail_urls={"example.com/bad"}),
+            HostPolitenessBudget(0),
+        )
+        pool.start()
+        pool.submit("example.com/bad")
+        results = _collect_results(pool, 1)
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].restart_needed)
+        self.assertIsNone(results[0].content)
+        self.assertEqual(self.sessions[0].restarts, 1)
+        self.assertEqual(pool.stats[0].browser_restarts, 1)
+
+    def test_restarts_after_page_budget(self):
+        pool = CrawlWorkerPool(
+            1, self._factory(), HostPolitenessBudget(0), pages_per_restart=2
+        )
+        pool.start()
+        for i in range(4):
+            pool.submit(f"example.com/page-{i}")
+            _collect_results(pool, 1)
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(self.sessions[0].restarts, 2)
+        self.assertEqual(pool.stats[0].context_recycles, 2)
+        self.assertEqual(pool.stats[0].browser_restarts, 0)
+
+    def test_recycles_when_session_check_is_due(self):
+        due = iter([False, True, False])
+        checked = []
+
+        def recycle_due(session):
+            checked.append(session)
+            return next(due)
+
+        pool = CrawlWorkerPool(
+            1, self._factory(), HostPolitenessBudget(0), recycle_due=recycle_due
+        )
+        pool.start()
+        for i in range(3):
+            pool.submit(f"example.com/page-{i}")
+            _collect_results(pool, 1)
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(self.sessions[0].restarts, 1)
+        self.assertEqual(checked, [self.sessions[0]] * 3)
+
+    def test_politeness_wait_is_recorded_per_worker(self):
+        pool = CrawlWorkerPool(1, self._factory(), HostPolitenessBudget(0.05))
+        pool.start()
+        for i in range(3):
+            pool.submit(f"example.com/page-{i}")
+            _collect_results(pool, 1)
+        pool.shutdown(timeout=5)
+
+        self.assertGreater(pool.stats[0].politeness_wait_seconds, 0.0)
+
+    def test_urls_come_back_when_no_session_can_start(self):
+        def create(worker_id: int):
+            raise RuntimeError("Firefox failed to launch")
+
+        pool = CrawlWorkerPool(2, create, HostPolitenessBudget(0))
+        pool.start()
+        pool.submit("example.com/page-0")
+        pool.submit("example.com/page-1")
+        results = _collect_results(pool, 2)
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(
+            sorted(r.url for r in results), ["example.com/page-0", "example.com/page-1"]
+        )
+        self.assertTrue(all(r.restart_needed and r.content is None for r in results))
+        self.assertEqual(pool.alive_workers, 0)
+        self.assertEqual(pool.in_flight, 0)
+        self.assertFalse(pool.has_capacity())
+
+    def test_url_of_a_failed_worker_loop_comes_back(self):
+        def recycle_due(session):
+            raise RuntimeError("memory check failed")
+
+        pool = CrawlWorkerPool(
+            1, self._factory(), HostPolitenessBudget(0), recycle_due=recycle_due
+        )
+        pool.start()
+        pool.submit("example.com/page-0")
+        pool.submit("example.com/page-1")
+        results = _collect_results(pool, 2)
+        pool.shutdown(timeout=5)
+
+        self.assertEqual(results[0].content, "content:example.com/page-0")
+        self.assertEqual(results[1].url, "example.com/page-1")
+        self.assertTrue(results[1].restart_needed)
+        self.assertEqual(pool.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Unit tests for single-pass main-text extraction."""
+
+import unittest
+
+from crawler.content_extraction import extract_main_text, parse_html, walk_text
+from crawler.website_crawler import WebsiteCrawler
+
+PAGE = """<!DOCTYPE html><html><head><title>T</title><style>p {}</style></head>
+<body><header>Site <nav>Home About</nav></header>
+<aside class="widget sidebar">Recent posts</aside>
+<main><h1>Title &amp; more</h1><p>Para <b>bold</b>text<!-- note -->after.</p>
+<script>var x = 1;</script>after script<div class="sidebar">side</div>
+<p>Two&nbsp;words</p></main><article>Second</article><footer>Foot</footer></body>
+</html>"""
+
+PAGES = [
+    PAGE,
+    '<html><body><div id="content"><p>One</p><iframe>x</iframe>Two</div></body></html>',
+    '<html><body><div class="x"><p>No content area.</p><nav>n</nav> tail</div>'
+    "</body></html>",
+    '<?xml version="1.0" encoding="utf-8"?><html><body>'
+    '<div class="entry-content">Ünïcode — text</div></body></html>',
+    '<html><body><div class="post-content main">A<br>B<ul><li>c</li></ul></div>'
+    "</body></html>",
+    "<html><body><main> </main><p>Body only</p></body></html>",
+    "<html><body><main><template>Hidden</template><p>Shown</p></main></body></html>",
+    "<html><body><main><p>Unclosed</p><article>a</article><p>b</p></body></html>",
+    "",
+]
+
+
+class TestExtractMainText(unittest.TestCase):
+    def test_prunes_and_picks_first_content_area(self):
+        self.assertEqual(
+            extract_main_text(PAGE),
+            "Title & more Para bold text after. after script Two words",
+        )
+
+    def test_walk_stops_at_end_of_content_area(self):
+        main_text, body_text = walk_text(parse_html(PAGE))
+        self.assertTrue(main_text.startswith("Title"))
+        self.assertNotIn("Second", body_text)
+
+    def test_falls_back_to_body_text(self):
+        html = "<html><body><div><p>Just</p>text<footer>f</footer></div></body></html>"
+        self.assertEqual(walk_text(parse_html(html)), ("", "Just text"))
+        self.assertEqual(extract_main_text(html), "Just text")
+
+    def test_empty_input(self):
+        self.assertIsNone(parse_html("  "))
+        self.assertEqual(extract_main_text(""), "")
+
+    def test_skips_template_contents(self):
+        html = "<html><body><main><template>t</template>after</main></body></html>"
+        self.assertEqual(extract_main_text(html), "after")
+
+    def test_known_differences_from_beautifulsoup(self):
+        # lxml drops CDATA and merges text around stray end tags; see the
+        # module docstring
+        cdata = "<html><body><main><p>a <![CDATA[b]]> c</p></main></body></html>"
+        self.assertEqual(extract_main_text(cdata), "a c")
+        stray = "<html><body><main>a<table>b</div>c</body></html>"
+        self.assertEqual(extract_main_text(stray), "a bc")
+
+    def test_matches_beautifulsoup_extractor(self):
+        crawler = WebsiteCrawler(
+            "test-site",
+            {"domain": "example.com"},
+            skip_db_init=True,
+            skip_robots_init=True,
+        )
+        self.assertEqual(crawler.content_extractor, "lxml")
+        for html in PAGES:
+            crawler.content_extractor = "beautifulsoup"
+            expected = crawler.clean_content(html)
+            crawler.content_extractor = "lxml"
+            with self.subTest(html=html[:60]):
+                self.assertEqual(crawler.clean_content(html), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Unit tests for crawler stage latency and throughput metrics."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from crawler.crawl_metrics import STAGES, CrawlMetrics, StageHistogram
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStageHistogram(unittest.TestCase):
+    def test_buckets_are_cumulative(self):
+        histogram = StageHistogram(buckets=(0.1, 1, 10))
+        for seconds in (0.05, 0.5, 0.7, 30):
+            histogram.observe(seconds)
+
+        self.assertEqual(histogram.counts, [1, 3, 3])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 31.25)
+
+
+class TestCrawlMetrics(unittest.TestCase):
+    def test_timed_records_failures_too(self):
+        metrics = CrawlMetrics("site")
+        with self.assertRaises(ValueError), metrics.timed("goto"):
+            raise ValueError("navigation failed")
+
+        self.assertIn(
+            'stage_duration_seconds_count{site="site",stage="goto"} 1', metrics.render()
+        )
+
+    def test_render_includes_every_stage_and_queue_depth(self):
+        metrics = CrawlMetrics("ananda")
+        metrics.observe("embedding", 0.3)
+
+        text = metrics.render({"visited": 10, "pending": 4})
+
+        for stage in STAGES:
+            self.assertIn(f'stage="{stage}",le="+Inf"', text)
+        self.assertIn(
+            'crawler_stage_duration_seconds_bucket{site="ananda",stage="embedding",'
+            'le="0.25"} 0',
+            text,
+        )
+        self.assertIn(
+            'crawler_stage_duration_seconds_bucket{site="ananda",stage="embedding",'
+            'le="0.5"} 1',
+            text,
+        )
+        self.assertIn('crawler_queue_urls{site="ananda",status="pending"} 4', text)
+        self.assertIn("# TYPE crawler_stage_duration_seconds histogram", text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_pages_per_minute_uses_recent_window(self):
+        clock = FakeClock()
+        metrics = CrawlMetrics("site", window_seconds=120, clock=clock)
+        for _ in range(10):
+            metrics.record_page()
+        self.assertEqual(metrics.pages_per_minute(), 5.0)
+
+        clock.now += 121
+        metrics.record_page()
+        self.assertEqual(metrics.pages_per_minute(), 0.5)
+        self.assertEqual(metrics.pages_total, 11)
+
+    def test_concurrent_observations_are_all_counted(self):
+        metrics = CrawlMetrics("site")
+
+        def observe_many():
+            for _ in range(1000):
+                metrics.observe("upsert", 0.01)
+
+        threads = [threading.Thread(target=observe_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIn('stage="upsert"} 4000', metrics.render())
+
+    def test_write_textfile_replaces_file(self):
+        metrics = CrawlMetrics("site")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "metrics" / "crawler.prom"
+            metrics.write_textfile(path, {"pending": 1})
+            metrics.record_page()
+            metrics.write_textfile(path, {"pending": 0})
+
+            text = path.read_text()
+            self.assertIn('crawler_pages_processed_total{site="site"} 1', text)
+            self.assertIn('status="pending"} 0', text)
+            self.assertEqual([p.name for p in path.parent.iterdir()], ["crawler.prom"])
+
+    def test_label_values_are_escaped(self):
+        text = CrawlMetrics('odd"site').render()
+        self.assertIn('site="odd\\"site"', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
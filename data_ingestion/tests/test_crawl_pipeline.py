@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Unit tests for the staged crawl processing pipeline."""
+
+import threading
+import time
+import unittest
+
+from crawler.crawl_pipeline import (
+    DEFAULT_STAGE_WORKERS,
+    PageJob,
+    StagedPipeline,
+    StageSpec,
+    build_stage_specs,
+)
+
+
+def _wait_for_outputs(pipeline: StagedPipeline, count: int, timeout: float = 5.0):
+    outputs = []
+    deadline = time.time() + timeout
+    while len(outputs) < count and time.time() < deadline:
+        job = pipeline.get_output(timeout=0.1)
+        if job is not None:
+            outputs.append(job)
+    return outputs
+
+
+class TestBuildStageSpecs(unittest.TestCase):
+    def test_defaults_and_overrides(self):
+        fns = {name: (lambda job: None) for name in DEFAULT_STAGE_WORKERS}
+        specs = build_stage_specs(fns, {"embed": 5}, queue_size=3)
+
+        self.assertEqual([s.name for s in specs], list(DEFAULT_STAGE_WORKERS))
+        workers = {s.name: s.workers for s in specs}
+        self.assertEqual(workers["embed"], 5)
+        self.assertEqual(workers["upsert"], DEFAULT_STAGE_WORKERS["upsert"])
+        self.assertTrue(all(s.queue_size == 3 for s in specs))
+
+    def test_invalid_sizes_are_clamped(self):
+        specs = build_stage_specs({"chunk": lambda job: None}, {"chunk": 0}, 0)
+        self.assertEqual(specs[0].workers, 1)
+        self.assertEqual(specs[0].queue_size, 1)
+
+
+class TestStagedPipeline(unittest.TestCase):
+    def test_requires_stages(self):
+        with self.assertRaises(ValueError):
+            StagedPipeline([])
+
+    def test_jobs_pass_through_stages_in_order(self):
+        def chunk(job):
+            job.chunks = job.content.split()
+
+        def embed(job):
+            job.vectors = [{"id": c} for c in job.chunks]
+
+        pipeline = StagedPipeline(
+            [StageSpec("chunk", chunk), StageSpec("embed", embed, workers=2)]
+        )
+        pipeline.start()
+        for i in range(5):
+            job = PageJob(url=f"u{i}", content="a b", links=[])
+            deadline = time.time() + 5
+            while not pipeline.try_submit(job) and time.time() < deadline:
+                time.sleep(0.01)
+        outputs = _wait_for_outputs(pipeline, 5)
+        pipeline.shutdown(timeout=5)
+
+        self.assertEqual(
+            sorted(job.url for job in outputs), [f"u{i}" for i in range(5)]
+        )
+        self.assertTrue(all(len(job.vectors) == 2 for job in outputs))
+        self.assertEqual(pipeline.pending, 0)
+        self.assertEqual(pipeline.stats["chunk"].processed, 5)
+        self.assertEqual(pipeline.stats["embed"].processed, 5)
+
+    def test_stage_error_skips_remaining_stages(self):
+        later_calls = []
+
+        def fail(job):
+            raise RuntimeError("rate limit exceeded")
+
+        pipeline = StagedPipeline(
+            [StageSpec("embed", fail), StageSpec("upsert", later_calls.append)]
+        )
+        pipeline.start()
+        pipeline.try_submit(PageJob(url="u", content="x", links=[]))
+        outputs = _wait_for_outputs(pipeline, 1)
+        pipeline.shutdown(timeout=5)
+
+        self.assertEqual(len(outputs), 1)
+        self.assertIsInstance(outputs[0].error, RuntimeError)
+        self.assertEqual(outputs[0].failed_stage, "embed")
+        self.assertIsNotNone(outputs[0].failed_at)
+        self.assertEqual(later_calls, [])
+        self.assertEqual(pipeline.stats["embed"].errors, 1)
+
+    def test_backpressure_when_stage_is_slow(self):
+        release = threading.Event()
+
+        def slow(job):
+            release.wait(5)
+
+        pipeline = StagedPipeline(
+            [StageSpec("embed", slow, workers=1, queue_size=1)], output_queue_size=1
+        )
+        pipeline.start()
+
+        accepted = 0
+        for i in range(10):
+            if pipeline.try_submit(PageJob(url=f"u{i}", content="", links=[])):
+                accepted += 1
+            time.sleep(0.05)
+
+        # One job in the worker plus one waiting in the queue; the rest are refused
+        self.assertEqual(accepted, 2)
+        self.assertLessEqual(accepted, pipeline.capacity)
+
+        release.set()
+        outputs = _wait_for_outputs(pipeline, accepted)
+        pipeline.shutdown(timeout=5)
+        self.assertEqual(len(outputs), accepted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ import sqlite3
 # Mock spaCy at module level to prevent loading in any test
 import sys
 import tempfile
+import time
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -370,6 +371,33 @@ class TestSQLiteIntegration(BaseWebsiteCrawlerTest):
 
         crawler.close()
 
+    def test_get_next_url_to_crawl_excludes_in_flight_urls(self):
+        """Test that URLs already handed to crawl workers are not claimed again."""
+        crawler = WebsiteCrawler(self.site_id, self.site_config)
+        seeded_url = crawler.normalize_url(crawler.start_url)
+        page1 = crawler.normalize_url("https://example.com/page1")
+        crawler.add_url_to_queue(page1)
+        crawler.conn.commit()
+
+        self.assertEqual(crawler.get_next_url_to_crawl(), seeded_url)
+        self.assertEqual(crawler.get_next_url_to_crawl(exclude={seeded_url}), page1)
+        self.assertIsNone(crawler.get_next_url_to_crawl(exclude={seeded_url, page1}))
+
+        crawler.close()
+
+    def test_resolve_worker_count(self):
+        """Test that --workers overrides the crawl_workers config value."""
+        from crawler.website_crawler import _resolve_worker_count
+
+        crawler = WebsiteCrawler(self.site_id, {**self.site_config, "crawl_workers": 3})
+
+        self.assertEqual(_resolve_worker_count(Mock(workers=None), crawler), 3)
+        self.assertEqual(_resolve_worker_count(Mock(workers=5), crawler), 5)
+        crawler.crawl_workers = 0
+        self.assertEqual(_resolve_worker_count(Mock(workers=None), crawler), 1)
+
+        crawler.close()
+
 
 class TestCSVFunctionality(BaseWebsiteCrawlerTest):
     """Test cases for CSV functionality."""
@@ -2966,5 +2994,1379 @@ class TestCSVRemoval:
         assert result == 0  # Should return 0 on error
 
 
+class QueueDatabaseTestCase(BaseWebsiteCrawlerTest):
+    """Base class for tests that need a crawler with an in-memory queue and one URL."""
+
+    def setUp(self):
+        """Set up test environment."""
+        super().setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.site_id = "test-site"
+        self.site_config = {
+            "domain": "example.com",
+            "skip_patterns": [],
+            "crawl_frequency_days": 7,
+        }
+        self.path_patcher = patch("crawler.website_crawler.Path")
+        mock_path_constructor = self.path_patcher.start()
+        mock_path_constructor.return_value.parent.return_value = Path(self.temp_dir)
+
+        self.original_sqlite_connect = sqlite3.connect
+        self.connect_patcher = patch("sqlite3.connect")
+        mock_sqlite_connect = self.connect_patcher.start()
+        mock_sqlite_connect.side_effect = (
+            lambda db_path_arg: self.original_sqlite_connect(":memory:")
+        )
+        self.crawler = WebsiteCrawler(self.site_id, self.site_config)
+        self.url = self.crawler.normalize_url("https://example.com/page")
+        self.crawler.add_url_to_queue(self.url)
+        self.crawler.conn.commit()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.crawler.close()
+        self.path_patcher.stop()
+        self.connect_patcher.stop()
+        shutil.rmtree(self.temp_dir)
+        super().tearDown()
+
+    def _job(self, **kwargs):
+        from crawler.crawl_pipeline import PageJob
+        from crawler.website_crawler import PageContent
+
+        content = PageContent(
+            url=self.url, title="Title", content="Body text", metadata={}
+        )
+        return PageJob(url=self.url, content=content, links=[], worker_id=0, **kwargs)
+
+    def _status(self):
+        self.crawler.cursor.execute(
+            "SELECT status, content_hash, last_error FROM crawl_queue WHERE url = ?",
+            (self.url,),
+        )
+        return self.crawler.cursor.fetchone()
+
+
+class TestCrawlPipelineStages(QueueDatabaseTestCase):
+    """Test cases for the staged processing pipeline steps in the crawler."""
+
+    def test_deferred_cleaning_marks_raw_html(self):
+        """Test that deferred cleaning leaves HTML for the clean stage."""
+        from crawler.website_crawler import _pipeline_clean
+
+        self.crawler.defer_content_cleaning = True
+        content, _links = self.crawler._create_page_content(
+            self.url, "Title", "<html><body><p>Hello world</p></body></html>", []
+        )
+        self.assertTrue(content.metadata["needs_cleaning"])
+
+        job = self._job()
+        job.content = content
+        _pipeline_clean(self.crawler, job)
+
+        self.assertNotIn("needs_cleaning", content.metadata)
+        self.assertIn("Hello world", content.content)
+        self.assertNotIn("<p>", content.content)
+
+    def test_chunk_stage_detects_unchanged_content(self):
+        """Test that the chunk stage flags pages whose hash matches the last crawl."""
+        import hashlib
+
+        from crawler.website_crawler import _pipeline_chunk, _pipeline_embed
+
+        mock_splitter = Mock()
+        mock_splitter.split_text.return_value = ["Title Body text"]
+        self.crawler._text_splitter = mock_splitter
+        stored_hash = hashlib.sha256(b"Body text").hexdigest()
+
+        job = self._job(previous_hash=stored_hash)
+        _pipeline_chunk(self.crawler, job)
+        self.assertTrue(job.unchanged)
+
+        with patch.object(self.crawler, "create_embeddings") as mock_embed:
+            _pipeline_embed(self.crawler, job)
+            mock_embed.assert_not_called()
+
+        mock_splitter.split_text.assert_not_called()
+        self.assertIsNone(job.chunks)
+
+        changed = self._job(previous_hash="old-hash")
+        _pipeline_chunk(self.crawler, changed)
+        self.assertFalse(changed.unchanged)
+        self.assertEqual(changed.chunks, ["Title Body text"])
+
+    def test_finish_unchanged_job_counts_avoided_work(self):
+        """Test that an unchanged job keeps its hash and is counted as skipped."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(content_hash="same-hash", unchanged=True)
+
+        self.assertEqual(_finish_pipeline_job(job, self.crawler), (1, False))
+        self.assertEqual(self._status()["content_hash"], "same-hash")
+        self.assertEqual(self.crawler.unchanged_pages_skipped, 1)
+        self.assertEqual(self.crawler.unchanged_chars_skipped, len("Body text"))
+
+    def test_process_page_content_skips_chunking_when_unchanged(self):
+        """Test that an unchanged recrawl never reaches the splitter or embeddings."""
+        import hashlib
+
+        from crawler.website_crawler import _process_page_content
+
+        stored_hash = hashlib.sha256(b"Body text").hexdigest()
+        self.crawler.mark_url_status(self.url, "visited", content_hash=stored_hash)
+        mock_splitter = Mock()
+        self.crawler._text_splitter = mock_splitter
+        job = self._job()
+
+        with patch.object(self.crawler, "create_embeddings") as mock_embed:
+            result = _process_page_content(
+                job.content, [], self.url, self.crawler, Mock(), "index"
+            )
+            mock_embed.assert_not_called()
+
+        self.assertEqual(result, (1, 1, False))
+        mock_splitter.split_text.assert_not_called()
+        self.assertEqual(self._status()["content_hash"], stored_hash)
+        self.assertEqual(self.crawler.unchanged_pages_skipped, 1)
+
+    def test_process_page_content_chunks_changed_page(self):
+        """Test that a changed page is chunked, embedded and upserted."""
+        import hashlib
+
+        from crawler.website_crawler import _process_page_content
+
+        mock_splitter = Mock()
+        mock_splitter.split_text.return_value = ["Title Body text"]
+        self.crawler._text_splitter = mock_splitter
+        job = self._job()
+
+        with (
+            patch.object(self.crawler, "create_embeddings") as mock_embed,
+            patch("crawler.website_crawler.upsert_to_pinecone") as mock_upsert,
+        ):
+            mock_embed.return_value = [{"id": "v1"}]
+            result = _process_page_content(
+                job.content, [], self.url, self.crawler, Mock(), "index"
+            )
+
+        self.assertEqual(result, (1, 1, False))
+        mock_upsert.assert_called_once()
+        self.assertEqual(
+            self._status()["content_hash"],
+            hashlib.sha256(b"Body text").hexdigest(),
+        )
+        self.assertEqual(self.crawler.unchanged_pages_skipped, 0)
+
+    def test_finish_job_marks_visited_and_queues_links(self):
+        """Test that a finished job is marked visited and its links are queued."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(chunks=["chunk"], content_hash="new-hash")
+        job.links = ["https://example.com/other-page"]
+
+        pages_inc, rate_limited = _finish_pipeline_job(job, self.crawler)
+
+        self.assertEqual((pages_inc, rate_limited), (1, False))
+        self.assertEqual(self._status()["status"], "visited")
+        self.assertEqual(self._status()["content_hash"], "new-hash")
+        self.assertTrue(
+            self.crawler.is_url_in_database("https://example.com/other-page")
+        )
+
+    def test_finish_job_without_chunks_keeps_its_hash(self):
+        """Test that a page with no chunks stores its hash, not a marker."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(chunks=[], content_hash="new-hash")
+
+        self.assertEqual(_finish_pipeline_job(job, self.crawler), (1, False))
+        self.assertEqual(self._status()["content_hash"], "new-hash")
+
+    def test_finish_job_with_stage_error_marks_failed(self):
+        """Test that a job that failed in a stage is marked failed."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(error=ValueError("boom"), failed_stage="upsert")
+
+        self.assertEqual(_finish_pipeline_job(job, self.crawler), (0, False))
+        self.assertIn("boom", self._status()["last_error"])
+
+    def test_finish_job_with_rate_limit_requeues(self):
+        """Test that a rate-limited job goes back to pending and signals a sleep."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(error=Exception("Error code: 429 - rate limit"))
+
+        self.assertEqual(_finish_pipeline_job(job, self.crawler), (0, True))
+        self.assertEqual(self._status()["status"], "pending")
+
+
+class TestConcurrentCrawlLoop(QueueDatabaseTestCase):
+    """Test cases for the concurrent crawl loop."""
+
+    def test_loop_ends_when_no_browser_session_starts(self):
+        """Test that claimed URLs go back to pending when every worker fails."""
+        from crawler.website_crawler import _run_concurrent_crawl_loop
+
+        with patch(
+            "crawler.website_crawler._PlaywrightCrawlSession",
+            side_effect=RuntimeError("Firefox failed to launch"),
+        ):
+            pages = _run_concurrent_crawl_loop(
+                self.crawler,
+                Mock(),
+                "index",
+                num_workers=2,
+                stop_after=None,
+                start_time=time.time(),
+                max_runtime_seconds=30,
+                args=SimpleNamespace(max_runtime_minutes=0.5),
+            )
+
+        self.assertEqual(pages, 0)
+        self.assertEqual(self._status()["status"], "pending")
+        self.assertIn(self.url, self.crawler.claim_next_urls(10))
+
+
+class TestHttpRevalidation(QueueDatabaseTestCase):
+    """Test cases for storing validators and skipping unchanged recrawls."""
+
+    def _revalidator(self, outcome):
+        from crawler.http_revalidation import (
+            CacheValidators,
+            RevalidationResult,
+        )
+
+        revalidator = Mock()
+        revalidator.revalidate.return_value = RevalidationResult(
+            outcome, CacheValidators(etag='"v2"'), 304
+        )
+        self.crawler.revalidator = revalidator
+        return revalidator
+
+    def _store_visit(self, etag='"v1"'):
+        from crawler.http_revalidation import CacheValidators
+
+        self.crawler.mark_url_status(
+            self.url,
+            "visited",
+            content_hash="stored-hash",
+            validators=CacheValidators(etag=etag),
+        )
+
+    def test_visited_status_stores_validators(self):
+        """Test that ETag and Last-Modified are saved with a visit."""
+        from crawler.http_revalidation import CacheValidators
+
+        self.crawler.mark_url_status(
+            self.url,
+            "visited",
+            content_hash="h",
+            validators=CacheValidators('"abc"', "Mon, 01 Jan 2024"),
+        )
+
+        validators = self.crawler.get_cache_validators(self.url)
+        self.assertEqual(validators.etag, '"abc"')
+        self.assertEqual(validators.last_modified, "Mon, 01 Jan 2024")
+
+    def test_old_database_gets_validator_columns(self):
+        """Test that a queue created before validators existed is migrated."""
+        self.crawler.cursor.execute("DROP TABLE crawl_queue")
+        self.crawler.cursor.execute(
+            "CREATE TABLE crawl_queue (url TEXT PRIMARY KEY, status TEXT)"
+        )
+        self.crawler._add_missing_columns(
+            "crawl_queue", {"etag": "TEXT", "last_modified": "TEXT"}
+        )
+        self.crawler.cursor.execute("PRAGMA table_info(crawl_queue)")
+        columns = {row[1] for row in self.crawler.cursor.fetchall()}
+        self.assertTrue({"etag", "last_modified"} <= columns)
+
+    def test_not_modified_page_skips_browser(self):
+        """Test that a 304 reschedules the URL without navigating."""
+        from crawler.http_revalidation import NOT_MODIFIED
+        from crawler.website_crawler import _process_page_content
+
+        self._store_visit()
+        self._revalidator(NOT_MODIFIED)
+        page = Mock()
+
+        content, links, restart = self.crawler.crawl_page(Mock(), page, self.url)
+
+        page.goto.assert_not_called()
+        self.assertEqual(content.metadata["type"], "not_modified")
+        self.assertEqual((links, restart), ([], False))
+        status = self._status()
+        self.assertEqual(status["status"], "visited")
+        self.assertEqual(status["content_hash"], "stored-hash")
+        self.assertEqual(self.crawler.get_cache_validators(self.url).etag, '"v2"')
+        self.assertEqual(
+            _process_page_content(content, [], self.url, self.crawler, Mock(), "i"),
+            (1, 0, False),
+        )
+
+    def test_modified_page_is_fetched(self):
+        """Test that a changed page still goes through the browser."""
+        from crawler.http_revalidation import MODIFIED
+
+        self._store_visit()
+        self._revalidator(MODIFIED)
+        page = Mock()
+        page.goto.side_effect = Exception("navigation attempted")
+
+        with patch.object(self.crawler, "_handle_crawl_exception") as handle:
+            handle.return_value = (False, False)
+            self.crawler.crawl_page(Mock(), page, self.url)
+
+        page.goto.assert_called_once()
+
+    def test_priority_urls_and_missing_validators_skip_revalidation(self):
+        """Test that revalidation only runs for plain recrawls with validators."""
+        self._store_visit(etag=None)
+        self.assertIsNone(self.crawler.get_cache_validators(self.url))
+
+        self._store_visit()
+        self.crawler.cursor.execute(
+            "UPDATE crawl_queue SET priority = 5 WHERE url = ?", (self.url,)
+        )
+        self.assertIsNone(self.crawler.get_cache_validators(self.url))
+
+    def test_finish_job_stores_validators_from_metadata(self):
+        """Test that the pipeline saves validators recorded by crawl_page."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        job = self._job(chunks=["chunk"], content_hash="new-hash")
+        job.content.metadata["etag"] = '"abc"'
+
+        _finish_pipeline_job(job, self.crawler)
+
+        self.assertEqual(self.crawler.get_cache_validators(self.url).etag, '"abc"')
+
+
+class TestStaticFetchPath(QueueDatabaseTestCase):
+    """Test cases for fetching server-rendered pages without Playwright."""
+
+    ARTICLE = "<p>" + "Meditation teaches us to be still. " * 20 + "</p>"
+
+    def setUp(self):
+        """Set up test environment with the static path enabled."""
+        super().setUp()
+        from crawler.static_fetch import StaticFetcher
+
+        self.session = Mock()
+        self.crawler.revalidator = None
+        self.crawler.static_fetcher = StaticFetcher(
+            self.session, browser_required_patterns=[r"/app/"], min_chars=200
+        )
+
+    def _respond(self, body, status_code=200, content_type="text/html"):
+        response = self.session.get.return_value
+        response.url = "https://example.com/page"
+        response.status_code = status_code
+        response.headers = {"content-type": content_type, "etag": '"abc"'}
+        response.text = (
+            "<html><head><title>Static Page</title></head><body>"
+            f"<main>{body}</main><a href='/other-page'>Other</a></body></html>"
+        )
+
+    def test_server_rendered_page_skips_browser(self):
+        """Test that a full page is extracted with clean_content and no navigation."""
+        from crawler.website_crawler import _process_page_content
+
+        self._respond(self.ARTICLE)
+        page = Mock()
+
+        content, links, restart = self.crawler.crawl_page(Mock(), page, self.url)
+
+        page.goto.assert_not_called()
+        self.assertFalse(restart)
+        self.assertEqual(content.title, "Static Page")
+        self.assertIn("Meditation teaches us", content.content)
+        self.assertNotIn("<p>", content.content)
+        self.assertEqual(content.metadata["fetch_path"], "static")
+        self.assertEqual(content.metadata["etag"], '"abc"')
+        self.assertEqual(links, ["https://example.com/other-page"])
+        self.assertEqual(self.crawler.static_fetcher.stats.static_pages, 1)
+
+        with (
+            patch.object(self.crawler, "create_embeddings", return_value=[]),
+            patch("crawler.website_crawler.upsert_to_pinecone"),
+            patch.object(self.crawler, "_text_splitter", Mock()) as splitter,
+        ):
+            splitter.split_text.return_value = ["chunk"]
+            result = _process_page_content(
+                content, links, self.url, self.crawler, Mock(), "index"
+            )
+        # Static pages don't use up the browser's restart budget
+        self.assertEqual(result, (1, 0, False))
+
+    def test_static_page_is_parsed_once(self):
+        """Test that title, links and text come from a single lxml parse."""
+        from crawler import website_crawler
+
+        self._respond(self.ARTICLE)
+
+        with (
+            patch.object(
+                website_crawler, "parse_html", wraps=website_crawler.parse_html
+            ) as mock_parse,
+            patch.object(website_crawler, "BeautifulSoup") as mock_soup,
+        ):
+            content, links = self.crawler._try_static_fetch(self.url)
+
+        mock_parse.assert_called_once()
+        mock_soup.assert_not_called()
+        self.assertEqual(content.title, "Static Page")
+        self.assertIn("Meditation teaches us", content.content)
+        self.assertEqual(links, ["https://example.com/other-page"])
+
+    def test_thin_content_falls_back_to_browser(self):
+        """Test that pages with too little server-rendered text use Playwright."""
+        self._respond("<div id='app'></div>")
+        self.assertIsNone(self.crawler._try_static_fetch(self.url))
+        self.assertEqual(
+            self.crawler.static_fetcher.stats.fallbacks, {"thin_content": 1}
+        )
+
+    def test_site_rule_falls_back_without_request(self):
+        """Test that browser_required_patterns skip the HTTP request entirely."""
+        self.assertIsNone(
+            self.crawler._try_static_fetch("https://example.com/app/dashboard")
+        )
+        self.session.get.assert_not_called()
+
+    def test_error_and_non_html_fall_back(self):
+        """Test that HTTP errors, non-HTML and network errors use Playwright."""
+        import requests
+
+        self._respond(self.ARTICLE, status_code=404)
+        self.assertIsNone(self.crawler._try_static_fetch(self.url))
+        self._respond(self.ARTICLE, content_type="application/pdf")
+        self.assertIsNone(self.crawler._try_static_fetch(self.url))
+        self.session.get.side_effect = requests.ConnectionError("down")
+        self.assertIsNone(self.crawler._try_static_fetch(self.url))
+        self.assertEqual(
+            self.crawler.static_fetcher.stats.fallbacks,
+            {"status:404": 1, "status:200": 1, "error:ConnectionError": 1},
+        )
+
+    def test_disabled_by_default(self):
+        """Test that sites must opt in to the static path."""
+        crawler = WebsiteCrawler(
+            "test-site",
+            {"domain": "example.com", "skip_patterns": []},
+            skip_db_init=True,
+            skip_robots_init=True,
+        )
+        self.assertIsNone(crawler.static_fetcher)
+
+
+class TestClaimScheduler(QueueDatabaseTestCase):
+    """Test cases for the indexed, claim-based URL scheduler."""
+
+    LEGACY_ORDER_QUERY = """
+        SELECT url FROM crawl_queue
+        WHERE (status = 'pending'
+               AND (retry_after IS NULL OR retry_after <= datetime('now')))
+           OR (status = 'visited' AND next_crawl <= datetime('now'))
+        ORDER BY priority DESC, CASE WHEN status = 'pending' THEN 0 ELSE 1 END,
+                 last_crawl IS NULL DESC, retry_count ASC, next_crawl ASC, url ASC
+    """
+
+    def _insert(self, url, status="pending", priority=0, next_crawl=None, **extra):
+        columns = ["url", "status", "priority", "next_crawl", *extra]
+        values = [url, status, priority, next_crawl, *extra.values()]
+        self.crawler.cursor.execute(
+            f"INSERT OR REPLACE INTO crawl_queue ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(values))})",
+            values,
+        )
+        self.crawler.conn.commit()
+
+    def _seed_mixed_queue(self):
+        self._insert("https://example.com/a", priority=1)
+        self._insert("https://example.com/b", last_crawl="2024-01-01 00:00:00")
+        self._insert("https://example.com/c", retry_count=2)
+        self._insert("https://example.com/d", "visited", 1, "2020-01-01 00:00:00")
+        self._insert("https://example.com/e", "visited", 0, "2020-01-02 00:00:00")
+        self._insert("https://example.com/f", "visited", 5, "2999-01-01 00:00:00")
+        self._insert("https://example.com/g", retry_after="2999-01-01 00:00:00")
+        self._insert("https://example.com/h", "failed", 9)
+
+    def test_scheduler_indexes_exist(self):
+        """Test that the queue schema creates the scheduler indexes."""
+        self.crawler.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'crawl_queue'"
+        )
+        names = {row[0] for row in self.crawler.cursor.fetchall()}
+        self.assertIn("idx_crawl_queue_pending_order", names)
+        self.assertIn("idx_crawl_queue_visited_due", names)
+
+    def test_pending_query_reads_index_order(self):
+        """Test that pending URLs are served from the index without a sort."""
+        self.crawler.cursor.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT url FROM crawl_queue WHERE status = 'pending'
+            ORDER BY priority DESC, last_crawl IS NULL DESC, retry_count ASC,
+                     next_crawl ASC, url ASC
+            LIMIT 1
+        """)
+        plan = " ".join(row[3] for row in self.crawler.cursor.fetchall())
+        self.assertIn("idx_crawl_queue_pending_order", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_claim_order_matches_legacy_query(self):
+        """Test that claims follow the single-query scheduling order."""
+        self._seed_mixed_queue()
+        self.crawler.cursor.execute(self.LEGACY_ORDER_QUERY)
+        expected = [row[0] for row in self.crawler.cursor.fetchall()]
+
+        self.assertEqual(self.crawler.claim_next_urls(len(expected) + 5), expected)
+
+    def test_second_claim_skips_leased_urls(self):
+        """Test that claimed URLs are not handed out again until marked."""
+        self._seed_mixed_queue()
+        first = self.crawler.claim_next_urls(2)
+        second = self.crawler.claim_next_urls(2)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 2)
+        self.assertFalse(set(first) & set(second))
+        self.assertNotIn(self.crawler.get_next_url_to_crawl(), first + second)
+
+    def test_marking_url_releases_claim(self):
+        """Test that mark_url_status clears the lease."""
+        [url] = self.crawler.claim_next_urls(1)
+        self.crawler.mark_url_status(url, "pending")
+
+        self.assertEqual(self.crawler.claim_next_urls(1), [url])
+
+    def test_expired_claim_is_handed_out_again(self):
+        """Test that a lease stops protecting a URL once it expires."""
+        [url] = self.crawler.claim_next_urls(1, lease_seconds=-1)
+
+        self.assertEqual(self.crawler.claim_next_urls(1), [url])
+
+    def test_claim_resets_due_recrawl_to_pending(self):
+        """Test that claiming a due visited URL moves it back to pending."""
+        self.crawler.cursor.execute("DELETE FROM crawl_queue")
+        self._insert("https://example.com/d", "visited", 0, "2020-01-01 00:00:00")
+
+        self.assertEqual(self.crawler.claim_next_urls(3), ["https://example.com/d"])
+        self.crawler.cursor.execute(
+            "SELECT status FROM crawl_queue WHERE url = 'https://example.com/d'"
+        )
+        self.assertEqual(self.crawler.cursor.fetchone()[0], "pending")
+
+    def test_claim_respects_exclude_and_empty_queue(self):
+        """Test exclusion of in-flight URLs and an exhausted queue."""
+        self.crawler.cursor.execute("SELECT url FROM crawl_queue")
+        queued = {row[0] for row in self.crawler.cursor.fetchall()}
+
+        self.assertEqual(self.crawler.claim_next_urls(5, exclude=queued), [])
+        self.assertEqual(self.crawler.claim_next_urls(0), [])
+
+
+class TestBulkLinkDiscovery(QueueDatabaseTestCase):
+    """Test cases for batched queueing of discovered links."""
+
+    def _queued(self):
+        self.crawler.cursor.execute("SELECT url, status, priority FROM crawl_queue")
+        return {row[0]: (row[1], row[2]) for row in self.crawler.cursor.fetchall()}
+
+    def test_inserts_only_new_normalized_urls(self):
+        """Test that URL variants collapse and known URLs are left alone."""
+        self.crawler.mark_url_status(self.url, "visited", content_hash="hash")
+
+        inserted = self.crawler.add_new_urls_to_queue(
+            [
+                "https://example.com/page",
+                "https://www.example.com/new/",
+                "https://example.com/new",
+                "https://example.com/NEW#section",
+                "https://example.com/other",
+            ]
+        )
+
+        self.assertEqual(inserted, 2)
+        queued = self._queued()
+        self.assertEqual(queued[self.url], ("visited", 0))
+        self.assertEqual(queued["example.com/new"], ("pending", 0))
+        self.assertEqual(queued["example.com/other"], ("pending", 0))
+
+    def test_large_link_sets_are_chunked(self):
+        """Test link sets larger than one IN (...) lookup."""
+        from crawler.website_crawler import BULK_QUERY_CHUNK_SIZE
+
+        urls = [
+            f"https://example.com/p/{i}" for i in range(BULK_QUERY_CHUNK_SIZE * 2 + 1)
+        ]
+        self.assertEqual(self.crawler.add_new_urls_to_queue(urls), len(urls))
+        self.assertEqual(self.crawler.add_new_urls_to_queue(urls), 0)
+
+    def test_queue_new_links_uses_constant_statements(self):
+        """Test that a link-heavy page costs a fixed number of queue statements."""
+        from crawler.website_crawler import _queue_new_links
+
+        links = [f"https://example.com/nav/{i}" for i in range(200)] * 2
+        links += ["https://other.org/page", "https://example.com/file.pdf"]
+        statements = []
+        self.crawler.conn.set_trace_callback(statements.append)
+        with patch.object(self.crawler, "_ensure_robots_cache_fresh"):
+            _queue_new_links(self.crawler, links)
+        self.crawler.conn.set_trace_callback(None)
+
+        queued = self._queued()
+        self.assertIn("example.com/nav/199", queued)
+        self.assertNotIn("other.org/page", queued)
+        self.assertNotIn("example.com/file.pdf", queued)
+        queue_selects = [sql for sql in statements if sql.startswith("SELECT")]
+        self.assertEqual(len(queue_selects), 1)
+
+    def test_no_new_urls_returns_zero(self):
+        """Test empty input and fully known link sets."""
+        self.assertEqual(self.crawler.add_new_urls_to_queue([]), 0)
+        self.assertEqual(self.crawler.add_new_urls_to_queue([self.url]), 0)
+
+
+class TestSitemapSeeding(QueueDatabaseTestCase):
+    """Test cases for loading sitemap entries into the crawl queue."""
+
+    def setUp(self):
+        super().setUp()
+        robots_patcher = patch.object(self.crawler, "_ensure_robots_cache_fresh")
+        robots_patcher.start()
+        self.addCleanup(robots_patcher.stop)
+
+    def _row(self, url):
+        self.crawler.cursor.execute(
+            "SELECT status, modified_date FROM crawl_queue WHERE url = ?", (url,)
+        )
+        return self.crawler.cursor.fetchone()
+
+    def _set_visited(self, url, last_crawl, modified_date=None):
+        self.crawler.cursor.execute(
+            "INSERT OR REPLACE INTO crawl_queue "
+            "(url, status, last_crawl, next_crawl, modified_date) "
+            "VALUES (?, 'visited', ?, datetime('now', '+10 days'), ?)",
+            (url, last_crawl, modified_date),
+        )
+        self.crawler.conn.commit()
+
+    def test_new_entries_are_queued_with_lastmod(self):
+        """Test bulk loading of unseen sitemap URLs."""
+        from crawler.sitemap_seeding import SitemapEntry
+
+        stats = self.crawler.sync_sitemap_entries(
+            [
+                SitemapEntry("https://example.com/new/", "2024-05-01T00:00:00"),
+                SitemapEntry("https://www.example.com/new"),
+                SitemapEntry("https://example.com/photo.jpg"),
+                SitemapEntry("https://other.org/page"),
+            ]
+        )
+
+        self.assertEqual(stats.inserted, 1)
+        self.assertEqual(stats.filtered, 2)
+        self.assertEqual(
+            tuple(self._row("example.com/new")), ("pending", "2024-05-01T00:00:00")
+        )
+
+    def test_only_pages_changed_since_last_crawl_are_rescheduled(self):
+        """Test that lastmod drives rescheduling of visited pages."""
+        from crawler.sitemap_seeding import SitemapEntry
+
+        self._set_visited("example.com/changed", "2024-04-01T00:00:00")
+        self._set_visited("example.com/crawled-later", "2024-06-01T00:00:00")
+        self._set_visited(
+            "example.com/same", "2024-06-01T00:00:00", "2024-05-01T00:00:00"
+        )
+
+        stats = self.crawler.sync_sitemap_entries(
+            [
+                SitemapEntry("https://example.com/changed", "2024-05-01T00:00:00"),
+                SitemapEntry(
+                    "https://example.com/crawled-later", "2024-05-01T00:00:00"
+                ),
+                SitemapEntry("https://example.com/same", "2024-05-01T00:00:00"),
+            ]
+        )
+
+        self.assertEqual((stats.rescheduled, stats.lastmod_recorded), (1, 1))
+        self.assertEqual(stats.unchanged, 1)
+        self.assertEqual(self._row("example.com/changed")["status"], "pending")
+        later = self._row("example.com/crawled-later")
+        self.assertEqual(tuple(later), ("visited", "2024-05-01T00:00:00"))
+        self.assertEqual(self._row("example.com/same")["status"], "visited")
+
+    def test_sitemap_urls_prefer_config_then_robots(self):
+        """Test where the crawler looks for sitemaps."""
+        self.crawler.robots_parser = None
+        self.assertEqual(
+            self.crawler.get_sitemap_urls(), ["https://example.com/sitemap.xml"]
+        )
+        self.crawler.robots_parser = Mock()
+        self.crawler.robots_parser.site_maps.return_value = [
+            "https://example.com/sitemap_index.xml"
+        ]
+        self.assertEqual(
+            self.crawler.get_sitemap_urls(), ["https://example.com/sitemap_index.xml"]
+        )
+        self.crawler.config["sitemap_urls"] = ["https://example.com/custom.xml"]
+        self.assertEqual(
+            self.crawler.get_sitemap_urls(), ["https://example.com/custom.xml"]
+        )
+
+    def test_check_runs_once_per_interval(self):
+        """Test the opt-in flag and the check interval."""
+        from crawler.sitemap_seeding import SitemapEntry
+
+        self.assertEqual(self.crawler.check_and_process_sitemaps(), 0)
+
+        self.crawler.sitemap_reader = Mock()
+        self.crawler.sitemap_reader.iter_entries.return_value = iter(
+            [SitemapEntry("https://example.com/from-sitemap")]
+        )
+        self.crawler.robots_parser = None
+
+        self.assertEqual(self.crawler.check_and_process_sitemaps(), 1)
+        self.assertEqual(self.crawler.check_and_process_sitemaps(), 0)
+        self.assertEqual(self.crawler.sitemap_reader.iter_entries.call_count, 1)
+
+    def test_disabled_by_default(self):
+        """Test that sites must opt in to sitemap seeding."""
+        self.assertIsNone(self.crawler.sitemap_reader)
+        self.assertFalse(self.crawler.should_check_sitemaps())
+
+
+class TestVectorManifest(QueueDatabaseTestCase):
+    """Test cases for the local record of each page's Pinecone vector IDs."""
+
+    def test_remove_uses_manifest_without_query(self):
+        """Test that a recorded page is removed without a metadata query."""
+        self.crawler._replace_vector_manifest(self.url, ["vec1", "vec2"])
+        mock_index = Mock()
+
+        self.assertEqual(self.crawler.remove_url_from_pinecone(mock_index, self.url), 2)
+
+        mock_index.query.assert_not_called()
+        mock_index.delete.assert_called_once_with(ids=["vec1", "vec2"])
+        self.assertIsNone(self.crawler.get_vector_manifest(self.url))
+
+    def test_failed_delete_keeps_ids_for_retry(self):
+        """Test that IDs whose delete failed stay in the manifest."""
+        self.crawler._replace_vector_manifest(self.url, ["vec1"])
+        mock_index = Mock()
+        mock_index.delete.side_effect = Exception("Pinecone unavailable")
+
+        self.assertEqual(self.crawler.remove_url_from_pinecone(mock_index, self.url), 0)
+        self.assertEqual(self.crawler.get_vector_manifest(self.url), ["vec1"])
+
+    def test_reembed_deletes_stale_vectors(self):
+        """Test that vectors missing from a re-embed are deleted."""
+        self.crawler._replace_vector_manifest(self.url, ["a", "b", "c"])
+        mock_index = Mock()
+
+        deleted = self.crawler.sync_vector_manifest(mock_index, self.url, ["a", "d"])
+
+        self.assertEqual(deleted, 2)
+        mock_index.query.assert_not_called()
+        mock_index.delete.assert_called_once_with(ids=["b", "c"])
+        self.assertEqual(sorted(self.crawler.get_vector_manifest(self.url)), ["a", "d"])
+
+    @patch.dict(os.environ, {"OPENAI_EMBEDDING_DIMENSION": "1536"})
+    def test_legacy_page_bootstraps_from_query(self):
+        """Test that a page without a manifest is looked up in Pinecone once."""
+        self.crawler.mark_url_status(self.url, "visited", content_hash="f" * 64)
+        mock_index = Mock()
+        mock_index.query.return_value = Mock(matches=[Mock(id="old"), Mock(id="a")])
+
+        self.crawler.sync_vector_manifest(mock_index, self.url, ["a"])
+        self.crawler.sync_vector_manifest(mock_index, self.url, ["a"])
+
+        mock_index.query.assert_called_once()
+        mock_index.delete.assert_called_once_with(ids=["old"])
+        self.assertEqual(self.crawler.get_vector_manifest(self.url), ["a"])
+
+    def test_first_crawl_of_new_url_skips_query(self):
+        """Test that a never-embedded page records its manifest without a query."""
+        mock_index = Mock()
+
+        deleted = self.crawler.sync_vector_manifest(mock_index, self.url, ["a", "b"])
+
+        self.assertEqual(deleted, 0)
+        mock_index.query.assert_not_called()
+        mock_index.delete.assert_not_called()
+        self.assertEqual(sorted(self.crawler.get_vector_manifest(self.url)), ["a", "b"])
+
+    def test_page_that_became_empty_loses_its_vectors(self):
+        """Test that a page producing no chunks has its old vectors deleted."""
+        from crawler.website_crawler import _chunk_embed_and_upsert
+
+        self.crawler._replace_vector_manifest(self.url, ["a", "b"])
+        self.crawler._text_splitter = Mock()
+        self.crawler._text_splitter.split_text.return_value = []
+        mock_index = Mock()
+
+        _chunk_embed_and_upsert(
+            self._job().content, self.url, self.crawler, mock_index, "index"
+        )
+
+        mock_index.delete.assert_called_once_with(ids=["a", "b"])
+        self.assertIsNone(self.crawler.get_vector_manifest(self.url))
+
+    def test_page_without_chunks_is_not_rechunked(self):
+        """Test that an unchanged page with no chunks is skipped on recrawl."""
+        from crawler.website_crawler import _page_content_hash, _process_page_content
+
+        self.crawler._text_splitter = Mock()
+        self.crawler._text_splitter.split_text.return_value = []
+        content = self._job().content
+
+        for _ in range(2):
+            _process_page_content(content, [], self.url, self.crawler, Mock(), "index")
+
+        self.crawler._text_splitter.split_text.assert_called_once()
+        self.assertEqual(self._status()["content_hash"], _page_content_hash(content))
+
+    def test_dry_run_leaves_manifest_untouched(self):
+        """Test that dry runs neither delete vectors nor change the manifest."""
+        self.crawler._replace_vector_manifest(self.url, ["a", "b"])
+        self.crawler.dry_run = True
+        mock_index = Mock()
+
+        self.assertEqual(self.crawler.sync_vector_manifest(mock_index, self.url, []), 0)
+        self.assertEqual(self.crawler.remove_url_from_pinecone(mock_index, self.url), 2)
+
+        mock_index.delete.assert_not_called()
+        self.assertEqual(sorted(self.crawler.get_vector_manifest(self.url)), ["a", "b"])
+
+    def test_recrawl_embeds_only_changed_chunks(self):
+        """Test that a small edit re-embeds one chunk and deletes one vector."""
+        from crawler.website_crawler import _process_page_content
+
+        self.crawler._embeddings = MagicMock()
+        self.crawler._embeddings.embed_documents.side_effect = lambda texts: [
+            [0.0] for _ in texts
+        ]
+        mock_splitter = Mock()
+        self.crawler._text_splitter = mock_splitter
+        mock_index = Mock()
+        mock_index.query.return_value = Mock(matches=[])
+        job = self._job()
+        before = ["intro", "middle", "outro"]
+        after = ["intro", "middle, edited", "outro"]
+
+        for chunks in (before, after):
+            mock_splitter.split_text.return_value = chunks
+            job.content.content = " ".join(chunks)
+            _process_page_content(
+                job.content, [], self.url, self.crawler, mock_index, "index"
+            )
+
+        last_embed = self.crawler._embeddings.embed_documents.call_args_list[-1]
+        self.assertEqual(last_embed.args[0], ["middle, edited"])
+        self.assertEqual(len(mock_index.upsert.call_args.kwargs["vectors"]), 1)
+        old_id = self.crawler.chunk_vector_ids(before, self.url, "Title")[1]
+        mock_index.delete.assert_called_once_with(ids=[old_id])
+        self.assertEqual(
+            sorted(self.crawler.get_vector_manifest(self.url)),
+            sorted(self.crawler.chunk_vector_ids(after, self.url, "Title")),
+        )
+        self.assertEqual(self.crawler.chunks_reused, 2)
+        # Same chunk count, so the reused vectors' metadata is still right
+        mock_index.fetch.assert_not_called()
+
+    def test_failed_upsert_stays_out_of_manifest(self):
+        """Test that vectors whose upsert failed are embedded again later."""
+        from crawler.website_crawler import _process_page_content
+
+        self.crawler._embeddings = MagicMock()
+        self.crawler._embeddings.embed_documents.side_effect = lambda texts: [
+            [0.0] for _ in texts
+        ]
+        self.crawler._text_splitter = Mock()
+        self.crawler._text_splitter.split_text.return_value = ["intro", "outro"]
+        mock_index = Mock()
+        mock_index.upsert.side_effect = [Exception("Pinecone unavailable"), None]
+        mock_index.query.return_value = Mock(matches=[])
+        content = self._job().content
+
+        for text in ("first", "second"):
+            content.content = text
+            _process_page_content(
+                content, [], self.url, self.crawler, mock_index, "index"
+            )
+            if text == "first":
+                self.assertIsNone(self.crawler.get_vector_manifest(self.url))
+
+        last_embed = self.crawler._embeddings.embed_documents.call_args_list[-1]
+        self.assertEqual(last_embed.args[0], ["intro", "outro"])
+        self.assertEqual(len(self.crawler.get_vector_manifest(self.url)), 2)
+
+    def test_pipeline_upsert_drops_failed_ids(self):
+        """Test that the pipeline leaves failed vectors out of the manifest."""
+        from crawler.website_crawler import _pipeline_upsert
+
+        job = self._job(chunks=["a", "b"], vector_ids=["a", "b"])
+        job.vectors = [{"id": "a"}, {"id": "b"}]
+        mock_index = Mock()
+        mock_index.upsert.side_effect = Exception("Pinecone unavailable")
+
+        _pipeline_upsert(self.crawler, mock_index, "index", job)
+
+        self.assertEqual(job.vector_ids, [])
+
+    def test_pipeline_upsert_refreshes_reused_vectors(self):
+        """Test that a changed chunk count re-upserts reused vectors in one batch."""
+        from crawler.website_crawler import _pipeline_upsert
+
+        chunks = ["kept", "also kept", "new"]
+        ids = self.crawler.chunk_vector_ids(chunks, self.url, "Title")
+        job = self._job(
+            chunks=chunks, vector_ids=ids, known_vector_ids=frozenset(ids[:2])
+        )
+        job.vectors = [{"id": ids[2], "values": [0.0], "metadata": {}}]
+        mock_index = Mock()
+        mock_index.fetch.return_value = Mock(
+            vectors={vector_id: Mock(values=[1.0]) for vector_id in ids[:2]}
+        )
+
+        _pipeline_upsert(self.crawler, mock_index, "index", job)
+
+        mock_index.fetch.assert_called_once_with(ids=ids[:2])
+        mock_index.update.assert_not_called()
+        upserted = mock_index.upsert.call_args.kwargs["vectors"]
+        self.assertEqual([v["id"] for v in upserted], [ids[2], ids[0], ids[1]])
+        self.assertEqual(upserted[1]["values"], [1.0])
+        self.assertEqual([v["metadata"]["total_chunks"] for v in upserted[1:]], [3, 3])
+        self.assertEqual(upserted[2]["metadata"]["chunk_index"], 1)
+
+    def test_pipeline_embed_skips_known_chunks(self):
+        """Test that the embed stage uses the IDs read when the job was queued."""
+        from crawler.website_crawler import _pipeline_embed
+
+        chunks = ["kept", "new"]
+        ids = self.crawler.chunk_vector_ids(chunks, self.url, "Title")
+        job = self._job(chunks=chunks, known_vector_ids=frozenset(ids[:1]))
+
+        with patch.object(
+            self.crawler, "create_embeddings", return_value=[]
+        ) as mock_embed:
+            _pipeline_embed(self.crawler, job)
+
+        mock_embed.assert_called_once_with(
+            chunks, self.url, "Title", job.known_vector_ids
+        )
+        self.assertEqual(job.vector_ids, ids)
+
+    def test_finished_pipeline_job_syncs_manifest(self):
+        """Test that the pipeline records vector IDs when a job is marked."""
+        from crawler.website_crawler import _finish_pipeline_job
+
+        self.crawler._replace_vector_manifest(self.url, ["old"])
+        job = self._job(chunks=["chunk"], vector_ids=["new"])
+        mock_index = Mock()
+
+        self.assertEqual(
+            _finish_pipeline_job(job, self.crawler, mock_index), (1, False)
+        )
+
+        mock_index.delete.assert_called_once_with(ids=["old"])
+        self.assertEqual(self.crawler.get_vector_manifest(self.url), ["new"])
+
+
+class TestCrawlerMetrics(QueueDatabaseTestCase):
+    """Test cases for the crawler's metrics file."""
+
+    def setUp(self):
+        """Set up test environment."""
+        super().setUp()
+        self.crawler.metrics_file = Path(self.temp_dir) / "crawler.prom"
+
+    def test_write_metrics_includes_queue_depth(self):
+        """Test that the metrics file lists URLs per queue status."""
+        self.crawler.mark_url_status(self.url, "visited", content_hash="hash")
+        self.crawler.record_page_processed()
+
+        self.assertTrue(self.crawler.write_metrics())
+
+        text = self.crawler.metrics_file.read_text()
+        self.assertIn('crawler_queue_urls{site="test-site",status="visited"} 1', text)
+        self.assertIn('crawler_pages_processed_total{site="test-site"} 1', text)
+        self.assertIn('stage="db_commit"', text)
+
+    def test_write_metrics_respects_interval(self):
+        """Test that the file is rewritten at most once per interval."""
+        self.assertTrue(self.crawler.write_metrics())
+        self.assertFalse(self.crawler.write_metrics())
+        self.assertTrue(self.crawler.write_metrics(force=True))
+
+    def test_disabled_metrics_write_nothing(self):
+        """Test that a crawler without a metrics file skips writing."""
+        self.crawler.metrics_file = None
+        self.assertFalse(self.crawler.write_metrics(force=True))
+
+    def test_worker_crawlers_share_metrics(self):
+        """Test that fetch workers record into the main crawler's metrics."""
+        from crawler.website_crawler import _create_worker_crawler
+
+        worker = _create_worker_crawler(self.crawler)
+        try:
+            self.assertIs(worker.metrics, self.crawler.metrics)
+            self.assertIsNone(worker.metrics_file)
+        finally:
+            worker.close()
+
+    def test_pipeline_stages_are_timed(self):
+        """Test that chunking, upsert and finishing a job feed the metrics."""
+        from crawler.website_crawler import (
+            _finish_pipeline_job,
+            _pipeline_chunk,
+            _pipeline_upsert,
+        )
+
+        mock_splitter = Mock()
+        mock_splitter.split_text.return_value = ["chunk"]
+        self.crawler._text_splitter = mock_splitter
+        job = self._job()
+
+        _pipeline_chunk(self.crawler, job)
+        job.vectors = [{"id": "v1"}]
+        with patch("crawler.website_crawler.upsert_to_pinecone"):
+            _pipeline_upsert(self.crawler, Mock(), "index", job)
+        _finish_pipeline_job(job, self.crawler)
+
+        text = self.crawler.metrics.render()
+        self.assertIn(
+            'stage_duration_seconds_count{site="test-site",stage="chunking"} 1', text
+        )
+        self.assertIn(
+            'stage_duration_seconds_count{site="test-site",stage="upsert"} 1', text
+        )
+        self.assertEqual(self.crawler.metrics.pages_total, 1)
+
+
+class TestBrowserRecycling(QueueDatabaseTestCase):
+    """Test cases for recycling browser contexts in the sequential crawl loop."""
+
+    def _check(self, pages_since_restart: int, browser):
+        from crawler.website_crawler import _handle_browser_restart_check
+
+        return _handle_browser_restart_check(
+            pages_since_restart, 50, Mock(), Mock(), browser, [], 0.0, self.crawler, 7
+        )
+
+    def _browser(self, connected: bool = True):
+        browser = Mock()
+        browser.is_connected.return_value = connected
+        browser.new_page.return_value.evaluate.return_value = "browser_ready"
+        return browser
+
+    def test_page_budget_recycles_context_and_keeps_browser(self):
+        """Test that the page budget no longer relaunches Firefox."""
+        browser = self._browser()
+
+        with patch("crawler.website_crawler._relaunch_browser") as mock_relaunch:
+            result = self._check(50, browser)
+
+        mock_relaunch.assert_not_called()
+        self.assertEqual(result[:4], (7, 0, False, True))
+        self.assertIs(result[4][0], browser)
+        self.assertIs(result[4][1], browser.new_page.return_value)
+        self.assertEqual(self.crawler.browser_stats.context_recycles, 1)
+
+    def test_memory_budget_triggers_recycle(self):
+        """Test that an over-budget browser is recycled before the page budget."""
+        self.crawler.browser_memory_budget = Mock()
+        self.crawler.browser_memory_budget.exceeded.return_value = None
+        self.assertIsNone(self._check(10, self._browser()))
+
+        self.crawler.browser_memory_budget.exceeded.return_value = 4096.0
+        self.assertIsNotNone(self._check(10, self._browser()))
+        self.assertEqual(self.crawler.browser_stats.context_recycles, 1)
+
+    def test_crashed_browser_is_relaunched(self):
+        """Test that a disconnected browser still gets a full restart."""
+        new_browser, new_page = Mock(), Mock()
+
+        with patch(
+            "crawler.website_crawler._relaunch_browser",
+            return_value=(new_browser, new_page),
+        ) as mock_relaunch:
+            result = self._check(50, self._browser(connected=False))
+
+        mock_relaunch.assert_called_once()
+        self.assertEqual(result[4][:2], (new_browser, new_page))
+        self.assertEqual(self.crawler.browser_stats.browser_restarts, 1)
+
+    def test_page_budget_comes_from_config(self):
+        """Test the browser_context_max_pages setting."""
+        crawler = WebsiteCrawler(
+            "test-site",
+            {"domain": "example.com", "browser_context_max_pages": 200},
+            skip_db_init=True,
+            skip_robots_init=True,
+        )
+        self.assertEqual(crawler.browser_context_max_pages, 200)
+
+
+class TestResourceBlocking(QueueDatabaseTestCase):
+    """Test cases for blocking heavy subresources on crawl pages."""
+
+    def test_enabled_by_default_and_configurable(self):
+        """Test the resource blocking settings in the site config."""
+        self.assertIsNotNone(self.crawler.resource_blocker)
+        crawler = WebsiteCrawler(
+            "test-site",
+            {"domain": "example.com", "resource_blocking_enabled": False},
+            skip_db_init=True,
+            skip_robots_init=True,
+        )
+        self.assertIsNone(crawler.resource_blocker)
+
+    def test_crawl_page_installs_policy_once(self):
+        """Test that crawl pages route requests through the blocker."""
+        page = Mock()
+        page.goto.side_effect = Exception("net::ERR_NAME_NOT_RESOLVED")
+        self.crawler._fetch_without_browser = Mock(return_value=None)
+
+        self.crawler.crawl_page(Mock(), page, self.url)
+
+        page.route.assert_called_once_with(
+            "**/*", self.crawler.resource_blocker._handle_route
+        )
+
+    def test_worker_crawlers_share_blocker(self):
+        """Test that blocked requests from workers are counted by the main crawler."""
+        from crawler.website_crawler import _create_worker_crawler
+
+        worker = _create_worker_crawler(self.crawler)
+        try:
+            self.assertIs(worker.resource_blocker, self.crawler.resource_blocker)
+        finally:
+            worker.close()
+
+
+class TestMultiSiteCrawl(QueueDatabaseTestCase):
+    """Test cases for crawling a site queue from the multi-site orchestrator."""
+
+    def _site(self):
+        from crawler.multi_site_crawler import SiteRun
+
+        # Leave only self.url due
+        self.crawler.mark_url_status(self.crawler.start_url, "visited")
+        site = SiteRun("test-site", self.crawler, Mock(), "index", {})
+        site.pipeline = Mock()
+        site.pipeline.try_submit.return_value = True
+        return site
+
+    def test_count_due_urls(self):
+        """Test that due URLs are counted like get_next_url_to_crawl sees them."""
+        self.assertEqual(self.crawler.count_due_urls(), 2)
+        self.crawler.claim_next_urls(1)
+        self.assertEqual(self.crawler.count_due_urls(), 1)
+        self.crawler.mark_url_status(self.url, "visited")
+        self.assertEqual(self.crawler.count_due_urls(), 0)
+
+    def test_fetched_page_goes_to_site_pipeline(self):
+        """Test that a fetched page is claimed, paced and queued for the pipeline."""
+        from crawler.multi_site_crawler import crawl_next_page
+
+        site = self._site()
+        scheduler = Mock()
+        self.crawler.crawl_page = Mock(
+            return_value=(self._job().content, ["https://example.com/next"], False)
+        )
+
+        self.assertEqual(crawl_next_page(site, Mock(), scheduler), 0)
+
+        scheduler.record_page.assert_called_once_with("test-site")
+        job = site.pipeline.try_submit.call_args[0][0]
+        self.assertEqual(job.url, self.url)
+        self.assertEqual(site.in_flight, {self.url})
+        self.assertEqual(self.crawler.count_due_urls(), 0)
+
+    def test_empty_queue_marks_site_idle(self):
+        """Test that a site without due URLs stops being scheduled."""
+        from crawler.multi_site_crawler import crawl_next_page
+
+        site = self._site()
+        self.crawler.mark_url_status(self.url, "visited")
+        scheduler = Mock()
+
+        self.assertEqual(crawl_next_page(site, Mock(), scheduler), 0)
+
+        scheduler.mark_idle.assert_called_once_with("test-site")
+
+    def test_site_environment_is_restored(self):
+        """Test that a site's .env values only apply inside the block."""
+        from crawler.multi_site_crawler import site_environment
+
+        with site_environment(
+            {"PINECONE_INGEST_INDEX_NAME": "site-index", "OPENAI_API_KEY": "site"}
+        ):
+            self.assertEqual(os.environ["PINECONE_INGEST_INDEX_NAME"], "site-index")
+            self.assertEqual(os.environ["OPENAI_API_KEY"], "site")
+        self.assertNotIn("PINECONE_INGEST_INDEX_NAME", os.environ)
+        self.assertEqual(os.environ["OPENAI_API_KEY"], "test-api-key")
+
+    def test_chunk_stage_uses_site_model_outside_site_environment(self):
+        """Test that a site's pipeline chunks with its model after its .env is gone."""
+        import tiktoken
+        from crawler.multi_site_crawler import SharedModels, site_environment
+        from crawler.website_crawler import _pipeline_chunk
+
+        # Byte-level encoding, since tiktoken's cannot be downloaded in tests
+        encoding = tiktoken.Encoding(
+            name="test_bytes",
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+        self.crawler.chunk_cache_enabled = False
+        self.crawler.embedding_cache_enabled = False
+        shared = SharedModels()
+        os.environ.pop("OPENAI_INGEST_EMBEDDINGS_MODEL")
+        with site_environment(
+            {"OPENAI_INGEST_EMBEDDINGS_MODEL": "site-model", "OPENAI_API_KEY": "site"}
+        ):
+            shared.attach(self.crawler)
+        self.assertNotIn("OPENAI_INGEST_EMBEDDINGS_MODEL", os.environ)
+
+        job = self._job()
+        with patch.dict(
+            "utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+            {"site-model": encoding},
+            clear=True,
+        ):
+            _pipeline_chunk(self.crawler, job)
+
+        self.assertEqual(job.chunks, ["Title Body text"])
+        self.assertIs(shared.text_splitters["site-model"], self.crawler.text_splitter)
+
+
+class TestQueueGroupCommits(QueueDatabaseTestCase):
+    """Test cases for grouping queue writes into fewer commits."""
+
+    def setUp(self):
+        """Set up test environment."""
+        super().setUp()
+        from crawler.queue_db import CommitBudget
+
+        self.crawler.commit_budget = CommitBudget(max_writes=3, max_seconds=60)
+
+    def test_status_updates_wait_for_the_budget(self):
+        """Test that marks stay in one transaction until the write budget is used."""
+        self.crawler.mark_url_status(self.url, "visited", content_hash="hash")
+        self.crawler.add_new_urls_to_queue(["https://example.com/next"])
+        self.assertTrue(self.crawler.conn.in_transaction)
+        self.assertTrue(self.crawler.commit_db_changes())
+        self.assertTrue(self.crawler.conn.in_transaction)
+
+        self.crawler.mark_url_status(self.crawler.start_url, "visited")
+        self.assertFalse(self.crawler.conn.in_transaction)
+        self.assertEqual(self.crawler.commit_budget.commits, 1)
+
+    def test_forced_commit_and_claims_flush_pending_writes(self):
+        """Test that forced commits and URL claims commit the group right away."""
+        self.crawler.mark_url_status(self.crawler.start_url, "visited")
+        self.crawler.commit_db_changes(force=True)
+        self.assertFalse(self.crawler.conn.in_transaction)
+
+        self.crawler.add_new_urls_to_queue(["https://example.com/next"])
+        self.assertTrue(self.crawler.conn.in_transaction)
+        self.assertEqual(len(self.crawler.claim_next_urls(1)), 1)
+        self.assertEqual(self.crawler.commit_budget.pending, 0)
+
+    def test_close_commits_pending_writes(self):
+        """Test that closing the crawler doesn't drop grouped writes."""
+        self.crawler.mark_url_status(self.url, "visited", content_hash="hash")
+        self.crawler.close()
+        self.crawler.conn = None  # Already closed for tearDown
+        self.assertEqual(self.crawler.commit_budget.commits, 1)
+        self.assertEqual(self.crawler.commit_budget.pending, 0)
+
+
+class TestCreateEmbeddings(BaseWebsiteCrawlerTest):
+    """Test cases for batched embedding creation."""
+
+    def setUp(self):
+        """Set up test environment."""
+        super().setUp()
+        self.crawler = WebsiteCrawler(
+            "test-site",
+            {"domain": "example.com", "skip_patterns": []},
+            skip_db_init=True,
+            skip_robots_init=True,
+        )
+        self.crawler._embeddings = MagicMock()
+        self.crawler._embeddings.embed_documents.side_effect = lambda texts: [
+            [float(i)] for i in range(len(texts))
+        ]
+
+    def test_page_chunks_embedded_in_one_call(self):
+        """Test that all chunks of a page go out in a single embedding call."""
+        chunks = ["first chunk", "second chunk", "third chunk"]
+        vectors = self.crawler.create_embeddings(
+            chunks, "https://example.com/page", "Title"
+        )
+
+        self.crawler._embeddings.embed_documents.assert_called_once_with(chunks)
+        self.crawler._embeddings.embed_query.assert_not_called()
+        self.assertEqual([v["values"] for v in vectors], [[0.0], [1.0], [2.0]])
+        self.assertEqual([v["metadata"]["chunk_index"] for v in vectors], [0, 1, 2])
+        self.assertTrue(all(v["metadata"]["total_chunks"] == 3 for v in vectors))
+
+    def test_known_chunks_are_not_embedded(self):
+        """Test that chunks already in the vector manifest are skipped."""
+        url = "https://example.com/page"
+        chunks = ["kept chunk", "edited chunk", "last chunk"]
+        known = self.crawler.chunk_vector_ids(
+            ["kept chunk", "old", "last chunk"], url, "Title"
+        )
+
+        vectors = self.crawler.create_embeddings(chunks, url, "Title", set(known))
+
+        self.crawler._embeddings.embed_documents.assert_called_once_with(
+            ["edited chunk"]
+        )
+        self.assertEqual(len(vectors), 1)
+        self.assertEqual(vectors[0]["metadata"]["chunk_index"], 1)
+        self.assertEqual(
+            vectors[0]["id"], self.crawler.chunk_vector_ids(chunks, url, "Title")[1]
+        )
+
+        self.crawler._embeddings.embed_documents.reset_mock()
+        self.assertEqual(
+            self.crawler.create_embeddings(chunks[:1], url, "Title", known), []
+        )
+        self.crawler._embeddings.embed_documents.assert_not_called()
+
+    def test_empty_chunks_make_no_call(self):
+        """Test that a page without chunks skips the embedding call."""
+        self.assertEqual(
+            self.crawler.create_embeddings([], "https://example.com/page", "Title"),
+            [],
+        )
+        self.crawler._embeddings.embed_documents.assert_not_called()
+
+    def test_uses_batcher_when_enabled(self):
+        """Test that the pipeline batcher is used instead of a direct call."""
+        from crawler.website_crawler import _create_embedding_batcher
+
+        self.crawler.embedding_batch_max_wait_seconds = 0.01
+        self.crawler.embedding_batcher = _create_embedding_batcher(self.crawler, 1)
+
+        vectors = self.crawler.create_embeddings(
+            ["a", "b"], "https://example.com/page", "Title"
+        )
+
+        self.assertEqual(len(vectors), 2)
+        self.assertEqual(self.crawler.embedding_batcher.stats.api_calls, 1)
+        self.crawler._embeddings.embed_documents.assert_called_once_with(["a", "b"])
+
+
 if __name__ == "__main__":
     unittest.main()
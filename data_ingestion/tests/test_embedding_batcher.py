@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Unit tests for the cross-page embedding batcher."""
+
+import threading
+import unittest
+
+from crawler.embedding_batcher import EmbeddingBatcher, estimate_tokens
+
+
+class RecordingEmbedder:
+    """Embedding function that records each batch it receives."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[str]] = []
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        with self.lock:
+            self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("rate limit exceeded")
+        return [[float(len(text))] for text in texts]
+
+
+def _embed_concurrently(batcher: EmbeddingBatcher, pages: list[list[str]]):
+    results: dict[int, object] = {}
+
+    def run(index: int, texts: list[str]) -> None:
+        try:
+            results[index] = batcher.embed(texts)
+        except Exception as e:
+            results[index] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, texts)) for i, texts in enumerate(pages)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestEstimateTokens(unittest.TestCase):
+    def test_four_characters_per_token(self):
+        self.assertEqual(estimate_tokens("a" * 40), 10)
+        self.assertEqual(estimate_tokens(""), 1)
+
+
+class TestEmbeddingBatcher(unittest.TestCase):
+    def test_empty_input_makes_no_call(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder)
+        self.assertEqual(batcher.embed([]), [])
+        self.assertEqual(embedder.calls, [])
+
+    def test_single_caller_flushes_after_timeout(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_wait_seconds=0.05)
+
+        vectors = batcher.embed(["a", "bb", "ccc"])
+
+        self.assertEqual(vectors, [[1.0], [2.0], [3.0]])
+        self.assertEqual(embedder.calls, [["a", "bb", "ccc"]])
+        self.assertEqual(batcher.stats.flushes_by_timeout, 1)
+
+    def test_count_threshold_flushes_immediately(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_texts=2, max_wait_seconds=60)
+
+        self.assertEqual(batcher.embed(["x", "yy"]), [[1.0], [2.0]])
+        self.assertEqual(batcher.stats.flushes_by_size, 1)
+
+    def test_token_threshold_flushes_immediately(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_tokens=10, max_wait_seconds=60)
+
+        batcher.embed(["a" * 40])
+        self.assertEqual(batcher.stats.flushes_by_size, 1)
+
+    def test_concurrent_pages_share_one_call(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_wait_seconds=5, expected_callers=3)
+        pages = [["p0-a", "p0-b"], ["p1-a"], ["p2-a", "p2-b", "p2-c"]]
+
+        results = _embed_concurrently(batcher, pages)
+
+        self.assertEqual(len(embedder.calls), 1)
+        self.assertEqual(sorted(embedder.calls[0]), sorted(sum(pages, [])))
+        for i, texts in enumerate(pages):
+            self.assertEqual(results[i], [[float(len(t))] for t in texts])
+        self.assertEqual(batcher.stats.api_calls, 1)
+        self.assertEqual(batcher.stats.requests, 3)
+
+    def test_error_is_raised_for_every_caller_in_batch(self):
+        embedder = RecordingEmbedder(fail=True)
+        batcher = EmbeddingBatcher(embedder, max_wait_seconds=5, expected_callers=2)
+
+        results = _embed_concurrently(batcher, [["a"], ["b"]])
+
+        self.assertEqual(len(embedder.calls), 1)
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results.values()))
+
+    def test_flush_embeds_waiting_requests(self):
+        embedder = RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder)
+        batcher.flush()
+        self.assertEqual(embedder.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests for the on-disk embedding cache shared by the ingestion scripts."""
+
+import asyncio
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+
+from data_ingestion.audio_video.pinecone_utils import create_embeddings
+from data_ingestion.utils.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+MODEL = "text-embedding-3-small"
+
+
+def vector_for(text: str) -> list[float]:
+    """A distinct float32-exact vector per text."""
+    return [float(len(text)), float(sum(map(ord, text)) % 1024), 0.5]
+
+
+class FakeEmbedder:
+    """Records every batch it is asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [vector_for(text) for text in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    embedding_cache = EmbeddingCache(tmp_path / "embedding-cache.db")
+    yield embedding_cache
+    embedding_cache.close()
+
+
+class TestEmbeddingCache:
+    def test_round_trip_as_float32(self, cache):
+        cache.put_many(["a", "b"], [[0.1, 0.2], [0.3, 0.4]], MODEL)
+
+        a, missing, b = cache.get_many(["a", "c", "b"], MODEL)
+
+        assert a == pytest.approx([0.1, 0.2], rel=1e-6)
+        assert b == pytest.approx([0.3, 0.4], rel=1e-6)
+        assert missing is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_keyed_by_model_and_dimensions(self, cache):
+        cache.put_many(["a"], [[1.0]], MODEL, dimensions=256)
+
+        assert cache.get_many(["a"], MODEL, dimensions=256) == [[1.0]]
+        assert cache.get_many(["a"], MODEL) == [None]
+        assert cache.get_many(["a"], "text-embedding-ada-002", 256) == [None]
+
+    def test_embed_sends_only_new_texts_once(self, cache):
+        embedder = FakeEmbedder()
+        cache.embed(["a", "b"], embedder, MODEL)
+
+        vectors = cache.embed(["b", "c", "c", "a"], embedder, MODEL)
+
+        assert vectors == [vector_for(text) for text in ["b", "c", "c", "a"]]
+        assert embedder.calls == [["a", "b"], ["c"]]
+
+    def test_embed_without_misses_makes_no_calls(self, cache):
+        embedder = FakeEmbedder()
+        cache.embed(["a", "b"], embedder, MODEL)
+
+        cache.embed(["a", "b"], embedder, MODEL)
+
+        assert len(embedder.calls) == 1
+        assert cache.summary().startswith("Embedding cache: 2 hits, 2 misses")
+
+    def test_aembed(self, cache):
+        embedder = FakeEmbedder()
+
+        async def embed_async(texts):
+            return embedder(texts)
+
+        asyncio.run(cache.aembed(["a", "b"], embed_async, MODEL))
+        vectors = asyncio.run(cache.aembed(["b", "c"], embed_async, MODEL))
+
+        assert vectors == [vector_for("b"), vector_for("c")]
+        assert embedder.calls == [["a", "b"], ["c"]]
+
+    def test_many_texts_are_looked_up_in_batches(self, cache):
+        texts = [f"text {n}" for n in range(1200)]
+        cache.embed(texts, FakeEmbedder(), MODEL)
+        embedder = FakeEmbedder()
+
+        vectors = cache.embed(texts, embedder, MODEL)
+
+        assert vectors == [vector_for(text) for text in texts]
+        assert embedder.calls == []
+
+    def test_entries_survive_reopening(self, cache, tmp_path):
+        cache.put_many(["a"], [[1.0, 2.0]], MODEL)
+        cache.close()
+
+        reopened = EmbeddingCache(tmp_path / "embedding-cache.db")
+        assert reopened.get_many(["a"], MODEL) == [[1.0, 2.0]]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        vector = [0.0] * 256  # 1 KB as float32
+        cache = EmbeddingCache(tmp_path / "embedding-cache.db", max_size_mb=0.0025)
+        cache.put_many(["old"], [vector], MODEL)
+        cache.put_many(["used"], [vector], MODEL)
+        cache.get_many(["used"], MODEL)
+
+        cache.put_many(["new"], [vector], MODEL)
+
+        assert cache.get_many(["old", "used", "new"], MODEL)[0] is None
+        assert None not in cache.get_many(["used", "new"], MODEL)
+        assert cache.stats() == {"entries": 2, "size_bytes": 2048}
+
+    def test_pickled_copy_opens_its_own_connection(self, cache):
+        cache.put_many(["a"], [[1.0]], MODEL)
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert copy.get_many(["a"], MODEL) == [[1.0]]
+        assert copy._conn is not cache._conn
+
+
+class TestCachedEmbeddings:
+    def test_embed_documents_and_query_use_the_cache(self, cache):
+        client = MagicMock(model=MODEL)
+        client.embed_documents.side_effect = FakeEmbedder()
+        embeddings = CachedEmbeddings(client, cache)
+
+        embeddings.embed_documents(["a", "b"])
+        vectors = embeddings.embed_documents(["a", "b"])
+        query = embeddings.embed_query("b")
+
+        assert vectors == [vector_for("a"), vector_for("b")]
+        assert query == vector_for("b")
+        client.embed_documents.assert_called_once_with(["a", "b"])
+
+    def test_passes_other_attributes_through(self, cache):
+        client = MagicMock(model=MODEL, chunk_size=1000)
+
+        assert CachedEmbeddings(client, cache).chunk_size == 1000
+
+
+class TestMediaCreateEmbeddings:
+    def test_only_new_chunks_are_sent(self, cache, monkeypatch):
+        monkeypatch.setenv("OPENAI_INGEST_EMBEDDINGS_MODEL", MODEL)
+        client = MagicMock()
+        client.embeddings.create.side_effect = lambda input, model: MagicMock(
+            data=[MagicMock(embedding=vector_for(text)) for text in input]
+        )
+        chunks = [{"text": "first chunk"}, {"text": "second chunk"}]
+        create_embeddings(chunks[:1], client, cache)
+
+        vectors = create_embeddings(chunks, client, cache)
+
+        assert vectors == [vector_for("first chunk"), vector_for("second chunk")]
+        assert client.embeddings.create.call_count == 2
+        client.embeddings.create.assert_called_with(input=["second chunk"], model=MODEL)
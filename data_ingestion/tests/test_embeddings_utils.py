@@ -6,6 +6,7 @@ Tests cover:
 - Sync and async embeddings generation
 - Error handling and retry logic
 - Batch processing functionality
+- Embedding cache integration
 - Legacy compatibility
 - Utility functions
 """
@@ -15,6 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from data_ingestion.utils.embedding_cache import EmbeddingCache
 from data_ingestion.utils.embeddings_utils import (
     LegacyOpenAIEmbeddings,
     OpenAIEmbeddings,
@@ -233,6 +235,43 @@ class TestOpenAIEmbeddings:
             input=["valid text"], model="text-embedding-ada-002"
         )
 
+    def test_embed_texts_sync_with_cache(self, mock_env, mock_openai_client, tmp_path):
+        """Test that cached texts are not sent to the API again."""
+        cache = EmbeddingCache(tmp_path / "embedding-cache.db")
+        embeddings = OpenAIEmbeddings(cache=cache)
+        embeddings.embed_texts(["text 1", "text 2"])
+
+        result = OpenAIEmbeddings(cache=cache).embed_texts([" text 2 ", "text 1"])
+
+        assert result == [
+            pytest.approx([0.4, 0.5, 0.6]),
+            pytest.approx([0.1, 0.2, 0.3]),
+        ]
+        mock_openai_client.embeddings.create.assert_called_once()
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_async_with_cache(
+        self, mock_env, mock_openai_client, tmp_path
+    ):
+        """Test that the async path only embeds texts missing from the cache."""
+        cache = EmbeddingCache(tmp_path / "embedding-cache.db")
+        cache.put_many(["text 1"], [[0.7, 0.8, 0.9]], "text-embedding-ada-002")
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.4, 0.5, 0.6])]
+        embeddings = OpenAIEmbeddings(cache=cache)
+
+        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread:
+            mock_to_thread.return_value = mock_response
+
+            result = await embeddings.embed_texts_async(["text 1", "text 2"])
+
+            assert result == [
+                pytest.approx([0.7, 0.8, 0.9]),
+                pytest.approx([0.4, 0.5, 0.6]),
+            ]
+            assert mock_to_thread.call_args.kwargs["input"] == ["text 2"]
+
     @pytest.mark.asyncio
     async def test_embed_query_async(self, mock_env, mock_openai_client):
         """Test asynchronous single query embedding."""
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Unit tests for conditional HTTP revalidation of recrawled pages."""
+
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+from crawler.http_revalidation import (
+    MODIFIED,
+    NOT_MODIFIED,
+    UNKNOWN,
+    CacheValidators,
+    HttpRevalidator,
+)
+
+
+def _response(status_code: int, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    return response
+
+
+class TestCacheValidators(unittest.TestCase):
+    def test_conditional_headers(self):
+        validators = CacheValidators(etag='"abc"', last_modified="Mon, 01 Jan 2024")
+        self.assertEqual(
+            validators.conditional_headers(),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024"},
+        )
+        self.assertEqual(CacheValidators().conditional_headers(), {})
+        self.assertTrue(CacheValidators().is_empty)
+
+    def test_matches_uses_weak_etag_comparison(self):
+        stored = CacheValidators(etag='W/"abc"')
+        self.assertTrue(stored.matches(CacheValidators(etag='"abc"')))
+        self.assertFalse(stored.matches(CacheValidators(etag='"xyz"')))
+
+    def test_matches_falls_back_to_last_modified(self):
+        stored = CacheValidators(last_modified="Mon, 01 Jan 2024")
+        self.assertTrue(
+            stored.matches(CacheValidators(last_modified="Mon, 01 Jan 2024"))
+        )
+        self.assertFalse(stored.matches(CacheValidators()))
+
+    def test_from_headers(self):
+        headers = {"etag": '"abc"', "last-modified": "Mon, 01 Jan 2024"}
+        validators = CacheValidators.from_headers(headers.get)
+        self.assertEqual(validators.etag, '"abc"')
+        self.assertEqual(validators.last_modified, "Mon, 01 Jan 2024")
+
+
+class TestHttpRevalidator(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.headers = {}
+        self.revalidator = HttpRevalidator("Test Agent", session=self.session)
+        self.stored = CacheValidators(etag='"abc"')
+
+    def test_304_is_not_modified_and_keeps_stored_validators(self):
+        self.session.head.return_value = _response(304)
+
+        result = self.revalidator.revalidate("https://example.com/a", self.stored)
+
+        self.assertEqual(result.outcome, NOT_MODIFIED)
+        self.assertEqual(result.validators.etag, '"abc"')
+        headers = self.session.head.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"abc"')
+        self.assertEqual(self.session.headers["User-Agent"], "Test Agent")
+
+    def test_200_with_same_etag_is_not_modified(self):
+        self.session.head.return_value = _response(200, {"ETag": '"abc"'})
+        result = self.revalidator.revalidate("https://example.com/a", self.stored)
+        self.assertEqual(result.outcome, NOT_MODIFIED)
+
+    def test_200_with_new_etag_is_modified(self):
+        self.session.head.return_value = _response(200, {"ETag": '"new"'})
+        result = self.revalidator.revalidate("https://example.com/a", self.stored)
+        self.assertEqual(result.outcome, MODIFIED)
+        self.assertEqual(result.validators.etag, '"new"')
+
+    def test_head_not_allowed_falls_back_to_conditional_get(self):
+        self.session.head.return_value = _response(405)
+        self.session.get.return_value = _response(304)
+
+        result = self.revalidator.revalidate("https://example.com/a", self.stored)
+
+        self.assertEqual(result.outcome, NOT_MODIFIED)
+        self.assertTrue(self.session.get.call_args.kwargs["stream"])
+        self.session.get.return_value.close.assert_called_once()
+
+    def test_redirects_and_errors_are_inconclusive(self):
+        self.session.head.return_value = _response(301)
+        self.assertEqual(
+            self.revalidator.revalidate("https://example.com/a", self.stored).outcome,
+            UNKNOWN,
+        )
+
+        self.session.head.side_effect = requests.ConnectionError("down")
+        self.assertEqual(
+            self.revalidator.revalidate("https://example.com/a", self.stored).outcome,
+            UNKNOWN,
+        )
+        self.assertEqual(self.revalidator.stats.checks, 2)
+        self.assertEqual(self.revalidator.stats.inconclusive, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,32 +69,20 @@ async def test_process_document(mock_env):
     # Mock the shared utilities and ensure is_exiting returns False
     with (
         patch(
-            "data_ingestion.utils.text_splitter_utils.SpacyTextSplitter.split_documents"
-        ) as mock_split_documents,
+            "data_ingestion.utils.text_splitter_utils.SpacyTextSplitter.iter_chunks"
+        ) as mock_iter_chunks,
         patch("data_ingestion.utils.progress_utils.is_exiting", return_value=False),
         patch(
             "pdf_to_vector_db.is_exiting", return_value=False
         ),  # Also patch in the module under test
     ):
-        # Mock spaCy text splitter response - return chunks with text content
-        mock_split_documents.return_value = [
-            Document(
-                page_content="This is chunk 1 with some meaningful content",
-                metadata={
-                    "source": "https://test.com/doc",
-                    "title": "Test Document",
-                    "page": 0,
-                },
-            ),
-            Document(
-                page_content="This is chunk 2 with more meaningful content",
-                metadata={
-                    "source": "https://test.com/doc",
-                    "title": "Test Document",
-                    "page": 1,
-                },
-            ),
-        ]
+        # Mock spaCy text splitter response - stream chunks with text content
+        mock_iter_chunks.return_value = iter(
+            [
+                "This is chunk 1 with some meaningful content",
+                "This is chunk 2 with more meaningful content",
+            ]
+        )
 
         # Note: OpenAI embeddings are now mocked at process_chunk level
         # The actual OpenAI client calls are handled by the mocked process_chunk function
@@ -134,7 +122,7 @@ async def test_process_document(mock_env):
 
             # Verify process_chunk was called for each chunk
             assert mock_process_chunk.call_count > 0
-            # Should be called once for each chunk returned by split_documents
+            # Should be called once for each chunk streamed by iter_chunks
             assert mock_process_chunk.call_count == 2
 
 
@@ -251,8 +239,8 @@ async def test_punctuation_preservation_in_pdf_processing(mock_env):
     """Test that PDF processing preserves punctuation through the entire pipeline"""
     with (
         patch(
-            "data_ingestion.utils.text_splitter_utils.SpacyTextSplitter.split_documents"
-        ) as mock_split_documents,
+            "data_ingestion.utils.text_splitter_utils.SpacyTextSplitter.iter_chunks"
+        ) as mock_iter_chunks,
         patch("data_ingestion.utils.progress_utils.is_exiting", return_value=False),
         patch("pdf_to_vector_db.is_exiting", return_value=False),
     ):
@@ -312,7 +300,9 @@ async def test_punctuation_preservation_in_pdf_processing(mock_env):
             ),
         ]
 
-        mock_split_documents.return_value = mock_chunks
+        mock_iter_chunks.return_value = iter(
+            [chunk.page_content for chunk in mock_chunks]
+        )
 
         # Create a mock document with the punctuation-rich text
         mock_doc = Document(
@@ -399,3 +389,119 @@ async def test_punctuation_preservation_in_pdf_processing(mock_env):
         print(
             f"PDF punctuation preservation test passed. Processed {len(processed_chunks)} chunks."
         )
+
+
+def test_chunk_page_locator_follows_chunks_across_pages():
+    """Streamed chunks get the page they start on, found in the document text."""
+    pages = [
+        "First page text about breath-\ning and posture.",
+        "Second page\nabout mindfulness and the present moment.",
+        "Third page on devotion.",
+    ]
+    locator = pdf_ingestion._ChunkPageLocator()
+    for page_number, page in enumerate(pages, start=1):
+        if page_number > 1:
+            locator.add_text("\n\n")
+        locator.add_text(page, page_number)
+
+    assert locator.locate("First page text about breathing and posture.") == "1"
+    # Overlap from the previous chunk is found on the page it came from
+    assert locator.locate("and posture. Second page about mindfulness") == "1"
+    assert locator.locate("about mindfulness and the present moment.") == "2"
+    # Words that can't be found keep the previous page
+    assert locator.locate("zzz unknown words") == "2"
+    assert locator.locate("Third page on devotion.") == "3"
+    assert locator.located_count == 4
+    # Text before the last chunk found has been dropped
+    assert locator.text == "Third page on devotion."
+
+
+def _pdf_pages(texts):
+    return [
+        Document(page_content=text, metadata={"source": "book.pdf", "page": index})
+        for index, text in enumerate(texts)
+    ]
+
+
+def test_pdf_page_stream_reads_one_page_at_a_time():
+    """Pages are pulled as the text is read and joined by the page separators."""
+    pages_read = []
+
+    def lazy_pages():
+        for page in _pdf_pages(
+            ["Ends mid breath-", "ing and then a sentence.", "", "New page.  Spaces"]
+        ):
+            pages_read.append(page.metadata["page"])
+            yield page
+
+    stream = pdf_ingestion._PdfPageStream(lazy_pages())
+    assert stream.metadata == {"source": "book.pdf", "page": 0}
+    assert pages_read == [0]
+
+    pieces = iter(stream)
+    assert next(pieces) == "Ends mid breath-"
+    assert pages_read == [0]
+    assert next(pieces) == ""  # Hyphenated across pages
+    assert pages_read == [0, 1]
+    assert list(pieces) == ["ing and then a sentence.", "\n\n", "New page. Spaces"]
+    assert stream.page_count == 4
+
+
+def test_assemble_full_document_matches_the_stream():
+    """The whole-text helper joins pages the way ingestion streams them."""
+    texts = ["Page one ends here.", "page two continues it", "Page three."]
+
+    document = pdf_ingestion._assemble_full_document(_pdf_pages(texts))
+
+    assert document.page_content == "".join(
+        pdf_ingestion._PdfPageStream(_pdf_pages(texts))
+    )
+    assert document.page_content == (
+        "Page one ends here.\n\npage two continues it\n\nPage three."
+    )
+    assert pdf_ingestion._assemble_full_document(_pdf_pages(["", " "])) is None
+
+
+@pytest.mark.asyncio
+async def test_process_document_streams_pdf_pages(mock_env):
+    """Chunks of a streamed PDF get their page without the whole text in memory."""
+    pages = pdf_ingestion._PdfPageStream(
+        _pdf_pages(
+            [
+                "Intro on page one.",
+                "Meditation on page two.",
+                "Devotion on page three.",
+            ]
+        )
+    )
+    processed_chunks = []
+
+    def iter_chunks(text, document_id=None):
+        # Chunk each paragraph as it is read, like the streaming splitter
+        for piece in text:
+            if piece.strip():
+                yield piece
+
+    async def mock_process_chunk(chunk, pinecone_index, embeddings, index, library):
+        processed_chunks.append(chunk)
+
+    text_splitter = SpacyTextSplitter()
+    with (
+        patch.object(text_splitter, "iter_chunks", side_effect=iter_chunks),
+        patch("pdf_to_vector_db.process_chunk", side_effect=mock_process_chunk),
+        patch("pdf_to_vector_db.is_exiting", return_value=False),
+        patch("pdf_to_vector_db.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        success, total_chunks, failed_chunks = await pdf_ingestion.process_document(
+            Document(page_content="", metadata=pages.metadata),
+            AsyncMock(),
+            OpenAIEmbeddings(model="text-embedding-ada-002"),
+            0,
+            "test-library",
+            text_splitter,
+            pages=pages,
+        )
+
+    assert (success, total_chunks, failed_chunks) == (True, 3, 0)
+    assert [chunk.metadata["page"] for chunk in processed_chunks] == ["1", "2", "3"]
+    assert pages.locator.text == "Devotion on page three."
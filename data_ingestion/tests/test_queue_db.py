@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Unit tests for crawl queue connection settings and group commits."""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from crawler.queue_db import CommitBudget, configure_connection, connect_read_only
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestConfigureConnection(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "crawler_queue_test.db"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_file_database_uses_wal(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            self.assertEqual(configure_connection(conn, cache_size_mb=8), "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -8192)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 30000)
+        finally:
+            conn.close()
+
+    def test_in_memory_database_keeps_memory_journal(self):
+        conn = sqlite3.connect(":memory:")
+        try:
+            self.assertEqual(configure_connection(conn), "memory")
+        finally:
+            conn.close()
+
+    def test_reader_is_not_blocked_by_open_write_transaction(self):
+        writer = sqlite3.connect(str(self.db_path))
+        configure_connection(writer)
+        writer.execute("CREATE TABLE crawl_queue (url TEXT PRIMARY KEY)")
+        writer.execute("INSERT INTO crawl_queue VALUES ('example.com/a')")
+        writer.commit()
+        # Grouped writes not committed yet
+        writer.execute("INSERT INTO crawl_queue VALUES ('example.com/b')")
+
+        reader = connect_read_only(self.db_path, busy_timeout_ms=0)
+        try:
+            rows = reader.execute("SELECT url FROM crawl_queue").fetchall()
+            self.assertEqual(rows, [("example.com/a",)])
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM crawl_queue")
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_read_only_connection_needs_existing_database(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            connect_read_only(Path(self.temp_dir) / "missing.db")
+
+
+class TestCommitBudget(unittest.TestCase):
+    def test_due_after_max_writes(self):
+        budget = CommitBudget(max_writes=3, max_seconds=60, clock=FakeClock())
+        self.assertFalse(budget.due())
+        budget.record_write()
+        budget.record_write()
+        self.assertFalse(budget.due())
+        budget.record_write()
+        self.assertTrue(budget.due())
+
+    def test_due_after_max_seconds_since_first_pending_write(self):
+        clock = FakeClock()
+        budget = CommitBudget(max_writes=100, max_seconds=5, clock=clock)
+        clock.now += 60  # Idle time before the first write doesn't count
+        budget.record_write()
+        clock.now += 4
+        budget.record_write()
+        self.assertFalse(budget.due())
+        clock.now += 1
+        self.assertTrue(budget.due())
+
+    def test_committed_resets_pending_and_counts_commits(self):
+        budget = CommitBudget(max_writes=2, clock=FakeClock())
+        for _ in range(4):
+            budget.record_write()
+            if budget.due():
+                budget.committed()
+        budget.committed()  # Nothing pending: not a commit
+        self.assertEqual((budget.writes, budget.commits, budget.pending), (4, 2, 0))
+        self.assertIn("4 writes in 2 commits", budget.summary())
+
+    def test_single_write_budget_commits_every_write(self):
+        budget = CommitBudget(max_writes=0, clock=FakeClock())
+        budget.record_write()
+        self.assertTrue(budget.due())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Unit tests for subresource blocking on crawl pages."""
+
+import unittest
+from unittest.mock import Mock
+
+from crawler.resource_blocking import (
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    ResourceBlocker,
+    ResourceBlockingPolicy,
+    create_resource_blocker,
+)
+
+
+def _route(resource_type: str, url: str, main_navigation: bool = False) -> Mock:
+    route = Mock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.request.is_navigation_request.return_value = main_navigation
+    route.request.frame.parent_frame = None if main_navigation else Mock()
+    return route
+
+
+class TestResourceBlockingPolicy(unittest.TestCase):
+    def test_blocks_heavy_types_and_tracker_hosts(self):
+        policy = ResourceBlockingPolicy()
+        self.assertEqual(policy.block_reason("image", "https://a.org/x.jpg"), "image")
+        self.assertEqual(policy.block_reason("font", "https://a.org/x.woff2"), "font")
+        self.assertEqual(
+            policy.block_reason("script", "https://www.googletagmanager.com/gtm.js"),
+            "tracker",
+        )
+        self.assertIsNone(policy.block_reason("script", "https://a.org/menu.js"))
+        self.assertIsNone(policy.block_reason("stylesheet", "https://a.org/x.css"))
+
+    def test_host_match_is_by_domain_suffix(self):
+        policy = ResourceBlockingPolicy(blocked_hosts=["hotjar.com"])
+        self.assertEqual(
+            policy.block_reason("script", "https://static.hotjar.com/c.js"), "tracker"
+        )
+        self.assertIsNone(policy.block_reason("script", "https://nothotjar.com/c.js"))
+
+    def test_from_config(self):
+        policy = ResourceBlockingPolicy.from_config(
+            {"blocked_resource_types": ["media"], "blocked_request_hosts": ["cdn.x.io"]}
+        )
+        self.assertEqual(policy.blocked_resource_types, {"media"})
+        self.assertEqual(
+            policy.block_reason("script", "https://cdn.x.io/a.js"), "tracker"
+        )
+        self.assertEqual(
+            policy.block_reason("script", "https://google-analytics.com/a.js"),
+            "tracker",
+        )
+        self.assertEqual(
+            ResourceBlockingPolicy.from_config({}).blocked_resource_types,
+            set(DEFAULT_BLOCKED_RESOURCE_TYPES),
+        )
+        self.assertIsNone(create_resource_blocker({"resource_blocking_enabled": False}))
+
+
+class TestResourceBlocker(unittest.TestCase):
+    def test_aborts_blocked_and_continues_the_rest(self):
+        blocker = ResourceBlocker(ResourceBlockingPolicy())
+        image = _route("image", "https://a.org/x.jpg")
+        script = _route("script", "https://a.org/x.js")
+
+        blocker._handle_route(image)
+        blocker._handle_route(script)
+
+        image.abort.assert_called_once_with("blockedbyclient")
+        image.continue_.assert_not_called()
+        script.continue_.assert_called_once()
+        self.assertEqual(
+            blocker.summary(),
+            "Resource blocking: 1 of 2 subresource requests blocked (image 1)",
+        )
+
+    def test_main_navigation_is_never_blocked(self):
+        policy = ResourceBlockingPolicy(blocked_hosts=["a.org"])
+        route = _route("document", "https://a.org/", main_navigation=True)
+
+        ResourceBlocker(policy)._handle_route(route)
+
+        route.continue_.assert_called_once()
+
+    def test_tracker_iframes_are_blocked(self):
+        route = _route("document", "https://www.googletagmanager.com/ns.html")
+        route.request.is_navigation_request.return_value = True
+
+        ResourceBlocker(ResourceBlockingPolicy())._handle_route(route)
+
+        route.abort.assert_called_once()
+
+    def test_closed_page_does_not_raise(self):
+        route = _route("script", "https://a.org/x.js")
+        route.continue_.side_effect = Exception("Target page has been closed")
+        ResourceBlocker(ResourceBlockingPolicy())._handle_route(route)
+
+    def test_install_routes_each_page_once(self):
+        blocker = ResourceBlocker(ResourceBlockingPolicy())
+        page = Mock()
+        blocker.install(page)
+        blocker.install(page)
+        page.route.assert_called_once_with("**/*", blocker._handle_route)
+
+
+if __name__ == "__main__":
+    unittest.main()
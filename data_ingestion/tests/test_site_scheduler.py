@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Unit tests for fair scheduling of several site queues."""
+
+import unittest
+
+from crawler.site_scheduler import SiteDemand, SiteScheduler, fair_share_rates
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFairShareRates(unittest.TestCase):
+    def test_priority_and_backlog_set_the_split(self):
+        rates = fair_share_rates(
+            [
+                SiteDemand("a", due_urls=1000, priority=2),
+                SiteDemand("b", due_urls=1000, priority=1),
+            ],
+            pages_per_minute=90,
+        )
+        self.assertAlmostEqual(rates["a"], 60)
+        self.assertAlmostEqual(rates["b"], 30)
+
+        rates = fair_share_rates(
+            [SiteDemand("big", due_urls=65535), SiteDemand("small", due_urls=255)],
+            pages_per_minute=48,
+        )
+        # log2 weights: 16 vs 8
+        self.assertAlmostEqual(rates["big"], 32)
+        self.assertAlmostEqual(rates["small"], 16)
+
+    def test_unused_share_goes_to_other_sites(self):
+        rates = fair_share_rates(
+            [
+                SiteDemand("few", due_urls=3),
+                SiteDemand("polite", due_urls=5000, max_pages_per_minute=10),
+                SiteDemand("rest", due_urls=5000),
+            ],
+            pages_per_minute=60,
+            horizon_minutes=1,
+        )
+        self.assertEqual(rates["few"], 3)
+        self.assertEqual(rates["polite"], 10)
+        self.assertAlmostEqual(rates["rest"], 47)
+
+    def test_sites_without_due_urls_get_nothing(self):
+        rates = fair_share_rates(
+            [SiteDemand("idle", due_urls=0), SiteDemand("off", 50, priority=0)],
+            pages_per_minute=60,
+        )
+        self.assertEqual(rates, {"idle": 0.0, "off": 0.0})
+
+
+class TestSiteScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = SiteScheduler(60, rebalance_seconds=60, clock=self.clock)
+        self.scheduler.rebalance(
+            [
+                SiteDemand("a", due_urls=1000, priority=2),
+                SiteDemand("b", due_urls=1000, priority=1),
+            ]
+        )
+
+    def _fetch_for(self, seconds: float) -> list[str]:
+        fetched = []
+        end = self.clock.now + seconds
+        while self.clock.now < end:
+            site_id, wait = self.scheduler.next_site()
+            if wait > 0:
+                self.clock.now += wait
+                continue
+            fetched.append(site_id)
+            self.scheduler.record_page(site_id)
+        return fetched
+
+    def test_fetches_follow_rates_within_global_limit(self):
+        fetched = self._fetch_for(60)
+        self.assertLessEqual(len(fetched), 61)
+        self.assertAlmostEqual(fetched.count("a") / fetched.count("b"), 2, delta=0.1)
+
+    def test_idle_time_does_not_become_a_burst(self):
+        self._fetch_for(10)
+        self.clock.now += 600
+        self.assertLessEqual(len(self._fetch_for(1)), 2)
+
+    def test_idle_and_deferred_sites(self):
+        self.scheduler.mark_idle("a")
+        self.assertEqual(self.scheduler.next_site()[0], "b")
+        self.scheduler.defer("b", 5)
+        self.assertEqual(self.scheduler.next_site(), ("b", 5))
+        self.scheduler.mark_idle("b")
+        self.assertEqual(self.scheduler.next_site(), (None, 0.0))
+        self.assertFalse(self.scheduler.rebalance_due())
+        self.clock.now += 60
+        self.assertTrue(self.scheduler.rebalance_due())
+
+    def test_summary(self):
+        self.scheduler.record_page("a")
+        self.scheduler.record_page("a")
+        self.scheduler.record_page("b")
+        self.assertEqual(
+            self.scheduler.summary(), "Multi-site crawl: 3 pages fetched (a 2, b 1)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""Unit tests for streaming sitemap parsing and lastmod scheduling."""
+
+import gzip
+import io
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+from crawler.sitemap_seeding import (
+    RECORD_LASTMOD,
+    RESCHEDULE,
+    UNCHANGED,
+    SitemapEntry,
+    SitemapReader,
+    SitemapStats,
+    batched,
+    iter_sitemap_xml,
+    normalize_lastmod,
+    sitemap_lastmod_action,
+)
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/a/</loc><lastmod>2024-05-01</lastmod></url>
+  <url><loc> https://example.com/b/ </loc></url>
+  <url><lastmod>2024-05-01</lastmod></url>
+</urlset>"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/post-sitemap.xml</loc></sitemap>
+  <sitemap><loc>https://example.com/page-sitemap.xml.gz</loc></sitemap>
+  <sitemap><loc>https://example.com/broken-sitemap.xml</loc></sitemap>
+  <sitemap><loc>https://example.com/sitemap_index.xml</loc></sitemap>
+</sitemapindex>"""
+
+
+def _response(url: str, body: bytes, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.url = url
+    response.status_code = status_code
+    response.headers = {"content-type": "application/xml"}
+    response.raw = io.BytesIO(body)
+    response.__enter__.return_value = response
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+class TestSitemapXml(unittest.TestCase):
+    def test_urlset_entries(self):
+        entries = list(iter_sitemap_xml(io.BytesIO(URLSET)))
+        self.assertEqual(
+            entries,
+            [
+                ("url", "https://example.com/a/", "2024-05-01"),
+                ("url", "https://example.com/b/", None),
+            ],
+        )
+
+    def test_sitemap_without_namespace(self):
+        body = b"<urlset><url><loc>https://example.com/x</loc></url></urlset>"
+        self.assertEqual(
+            list(iter_sitemap_xml(io.BytesIO(body))),
+            [("url", "https://example.com/x", None)],
+        )
+
+    def test_index_entries(self):
+        kinds = {kind for kind, _, _ in iter_sitemap_xml(io.BytesIO(INDEX))}
+        self.assertEqual(kinds, {"sitemap"})
+
+    def test_normalize_lastmod(self):
+        self.assertEqual(normalize_lastmod("2024-05-01"), "2024-05-01T00:00:00")
+        self.assertIsNone(normalize_lastmod("  "))
+        self.assertEqual(normalize_lastmod("last tuesday"), "last tuesday")
+        aware = normalize_lastmod("2024-05-01T10:00:00+00:00")
+        self.assertNotIn("+", aware)
+
+    def test_batched(self):
+        self.assertEqual(list(batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+
+class TestSitemapLastmodAction(unittest.TestCase):
+    def test_visited_page_changed_after_crawl_is_rescheduled(self):
+        action = sitemap_lastmod_action(
+            "visited", "2024-04-01T12:00:00", None, "2024-05-01T00:00:00"
+        )
+        self.assertEqual(action, RESCHEDULE)
+
+    def test_visited_page_crawled_after_change_only_records(self):
+        action = sitemap_lastmod_action(
+            "visited", "2024-06-01T12:00:00", None, "2024-05-01T00:00:00"
+        )
+        self.assertEqual(action, RECORD_LASTMOD)
+
+    def test_same_missing_or_failed_is_unchanged(self):
+        lastmod = "2024-05-01T00:00:00"
+        self.assertEqual(
+            sitemap_lastmod_action("visited", None, lastmod, lastmod), UNCHANGED
+        )
+        self.assertEqual(sitemap_lastmod_action("visited", None, None, None), UNCHANGED)
+        self.assertEqual(
+            sitemap_lastmod_action("failed", None, None, lastmod), UNCHANGED
+        )
+
+    def test_pending_page_records_lastmod(self):
+        action = sitemap_lastmod_action("pending", None, None, "2024-05-01T00:00:00")
+        self.assertEqual(action, RECORD_LASTMOD)
+
+    def test_unparseable_dates_reschedule_when_moved(self):
+        action = sitemap_lastmod_action("visited", "2024-06-01", "old", "new")
+        self.assertEqual(action, RESCHEDULE)
+
+
+class TestSitemapReader(unittest.TestCase):
+    def test_follows_index_gzip_and_survives_errors(self):
+        child = (
+            b"<urlset><url><loc>https://example.com/post/</loc>"
+            b"<lastmod>2024-05-01</lastmod></url></urlset>"
+        )
+        responses = {
+            "https://example.com/sitemap_index.xml": _response(
+                "https://example.com/sitemap_index.xml", INDEX
+            ),
+            "https://example.com/post-sitemap.xml": _response(
+                "https://example.com/post-sitemap.xml", child
+            ),
+            "https://example.com/page-sitemap.xml.gz": _response(
+                "https://example.com/page-sitemap.xml.gz", gzip.compress(URLSET)
+            ),
+            "https://example.com/broken-sitemap.xml": _response(
+                "https://example.com/broken-sitemap.xml", b"", status_code=500
+            ),
+        }
+        session = MagicMock()
+        session.get.side_effect = lambda url, **kwargs: responses[url]
+        stats = SitemapStats()
+
+        entries = list(
+            SitemapReader(session).iter_entries(
+                ["https://example.com/sitemap_index.xml"], stats
+            )
+        )
+
+        self.assertEqual(
+            entries,
+            [
+                SitemapEntry("https://example.com/post/", "2024-05-01T00:00:00"),
+                SitemapEntry("https://example.com/a/", "2024-05-01T00:00:00"),
+                SitemapEntry("https://example.com/b/", None),
+            ],
+        )
+        self.assertEqual(stats.sitemaps, 3)
+        self.assertEqual(stats.entries, 3)
+        self.assertEqual(stats.errors, ["https://example.com/broken-sitemap.xml"])
+        # The index lists itself; it is only read once
+        self.assertEqual(session.get.call_count, 4)
+
+    def test_malformed_xml_is_counted_as_error(self):
+        session = MagicMock()
+        session.get.return_value = _response("https://example.com/s.xml", b"<urlset>")
+        stats = SitemapStats()
+
+        entries = list(
+            SitemapReader(session).iter_entries(["https://example.com/s.xml"], stats)
+        )
+
+        self.assertEqual(entries, [])
+        self.assertEqual(len(stats.errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for loading the sentence-only spaCy pipeline used by SpacyTextSplitter."""
+
+import pytest
+import spacy
+from spacy.training import Example
+
+from data_ingestion.utils.text_splitter_utils import load_spacy_pipeline
+
+
+@pytest.fixture
+def saved_pipeline(tmp_path):
+    """A small pipeline laid out like en_core_web_sm: senter disabled, extras enabled."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("senter")
+    nlp.add_pipe("attribute_ruler")
+    nlp.add_pipe("entity_ruler", name="ner")
+    doc = nlp.make_doc("Hello there. How are you?")
+    nlp.initialize(
+        lambda: [Example.from_dict(doc, {"sent_starts": [1, 0, 0, 1, 0, 0, 0]})]
+    )
+    nlp.disable_pipe("senter")
+    nlp.to_disk(tmp_path / "pipeline")
+    return str(tmp_path / "pipeline")
+
+
+def test_sentence_pipeline_keeps_only_senter(saved_pipeline):
+    nlp = load_spacy_pipeline(saved_pipeline)
+
+    assert nlp.pipe_names == ["senter"]
+    assert nlp.component_names == ["senter"]
+    assert nlp.max_length == 2_000_000
+    assert len(list(nlp("Hello there. How are you?").sents)) >= 1
+
+
+def test_full_pipeline_is_unchanged(saved_pipeline):
+    nlp = load_spacy_pipeline(saved_pipeline, sentences_only=False)
+
+    assert nlp.pipe_names == ["attribute_ruler", "ner"]
+    assert nlp.disabled == ["senter"]
+    assert nlp.max_length == 2_000_000
+
+
+def test_sentencizer_added_without_senter(tmp_path):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("attribute_ruler")
+    nlp.initialize()
+    nlp.to_disk(tmp_path / "pipeline")
+
+    nlp = load_spacy_pipeline(str(tmp_path / "pipeline"))
+
+    assert nlp.pipe_names == ["sentencizer"]
+    texts = ["Hello there. How are you?", "One sentence only"]
+    assert [[s.text for s in doc.sents] for doc in nlp.pipe(texts)] == [
+        ["Hello there.", "How are you?"],
+        ["One sentence only"],
+    ]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Unit tests for the static-HTML fetch path helpers."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from crawler.content_extraction import parse_html
+from crawler.static_fetch import (
+    StaticFetcher,
+    StaticPage,
+    create_http_session,
+    extract_links,
+    extract_title,
+    is_plain_html_response,
+)
+
+
+def _page(status_code=200, content_type="text/html; charset=UTF-8") -> StaticPage:
+    return StaticPage(
+        url="https://example.com/a",
+        final_url="https://example.com/a",
+        status_code=status_code,
+        content_type=content_type,
+        html="<html></html>",
+        headers={},
+        elapsed_seconds=0.1,
+    )
+
+
+class TestHtmlHelpers(unittest.TestCase):
+    def test_extract_links_resolves_relative_and_skips_anchors(self):
+        root = parse_html(
+            """
+            <a href="/about">About</a>
+            <a href="contact/">Contact</a>
+            <a href="https://other.org/x">Other</a>
+            <a href="/page#">Anchor</a>
+            <a href="/#top">Top</a>
+            <a>No href</a>
+            <a href="">Empty</a>
+            """
+        )
+        self.assertEqual(
+            extract_links(root, "https://example.com/dir/page"),
+            [
+                "https://example.com/about",
+                "https://example.com/dir/contact/",
+                "https://other.org/x",
+            ],
+        )
+
+    def test_extract_title(self):
+        self.assertEqual(extract_title(parse_html("<title> Hello </title>")), "Hello")
+        self.assertEqual(extract_title(parse_html("<p>x</p>")), "No Title Found")
+        self.assertEqual(
+            extract_title(parse_html("<title> </title><p>x</p>")), "No Title Found"
+        )
+
+    def test_is_plain_html_response(self):
+        self.assertTrue(is_plain_html_response(_page()))
+        self.assertFalse(is_plain_html_response(_page(status_code=404)))
+        self.assertFalse(is_plain_html_response(_page(content_type="application/pdf")))
+
+
+class TestStaticFetcher(unittest.TestCase):
+    def test_requires_browser_uses_site_patterns(self):
+        fetcher = StaticFetcher(MagicMock(), browser_required_patterns=[r"/events/"])
+        self.assertTrue(fetcher.requires_browser("https://example.com/events/1"))
+        self.assertFalse(fetcher.requires_browser("https://example.com/about"))
+
+    def test_fetch_returns_response_details(self):
+        session = MagicMock()
+        response = session.get.return_value
+        response.url = "https://example.com/final"
+        response.status_code = 200
+        response.headers = {"content-type": "text/html", "etag": '"abc"'}
+        response.text = "<html>hi</html>"
+
+        page = StaticFetcher(session, timeout_seconds=5).fetch("https://example.com/a")
+
+        session.get.assert_called_once_with("https://example.com/a", timeout=5)
+        self.assertEqual(page.final_url, "https://example.com/final")
+        self.assertEqual(page.html, "<html>hi</html>")
+        self.assertEqual(page.headers["etag"], '"abc"')
+
+    def test_stats_summary(self):
+        fetcher = StaticFetcher(MagicMock())
+        fetcher.record_static_page(0.5)
+        fetcher.record_static_page(0.5)
+        fetcher.record_fallback("https://example.com/a", "thin_content")
+
+        summary = fetcher.stats.summary()
+        self.assertIn("2 pages (2.0 pages/sec)", summary)
+        self.assertIn("thin_content=1", summary)
+
+    def test_http_session_pool_size_and_user_agent(self):
+        session = create_http_session("Test Agent", pool_size=8)
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(session.headers["User-Agent"], "Test Agent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Tests for streaming chunking with SpacyTextSplitter.iter_chunks."""
+
+import io
+import random
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from data_ingestion.utils.text_splitter_utils import SpacyTextSplitter
+
+WORDS = ["light", "peace", "wisdom", "the", "of", "and", "practice", "teacher"]
+# Line wraps, hyphenated words and blank lines the cleaner has to undo
+JOINERS = [" ", " ", " ", "\n", "-\n", "- \n  ", "\n \n", "\n\n", "\n\n\n  ", "-\n\n"]
+
+
+class FakeNlp:
+    """Whitespace tokenizer standing in for spaCy."""
+
+    def __call__(self, text: str):
+        return [
+            SimpleNamespace(text=m.group(1), whitespace_=m.group(2), is_space=False)
+            for m in re.finditer(r"(\S+)(\s*)", text)
+        ]
+
+    def pipe(self, texts, batch_size: int = 1):
+        return map(self, texts)
+
+
+@pytest.fixture(autouse=True)
+def offline_models():
+    """A small BPE encoding and fake spaCy model, since neither can be downloaded."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in WORDS:
+        for piece in (word, " " + word):
+            encoded = piece.encode()
+            for length in range(2, len(encoded) + 1):
+                ranks.setdefault(encoded[:length], len(ranks))
+    encoding = tiktoken.Encoding(
+        name="test_words",
+        pat_str=r""" ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks=ranks,
+        special_tokens={},
+    )
+    with (
+        patch.dict(
+            "os.environ", {"OPENAI_INGEST_EMBEDDINGS_MODEL": "text-embedding-ada-002"}
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+            {"text-embedding-ada-002": encoding},
+            clear=True,
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._SPACY_MODEL_CACHE",
+            {"en_core_web_sm": FakeNlp()},
+            clear=True,
+        ),
+    ):
+        yield
+
+
+@pytest.fixture
+def small_blocks():
+    """Read tiny blocks and batches so block and batch edges land everywhere."""
+    with (
+        patch("data_ingestion.utils.text_splitter_utils.STREAM_READ_CHARS", 37),
+        patch(
+            "data_ingestion.utils.text_splitter_utils.STREAM_PARAGRAPH_BATCH_SIZE", 3
+        ),
+    ):
+        yield
+
+
+def make_text(seed: int, words: int = 3000) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice(JOINERS) if rng.random() < 0.3 else " ")
+    # Some paragraphs are far too large for one chunk
+    parts.insert(words, " ".join(rng.choice(WORDS) for _ in range(600)) + "\n\n")
+    return "".join(parts)
+
+
+def make_splitter(engine: str = "strings") -> SpacyTextSplitter:
+    return SpacyTextSplitter(log_summary_on_split=False, chunking_engine=engine)
+
+
+@pytest.mark.usefixtures("small_blocks")
+class TestIterChunks:
+    @pytest.mark.parametrize("engine", ["strings", "offsets"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_split_text(self, engine, seed):
+        text = make_text(seed)
+        splitter = make_splitter(engine)
+
+        assert list(splitter.iter_chunks(text)) == splitter.split_text(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "  \n\n \n", "One short paragraph.", "Ends with a hyphen-\n\n"],
+    )
+    def test_matches_split_text_on_small_inputs(self, text):
+        splitter = make_splitter()
+
+        assert list(splitter.iter_chunks(text)) == splitter.split_text(text)
+
+    def test_accepts_a_stream_of_pieces(self):
+        text = make_text(seed=7)
+        splitter = make_splitter()
+        expected = splitter.split_text(text)
+
+        assert list(splitter.iter_chunks(io.StringIO(text))) == expected
+        pieces = [text[i : i + 11] for i in range(0, len(text), 11)]
+        assert list(splitter.iter_chunks(iter(pieces))) == expected
+
+    def test_yields_before_reading_the_whole_stream(self):
+        text = make_text(seed=8)
+        pieces = [text[i : i + 50] for i in range(0, len(text), 50)]
+        read = []
+
+        def stream():
+            for piece in pieces:
+                read.append(piece)
+                yield piece
+
+        next(make_splitter().iter_chunks(stream()))
+
+        assert len(read) < len(pieces) / 2
+
+    def test_cuts_long_text_without_paragraph_breaks(self):
+        text = " ".join(["wisdom"] * 2000)
+        splitter = make_splitter()
+
+        with patch(
+            "data_ingestion.utils.text_splitter_utils.STREAM_MAX_BUFFER_CHARS", 500
+        ):
+            chunks = list(splitter.iter_chunks(text))
+
+        assert " ".join(chunks).split().count("wisdom") >= 2000
+        assert all(
+            splitter.count_tokens(chunk) <= splitter.target_chunk_size
+            for chunk in chunks
+        )
+
+    def test_records_metrics_like_split_text(self):
+        text = make_text(seed=9)
+        streamed, split = make_splitter(), make_splitter()
+
+        list(streamed.iter_chunks(text, document_id="doc"))
+        split.split_text(text, document_id="doc")
+
+        assert streamed.get_metrics_summary() == split.get_metrics_summary()
+        assert streamed.metrics.total_documents == 1
@@ -15,6 +15,7 @@ from unittest.mock import patch  # noqa: E402
 import pytest  # noqa: E402
 
 from data_ingestion.utils.text_splitter_utils import (  # noqa: E402
+    SENTENCE_PIPELINE_EXCLUDE,
     Document,
     SpacyTextSplitter,
 )
@@ -251,7 +252,7 @@ def test_ensure_nlp_called(mocker):
 
     # Verify the calls
     assert mock_load.call_count == 2
-    mock_load.assert_any_call(splitter.pipeline)
+    mock_load.assert_any_call(splitter.pipeline, exclude=SENTENCE_PIPELINE_EXCLUDE)
     mock_download.assert_called_once_with(splitter.pipeline)
 
     # Reset for the second call test
@@ -550,6 +551,7 @@ def mock_nlp_func(text):
 
 
 mock_nlp.side_effect = mock_nlp_func
+mock_nlp.pipe.side_effect = lambda texts, batch_size=None: map(mock_nlp_func, texts)
 
 
 class TestTokenizationBugFixes:
@@ -1020,3 +1022,62 @@ class TestTokenizationBugFixes:
             assert len(errors_found) == 0, (
                 f"Found punctuation errors in overlap: {errors_found}"
             )
+
+
+class TestTokenEncodingCache:
+    """Test the cached tiktoken encoder and count-only token API."""
+
+    @pytest.fixture
+    def fake_encoding(self):
+        """A word-per-token encoding, so tests don't need tiktoken's BPE files."""
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text: list(range(len(text.split())))
+        encoding.decode.side_effect = lambda ids: " ".join(f"w{i}" for i in ids)
+        with (
+            patch.dict(
+                "data_ingestion.utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+                clear=True,
+            ),
+            patch(
+                "data_ingestion.utils.text_splitter_utils.tiktoken.encoding_for_model",
+                return_value=encoding,
+            ) as encoding_for_model,
+        ):
+            yield encoding, encoding_for_model
+
+    def test_encoding_is_loaded_once_per_model(self, fake_encoding):
+        encoding, encoding_for_model = fake_encoding
+        splitter = SpacyTextSplitter()
+
+        for _ in range(3):
+            splitter.count_tokens("three word text")
+        SpacyTextSplitter().count_tokens("another splitter")
+
+        encoding_for_model.assert_called_once_with("text-embedding-ada-002")
+        with patch.dict(
+            "os.environ", {"OPENAI_INGEST_EMBEDDINGS_MODEL": "text-embedding-3-large"}
+        ):
+            splitter.count_tokens("other model")
+        assert encoding_for_model.call_count == 2
+
+    def test_count_tokens_does_not_decode(self, fake_encoding):
+        encoding, _ = fake_encoding
+        splitter = SpacyTextSplitter()
+
+        assert splitter.count_tokens("one two three") == 3
+        assert splitter.count_tokens("   ") == 0
+        encoding.decode.assert_not_called()
+        # The string API still decodes each token
+        assert splitter._tokenize_text("one two") == ["w0", "w1"]
+
+    def test_overlap_encodes_each_chunk_once(self, fake_encoding):
+        encoding, _ = fake_encoding
+        splitter = SpacyTextSplitter(chunk_size=20, chunk_overlap=2)
+        chunks = ["a b c d e", "f g h", "i j"]
+
+        overlapped = splitter._apply_overlap_to_chunks(chunks)
+
+        assert overlapped == ["a b c d e", "w3 w4 f g h", "w1 w2 i j"]
+        encoded = [call.args[0] for call in encoding.encode.call_args_list]
+        for chunk in chunks:
+            assert encoded.count(chunk) == 1
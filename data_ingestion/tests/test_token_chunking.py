@@ -0,0 +1,216 @@
+"""Tests for single-tokenization chunking in SpacyTextSplitter."""
+
+import random
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+import tiktoken
+
+from data_ingestion.utils.text_splitter_utils import SpacyTextSplitter
+from data_ingestion.utils.token_chunking import TokenizedText, locate_paragraphs
+
+# cl100k_base's pre-tokenizer. tiktoken's BPE files can't be downloaded in
+# tests, so the encoding below pairs it with a small made-up vocabulary.
+CL100K_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+|"""
+    r""" ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+)
+VOCABULARY = (
+    "the of and to in is that for it as with was on be by this are from at "
+    "or an have not but which one all were when we there can their has more "
+    "meditation practice teacher wisdom light peace"
+)
+WORDS = VOCABULARY.split()
+PUNCTUATION = [".", "!", "?", ", indeed.", " 42,000.", " — café “quote”.", "'s."]
+
+
+def make_encoding() -> tiktoken.Encoding:
+    ranks = {bytes([i]): i for i in range(256)}
+    for piece in [".\n\n", "\n\n", " —"] + WORDS + [" " + word for word in WORDS]:
+        encoded = piece.encode()
+        for length in range(2, len(encoded) + 1):
+            ranks.setdefault(encoded[:length], len(ranks))
+    return tiktoken.Encoding(
+        name="test_cl100k_pattern",
+        pat_str=CL100K_PATTERN,
+        mergeable_ranks=ranks,
+        special_tokens={},
+    )
+
+
+class FakeNlp:
+    """Whitespace tokenizer standing in for spaCy."""
+
+    def __call__(self, text: str):
+        return [
+            SimpleNamespace(text=m.group(1), whitespace_=m.group(2), is_space=False)
+            for m in re.finditer(r"(\S+)(\s*)", text)
+        ]
+
+    def pipe(self, texts, batch_size: int = 1):
+        return map(self, texts)
+
+
+fake_nlp = FakeNlp()
+
+
+def make_text(seed: int, paragraphs: int = 60) -> str:
+    rng = random.Random(seed)
+    result = []
+    for n in range(paragraphs):
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 20))).capitalize()
+            + rng.choice(PUNCTUATION)
+            for _ in range(rng.randint(1, 8))
+        ]
+        # Every tenth paragraph is too large for one chunk
+        result.append(" ".join(sentences * (8 if n % 10 == 0 else 1)))
+    return "\n\n".join(result)
+
+
+@pytest.fixture
+def encoding():
+    encoding = make_encoding()
+    with (
+        patch.dict(
+            "os.environ", {"OPENAI_INGEST_EMBEDDINGS_MODEL": "text-embedding-ada-002"}
+        ),
+        patch.dict(
+            "data_ingestion.utils.text_splitter_utils._TIKTOKEN_ENCODING_CACHE",
+            {"text-embedding-ada-002": encoding},
+            clear=True,
+        ),
+    ):
+        yield encoding
+
+
+def make_splitter(engine: str, **kwargs) -> SpacyTextSplitter:
+    splitter = SpacyTextSplitter(
+        log_summary_on_split=False, chunking_engine=engine, **kwargs
+    )
+    splitter.nlp = fake_nlp
+    return splitter
+
+
+class TestTokenizedText:
+    def test_span_ids_match_encoding_each_span(self, encoding):
+        text = SpacyTextSplitter()._clean_text(make_text(seed=1, paragraphs=20))
+        doc = TokenizedText(text, encoding)
+        spans = locate_paragraphs(text, text.split("\n\n"))
+        rng = random.Random(2)
+        spans += [tuple(sorted(rng.sample(range(len(text)), 2))) for _ in range(200)]
+
+        for start, end in spans:
+            span_text = text[start:end]
+            assert doc.span_ids(start, end) == encoding.encode(span_text)
+            assert doc.span_ids(start, end, leading_space=True) == encoding.encode(
+                " " + span_text
+            )
+
+    def test_joined_chunk_ids_match_encoding_joined_text(self, encoding):
+        text = "First paragraph here.\n\nSecond 'one' is 123,456.\n\nCafé — third."
+        doc = TokenizedText(text, encoding)
+        chunk = tuple(locate_paragraphs(text, text.split("\n\n")))
+
+        assert doc.chunk_text(chunk) == text.replace("\n\n", " ")
+        assert doc.chunk_ids(chunk) == encoding.encode(doc.chunk_text(chunk))
+        assert doc.chunk_ids("not a span") == encoding.encode("not a span")
+
+    def test_locate_keeps_unknown_pieces_as_text(self, encoding):
+        doc = TokenizedText("one two three four", encoding)
+
+        assert doc.locate(["two", "four", "five"], 0, 18) == [
+            ((4, 7),),
+            ((14, 18),),
+            "five",
+        ]
+
+
+class TestOffsetChunking:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "This is the first sentence. This is the second sentence.",
+            "This is the first paragraph.\n\nThis is the second paragraph.",
+            make_text(seed=3),
+            make_text(seed=4, paragraphs=150),
+            # Too few blank lines: falls back to merging single-newline lines
+            make_text(seed=5, paragraphs=40).replace("\n\n", "\n"),
+        ],
+    )
+    def test_same_chunks_as_string_pipeline(self, encoding, text):
+        expected = make_splitter("strings").split_text(text)
+        splitter = make_splitter("offsets")
+
+        assert splitter.split_text(text) == expected
+
+    def test_chunk_sizes_without_reencoding(self, encoding):
+        text = SpacyTextSplitter()._clean_text(make_text(seed=6))
+        splitter = make_splitter("offsets")
+
+        with patch.object(encoding, "encode", wraps=encoding.encode) as encode:
+            chunks, sizes = splitter._chunk_with_token_counts(text)
+
+        assert sizes == [len(encoding.encode(chunk)) for chunk in chunks]
+        encoded_chars = sum(len(call.args[0]) for call in encode.call_args_list)
+        # The string pipeline encodes the document four to five times
+        assert encoded_chars < 2 * len(text)
+
+    def test_no_overlap(self, encoding):
+        text = make_text(seed=7)
+        expected = make_splitter("strings", chunk_overlap=0).split_text(text)
+
+        assert make_splitter("offsets", chunk_overlap=0).split_text(text) == expected
+
+    @pytest.mark.parametrize("engine", ["strings", "offsets"])
+    def test_large_paragraphs_go_through_spacy_in_batches(self, encoding, engine):
+        splitter = make_splitter(engine)
+        splitter.nlp = Mock(wraps=fake_nlp)
+
+        splitter.split_text(make_text(seed=8))
+
+        splitter.nlp.assert_not_called()
+        # Once for oversized paragraphs, once for chunks still too large
+        assert 1 <= splitter.nlp.pipe.call_count <= 2
+
+    def test_spacy_docs_are_consumed_lazily(self, encoding):
+        splitter = make_splitter("strings")
+        texts = [f"{word} practice." * 5 for word in WORDS[:4]]
+        piped = []
+
+        def pipe(texts, batch_size=1):
+            for text in texts:
+                piped.append(text)
+                yield fake_nlp(text)
+
+        splitter.nlp = Mock(wraps=fake_nlp)
+        splitter.nlp.pipe.side_effect = pipe
+        results = splitter._split_texts_by_tokens(texts)
+
+        assert next(results) == splitter._split_by_tokens(texts[0], fake_nlp(texts[0]))
+        assert piped == texts[:1]
+
+    def test_failed_batch_falls_back_from_that_text_on(self, encoding):
+        splitter = make_splitter("strings")
+        texts = [f"{word} practice." * 5 for word in WORDS[:4]]
+
+        def pipe(texts, batch_size=1):
+            yield fake_nlp(texts[0])
+            raise RuntimeError("batch failed")
+
+        splitter.nlp = Mock(wraps=fake_nlp)
+        splitter.nlp.pipe.side_effect = pipe
+
+        results = list(splitter._split_texts_by_tokens(texts))
+
+        assert results == [
+            splitter._split_by_tokens(text, fake_nlp(text)) for text in texts
+        ]
+        assert [c.args[0] for c in splitter.nlp.call_args_list] == texts[1:]
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError, match="chunking engine"):
+            SpacyTextSplitter(chunking_engine="bpe")
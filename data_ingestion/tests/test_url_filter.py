@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""Unit tests for the precompiled crawler URL filters."""
+
+import random
+import re
+import unittest
+from unittest.mock import Mock, patch
+from urllib.robotparser import RobotFileParser
+
+from crawler.url_filter import (
+    RobotsDecisionCache,
+    UrlFilter,
+    compile_skip_patterns,
+    has_non_html_extension,
+)
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /wp-admin/
+Allow: /wp-admin/admin-ajax.php
+Disallow: /private
+Disallow: /search?
+Disallow: /caf%C3%A9/
+
+User-agent: BadBot
+Disallow: /
+"""
+
+
+def _robots_parser(text: str = ROBOTS_TXT) -> RobotFileParser:
+    parser = RobotFileParser()
+    parser.parse(text.splitlines())
+    return parser
+
+
+class TestSkipPatterns(unittest.TestCase):
+    def test_combined_regex_matches_like_individual_patterns(self):
+        patterns = [r"/search/", r"/autobiography$", r"\?replytocom=", r"^https://x"]
+        [combined] = compile_skip_patterns(patterns)
+        urls = [
+            "https://example.com/search/q",
+            "https://example.com/autobiography",
+            "https://example.com/autobiography/ch1",
+            "https://example.com/post?replytocom=5",
+            "https://x.org/",
+            "https://example.com/about",
+        ]
+        for url in urls:
+            expected = any(re.search(p, url) for p in patterns)
+            self.assertEqual(bool(combined.search(url)), expected, url)
+
+    def test_backreference_and_flag_patterns_compile_separately(self):
+        compiled = compile_skip_patterns([r"/a/", r"/(\w+)/\1/", r"(?i)/Cart/"])
+        self.assertEqual(len(compiled), 3)
+        skip = UrlFilter([r"/a/", r"/(\w+)/\1/", r"(?i)/Cart/"], "agent")
+        self.assertTrue(skip.matches_skip_pattern("https://example.com/x/x/"))
+        self.assertTrue(skip.matches_skip_pattern("https://example.com/cart/"))
+        self.assertFalse(skip.matches_skip_pattern("https://example.com/x/y/"))
+
+    def test_duplicate_group_names_fall_back_to_separate_regexes(self):
+        patterns = [r"/(?P<s>a)/", r"/(?P<s>b)/"]
+        self.assertEqual(len(compile_skip_patterns(patterns)), 2)
+
+    def test_no_patterns(self):
+        self.assertEqual(compile_skip_patterns([]), [])
+        self.assertFalse(UrlFilter([], "agent").matches_skip_pattern("https://a/b"))
+
+    def test_invalid_pattern_raises(self):
+        with self.assertRaises(re.error):
+            compile_skip_patterns(["/ok/", "(unclosed"])
+
+
+class TestPathChecks(unittest.TestCase):
+    def test_non_html_extensions(self):
+        self.assertTrue(has_non_html_extension("/files/talk.mp3"))
+        self.assertTrue(has_non_html_extension("/fonts/a.woff2"))
+        self.assertFalse(has_non_html_extension("/blog/javascript-tips"))
+        self.assertFalse(has_non_html_extension("/v1.2/notes"))
+        self.assertFalse(has_non_html_extension("/about"))
+
+    def test_wordpress_paths_and_calendar_queries(self):
+        self.assertTrue(UrlFilter.is_non_html_path("/blog/feed/"))
+        self.assertTrue(UrlFilter.is_non_html_path("/wp-content/uploads/x"))
+        self.assertTrue(UrlFilter.is_calendar_export("ical=1"))
+        self.assertTrue(UrlFilter.is_calendar_export("Format=ICS"))
+        self.assertFalse(UrlFilter.is_calendar_export("page=2"))
+
+
+class TestRobotsDecisionCache(unittest.TestCase):
+    def test_matches_parser_on_random_urls(self):
+        parser = _robots_parser()
+        cache = RobotsDecisionCache("Ananda Chatbot Crawler")
+        rng = random.Random(7)
+        segments = ["wp-admin", "admin-ajax.php", "private", "privateer", "search"]
+        segments += ["caf%C3%A9", "café", "%41", "blog", "a" * 40, ""]
+        for _ in range(2000):
+            path = "/".join(rng.choice(segments) for _ in range(rng.randint(1, 4)))
+            query = rng.choice(["", "?q=1", "?", "#frag"])
+            url = f"https://example.com/{path}{query}"
+            self.assertEqual(
+                cache.can_fetch(parser, url),
+                parser.can_fetch("Ananda Chatbot Crawler", url),
+                url,
+            )
+        self.assertGreater(cache.hits, 0)
+
+    def test_reuses_decisions_for_shared_prefix(self):
+        parser = _robots_parser("User-agent: *\nDisallow: /p\n")
+        cache = RobotsDecisionCache("agent")
+        prefix = "https://example.com/programs/2024/spring-retreats"
+
+        with patch.object(parser, "can_fetch", wraps=parser.can_fetch) as spy:
+            for i in range(50):
+                self.assertFalse(cache.can_fetch(parser, f"{prefix}/{i}"))
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(cache.hits, 49)
+
+    def test_new_parser_resets_decisions(self):
+        cache = RobotsDecisionCache("agent")
+        url = "https://example.com/private/x"
+        self.assertFalse(cache.can_fetch(_robots_parser(), url))
+        self.assertTrue(cache.can_fetch(_robots_parser("User-agent: *\n"), url))
+
+    def test_parser_without_rules_is_called_directly(self):
+        parser = Mock()
+        parser.can_fetch.return_value = True
+        cache = RobotsDecisionCache("agent")
+
+        cache.can_fetch(parser, "https://example.com/a")
+        cache.can_fetch(parser, "https://example.com/a")
+
+        self.assertEqual(parser.can_fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
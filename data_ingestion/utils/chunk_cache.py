@@ -0,0 +1,102 @@
+"""
+On-disk cache of chunking results for SpacyTextSplitter.
+
+Re-running ingest_db_text.py or the crawler re-chunked every document, even
+though almost all of them are unchanged since the last run.
+SpacyTextSplitter(chunk_cache=ChunkCache(...)) looks each document up first:
+
+- The key is a SHA-256 of the cleaned text plus everything that changes the
+  chunks: target size, overlap, separator, spaCy pipeline and the tiktoken
+  encoding of the embedding model. A changed document, or a changed splitter
+  setting, simply misses. CHUNK_CACHE_VERSION is part of every key; bump it
+  when the chunking algorithm changes so old entries are never returned.
+- An entry holds the chunks and their token counts, so a hit records the same
+  ChunkingMetrics as chunking the document would. Hits and misses are counted
+  in ChunkingMetrics too.
+- Entries live in one SQLite table (see sqlite_lru_cache.py). Each hit
+  updates last_used; once the table grows past max_size_mb, the least
+  recently used entries are deleted.
+
+A ChunkCache can be passed to a ChunkingPool: it opens its connection lazily
+and again in each process, so pickled or forked copies never share one.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from .sqlite_lru_cache import SQLiteLRUCache, get_cache_db_path
+
+# Bump when a change to SpacyTextSplitter makes previously cached chunks stale
+CHUNK_CACHE_VERSION = 1
+DEFAULT_MAX_SIZE_MB = 1024
+
+
+def get_chunk_cache_path() -> str:
+    """Get the shared chunk cache database path."""
+    return get_cache_db_path("chunk-cache.db")
+
+
+def chunk_cache_key(pieces: Iterable[str], config: dict) -> str:
+    """Hash cleaned text, given as one or more pieces, with the splitter config."""
+    digest = hashlib.sha256()
+    settings = {"version": CHUNK_CACHE_VERSION, **config}
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    for piece in pieces:
+        digest.update(b"\0")
+        digest.update(piece.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class ChunkCache(SQLiteLRUCache):
+    """SQLite store of chunk lists keyed by chunk_cache_key, with LRU eviction."""
+
+    table = "chunks"
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS chunks (
+            key TEXT PRIMARY KEY,
+            chunks TEXT NOT NULL,
+            token_counts TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            last_used REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_chunks_last_used ON chunks(last_used)",
+    )
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+    ):
+        super().__init__(db_path or get_chunk_cache_path(), max_size_mb)
+
+    def get(self, key: str) -> tuple[list[str], list[int]] | None:
+        """Return (chunks, token counts) stored under key, or None."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT chunks, token_counts FROM chunks WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE chunks SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return json.loads(row[0]), json.loads(row[1])
+
+    def put(self, key: str, chunks: list[str], token_counts: list[int]) -> None:
+        """Store a document's chunks, evicting old entries if over the size limit."""
+        chunks_json = json.dumps(chunks)
+        counts_json = json.dumps(token_counts)
+        size_bytes = len(chunks_json.encode()) + len(counts_json)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                (key, chunks_json, counts_json, size_bytes, time.time()),
+            )
+            self._record_write(conn, size_bytes)
@@ -0,0 +1,82 @@
+"""
+Process pool for chunking many documents with SpacyTextSplitter.
+
+spaCy and tiktoken run in the calling process, so split_documents used one
+core no matter how many documents it was given. SpacyTextSplitter(workers=N)
+hands documents to a ChunkingPool instead:
+
+- Each worker builds its own SpacyTextSplitter with the parent's settings and
+  loads the spaCy pipeline once, in the pool initializer. The parent loads it
+  first, so the model is downloaded at most once and forked workers start
+  with it already in memory.
+- Documents go out one at a time (imap with chunksize 1), so a long book
+  doesn't hold up a batch of short posts. Results come back in input order as
+  soon as the next one is ready.
+- Every result carries the ChunkingMetrics recorded for that document alone.
+  The parent merges them into its own metrics, so summaries look the same as
+  a serial run.
+
+Workers ignore SIGINT; the parent's signal handling decides when to stop and
+close() terminates the pool.
+"""
+
+import multiprocessing
+import os
+import signal
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .text_splitter_utils import ChunkingMetrics
+
+# The worker's splitter, set by the pool initializer
+_worker_splitter = None
+
+
+def _init_worker(splitter_class: type, splitter_kwargs: dict) -> None:
+    global _worker_splitter
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_splitter = splitter_class(**splitter_kwargs)
+    _worker_splitter._ensure_nlp()
+
+
+def _split_in_worker(
+    task: tuple[str, str | None, str],
+) -> tuple[list[str], "ChunkingMetrics"]:
+    """Chunk one document. Returns (chunks, metrics for this document only)."""
+    from .text_splitter_utils import ChunkingMetrics
+
+    text, document_id, model_name = task
+    # The parent's embedding model decides token counts, even if it changed
+    # after the pool started
+    os.environ["OPENAI_INGEST_EMBEDDINGS_MODEL"] = model_name
+    _worker_splitter.metrics = ChunkingMetrics()
+    chunks = _worker_splitter.split_text(text, document_id=document_id)
+    return chunks, _worker_splitter.metrics
+
+
+class ChunkingPool:
+    """Worker processes that each hold one loaded text splitter."""
+
+    def __init__(self, workers: int, splitter_class: type, splitter_kwargs: dict):
+        self.workers = workers
+        self._pool = multiprocessing.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(splitter_class, splitter_kwargs),
+        )
+
+    def imap(
+        self, tasks: Iterable[tuple[str, str | None, str]]
+    ) -> Iterator[tuple[list[str], "ChunkingMetrics"]]:
+        """Chunk (text, document_id, embedding model) tasks, yielding results in order.
+
+        A task that raised re-raises its exception when its result is reached;
+        later results can still be read.
+        """
+        return self._pool.imap(_split_in_worker, tasks, chunksize=1)
+
+    def close(self) -> None:
+        """Stop the workers, dropping any documents still queued."""
+        self._pool.terminate()
+        self._pool.join()
@@ -0,0 +1,232 @@
+"""
+On-disk cache of OpenAI embeddings shared by all ingestion scripts.
+
+Every ingestion run paid for its embeddings again: re-ingesting the same
+posts after a metadata-only change, re-running a PDF folder or re-crawling a
+page with unchanged chunks embedded identical text once more. EmbeddingCache
+stores each vector once:
+
+- Rows are keyed by (model, dimensions, SHA-256 of the exact text sent).
+  dimensions is the size requested from the API, 0 for the model's default.
+- Vectors are stored as float32 blobs, 6 KB for a 1536-dimension vector
+  instead of ~30 KB of JSON. Pinecone stores float32 too, so a cached vector
+  upserts the same values as a fresh one.
+- embed() and aembed() look a batch up, send only the missing texts (once
+  each, even when a batch repeats a text) to the embedding function and
+  store what comes back. Hits and misses are counted per process.
+- Rows live in one SQLite table (see sqlite_lru_cache.py), evicted least
+  recently used first above max_size_mb.
+
+OpenAIEmbeddings(cache=...) in embeddings_utils.py uses it in embed_texts
+and embed_texts_async; CachedEmbeddings wraps LangChain-style clients
+(embed_documents / embed_query) such as the ones ingest_db_text.py and the
+crawler use.
+"""
+
+import hashlib
+import time
+from array import array
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from .sqlite_lru_cache import SQLiteLRUCache, get_cache_db_path
+
+DEFAULT_MAX_SIZE_MB = 4096
+# SQLite's default limit on host parameters is 999 in older builds
+LOOKUP_BATCH_SIZE = 500
+
+
+def get_embedding_cache_path() -> str:
+    """Get the shared embedding cache database path."""
+    return get_cache_db_path("embedding-cache.db")
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+
+
+class EmbeddingCache(SQLiteLRUCache):
+    """SQLite store of float32 embedding vectors, with LRU eviction and hit counts."""
+
+    table = "embeddings"
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS embeddings (
+            model TEXT NOT NULL,
+            dimensions INTEGER NOT NULL,
+            text_hash BLOB NOT NULL,
+            vector BLOB NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (model, dimensions, text_hash)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)",
+    )
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+    ):
+        super().__init__(db_path or get_embedding_cache_path(), max_size_mb)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked up texts that hit, 0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Embedding cache: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate * 100:.1f}% hit rate)"
+        )
+
+    def get_many(
+        self, texts: list[str], model: str, dimensions: int | None = None
+    ) -> list[list[float] | None]:
+        """Return the stored vector for each text, or None where there is none."""
+        hashes = [_text_hash(text) for text in texts]
+        found = {}
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+                batch = list(set(hashes[start : start + LOOKUP_BATCH_SIZE]))
+                placeholders = ",".join("?" * len(batch))
+                where = (
+                    f"model = ? AND dimensions = ? AND text_hash IN ({placeholders})"
+                )
+                params = (model, dimensions or 0, *batch)
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE {where}", params
+                ).fetchall()
+                if rows:
+                    conn.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE {where}",
+                        (time.time(), *params),
+                    )
+                found.update(rows)
+            vectors = []
+            for text_hash in hashes:
+                blob = found.get(text_hash)
+                vectors.append(None if blob is None else array("f", blob).tolist())
+            hit_count = sum(vector is not None for vector in vectors)
+            self.hits += hit_count
+            self.misses += len(vectors) - hit_count
+        return vectors
+
+    def put_many(
+        self,
+        texts: list[str],
+        vectors: list[list[float]],
+        model: str,
+        dimensions: int | None = None,
+    ) -> None:
+        """Store vectors for texts, evicting old rows if over the size limit."""
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors, strict=True):
+            blob = array("f", vector).tobytes()
+            rows.append(
+                (model, dimensions or 0, _text_hash(text), blob, len(blob), now)
+            )
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._record_write(conn, sum(row[4] for row in rows))
+
+    def _split_misses(
+        self, texts: list[str], model: str, dimensions: int | None
+    ) -> tuple[list[list[float] | None], list[str]]:
+        """Look texts up. Returns (vectors with None for misses, unique missing texts)."""
+        vectors = self.get_many(texts, model, dimensions)
+        missing = list(
+            dict.fromkeys(t for t, v in zip(texts, vectors, strict=True) if v is None)
+        )
+        return vectors, missing
+
+    @staticmethod
+    def _fill_misses(
+        texts: list[str],
+        vectors: list[list[float] | None],
+        missing: list[str],
+        new_vectors: list[list[float]],
+    ) -> list[list[float]]:
+        by_text = dict(zip(missing, new_vectors, strict=True))
+        return [
+            by_text[text] if vector is None else vector
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+
+    def embed(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        model: str,
+        dimensions: int | None = None,
+    ) -> list[list[float]]:
+        """Embed texts, calling embed_fn only for texts not in the cache."""
+        vectors, missing = self._split_misses(texts, model, dimensions)
+        if not missing:
+            return vectors
+        new_vectors = embed_fn(missing)
+        self.put_many(missing, new_vectors, model, dimensions)
+        return self._fill_misses(texts, vectors, missing, new_vectors)
+
+    async def aembed(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], Awaitable[list[list[float]]]],
+        model: str,
+        dimensions: int | None = None,
+    ) -> list[list[float]]:
+        """Like embed, for an async embed_fn."""
+        vectors, missing = self._split_misses(texts, model, dimensions)
+        if not missing:
+            return vectors
+        new_vectors = await embed_fn(missing)
+        self.put_many(missing, new_vectors, model, dimensions)
+        return self._fill_misses(texts, vectors, missing, new_vectors)
+
+
+class CachedEmbeddings:
+    """LangChain-style embeddings client that checks an EmbeddingCache first.
+
+    Other attributes are passed through to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        cache: EmbeddingCache,
+        model: str | None = None,
+        dimensions: int | None = None,
+    ):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model or embeddings.model
+        self.dimensions = dimensions
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.cache.embed(
+            texts, self.embeddings.embed_documents, self.model, self.dimensions
+        )
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    def __getattr__(self, name: str):
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
@@ -12,9 +12,11 @@ Key Features:
 - Batch processing optimization
 - Robust error handling and retry logic
 - Environment variable management
+- Optional on-disk embedding cache (see embedding_cache.py)
 
 Usage:
     from data_ingestion.utils.embeddings_utils import OpenAIEmbeddings, validate_embedding_config
+    from data_ingestion.utils.embedding_cache import EmbeddingCache
     
     # Validate configuration
     config = validate_embedding_config()
@@ -25,6 +27,9 @@ Usage:
     # Generate embeddings
     vector = await embeddings.embed_query("Your text here")
     vectors = await embeddings.embed_texts(["Text 1", "Text 2"])
+
+    # Reuse vectors of texts embedded by earlier runs
+    embeddings = OpenAIEmbeddings(model=config["model"], cache=EmbeddingCache())
 """
 
 import asyncio
@@ -34,6 +39,8 @@ import time
 
 from openai import OpenAI
 
+from .embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -123,6 +130,7 @@ class OpenAIEmbeddings:
         chunk_size (int): Maximum batch size for API calls
         max_retries (int): Maximum number of retry attempts
         retry_delay (float): Initial delay between retries (with exponential backoff)
+        cache (EmbeddingCache): Optional on-disk cache; only texts not in it are sent to the API
     
     Example:
         >>> embeddings = OpenAIEmbeddings()
@@ -136,7 +144,8 @@ class OpenAIEmbeddings:
         api_key: str | None = None,
         chunk_size: int = 1000,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        cache: EmbeddingCache | None = None
     ):
         """
         Initialize the OpenAI embeddings client.
@@ -147,6 +156,7 @@ class OpenAIEmbeddings:
             chunk_size: Maximum batch size for processing multiple texts
             max_retries: Maximum number of retry attempts for failed requests
             retry_delay: Initial delay between retries in seconds
+            cache: Optional EmbeddingCache shared with other clients and runs
             
         Raises:
             ValueError: If API key is not provided and not found in environment
@@ -161,6 +171,7 @@ class OpenAIEmbeddings:
         self.chunk_size = chunk_size
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.cache = cache
         
         # Initialize OpenAI client for sync operations
         self._client = OpenAI(api_key=self.api_key)
@@ -214,11 +225,17 @@ class OpenAIEmbeddings:
             logger.warning("All texts were empty after filtering")
             return []
         
+        if self.cache is not None:
+            return self.cache.embed(valid_texts, self._embed_in_batches_sync, self.model)
+        return self._embed_in_batches_sync(valid_texts)
+    
+    def _embed_in_batches_sync(self, texts: list[str]) -> list[list[float]]:
+        """Embed non-empty texts in API-sized batches (synchronous)."""
         all_embeddings = []
         
         # Process in batches to respect API limits
-        for i in range(0, len(valid_texts), self.chunk_size):
-            batch = valid_texts[i:i + self.chunk_size]
+        for i in range(0, len(texts), self.chunk_size):
+            batch = texts[i:i + self.chunk_size]
             batch_embeddings = self._embed_batch_sync(batch)
             all_embeddings.extend(batch_embeddings)
         
@@ -270,11 +287,19 @@ class OpenAIEmbeddings:
             logger.warning("All texts were empty after filtering")
             return []
         
+        if self.cache is not None:
+            return await self.cache.aembed(
+                valid_texts, self._embed_in_batches_async, self.model
+            )
+        return await self._embed_in_batches_async(valid_texts)
+    
+    async def _embed_in_batches_async(self, texts: list[str]) -> list[list[float]]:
+        """Embed non-empty texts in API-sized batches (asynchronous)."""
         all_embeddings = []
         
         # Process in batches to respect API limits
-        for i in range(0, len(valid_texts), self.chunk_size):
-            batch = valid_texts[i:i + self.chunk_size]
+        for i in range(0, len(texts), self.chunk_size):
+            batch = texts[i:i + self.chunk_size]
             batch_embeddings = await self._embed_batch_async(batch)
             all_embeddings.extend(batch_embeddings)
         
@@ -0,0 +1,134 @@
+"""
+Shared storage for the on-disk ingestion caches (chunk_cache.py, embedding_cache.py).
+
+Each cache is one SQLite table whose rows carry a size_bytes and a last_used
+column. SQLiteLRUCache handles what they have in common:
+
+- The connection is opened lazily, in WAL mode with a busy timeout, and again
+  in every process. Pickled copies (e.g. passed to a ChunkingPool) and forked
+  workers never share a connection; several processes can use the same file.
+- A lock serializes access within a process, so threads can share a cache.
+- Once the table grows past max_size_mb, the least recently used rows are
+  deleted until it is back under EVICT_TO_FRACTION of the limit. Each process
+  adds its own writes to the size it last read and re-reads it every
+  SIZE_RECHECK_WRITES writes, so other processes' writes are noticed too.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Evict down to this fraction of the limit so eviction doesn't run on every write
+EVICT_TO_FRACTION = 0.9
+# Other processes write to the same file; re-read the table size this often
+SIZE_RECHECK_WRITES = 256
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+
+def get_cache_db_path(file_name: str) -> str:
+    """Get the path of a cache database in data_ingestion/media."""
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "media", file_name)
+    )
+
+
+class SQLiteLRUCache:
+    """Base class for a size-limited SQLite table evicted least recently used first.
+
+    Subclasses set table and schema (statements run on every new connection)
+    and call _record_write after inserting rows, holding self._lock.
+    """
+
+    table = ""
+    schema: tuple[str, ...] = ()
+
+    def __init__(self, db_path: str | Path, max_size_mb: float):
+        self.db_path = str(db_path)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._conn = None
+        self._pid = None
+        self._size_bytes = 0
+        self._writes_since_recheck = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use, and again after a fork."""
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA busy_timeout = {DEFAULT_BUSY_TIMEOUT_MS}")
+            for statement in self.schema:
+                conn.execute(statement)
+            self._conn = conn
+            self._pid = os.getpid()
+            self._size_bytes = self._table_size(conn)
+            self._writes_since_recheck = 0
+        return self._conn
+
+    def _table_size(self, conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            f"SELECT COALESCE(SUM(size_bytes), 0) FROM {self.table}"
+        ).fetchone()[0]
+
+    def _record_write(self, conn: sqlite3.Connection, size_bytes: int) -> None:
+        """Account for newly written rows, evicting old ones if over the size limit."""
+        self._size_bytes += size_bytes
+        self._writes_since_recheck += 1
+        if self._writes_since_recheck >= SIZE_RECHECK_WRITES:
+            self._size_bytes = self._table_size(conn)
+            self._writes_since_recheck = 0
+        if self._size_bytes > self.max_size_bytes:
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used rows until under EVICT_TO_FRACTION of the limit."""
+        total = self._table_size(conn)
+        target = self.max_size_bytes * EVICT_TO_FRACTION
+        evicted = []
+        for rowid, size_bytes in conn.execute(
+            f"SELECT rowid, size_bytes FROM {self.table} ORDER BY last_used"
+        ).fetchall():
+            if total <= target:
+                break
+            evicted.append((rowid,))
+            total -= size_bytes
+        conn.executemany(f"DELETE FROM {self.table} WHERE rowid = ?", evicted)
+        self._size_bytes = total
+        self._writes_since_recheck = 0
+        logger.debug(f"Evicted {len(evicted)} rows from {self.table} in {self.db_path}")
+
+    def stats(self) -> dict:
+        """Entry count and total stored size."""
+        with self._lock:
+            conn = self._connection()
+            entries, size_bytes = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {self.table}"
+            ).fetchone()
+        return {"entries": entries, "size_bytes": size_bytes}
+
+    def close(self) -> None:
+        """Close this process's connection; the next call reopens it."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
@@ -8,17 +8,129 @@ import logging
 import os
 import re
 import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 
 import spacy
 import tiktoken
 
+from .chunk_cache import ChunkCache, chunk_cache_key
+from .chunking_pool import ChunkingPool
+from .token_chunking import (
+    CHUNKING_ENGINES,
+    DEFAULT_CHUNKING_ENGINE,
+    OFFSETS_ENGINE,
+    OffsetChunker,
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Global cache for spaCy models to avoid reloading in tests
 _SPACY_MODEL_CACHE = {}
 
+# Global cache for tiktoken encodings, keyed by embedding model name
+_TIKTOKEN_ENCODING_CACHE = {}
+
+# Trained components the splitter never reads. It only uses tokens and
+# sentence boundaries, so the tagger, parser, NER and their helpers are not
+# loaded; the parser's sentence boundaries come from senter instead.
+SENTENCE_PIPELINE_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+# Texts per batch when several are run through spaCy with nlp.pipe
+SPACY_PIPE_BATCH_SIZE = 64
+
+# Streaming chunker (SpacyTextSplitter.iter_chunks): characters read from the
+# input at a time, paragraphs grouped per batch, and the longest stretch of
+# text without a paragraph break held before it is cut at whitespace
+STREAM_READ_CHARS = 64 * 1024
+STREAM_PARAGRAPH_BATCH_SIZE = 256
+STREAM_MAX_BUFFER_CHARS = 1_000_000
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_NON_SPACE = re.compile(r"\S")
+
+
+def get_token_encoding(model_name: str) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoding for an embedding model, loading it once per process.
+
+    tiktoken.encoding_for_model resolves the model name and builds the encoder
+    on every call, which costs more than encoding a typical chunk.
+
+    Args:
+        model_name: OpenAI embedding model name (e.g., text-embedding-3-large)
+
+    Returns:
+        tiktoken.Encoding: The model's encoding
+    """
+    encoding = _TIKTOKEN_ENCODING_CACHE.get(model_name)
+    if encoding is None:
+        encoding = tiktoken.encoding_for_model(model_name)
+        _TIKTOKEN_ENCODING_CACHE[model_name] = encoding
+    return encoding
+
+
+def load_spacy_pipeline(
+    name: str, sentences_only: bool = True
+) -> spacy.language.Language:
+    """
+    Load a spaCy pipeline for chunking.
+
+    With sentences_only, the components in SENTENCE_PIPELINE_EXCLUDE are never
+    loaded. The pipeline's statistical sentence recognizer (senter, disabled by
+    default in the en_core_web models) is enabled, or a rule-based sentencizer
+    added when there is none, and tok2vec is dropped if nothing left uses it.
+
+    Args:
+        name: spaCy model name (e.g., en_core_web_sm)
+        sentences_only: Load only what tokenization and sentence splitting need
+
+    Returns:
+        spacy.language.Language: The loaded pipeline
+
+    Raises:
+        OSError: If the model is not installed
+    """
+    if not sentences_only:
+        nlp = spacy.load(name)
+    else:
+        nlp = spacy.load(name, exclude=SENTENCE_PIPELINE_EXCLUDE)
+        try:
+            nlp.enable_pipe("senter")
+        except ValueError:
+            nlp.add_pipe("sentencizer")
+        if nlp.has_pipe("tok2vec") and not nlp.get_pipe("tok2vec").listening_components:
+            nlp.remove_pipe("tok2vec")
+
+    # Increase max_length to handle very large documents
+    # Default is 1,000,000 chars. Setting to 2,000,000 to handle large PDFs
+    # This requires roughly 2GB of temporary memory during processing with the
+    # full pipeline; the parser accounted for most of it
+    nlp.max_length = 2_000_000
+    return nlp
+
+
+def _iter_text_blocks(text_or_stream: str | Iterable[str]) -> Iterator[str]:
+    """Read a text, or a stream of text pieces, in blocks of about STREAM_READ_CHARS."""
+    if isinstance(text_or_stream, str):
+        for start in range(0, len(text_or_stream), STREAM_READ_CHARS):
+            yield text_or_stream[start : start + STREAM_READ_CHARS]
+        return
+
+    pending = []
+    pending_chars = 0
+    for piece in text_or_stream:
+        pending.append(piece)
+        pending_chars += len(piece)
+        if pending_chars >= STREAM_READ_CHARS:
+            yield "".join(pending)
+            pending = []
+            pending_chars = 0
+    if pending:
+        yield "".join(pending)
+
 
 # Define Document class to avoid circular imports
 class Document:
@@ -50,6 +162,25 @@ class ChunkingMetrics:
         }
         self.edge_cases = []
         self.anomalies = []
+        # Documents looked up in the splitter's chunk cache, if it has one
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of chunk cache lookups that hit, 0 if there were none."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def _cache_summary(self) -> str:
+        return (
+            f"Chunk cache: {self.cache_hits} hits, {self.cache_misses} misses "
+            f"({self.cache_hit_rate * 100:.1f}% hit rate)"
+        )
+
+    def _print_cache_summary(self) -> None:
+        if self.cache_hits + self.cache_misses:
+            print(f"\n{self._cache_summary()}")
 
     def _update_word_count_distribution(self, word_count: int) -> None:
         """Update word count distribution tracking."""
@@ -133,6 +264,19 @@ class ChunkingMetrics:
         self._detect_edge_cases(word_count, chunk_count, document_id)
         self._detect_anomalies(chunk_token_counts, word_count, document_id)
 
+    def merge(self, other: "ChunkingMetrics") -> None:
+        """Add another instance's counts, e.g. from a chunking worker process."""
+        self.total_documents += other.total_documents
+        self.total_chunks += other.total_chunks
+        for range_key, count in other.word_count_distribution.items():
+            self.word_count_distribution[range_key] += count
+        for range_key, count in other.chunk_size_distribution.items():
+            self.chunk_size_distribution[range_key] += count
+        self.edge_cases.extend(other.edge_cases)
+        self.anomalies.extend(other.anomalies)
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+
     def log_summary(self, logger: logging.Logger):
         """Log a summary of all chunking metrics."""
         logger.info("=== CHUNKING METRICS SUMMARY ===")
@@ -157,6 +301,9 @@ class ChunkingMetrics:
             )
             logger.info(f"  {range_key} tokens: {count} chunks ({percentage:.1f}%)")
 
+        if self.cache_hits + self.cache_misses:
+            logger.info(self._cache_summary())
+
         if self.edge_cases:
             logger.info(f"Edge cases detected ({len(self.edge_cases)}):")
             for case in self.edge_cases[:10]:  # Log first 10 edge cases
@@ -198,6 +345,8 @@ class ChunkingMetrics:
             )
             print(f"  {range_key} tokens: {count} chunks ({percentage:.1f}%)")
 
+        self._print_cache_summary()
+
         if self.edge_cases:
             print(f"\nEdge cases detected: {len(self.edge_cases)}")
             for case in self.edge_cases[:200]:  # Show first 200 edge cases
@@ -223,6 +372,10 @@ class SpacyTextSplitter:
         separator="\n\n",
         pipeline="en_core_web_sm",
         log_summary_on_split: bool = True,
+        chunking_engine: str = DEFAULT_CHUNKING_ENGINE,
+        workers: int = 1,
+        chunk_cache: ChunkCache | None = None,
+        embedding_model: str | None = None,
     ):
         """
         Initialize the SpacyTextSplitter with historical paragraph-based chunking parameters.
@@ -233,7 +386,24 @@ class SpacyTextSplitter:
             separator (str): Separator to use for splitting text
             pipeline (str): Name of spaCy pipeline/model to use
             log_summary_on_split (bool): Whether to automatically log summary after each split_documents call.
+            chunking_engine (str): "offsets" encodes each document once and slices its
+                tokens (see token_chunking.py); "strings" re-encodes paragraphs and chunks.
+                Both produce the same chunks.
+            workers (int): Processes used by split_documents for lists of documents.
+                Above 1, documents are chunked in a process pool (see chunking_pool.py);
+                call close() when done with the splitter.
+            chunk_cache (ChunkCache): Optional on-disk cache of chunking results
+                (see chunk_cache.py). split_text and iter_chunks on a str return
+                stored chunks for text they have already chunked with the same
+                settings.
+            embedding_model (str): Embedding model whose tokenizer counts tokens.
+                Defaults to OPENAI_INGEST_EMBEDDINGS_MODEL at the time of each call;
+                set it when the splitter outlives the environment it was made in.
         """
+        if chunking_engine not in CHUNKING_ENGINES:
+            raise ValueError(
+                f"Unknown chunking engine {chunking_engine!r}, expected one of {CHUNKING_ENGINES}"
+            )
         # Calculate base chunk size to account for overlap
         # Target: final chunks of 250 tokens with 50 token overlap
         # Problem: Paragraph-based chunking can create chunks slightly larger than target
@@ -249,10 +419,15 @@ class SpacyTextSplitter:
         self.logger = logging.getLogger(f"{__name__}.SpacyTextSplitter")
         self.metrics = ChunkingMetrics()
         self.log_summary_on_split = log_summary_on_split
+        self.chunking_engine = chunking_engine
+        self.workers = max(1, int(workers))
+        self._chunking_pool = None
+        self.chunk_cache = chunk_cache
+        self.embedding_model = embedding_model
 
     def _get_embedding_model(self) -> str:
         """
-        Get the embedding model name from environment variables.
+        Get the embedding model name, from embedding_model or environment variables.
 
         Returns:
             str: The embedding model name
@@ -260,6 +435,8 @@ class SpacyTextSplitter:
         Raises:
             ValueError: If OPENAI_INGEST_EMBEDDINGS_MODEL environment variable is not set
         """
+        if self.embedding_model:
+            return self.embedding_model
         model_name = os.getenv("OPENAI_INGEST_EMBEDDINGS_MODEL")
         if not model_name:
             raise ValueError(
@@ -285,14 +462,10 @@ class SpacyTextSplitter:
 
             try:
                 self.logger.debug(f"Loading spaCy model {self.pipeline}")
-                self.nlp = spacy.load(self.pipeline)
-
-                # Increase max_length to handle very large documents
-                # Default is 1,000,000 chars. Setting to 2,000,000 to handle large PDFs
-                # This requires roughly 2GB of temporary memory during processing
-                self.nlp.max_length = 2_000_000
+                self.nlp = load_spacy_pipeline(self.pipeline)
                 self.logger.debug(
-                    f"Set spaCy max_length to {self.nlp.max_length:,} characters"
+                    f"Loaded spaCy components {self.nlp.pipe_names}, "
+                    f"max_length {self.nlp.max_length:,} characters"
                 )
 
                 # Cache the loaded model
@@ -302,13 +475,7 @@ class SpacyTextSplitter:
                 try:
                     self.logger.info(f"Downloading spaCy model {self.pipeline}...")
                     spacy.cli.download(self.pipeline)
-                    self.nlp = spacy.load(self.pipeline)
-
-                    # Increase max_length for downloaded model too
-                    self.nlp.max_length = 2_000_000
-                    self.logger.debug(
-                        f"Set spaCy max_length to {self.nlp.max_length:,} characters"
-                    )
+                    self.nlp = load_spacy_pipeline(self.pipeline)
 
                     # Cache the loaded model
                     _SPACY_MODEL_CACHE[self.pipeline] = self.nlp
@@ -327,12 +494,41 @@ class SpacyTextSplitter:
                 self.logger.error(error_msg)
                 raise RuntimeError(error_msg) from e
 
+    def _encode(self, text: str) -> list[int]:
+        """
+        Encode text into embedding-model token IDs.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            List of token IDs (empty for blank text)
+        """
+        if not text.strip():
+            return []
+        return get_token_encoding(self._get_embedding_model()).encode(text)
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text the way OpenAI's embedding models do.
+
+        This ensures chunks don't exceed the 8192 token limit. Unlike
+        _tokenize_text, it never decodes the tokens back to strings.
+
+        Args:
+            text: Text to count tokens in
+
+        Returns:
+            int: Number of tokens (0 for blank text)
+        """
+        return len(self._encode(text))
+
     def _tokenize_text(self, text: str) -> list[str]:
         """
         Tokenize text into a list of tokens using tiktoken for consistency with OpenAI embeddings.
 
-        This ensures token counting matches what OpenAI's embedding models expect,
-        preventing chunks from exceeding the 8192 token limit.
+        Decodes every token separately, so use count_tokens when only the
+        number of tokens is needed.
 
         Args:
             text: Text to tokenize
@@ -345,15 +541,9 @@ class SpacyTextSplitter:
 
         try:
             # Use tiktoken for consistent token counting with OpenAI embeddings
-            import tiktoken
-
-            model_name = self._get_embedding_model()
-            encoding = tiktoken.encoding_for_model(model_name)
-            # Get token IDs and convert back to strings for compatibility
-            token_ids = encoding.encode(text)
+            encoding = get_token_encoding(self._get_embedding_model())
             # Convert token IDs back to token strings
-            tokens = [encoding.decode([token_id]) for token_id in token_ids]
-            return tokens
+            return [encoding.decode([token_id]) for token_id in encoding.encode(text)]
         except ImportError:
             self.logger.warning(
                 "tiktoken not available, falling back to spaCy tokenization. "
@@ -436,7 +626,11 @@ class SpacyTextSplitter:
         return len(words)
 
     def _log_chunk_metrics(
-        self, chunks: list[str], word_count: int, document_id: str = None
+        self,
+        chunks: list[str],
+        word_count: int,
+        document_id: str = None,
+        chunk_token_counts: list[int] = None,
     ) -> None:
         """
         Log detailed chunking metrics for a document using token counts.
@@ -445,12 +639,29 @@ class SpacyTextSplitter:
             chunks (list[str]): The chunks created for the document
             word_count (int): The word count of the original document
             document_id (str, optional): Identifier for the document
+            chunk_token_counts (list[int], optional): Token counts of the chunks,
+                if the caller already has them
         """
         # Log detailed chunking metrics using token counts
-        chunk_token_counts = [len(self._tokenize_text(chunk)) for chunk in chunks]
-        chunk_char_counts = [len(chunk) for chunk in chunks]
+        if chunk_token_counts is None:
+            chunk_token_counts = [self.count_tokens(chunk) for chunk in chunks]
+        self._record_chunk_metrics(
+            word_count,
+            chunk_token_counts,
+            [len(chunk) for chunk in chunks],
+            document_id,
+        )
 
-        if chunks:
+    def _record_chunk_metrics(
+        self,
+        word_count: int,
+        chunk_token_counts: list[int],
+        chunk_char_counts: list[int],
+        document_id: str = None,
+    ) -> None:
+        """Log and record a document's chunk statistics from per-chunk counts."""
+        chunk_count = len(chunk_token_counts)
+        if chunk_count:
             avg_chunk_tokens = sum(chunk_token_counts) / len(chunk_token_counts)
             min_chunk_tokens = min(chunk_token_counts)
             max_chunk_tokens = max(chunk_token_counts)
@@ -474,7 +685,7 @@ class SpacyTextSplitter:
                     f"Very large chunks detected (ID: {document_id}): "
                     f"maximum {max_chunk_tokens} tokens"
                 )
-            if len(chunks) == 1 and word_count > 1000:
+            if chunk_count == 1 and word_count > 1000:
                 self.logger.warning(
                     f"Large document not chunked (ID: {document_id}): "
                     f"{word_count} words in single chunk"
@@ -482,11 +693,11 @@ class SpacyTextSplitter:
 
         # Record metrics for analysis
         chunk_overlaps = (
-            [self.chunk_overlap] * (len(chunks) - 1) if len(chunks) > 1 else []
+            [self.chunk_overlap] * (chunk_count - 1) if chunk_count > 1 else []
         )
         self.metrics.log_document_metrics(
             word_count=word_count,
-            chunk_count=len(chunks),
+            chunk_count=chunk_count,
             chunk_token_counts=chunk_token_counts,
             chunk_overlaps=chunk_overlaps,
             document_id=document_id,
@@ -523,7 +734,7 @@ class SpacyTextSplitter:
         if current_merged:
             merged_text = " ".join(current_merged)
             merged_chunks.append(merged_text)
-            merged_tokens = len(self._tokenize_text(merged_text))
+            merged_tokens = self.count_tokens(merged_text)
             self.logger.debug(
                 f"Merged {len(current_merged)} small chunks into {merged_tokens} tokens"
             )
@@ -635,7 +846,8 @@ class SpacyTextSplitter:
         target_max_tokens = int(self.target_chunk_size * 1.25)  # 313 tokens
 
         # Calculate total token count to decide strategy
-        total_tokens = sum(len(self._tokenize_text(chunk)) for chunk in chunks)
+        chunk_token_counts = [self.count_tokens(chunk) for chunk in chunks]
+        total_tokens = sum(chunk_token_counts)
 
         # If total content is large enough for multiple chunks, be less aggressive about merging
         min_chunks_for_total = max(2, total_tokens // target_max_tokens)
@@ -648,9 +860,7 @@ class SpacyTextSplitter:
         current_merged = []
         current_token_count = 0
 
-        for chunk in chunks:
-            chunk_tokens = len(self._tokenize_text(chunk))
-
+        for chunk, chunk_tokens in zip(chunks, chunk_token_counts, strict=True):
             # If this chunk alone is already in target range or too large, handle it separately
             if chunk_tokens >= target_min_tokens:
                 current_merged, current_token_count = self._handle_target_sized_chunk(
@@ -683,13 +893,13 @@ class SpacyTextSplitter:
         # Log the improvement
         original_in_range = sum(
             1
-            for chunk in chunks
-            if target_min_tokens <= len(self._tokenize_text(chunk)) <= target_max_tokens
+            for chunk_tokens in chunk_token_counts
+            if target_min_tokens <= chunk_tokens <= target_max_tokens
         )
         merged_in_range = sum(
             1
             for chunk in merged_chunks
-            if target_min_tokens <= len(self._tokenize_text(chunk)) <= target_max_tokens
+            if target_min_tokens <= self.count_tokens(chunk) <= target_max_tokens
         )
 
         self.logger.info(
@@ -1110,9 +1320,15 @@ class SpacyTextSplitter:
                 f"original length: {original_length} chars, cleaned: {cleaned_length} chars"
             )
 
+        cache_key = None
+        cached = None
+        if self.chunk_cache is not None:
+            cache_key = chunk_cache_key([text], self._chunk_cache_config())
+            cached = self._get_cached_chunks(cache_key)
+
         # Apply paragraph-based chunking (proven approach from evaluation)
         # Show progress for large documents (>50k chars)
-        show_progress = len(text) > 50000
+        show_progress = cached is None and len(text) > 50000
         if show_progress:
             # Create a simple progress indicator for chunking stages
             from tqdm import tqdm
@@ -1125,18 +1341,14 @@ class SpacyTextSplitter:
             )
             progress.set_postfix(stage="paragraphs")
 
-        chunks = self._chunk_by_paragraphs(text)
-
-        if show_progress:
-            progress.update(1)
-            progress.set_postfix(stage="overlap")
-
-        # Apply overlap between chunks
-        overlapped_chunks = self._apply_overlap_to_chunks(chunks)
-
-        if show_progress:
-            progress.update(1)
-            progress.set_postfix(stage="finalizing")
+        if cached is not None:
+            overlapped_chunks, chunk_sizes = cached
+        else:
+            overlapped_chunks, chunk_sizes = self._chunk_with_token_counts(
+                text, progress if show_progress else None
+            )
+            if cache_key is not None:
+                self.chunk_cache.put(cache_key, overlapped_chunks, chunk_sizes)
 
         # Log results
         processing_time = time.time() - start_time
@@ -1145,7 +1357,6 @@ class SpacyTextSplitter:
         )
 
         # Log chunk statistics for quality monitoring
-        chunk_sizes = [len(self._tokenize_text(chunk)) for chunk in overlapped_chunks]
         if chunk_sizes:
             avg_size = sum(chunk_sizes) / len(chunk_sizes)
             min_size, max_size = min(chunk_sizes), max(chunk_sizes)
@@ -1170,10 +1381,242 @@ class SpacyTextSplitter:
         # Record metrics for analysis
         if document_id:
             word_count = self._estimate_word_count(text)
-            self._log_chunk_metrics(overlapped_chunks, word_count, document_id)
+            self._log_chunk_metrics(
+                overlapped_chunks, word_count, document_id, chunk_sizes
+            )
 
         return overlapped_chunks
 
+    def _chunk_with_token_counts(
+        self, text: str, progress=None
+    ) -> tuple[list[str], list[int]]:
+        """
+        Chunk cleaned text with overlap using the configured chunking engine.
+
+        Args:
+            text: Cleaned text to chunk
+            progress: Optional tqdm bar advanced once per chunking stage
+
+        Returns:
+            Tuple of (chunks, token count of each chunk)
+        """
+        chunked = None
+        if self.chunking_engine == OFFSETS_ENGINE and text.strip():
+            # Token counts come with the chunks, no re-encoding needed
+            encoding = get_token_encoding(self._get_embedding_model())
+            chunked = OffsetChunker(self, encoding).split(text)
+        if chunked is not None:
+            if progress is not None:
+                progress.update(2)
+                progress.set_postfix(stage="finalizing")
+            return chunked
+
+        chunks = self._chunk_by_paragraphs(text)
+
+        if progress is not None:
+            progress.update(1)
+            progress.set_postfix(stage="overlap")
+
+        # Apply overlap between chunks
+        overlapped_chunks = self._apply_overlap_to_chunks(chunks)
+
+        if progress is not None:
+            progress.update(1)
+            progress.set_postfix(stage="finalizing")
+
+        return overlapped_chunks, [
+            self.count_tokens(chunk) for chunk in overlapped_chunks
+        ]
+
+    def iter_chunks(
+        self, text_or_stream: str | Iterable[str], document_id: str = None
+    ) -> Iterator[str]:
+        """
+        Split text into chunks like split_text, yielding them as paragraphs arrive.
+
+        The text is cleaned and split into paragraphs a block at a time, grouped
+        in batches of STREAM_PARAGRAPH_BATCH_SIZE paragraphs, and each chunk is
+        overlapped with the one before it as it is yielded. Only a block of
+        text, a batch of paragraphs and the previous chunk's tokens are held at
+        once, so memory does not grow with the document. The chunks are the
+        ones split_text returns, except that a stretch of more than
+        STREAM_MAX_BUFFER_CHARS without a paragraph break is cut at whitespace
+        instead of being kept whole.
+
+        Args:
+            text_or_stream: Text, or an iterable of text pieces (e.g. PDF pages
+                or an open text file) that are concatenated
+            document_id: Optional document identifier. When given, chunk
+                metrics are recorded after the last chunk.
+
+        With a chunk_cache, text given as a str is cleaned and hashed in a
+        first pass and the stored chunks are yielded on a hit. On a miss the
+        chunks are kept until the last one and then stored. Streams can't be
+        read twice, so they are never cached.
+
+        Yields:
+            Text chunks with overlap applied
+        """
+        word_count = 0
+        cache_key = None
+        if self.chunk_cache is not None and isinstance(text_or_stream, str):
+            cache_key, word_count = self._streamed_cache_key(text_or_stream)
+            cached = self._get_cached_chunks(cache_key)
+            if cached is not None:
+                yield from self._replay_cached_chunks(cached, word_count, document_id)
+                return
+            word_count = 0
+
+        cached_chunks = []
+        chunk_token_counts = []
+        chunk_char_counts = []
+
+        def paragraph_batches():
+            nonlocal word_count
+            paragraphs = self._iter_cleaned_paragraphs(text_or_stream)
+            while batch := list(islice(paragraphs, STREAM_PARAGRAPH_BATCH_SIZE)):
+                word_count += sum(len(para.split()) for para in batch)
+                yield batch
+
+        chunks = (
+            chunk
+            for grouped in self._iter_grouped_chunks(
+                paragraph_batches(), show_progress=False
+            )
+            for chunk in self._force_split_large_chunks(grouped)
+        )
+        for chunk in self._iter_overlapped_chunks(chunks):
+            if document_id or cache_key:
+                chunk_token_counts.append(self.count_tokens(chunk))
+                chunk_char_counts.append(len(chunk))
+            if cache_key:
+                cached_chunks.append(chunk)
+            yield chunk
+
+        if cache_key:
+            self.chunk_cache.put(cache_key, cached_chunks, chunk_token_counts)
+
+        if document_id:
+            self.logger.debug(
+                f"Streamed {len(chunk_token_counts)} chunks from {word_count} words "
+                f"(ID: {document_id})"
+            )
+            self._record_chunk_metrics(
+                word_count, chunk_token_counts, chunk_char_counts, document_id
+            )
+
+    def _chunk_cache_config(self, streamed: bool = False) -> dict:
+        """Splitter settings that change the chunks, for the chunk cache key.
+
+        The chunking engine is left out since both engines give the same chunks.
+        iter_chunks cuts very long runs without paragraph breaks, so its entries
+        are kept apart from split_text's.
+        """
+        config = {
+            "chunk_size": self.target_chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "separator": self.separator,
+            "pipeline": self.pipeline,
+            "encoding": get_token_encoding(self._get_embedding_model()).name,
+        }
+        if streamed:
+            config["stream_max_buffer_chars"] = STREAM_MAX_BUFFER_CHARS
+        return config
+
+    def _streamed_cache_key(self, text: str) -> tuple[str, int]:
+        """Hash text's cleaned paragraphs for iter_chunks. Returns (key, word count)."""
+        word_count = 0
+
+        def paragraphs():
+            nonlocal word_count
+            for para in self._iter_cleaned_paragraphs(text):
+                word_count += len(para.split())
+                yield para
+
+        key = chunk_cache_key(paragraphs(), self._chunk_cache_config(streamed=True))
+        return key, word_count
+
+    def _replay_cached_chunks(
+        self,
+        cached: tuple[list[str], list[int]],
+        word_count: int,
+        document_id: str = None,
+    ) -> Iterator[str]:
+        """Yield chunks from the chunk cache, then record their metrics."""
+        chunks, chunk_token_counts = cached
+        yield from chunks
+        if document_id:
+            self._record_chunk_metrics(
+                word_count,
+                chunk_token_counts,
+                [len(chunk) for chunk in chunks],
+                document_id,
+            )
+
+    def _get_cached_chunks(self, key: str) -> tuple[list[str], list[int]] | None:
+        """Look up (chunks, token counts) in the chunk cache, counting the hit or miss."""
+        cached = self.chunk_cache.get(key)
+        if cached is None:
+            self.metrics.cache_misses += 1
+        else:
+            self.metrics.cache_hits += 1
+        return cached
+
+    def _iter_cleaned_paragraphs(
+        self, text_or_stream: str | Iterable[str]
+    ) -> Iterator[str]:
+        """
+        Clean a text or stream block by block and yield its paragraphs.
+
+        Each block ends at a paragraph break that _clean_text cannot join across
+        (one not preceded by a hyphen), so the paragraphs are the ones
+        _extract_paragraphs finds in the whole cleaned text.
+        """
+        buffer = ""
+        for block in _iter_text_blocks(text_or_stream):
+            buffer += block
+            paragraph_break = self._last_paragraph_break(buffer)
+            if paragraph_break is None:
+                if len(buffer) <= STREAM_MAX_BUFFER_CHARS:
+                    continue
+                cut = max(buffer.rfind(" "), buffer.rfind("\n"))
+                if cut <= 0:
+                    cut = len(buffer)
+                self.logger.warning(
+                    f"No paragraph break in {len(buffer):,} characters, "
+                    f"splitting the text at character {cut:,}"
+                )
+                paragraph_break = (cut, cut)
+
+            start, end = paragraph_break
+            cleaned = self._clean_text(buffer[:start])
+            if cleaned:
+                yield from cleaned.split("\n\n")
+            buffer = buffer[end:]
+
+        cleaned = self._clean_text(buffer)
+        if cleaned:
+            yield from cleaned.split("\n\n")
+
+    def _last_paragraph_break(self, text: str) -> tuple[int, int] | None:
+        """
+        (start, end) of the last paragraph break in text that can end a block.
+
+        Breaks with only whitespace after them may still grow, and breaks after
+        a hyphen are joined by _clean_text, so neither can end a block.
+        """
+        last_break = None
+        for match in _PARAGRAPH_BREAK.finditer(text):
+            if not _NON_SPACE.search(text, match.end()):
+                break
+            before = match.start()
+            while before > 0 and text[before - 1] in " \t\r\f\v":
+                before -= 1
+            if before == 0 or text[before - 1] == "-":
+                continue
+            last_break = match.span()
+        return last_break
+
     def _chunk_by_paragraphs(self, text: str) -> list[str]:
         """
         Handle paragraph-based chunking using the proven evaluation approach.
@@ -1324,43 +1767,86 @@ class SpacyTextSplitter:
 
     def _group_paragraphs_into_chunks(self, paragraphs: list[str]) -> list[str]:
         """Group paragraphs to reach target chunk size."""
-        chunks = []
+        return [
+            chunk
+            for chunks in self._iter_grouped_chunks([paragraphs])
+            for chunk in chunks
+        ]
+
+    def _iter_grouped_chunks(
+        self, paragraph_batches: Iterable[list[str]], show_progress: bool = True
+    ) -> Iterator[list[str]]:
+        """
+        Group batches of paragraphs to reach target chunk size.
+
+        Yields the chunks completed by each batch. A chunk still being filled at
+        the end of a batch carries over into the next one, so the grouping is
+        the same however the paragraphs are batched.
+
+        Args:
+            paragraph_batches: Consecutive lists of paragraphs
+            show_progress: Show a progress bar for batches over 100 paragraphs
+
+        Yields:
+            Lists of chunks, in order
+        """
         current_chunk = []
         current_length = 0
 
-        # Show progress for documents with many paragraphs (>100)
-        paragraphs_iter = self._get_paragraphs_iterator(paragraphs)
+        for paragraphs in paragraph_batches:
+            chunks = []
 
-        for para in paragraphs_iter:
-            para_tokens = len(self._tokenize_text(para))
+            # Show progress for documents with many paragraphs (>100)
+            paragraphs_iter = (
+                self._get_paragraphs_iterator(paragraphs)
+                if show_progress
+                else paragraphs
+            )
+            para_token_counts = [self.count_tokens(para) for para in paragraphs_iter]
 
-            # If this single paragraph is larger than chunk size, split it immediately
-            if para_tokens > self.chunk_size:
-                chunks = self._handle_large_paragraph(
-                    para, para_tokens, chunks, current_chunk
-                )
-                current_chunk = []
-                current_length = 0
-                continue
+            # Close progress bar if it was opened
+            if hasattr(paragraphs_iter, "close"):
+                paragraphs_iter.close()
 
-            # If adding this paragraph would exceed chunk size, finalize current chunk
-            if current_length + para_tokens > self.chunk_size and current_chunk:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [para]
-                current_length = para_tokens
-            else:
-                current_chunk.append(para)
-                current_length += para_tokens
+            # Paragraphs larger than chunk size are split with spaCy in one batch
+            large_paragraphs = [
+                para
+                for para, para_tokens in zip(paragraphs, para_token_counts, strict=True)
+                if para_tokens > self.chunk_size
+            ]
+            large_paragraph_chunks = iter(self._split_texts_by_tokens(large_paragraphs))
+
+            for para, para_tokens in zip(paragraphs, para_token_counts, strict=True):
+                # If this single paragraph is larger than chunk size, split it immediately
+                if para_tokens > self.chunk_size:
+                    if current_chunk:
+                        chunks.append(" ".join(current_chunk))
+                    para_chunks = next(large_paragraph_chunks)
+                    if para_chunks is None:
+                        chunks.append(para)
+                    else:
+                        chunks.extend(para_chunks)
+                        self.logger.debug(
+                            f"Split large paragraph ({para_tokens} tokens) into {len(para_chunks)} chunks"
+                        )
+                    current_chunk = []
+                    current_length = 0
+                    continue
+
+                # If adding this paragraph would exceed chunk size, finalize current chunk
+                if current_length + para_tokens > self.chunk_size and current_chunk:
+                    chunks.append(" ".join(current_chunk))
+                    current_chunk = [para]
+                    current_length = para_tokens
+                else:
+                    current_chunk.append(para)
+                    current_length += para_tokens
 
-        # Close progress bar if it was opened
-        if hasattr(paragraphs_iter, "close"):
-            paragraphs_iter.close()
+            yield chunks
 
         # Add the final chunk if it exists
         if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
+            yield [" ".join(current_chunk)]
 
     def _get_paragraphs_iterator(self, paragraphs: list[str]):
         """Get an iterator for paragraphs, with progress bar for large documents."""
@@ -1374,50 +1860,72 @@ class SpacyTextSplitter:
         else:
             return paragraphs
 
-    def _handle_large_paragraph(
-        self, para: str, para_tokens: int, chunks: list[str], current_chunk: list[str]
-    ) -> list[str]:
-        """Handle paragraphs that exceed chunk size by splitting them."""
-        # First, finalize any current chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+    def _split_texts_by_tokens(self, texts: list[str]) -> Iterator[list[str] | None]:
+        """
+        Split each text into token-based chunks with _split_by_tokens.
 
-        # Split the large paragraph using token-based approach
+        The texts go through spaCy together with nlp.pipe rather than one
+        nlp() call each. Docs are consumed as nlp.pipe yields them, so only the
+        current batch is held in memory. If a batch fails, the texts from that
+        point on are retried one at a time.
+
+        Args:
+            texts: Texts to split
+
+        Yields:
+            The chunks for each text, or None where spaCy failed on that text
+        """
+        if not texts:
+            return
+        split = 0
         try:
             self._ensure_nlp()
-            doc = self.nlp(para)
-            para_chunks = self._split_by_tokens(para, doc)
-            chunks.extend(para_chunks)
-            self.logger.debug(
-                f"Split large paragraph ({para_tokens} tokens) into {len(para_chunks)} chunks"
-            )
+            for text, doc in zip(
+                texts,
+                self.nlp.pipe(texts, batch_size=SPACY_PIPE_BATCH_SIZE),
+                strict=True,
+            ):
+                chunks = self._split_by_tokens(text, doc)
+                split += 1
+                yield chunks
         except Exception as e:
             self.logger.warning(
-                f"Failed to split large paragraph, keeping as single chunk: {e}"
+                f"Batched spaCy processing failed, splitting texts one at a time: {e}"
             )
-            chunks.append(para)
+            yield from (self._split_text_by_tokens(text) for text in texts[split:])
 
-        return chunks
+    def _split_text_by_tokens(self, text: str) -> list[str] | None:
+        """Split one text with _split_by_tokens, or return None if spaCy fails."""
+        try:
+            self._ensure_nlp()
+            return self._split_by_tokens(text, self.nlp(text))
+        except Exception as e:
+            self.logger.warning(f"Failed to split large text, keeping it whole: {e}")
+            return None
 
     def _force_split_large_chunks(self, chunks: list[str]) -> list[str]:
         """Final safety check: force split any remaining large chunks."""
+        chunk_token_counts = [self.count_tokens(chunk) for chunk in chunks]
+        large_chunks = [
+            chunk
+            for chunk, chunk_tokens in zip(chunks, chunk_token_counts, strict=True)
+            if chunk_tokens > self.chunk_size
+        ]
+        split_large_chunks = iter(self._split_texts_by_tokens(large_chunks))
+
         final_chunks = []
-        for chunk in chunks:
-            chunk_tokens = len(self._tokenize_text(chunk))
-            if chunk_tokens > self.chunk_size:
-                try:
-                    self._ensure_nlp()
-                    doc = self.nlp(chunk)
-                    split_chunks = self._split_by_tokens(chunk, doc)
-                    final_chunks.extend(split_chunks)
-                    self.logger.debug(
-                        f"Force-split large chunk ({chunk_tokens} tokens) into {len(split_chunks)} chunks"
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Failed to force-split large chunk: {e}")
-                    final_chunks.append(chunk)
-            else:
+        for chunk, chunk_tokens in zip(chunks, chunk_token_counts, strict=True):
+            if chunk_tokens <= self.chunk_size:
+                final_chunks.append(chunk)
+                continue
+            split_chunks = next(split_large_chunks)
+            if split_chunks is None:
                 final_chunks.append(chunk)
+                continue
+            final_chunks.extend(split_chunks)
+            self.logger.debug(
+                f"Force-split large chunk ({chunk_tokens} tokens) into {len(split_chunks)} chunks"
+            )
 
         return final_chunks
 
@@ -1426,7 +1934,8 @@ class SpacyTextSplitter:
         Apply overlap to chunks by prepending tokens from the previous chunk.
 
         This matches the proven evaluation approach for maintaining context.
-        Uses NLTK word_tokenize to preserve punctuation spacing.
+        Every chunk is encoded once; the overlap is the decoded tail of the
+        previous chunk's token IDs, which keeps its punctuation spacing.
         Respects the target token limit when adding overlap.
         """
         if self.chunk_overlap <= 0 or len(chunks) <= 1:
@@ -1437,87 +1946,89 @@ class SpacyTextSplitter:
         if show_overlap_progress:
             from tqdm import tqdm
 
-            overlap_progress = tqdm(
-                total=len(chunks), desc="Applying overlap", unit="chunk", leave=False
-            )
+            chunks = tqdm(chunks, desc="Applying overlap", unit="chunk", leave=False)
+
+        overlapped_chunks = list(self._iter_overlapped_chunks(chunks))
+
+        if show_overlap_progress:
+            chunks.close()
 
-        overlapped_chunks = []
+        return overlapped_chunks
 
-        for i, chunk in enumerate(chunks):
-            if show_overlap_progress:
-                overlap_progress.update(1)
+    def _iter_overlapped_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Apply overlap to a stream of chunks, as _apply_overlap_to_chunks does.
 
+        Only the previous chunk's token IDs are kept between chunks.
+        """
+        if self.chunk_overlap <= 0:
+            yield from chunks
+            return
+
+        encoding = get_token_encoding(self._get_embedding_model())
+        # Account for the space character that will be added during concatenation
+        space_tokens = self.count_tokens(" ")
+        prev_chunk_token_ids = None
+
+        for chunk in chunks:
+            chunk_token_ids = self._encode(chunk)
             overlapped_chunk = chunk
 
-            # Add overlap from previous chunk using NLTK tokenization
-            if i > 0:
+            # Add overlap from previous chunk
+            if prev_chunk_token_ids is not None:
                 # Calculate how much overlap we can add without exceeding target token limit
-                chunk_tokens = len(self._tokenize_text(chunk))
-                # Account for the space character that will be added during concatenation
-                space_tokens = len(self._tokenize_text(" "))
+                chunk_tokens = len(chunk_token_ids)
                 max_overlap_tokens = (
                     self.target_chunk_size - chunk_tokens - space_tokens
                 )
 
                 if max_overlap_tokens > 0:
-                    # Use tiktoken directly for consistent tokenization
-                    try:
-                        model_name = self._get_embedding_model()
-                        encoding = tiktoken.encoding_for_model(model_name)
-
-                        # Tokenize the previous chunk to get token IDs
-                        prev_chunk_token_ids = encoding.encode(chunks[i - 1])
-
-                        # Use the minimum of: configured overlap, available previous tokens, and token budget
-                        actual_overlap = min(
-                            self.chunk_overlap,
-                            len(prev_chunk_token_ids),
-                            max_overlap_tokens,
-                        )
-
-                        # Take the last N token IDs for overlap
-                        overlap_token_ids = prev_chunk_token_ids[-actual_overlap:]
-
-                        # Use tiktoken's decode to properly reconstruct text
-                        overlap_text = encoding.decode(overlap_token_ids).strip()
-                    except (ImportError, Exception) as e:
-                        # Fallback to _tokenize_text method if tiktoken fails
-                        self.logger.warning(
-                            f"Failed to use tiktoken for overlap calculation: {e}"
-                        )
-                        prev_chunk_tokens = self._tokenize_text(chunks[i - 1])
-                        actual_overlap = min(
-                            self.chunk_overlap,
-                            len(prev_chunk_tokens),
-                            max_overlap_tokens,
-                        )
-                        overlap_tokens = prev_chunk_tokens[-actual_overlap:]
-                        overlap_text = " ".join(overlap_tokens).strip()
-                    overlapped_chunk = overlap_text + " " + chunk
-
-                    # Safety check: verify we didn't exceed target token limit
-                    final_token_count = len(self._tokenize_text(overlapped_chunk))
-                    if final_token_count > self.target_chunk_size:
-                        self.logger.warning(
-                            f"Overlap would exceed target token limit ({final_token_count} > {self.target_chunk_size}), using original chunk"
-                        )
-                        overlapped_chunk = chunk
+                    overlapped_chunk = self._prepend_overlap(
+                        chunk, prev_chunk_token_ids, max_overlap_tokens, encoding
+                    )
                 else:
                     self.logger.warning(
                         f"Chunk already at target token limit ({chunk_tokens} tokens), skipping overlap"
                     )
 
-            overlapped_chunks.append(overlapped_chunk)
+            prev_chunk_token_ids = chunk_token_ids
+            yield overlapped_chunk
 
-        if show_overlap_progress:
-            overlap_progress.close()
+    def _prepend_overlap(
+        self,
+        chunk: str,
+        prev_chunk_token_ids: list[int],
+        max_overlap_tokens: int,
+        encoding: tiktoken.Encoding,
+    ) -> str:
+        """Prefix a chunk with the end of the previous chunk, within the token limit."""
+        # Use the minimum of: configured overlap, available previous tokens, and token budget
+        actual_overlap = min(
+            self.chunk_overlap, len(prev_chunk_token_ids), max_overlap_tokens
+        )
+        if actual_overlap <= 0:
+            return chunk
 
-        return overlapped_chunks
+        # Decode the last N token IDs to properly reconstruct text
+        overlap_text = encoding.decode(prev_chunk_token_ids[-actual_overlap:]).strip()
+        overlapped_chunk = overlap_text + " " + chunk
+
+        # Safety check: tokens can merge across the joining space, so verify
+        # we didn't exceed target token limit
+        final_token_count = self.count_tokens(overlapped_chunk)
+        if final_token_count > self.target_chunk_size:
+            self.logger.warning(
+                f"Overlap would exceed target token limit ({final_token_count} > {self.target_chunk_size}), using original chunk"
+            )
+            return chunk
+        return overlapped_chunk
 
     def split_documents(self, documents: list[Document]) -> list[Document]:
         """
         Split documents into chunks.
 
+        With workers > 1, the documents are chunked in parallel processes.
+
         Args:
             documents (List[Document]): The documents to split
 
@@ -1537,43 +2048,20 @@ class SpacyTextSplitter:
             chunked_docs = []
             self.logger.info(f"Starting to split {len(documents)} documents")
 
+            document_chunks = self.iter_split_documents(documents)
             # Only show progress bar for multiple documents
             if len(documents) > 1:
                 from tqdm import tqdm
 
-                documents_iter = tqdm(documents, desc="Splitting documents", unit="doc")
-            else:
-                documents_iter = documents
-
-            for i, doc in enumerate(documents_iter):
-                # Check if doc has required attributes (supports both local Document and LangChain Document)
-                if not hasattr(doc, "page_content") or not hasattr(doc, "metadata"):
-                    error_msg = f"Expected Document object with 'page_content' and 'metadata' attributes, got {type(doc)}"
-                    self.logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                text = doc.page_content
-                # Generate document ID from metadata or use index
-                document_id = (
-                    doc.metadata.get("source")
-                    or doc.metadata.get("title")
-                    or doc.metadata.get("id")
-                    or f"doc_{i}"
+                document_chunks = tqdm(
+                    document_chunks,
+                    total=len(documents),
+                    desc="Splitting documents",
+                    unit="doc",
                 )
 
-                chunks = self.split_text(text, document_id=document_id)
-
-                for j, chunk in enumerate(chunks):
-                    if chunk:
-                        # Add chunk index to metadata for tracking
-                        chunk_metadata = doc.metadata.copy()
-                        chunk_metadata["chunk_index"] = j
-                        chunk_metadata["total_chunks"] = len(chunks)
-                        chunk_metadata["document_id"] = document_id
-
-                        chunked_docs.append(
-                            Document(page_content=chunk, metadata=chunk_metadata)
-                        )
+            for chunks in document_chunks:
+                chunked_docs.extend(chunks)
 
             self.logger.info(
                 f"Split {len(documents)} documents into {len(chunked_docs)} chunks"
@@ -1591,6 +2079,113 @@ class SpacyTextSplitter:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def iter_split_documents(
+        self, documents: list[Document], return_exceptions: bool = False
+    ) -> Iterator[list[Document] | Exception]:
+        """
+        Chunk documents one by one, yielding each document's chunks in input order.
+
+        With workers > 1 and more than one document, the documents are chunked
+        in the process pool and each result is yielded as soon as it and all
+        earlier ones are ready. Metrics from the workers are merged into
+        self.metrics.
+
+        Args:
+            documents: The documents to split
+            return_exceptions: Yield the exception for a document that failed
+                to split, instead of raising it and stopping
+
+        Yields:
+            List of chunk Documents per input document (or its exception)
+
+        Raises:
+            ValueError: If a document lacks page_content or metadata
+        """
+        for doc in documents:
+            # Supports both local Document and LangChain Document
+            if not hasattr(doc, "page_content") or not hasattr(doc, "metadata"):
+                error_msg = f"Expected Document object with 'page_content' and 'metadata' attributes, got {type(doc)}"
+                self.logger.error(error_msg)
+                raise ValueError(error_msg)
+        document_ids = [
+            self._get_document_id(doc, i) for i, doc in enumerate(documents)
+        ]
+
+        results = None
+        if self.workers > 1 and len(documents) > 1:
+            model_name = self._get_embedding_model()
+            results = self._get_chunking_pool().imap(
+                (doc.page_content, document_id, model_name)
+                for doc, document_id in zip(documents, document_ids, strict=True)
+            )
+
+        for doc, document_id in zip(documents, document_ids, strict=True):
+            try:
+                if results is None:
+                    chunks = self.split_text(doc.page_content, document_id=document_id)
+                else:
+                    chunks, metrics = next(results)
+                    self.metrics.merge(metrics)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                yield e
+                continue
+            yield self._build_chunk_documents(doc, document_id, chunks)
+
+    def _get_document_id(self, doc: Document, index: int) -> str:
+        """Document ID for logging and chunk metadata, from metadata or the list index."""
+        return (
+            doc.metadata.get("source")
+            or doc.metadata.get("title")
+            or doc.metadata.get("id")
+            or f"doc_{index}"
+        )
+
+    def _build_chunk_documents(
+        self, doc: Document, document_id: str, chunks: list[str]
+    ) -> list[Document]:
+        """Wrap a document's chunks in Documents with chunk tracking metadata."""
+        chunk_docs = []
+        for j, chunk in enumerate(chunks):
+            if chunk:
+                # Add chunk index to metadata for tracking
+                chunk_metadata = doc.metadata.copy()
+                chunk_metadata["chunk_index"] = j
+                chunk_metadata["total_chunks"] = len(chunks)
+                chunk_metadata["document_id"] = document_id
+
+                chunk_docs.append(Document(page_content=chunk, metadata=chunk_metadata))
+        return chunk_docs
+
+    def _get_chunking_pool(self) -> ChunkingPool:
+        """Start the worker pool on first use."""
+        if self._chunking_pool is None:
+            # Load (or download) the spaCy model once here; forked workers inherit it
+            self._ensure_nlp()
+            self._chunking_pool = ChunkingPool(
+                self.workers,
+                type(self),
+                {
+                    "chunk_size": self.target_chunk_size,
+                    "chunk_overlap": self.chunk_overlap,
+                    "separator": self.separator,
+                    "pipeline": self.pipeline,
+                    "log_summary_on_split": False,
+                    "chunking_engine": self.chunking_engine,
+                    "chunk_cache": self.chunk_cache,
+                    "embedding_model": self.embedding_model,
+                },
+            )
+            self.logger.info(f"Started {self.workers} chunking worker processes")
+        return self._chunking_pool
+
+    def close(self) -> None:
+        """Stop the chunking worker processes, if any were started."""
+        if self._chunking_pool is not None:
+            self._chunking_pool.close()
+            self._chunking_pool = None
+
     def get_metrics_summary(self) -> dict:
         """
         Get a dictionary summary of chunking metrics for external analysis.
@@ -1612,4 +2207,7 @@ class SpacyTextSplitter:
             "anomalies_count": len(self.metrics.anomalies),
             "edge_cases": self.metrics.edge_cases.copy(),
             "anomalies": self.metrics.anomalies.copy(),
+            "cache_hits": self.metrics.cache_hits,
+            "cache_misses": self.metrics.cache_misses,
+            "cache_hit_rate": self.metrics.cache_hit_rate,
         }
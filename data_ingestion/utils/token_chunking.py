@@ -0,0 +1,313 @@
+"""
+Single-tokenization chunking for SpacyTextSplitter.
+
+SpacyTextSplitter.split_text used to run tiktoken over the same text several
+times: once per paragraph to size it, once per grouped chunk in the
+force-split check, once more per chunk and per overlapped chunk in
+_apply_overlap_to_chunks, and a last time for the chunk statistics. On a
+book-length PDF that is four or five BPE passes over the whole document.
+
+This module encodes the cleaned document once and works with token offsets
+from then on:
+
+- TokenizedText keeps the document's token IDs and the byte offset where each
+  token starts. The tokens of a paragraph, or of any other span of the text,
+  are a slice of that array plus its first and last word, which are encoded
+  on their own.
+- OffsetChunker runs the same paragraph grouping, large-paragraph splitting
+  and overlap rules as the string pipeline in SpacyTextSplitter. It sizes
+  paragraphs and chunks from those slices and takes each overlap from the
+  tail of the previous chunk's token IDs. The token count of every output
+  chunk falls out of the same arithmetic, so the statistics need no encoding.
+
+Why a slice gives the same tokens as encoding the span by itself: tiktoken's
+pre-tokenizer never lets a piece run across a single space that follows a
+non-space character, so such a space always starts a piece, both in the
+document and in the span, and BPE merges stay inside pieces. Everything
+between the first and the last space of a span is therefore tokenized the
+same way in both. The edges are not: the first word of a paragraph is
+" word" once paragraphs are joined with spaces, and its last word can share
+a token with the newlines after it (".\\n\\n"). Those words are encoded
+separately. If a span has no such space, or the document's tokens don't
+start where the spaces are, the whole span is encoded, so the chunks and
+counts always equal the string pipeline's.
+
+OffsetChunker handles the paragraph lists that are spans of the text. When
+SpacyTextSplitter falls back to merging single-newline lines, split returns
+None and the string pipeline chunks the text instead.
+"""
+
+import bisect
+import re
+from collections.abc import Iterable
+from itertools import accumulate
+
+import tiktoken
+
+OFFSETS_ENGINE = "offsets"
+STRINGS_ENGINE = "strings"
+CHUNKING_ENGINES = (OFFSETS_ENGINE, STRINGS_ENGINE)
+DEFAULT_CHUNKING_ENGINE = OFFSETS_ENGINE
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+# (start, end) character offsets into the document
+Span = tuple[int, int]
+# Spans joined with single spaces, or text that is not a span of the document
+Chunk = tuple[Span, ...] | str
+
+
+class TokenizedText:
+    """A document encoded once, with token offsets for slicing spans."""
+
+    def __init__(self, text: str, encoding: tiktoken.Encoding):
+        self.text = text
+        self.encoding = encoding
+        self.token_ids = encoding.encode(text)
+        token_bytes = encoding.decode_tokens_bytes(self.token_ids)
+        # Byte offset where each token starts, plus the end of the text
+        self._token_starts = list(accumulate(map(len, token_bytes), initial=0))
+        # Character offsets map to byte offsets through the non-ASCII characters
+        self._wide_chars = [m.start() for m in _NON_ASCII.finditer(text)]
+        self._wide_extra_bytes = list(
+            accumulate(len(text[i].encode("utf-8")) - 1 for i in self._wide_chars)
+        )
+
+    def _byte_offset(self, char_offset: int) -> int:
+        wide_before = bisect.bisect_left(self._wide_chars, char_offset)
+        if wide_before == 0:
+            return char_offset
+        return char_offset + self._wide_extra_bytes[wide_before - 1]
+
+    def _token_index(self, char_offset: int) -> int | None:
+        """Index of the token starting at char_offset, or None inside a token."""
+        byte_offset = self._byte_offset(char_offset)
+        index = bisect.bisect_left(self._token_starts, byte_offset)
+        if index < len(self._token_starts) and self._token_starts[index] == byte_offset:
+            return index
+        return None
+
+    def span_ids(self, start: int, end: int, leading_space: bool = False) -> list[int]:
+        """Token IDs of text[start:end] (with a space in front) as if encoded alone."""
+        text = self.text
+        prefix = " " if leading_space else ""
+        first_space = text.find(" ", start, end)
+        last_space = text.rfind(" ", start, end)
+        if (
+            first_space <= start
+            or text[first_space - 1].isspace()
+            or text[last_space - 1].isspace()
+        ):
+            return self.encoding.encode(prefix + text[start:end])
+        first, last = self._token_index(first_space), self._token_index(last_space)
+        if first is None or last is None:
+            return self.encoding.encode(prefix + text[start:end])
+        return (
+            self.encoding.encode(prefix + text[start:first_space])
+            + self.token_ids[first:last]
+            + self.encoding.encode(text[last_space:end])
+        )
+
+    def chunk_ids(self, chunk: Chunk, leading_space: bool = False) -> list[int]:
+        """Token IDs of a chunk's text (with a space in front) as if encoded alone."""
+        if isinstance(chunk, str):
+            return self.encoding.encode(" " + chunk if leading_space else chunk)
+        token_ids = []
+        for position, (start, end) in enumerate(chunk):
+            token_ids += self.span_ids(start, end, leading_space or position > 0)
+        return token_ids
+
+    def chunk_text(self, chunk: Chunk) -> str:
+        if isinstance(chunk, str):
+            return chunk
+        return " ".join(self.text[start:end] for start, end in chunk)
+
+    def locate(self, pieces: Iterable[str], start: int, end: int) -> list[Chunk]:
+        """Turn consecutive substrings of text[start:end] into spans.
+
+        Pieces that can't be found are kept as text.
+        """
+        chunks: list[Chunk] = []
+        position = start
+        for piece in pieces:
+            found = self.text.find(piece, position, end)
+            if found < 0:
+                chunks.append(piece)
+                continue
+            position = found + len(piece)
+            chunks.append(((found, position),))
+        return chunks
+
+
+def locate_paragraphs(text: str, paragraphs: list[str]) -> list[Span] | None:
+    """Spans of consecutive paragraphs in text, or None if one isn't a substring."""
+    spans = []
+    position = 0
+    for paragraph in paragraphs:
+        found = text.find(paragraph, position)
+        if found < 0:
+            return None
+        position = found + len(paragraph)
+        spans.append((found, position))
+    return spans
+
+
+class OffsetChunker:
+    """SpacyTextSplitter's paragraph chunking on a single encoding of the text.
+
+    Uses the splitter's settings, spaCy model and paragraph extraction; only
+    the token counting differs from the string pipeline.
+    """
+
+    def __init__(self, splitter, encoding: tiktoken.Encoding):
+        self.splitter = splitter
+        self.encoding = encoding
+        self.logger = splitter.logger
+
+    def split(self, text: str) -> tuple[list[str], list[int]] | None:
+        """Chunk cleaned text with overlap.
+
+        Returns:
+            (chunks, token count of each chunk), or None when the paragraphs
+            are not spans of the text and the string pipeline must be used
+        """
+        if not text.strip():
+            return [], []
+        spans = locate_paragraphs(text, self.splitter._extract_paragraphs(text))
+        if spans is None:
+            self.logger.debug("Paragraphs were rejoined, using string chunking")
+            return None
+        doc = TokenizedText(text, self.encoding)
+        chunks = self._force_split_large_chunks(doc, self._group_paragraphs(doc, spans))
+        return self._apply_overlap(doc, chunks)
+
+    def _group_paragraphs(self, doc: TokenizedText, spans: list[Span]) -> list[Chunk]:
+        """Group paragraphs to reach the chunk size, like _group_paragraphs_into_chunks."""
+        chunk_size = self.splitter.chunk_size
+        chunks: list[Chunk] = []
+        current: list[Span] = []
+        current_length = 0
+
+        spans_iter = self.splitter._get_paragraphs_iterator(spans)
+        span_token_counts = [len(doc.span_ids(*span)) for span in spans_iter]
+        if hasattr(spans_iter, "close"):
+            spans_iter.close()
+        large_spans = [
+            span
+            for span, para_tokens in zip(spans, span_token_counts, strict=True)
+            if para_tokens > chunk_size
+        ]
+        split_large_spans = iter(self._split_large_paragraphs(doc, large_spans))
+
+        for span, para_tokens in zip(spans, span_token_counts, strict=True):
+            if para_tokens > chunk_size:
+                if current:
+                    chunks.append(tuple(current))
+                pieces = next(split_large_spans)
+                self.logger.debug(
+                    f"Split large paragraph ({para_tokens} tokens) into {len(pieces)} chunks"
+                )
+                chunks.extend(pieces)
+                current, current_length = [], 0
+            elif current_length + para_tokens > chunk_size and current:
+                chunks.append(tuple(current))
+                current, current_length = [span], para_tokens
+            else:
+                current.append(span)
+                current_length += para_tokens
+
+        if current:
+            chunks.append(tuple(current))
+        return chunks
+
+    def _split_large_paragraphs(
+        self, doc: TokenizedText, spans: list[Span]
+    ) -> list[list[Chunk]]:
+        """Split oversized paragraphs with spaCy in one batch.
+
+        A paragraph spaCy fails on stays a single chunk.
+        """
+        paragraphs = [doc.text[start:end] for start, end in spans]
+        return [
+            [(span,)] if pieces is None else doc.locate(pieces, *span)
+            for span, pieces in zip(
+                spans, self.splitter._split_texts_by_tokens(paragraphs), strict=True
+            )
+        ]
+
+    def _force_split_large_chunks(
+        self, doc: TokenizedText, chunks: list[Chunk]
+    ) -> list[tuple[Chunk, list[int]]]:
+        """Split chunks still over the chunk size. Returns (chunk, token IDs) pairs."""
+        chunk_ids = [doc.chunk_ids(chunk) for chunk in chunks]
+        large_chunks = [
+            chunk
+            for chunk, token_ids in zip(chunks, chunk_ids, strict=True)
+            if len(token_ids) > self.splitter.chunk_size
+        ]
+        split_large_chunks = iter(
+            self.splitter._split_texts_by_tokens(
+                [doc.chunk_text(chunk) for chunk in large_chunks]
+            )
+        )
+
+        sized = []
+        for chunk, token_ids in zip(chunks, chunk_ids, strict=True):
+            if len(token_ids) <= self.splitter.chunk_size:
+                sized.append((chunk, token_ids))
+                continue
+            pieces = next(split_large_chunks)
+            if pieces is None:
+                sized.append((chunk, token_ids))
+                continue
+            self.logger.debug(
+                f"Force-split large chunk ({len(token_ids)} tokens) into {len(pieces)} chunks"
+            )
+            if not isinstance(chunk, str) and len(chunk) == 1:
+                pieces = doc.locate(pieces, *chunk[0])
+            sized.extend((piece, doc.chunk_ids(piece)) for piece in pieces)
+        return sized
+
+    def _apply_overlap(
+        self, doc: TokenizedText, sized: list[tuple[Chunk, list[int]]]
+    ) -> tuple[list[str], list[int]]:
+        """Prefix chunks with the previous chunk's last tokens, like _apply_overlap_to_chunks."""
+        splitter = self.splitter
+        texts = [doc.chunk_text(chunk) for chunk, _ in sized]
+        counts = [len(token_ids) for _, token_ids in sized]
+        if splitter.chunk_overlap <= 0 or len(sized) <= 1:
+            return texts, counts
+
+        space_tokens = splitter.count_tokens(" ")
+        for i in range(1, len(sized)):
+            chunk, token_ids = sized[i]
+            prev_token_ids = sized[i - 1][1]
+            max_overlap_tokens = (
+                splitter.target_chunk_size - len(token_ids) - space_tokens
+            )
+            if max_overlap_tokens <= 0:
+                self.logger.warning(
+                    f"Chunk already at target token limit ({len(token_ids)} tokens), skipping overlap"
+                )
+                continue
+            actual_overlap = min(
+                splitter.chunk_overlap, len(prev_token_ids), max_overlap_tokens
+            )
+            if actual_overlap <= 0:
+                continue
+
+            overlap_text = self.encoding.decode(
+                prev_token_ids[-actual_overlap:]
+            ).strip()
+            # The joining space always starts a new piece, so the counts add up
+            final_token_count = splitter.count_tokens(overlap_text) + len(
+                doc.chunk_ids(chunk, leading_space=True)
+            )
+            if final_token_count > splitter.target_chunk_size:
+                self.logger.warning(
+                    f"Overlap would exceed target token limit ({final_token_count} > {splitter.target_chunk_size}), using original chunk"
+                )
+                continue
+            texts[i] = overlap_text + " " + texts[i]
+            counts[i] = final_token_count
+        return texts, counts